@@ -341,7 +341,12 @@ if os.environ.get('DISABLE_AUTH_MIGRATIONS') == '1':
         'auth': None,
     }
 
+# Per-request FreeIPA RPC, FreeIPA cache and ORM query accounting
+# (core/request_profiling.py): totals go to the access log and a Server-Timing header.
+REQUEST_PROFILING_ENABLED = _env_bool("REQUEST_PROFILING_ENABLED", default=False)
+
 MIDDLEWARE = [
+    'core.middleware.RequestProfilingMiddleware',
     'core.middleware.FreeIPAUnavailableMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
@@ -350,6 +355,7 @@ MIDDLEWARE = [
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'core.middleware.FreeIPAServiceClientReuseMiddleware',
+    'core.middleware.PermissionGrantScopeMiddleware',
     'core.middleware.FreeIPAAuthenticationMiddleware',
     'core.middleware.SentryRequestContextMiddleware',
     'core.middleware.StructuredAccessLogMiddleware',
@@ -361,6 +367,9 @@ MIDDLEWARE = [
 
 ROOT_URLCONF = 'config.urls'
 
+# Clears per-process caches between tests (config/test_runner.py).
+TEST_RUNNER = 'config.test_runner.AstraTestRunner'
+
 TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
@@ -524,6 +533,10 @@ FREEIPA_CIRCUIT_BREAKER_COOLDOWN_SECONDS = _env_int(
 
 FREEIPA_REQUEST_TIMEOUT_SECONDS = _env_int("FREEIPA_REQUEST_TIMEOUT_SECONDS", default=10)
 
+# Maximum number of sub-calls packed into one FreeIPA `batch` JSON-RPC request
+# for bulk user/group lookups.
+FREEIPA_BATCH_CHUNK_SIZE = _env_int("FREEIPA_BATCH_CHUNK_SIZE", default=50)
+
 # Geocoding configuration
 GEOCODING_ENDPOINT = _env_str("GEOCODING_ENDPOINT", default="https://photon.komoot.io/api/")
 GEOCODING_TIMEOUT = _env_int("GEOCODING_TIMEOUT", default=10)  # seconds
@@ -587,6 +600,11 @@ MEMBERSHIP_EXPIRING_SOON_DAYS = _env_int("MEMBERSHIP_EXPIRING_SOON_DAYS", defaul
 MEMBERSHIP_VALIDITY_DAYS = _env_int("MEMBERSHIP_VALIDITY_DAYS", default=365)
 MEMBERSHIP_STATS_APPROVAL_OUTLIER_DAYS = _env_int("MEMBERSHIP_STATS_APPROVAL_OUTLIER_DAYS", default=180)
 MEMBERSHIP_STATS_RETENTION_COHORTS_LIMIT = _env_int("MEMBERSHIP_STATS_RETENTION_COHORTS_LIMIT", default=24)
+# Statistics payloads are recomputed after the fresh window; until then (and
+# while one request recomputes) the cached payload is served for up to the
+# stale window.
+MEMBERSHIP_STATS_CACHE_FRESH_SECONDS = _env_int("MEMBERSHIP_STATS_CACHE_FRESH_SECONDS", default=300)
+MEMBERSHIP_STATS_CACHE_STALE_SECONDS = _env_int("MEMBERSHIP_STATS_CACHE_STALE_SECONDS", default=24 * 60 * 60)
 MEMBERSHIP_EMBARGOED_COUNTRY_CODES = _env_list(
     "MEMBERSHIP_EMBARGOED_COUNTRY_CODES",
     default=["CU", "IR", "KP", "MM", "RU", "SY", "VE"],
@@ -706,7 +724,8 @@ EMAIL_BACKEND = 'post_office.EmailBackend'
 # Configure post_office delivery backends.
 # - DEBUG: deliver immediately via SMTP to Mailhog.
 # - non-DEBUG: default delivery backend is AWS SES (django-ses); delivery still
-#   requires running `python manage.py send_queued_mail` (or enabling Celery).
+#   requires running `python manage.py send_queued_mail` (`--loop` keeps it
+#   running as a worker; or enable Celery).
 POST_OFFICE = {
     'DEFAULT_PRIORITY': 'now' if DEBUG else 'medium',
     'MESSAGE_ID_ENABLED': True,
@@ -752,6 +771,18 @@ AWS_SES_ADD_COMPLAINT_TO_BLACKLIST = _env_bool("AWS_SES_ADD_COMPLAINT_TO_BLACKLI
 # Optional: tag outgoing mail with a configuration set for event publishing.
 AWS_SES_CONFIGURATION_SET = (_env_str("AWS_SES_CONFIGURATION_SET", default="")).strip() or None
 
+# When enabled, SES event notifications (send/delivery/bounce/complaint/open/click)
+# are queued in the outbox and `manage.py outbox_drain` records them in batches,
+# instead of each webhook request updating post_office rows itself.
+SES_EVENT_BATCHING_ENABLED = _env_bool("SES_EVENT_BATCHING_ENABLED", default=False)
+
+# Send Mail (core/send_mail_delivery.py) inserts rendered emails in chunks of this size.
+# Sends to at least SEND_MAIL_BACKGROUND_THRESHOLD recipients are queued as outbox
+# chunks for `manage.py outbox_drain` instead of being rendered in the request
+# (0 always renders in the request).
+SEND_MAIL_CHUNK_SIZE = _env_int("SEND_MAIL_CHUNK_SIZE", default=500)
+SEND_MAIL_BACKGROUND_THRESHOLD = _env_int("SEND_MAIL_BACKGROUND_THRESHOLD", default=1000)
+
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
 AUTH_PASSWORD_VALIDATORS = [
@@ -934,6 +965,12 @@ MATTERMOST_WEBHOOK_DEFAULT_ICON_URL = _env_str(
     "MATTERMOST_WEBHOOK_DEFAULT_ICON_URL",
     default="/static/core/images/almalinux_astra_small.png",
 )
+# Signals record webhook posts in the outbox; `manage.py outbox_drain` delivers them.
+# Threads used to post a batch to several endpoints in parallel.
+MATTERMOST_WEBHOOK_FANOUT_WORKERS = _env_int("MATTERMOST_WEBHOOK_FANOUT_WORKERS", default=8)
+# How often a worker rechecks the shared endpoint-config generation (0 disables
+# the per-process endpoint cache).
+MATTERMOST_WEBHOOK_ENDPOINT_CACHE_SECONDS = _env_int("MATTERMOST_WEBHOOK_ENDPOINT_CACHE_SECONDS", default=30)
 
 # Default primary key field type
 # https://docs.djangoproject.com/en/6.0/ref/settings/#default-auto-field
@@ -1040,6 +1077,46 @@ CACHES = {
     }
 }
 
+# Per-process LRU in front of the shared cache for FreeIPA user/group entries and
+# circuit-breaker flags (core/freeipa/local_cache.py). Workers drop their local
+# copies when the shared invalidation generation changes. 0 disables it.
+FREEIPA_L1_CACHE_MAX_ENTRIES = _env_int("FREEIPA_L1_CACHE_MAX_ENTRIES", default=2048)
+FREEIPA_L1_CACHE_TTL_SECONDS = _env_int("FREEIPA_L1_CACHE_TTL_SECONDS", default=30)
+FREEIPA_L1_CACHE_GENERATION_CHECK_SECONDS = _env_int("FREEIPA_L1_CACHE_GENERATION_CHECK_SECONDS", default=2)
+
+# How long the cached /users directory index counts as fresh. Older indexes are
+# still served while a background refresh rebuilds them.
+FREEIPA_USER_DIRECTORY_REFRESH_SECONDS = _env_int("FREEIPA_USER_DIRECTORY_REFRESH_SECONDS", default=300)
+
+# How often a worker rechecks the shared FreeIPAPermissionGrant generation (0
+# reloads the grant table for every request).
+FREEIPA_PERMISSION_GRANT_CACHE_SECONDS = _env_int("FREEIPA_PERMISSION_GRANT_CACHE_SECONDS", default=30)
+
+# Maximum age of a worker's in-memory group search index (core/freeipa_directory.py).
+# Invalidating the group list rebuilds it sooner; this bounds staleness when the
+# shared group list simply expires. 0 rebuilds on every search.
+FREEIPA_GROUP_INDEX_MAX_AGE_SECONDS = _env_int("FREEIPA_GROUP_INDEX_MAX_AGE_SECONDS", default=300)
+
+# Maximum age of a worker's in-memory nested-group member closure (core/freeipa/group.py),
+# which answers recursive member lookups without fetching each nested group. Bounded the
+# same way as the group index above. 0 walks the groups on every lookup.
+FREEIPA_GROUP_CLOSURE_MAX_AGE_SECONDS = _env_int("FREEIPA_GROUP_CLOSURE_MAX_AGE_SECONDS", default=300)
+
+# Maximum age of a worker's in-memory email -> username index (core/freeipa_directory.py),
+# bounded the same way as the group index above. 0 rebuilds on every use.
+FREEIPA_USER_EMAIL_INDEX_MAX_AGE_SECONDS = _env_int("FREEIPA_USER_EMAIL_INDEX_MAX_AGE_SECONDS", default=300)
+
+# Lifetime of the shared lowercased username set (core/freeipa_directory.py) that
+# committee visibility filtering reads instead of the full user list. Invalidating
+# the user list makes it stale sooner. 0 recomputes it on every use.
+FREEIPA_LIVE_USERNAMES_CACHE_SECONDS = _env_int("FREEIPA_LIVE_USERNAMES_CACHE_SECONDS", default=3600)
+
+# Concurrency of the membership_mirror_validation job (core/mirror_membership_validation.py):
+# how many mirror requests are checked at once, and how many checks may talk to one host
+# (a mirror, github.com) at the same time. 1 validates inline on the calling thread.
+MIRROR_VALIDATION_WORKERS = _env_int("MIRROR_VALIDATION_WORKERS", default=8)
+MIRROR_VALIDATION_PER_HOST_CONCURRENCY = _env_int("MIRROR_VALIDATION_PER_HOST_CONCURRENCY", default=4)
+
 # Logging
 # Ensure app logs (including FreeIPA integration) are visible in container stdout.
 LOGGING = {
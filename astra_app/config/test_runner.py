@@ -0,0 +1,24 @@
+from django.test.runner import DiscoverRunner
+from django.test.utils import iter_test_cases
+
+
+def _clear_process_caches() -> None:
+    from core.cache_tools import clear_process_caches
+
+    clear_process_caches()
+
+
+class AstraTestRunner(DiscoverRunner):
+    """Django's test runner, clearing per-process caches after every test.
+
+    The shared DatabaseCache is rolled back with each test's transaction, but
+    the in-memory copies workers keep in front of it (the FreeIPA L1 cache,
+    group and email indexes, permission grants, webhook endpoints) live in the
+    test process and would carry one test's data into the next.
+    """
+
+    def build_suite(self, *args, **kwargs):
+        suite = super().build_suite(*args, **kwargs)
+        for test in iter_test_cases(suite):
+            test.addCleanup(_clear_process_caches)
+        return suite
@@ -15,6 +15,7 @@ from post_office.models import EmailTemplate
 from core.account_invitation_reconcile import persist_non_org_invitation_acceptance
 from core.email_context import membership_committee_email_context, system_email_context
 from core.freeipa.user import FreeIPAUser
+from core.freeipa_directory import UserEmailIndex, get_user_email_index
 from core.logging_extras import current_exception_log_fields
 from core.models import AccountInvitation, AccountInvitationSend, Organization
 from core.organization_claim import build_organization_claim_url
@@ -171,22 +172,17 @@ def resolve_invitation_template_selection(
 
 
 def build_freeipa_email_lookup() -> dict[str, set[str]]:
-    users = FreeIPAUser.all(respect_privacy=False)
-    if not users:
+    index = get_user_email_index()
+    if not index.complete:
         logger.warning(
             "Account invitation FreeIPA lookup: FreeIPAUser.all() returned 0 users; falling back to per-email lookup"
         )
         return {}
 
-    mapping: dict[str, set[str]] = {}
-    for user in users:
-        email = normalize_invitation_email(user.email)
-        username = str(user.username or "").strip().lower()
-        if not email or not username:
-            continue
-        mapping.setdefault(email, set()).add(username)
-
-    return mapping
+    return {
+        email: {username.lower() for username in usernames}
+        for email, usernames in index.usernames_by_email.items()
+    }
 
 
 def parse_invitation_csv(content: str, *, max_rows: int) -> list[dict[str, str]]:
@@ -482,31 +478,28 @@ def summarize_resend_results(results: Iterable[str]) -> AccountInvitationResendS
 
 
 def confirm_existing_usernames(usernames: list[str]) -> tuple[list[str], bool]:
-    confirmed: list[str] = []
-    seen: set[str] = set()
+    normalized = sorted({str(username or "").strip().lower() for username in usernames if str(username or "").strip()})
+    if not normalized:
+        return [], True
 
-    for username in usernames:
-        normalized = str(username or "").strip().lower()
-        if not normalized or normalized in seen:
-            continue
-        try:
-            user = FreeIPAUser.get(normalized)
-        except Exception:
-            logger.exception("Account invitation FreeIPA user lookup failed", extra=current_exception_log_fields())
-            return [], False
-        if user is None:
-            continue
-        confirmed.append(normalized)
-        seen.add(normalized)
+    try:
+        users_by_username = FreeIPAUser.get_many(normalized)
+    except Exception:
+        logger.exception("Account invitation FreeIPA user lookup failed", extra=current_exception_log_fields())
+        return [], False
 
-    return sorted(confirmed), True
+    return [username for username in normalized if username in users_by_username], True
 
 
-def find_account_invitation_matches(email: str) -> list[str]:
+def find_account_invitation_matches(email: str, *, email_index: UserEmailIndex | None = None) -> list[str]:
     normalized = normalize_invitation_email(email)
     if not normalized:
         return []
 
+    # A freshly listed index is authoritative, misses included.
+    if email_index is not None and email_index.complete:
+        return sorted({username.lower() for username in email_index.usernames_for(normalized)})
+
     try:
         matches = FreeIPAUser.find_usernames_by_email(normalized)
     except Exception:
@@ -547,12 +540,13 @@ def refresh_pending_invitations(
     pending: Iterable[AccountInvitation],
     actor_username: str,
     now: datetime,
+    email_index: UserEmailIndex | None = None,
 ) -> tuple[int, int]:
     updated = 0
     checked = 0
     for invitation in pending:
         checked += 1
-        matches = find_account_invitation_matches(invitation.email)
+        matches = find_account_invitation_matches(invitation.email, email_index=email_index)
         if matches:
             if _mark_invitation_accepted_from_email_match(
                 invitation=invitation,
@@ -572,6 +566,7 @@ def refresh_accepted_invitations(
     *,
     accepted: Iterable[AccountInvitation],
     now: datetime,
+    email_index: UserEmailIndex | None = None,
 ) -> tuple[int, int]:
     updated = 0
     checked = 0
@@ -579,7 +574,17 @@ def refresh_accepted_invitations(
         checked += 1
         if not invitation.freeipa_matched_usernames:
             continue
-        confirmed, ok = confirm_existing_usernames(invitation.freeipa_matched_usernames)
+        if email_index is not None and email_index.complete:
+            confirmed = sorted(
+                {
+                    str(username).strip().lower()
+                    for username in invitation.freeipa_matched_usernames
+                    if email_index.has_username(str(username))
+                }
+            )
+            ok = True
+        else:
+            confirmed, ok = confirm_existing_usernames(invitation.freeipa_matched_usernames)
         if not ok:
             continue
         if not confirmed:
@@ -618,14 +623,23 @@ def refresh_account_invitations(
             accepted_at__isnull=False,
         ).order_by("pk")
 
+    pending_source = list(pending_source)
+    accepted_source = list(accepted_source)
+
+    # One fresh directory listing answers every invitation, instead of one
+    # FreeIPA search per pending invitation and one lookup per accepted one.
+    email_index = get_user_email_index(refresh=True) if pending_source or accepted_source else None
+
     pending_updated, pending_checked = refresh_pending_invitations(
         pending=pending_source,
         actor_username=actor_username,
         now=now,
+        email_index=email_index,
     )
     accepted_updated, accepted_checked = refresh_accepted_invitations(
         accepted=accepted_source,
         now=now,
+        email_index=email_index,
     )
     return AccountInvitationRefreshSummary(
         pending_checked=pending_checked,
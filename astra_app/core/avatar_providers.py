@@ -1,6 +1,7 @@
 from types import SimpleNamespace
 
 from avatar.templatetags.avatar_tags import avatar_url
+from django.core.cache import cache
 from django.core.files.storage import default_storage
 
 from core.avatar_storage import avatar_path_handler
@@ -23,6 +24,29 @@ class LocalS3AvatarProvider:
         return str(default_storage.url(key) or "").strip()
 
 
+def _cached_avatar_urls(users_by_key: dict[str, object], *, width: int, height: int) -> dict[str, str]:
+    """Read django-avatar's cached ``avatar_url`` results for many users at once.
+
+    ``avatar_url`` caches per user but reads that cache one key at a time; one
+    ``get_many`` here lets cache hits skip it entirely. The key helper belongs
+    to django-avatar, so any mismatch falls back to per-user resolution.
+    """
+    try:
+        from avatar.conf import settings as avatar_settings
+        from avatar.utils import get_cache_key
+
+        if not users_by_key or not avatar_settings.AVATAR_CACHE_ENABLED:
+            return {}
+        keys = {
+            get_cache_key(user, "avatar_url", width, height): cache_key
+            for cache_key, user in users_by_key.items()
+        }
+        cached = cache.get_many(list(keys))
+    except Exception:
+        return {}
+    return {keys[key]: str(value or "").strip() for key, value in cached.items() if isinstance(value, str)}
+
+
 def resolve_avatar_urls_for_users(
     users: list[object],
     *,
@@ -40,6 +64,13 @@ def resolve_avatar_urls_for_users(
     avatar_resolution_count = 0
     avatar_fallback_count = 0
 
+    users_by_key: dict[str, object] = {}
+    for user in users:
+        username = try_get_username_from_user(user)
+        if username:
+            users_by_key.setdefault(username.lower(), user)
+    cached_url_by_key = _cached_avatar_urls(users_by_key, width=width, height=height)
+
     for user in users:
         username = try_get_username_from_user(user)
         if not username:
@@ -50,10 +81,13 @@ def resolve_avatar_urls_for_users(
             continue
 
         avatar_resolution_count += 1
-        try:
-            resolved_avatar_url = str(avatar_url(user, width, height) or "").strip()
-        except Exception:
-            resolved_avatar_url = ""
+        if cache_key in cached_url_by_key:
+            resolved_avatar_url = cached_url_by_key[cache_key]
+        else:
+            try:
+                resolved_avatar_url = str(avatar_url(user, width, height) or "").strip()
+            except Exception:
+                resolved_avatar_url = ""
 
         if not resolved_avatar_url:
             avatar_fallback_count += 1
@@ -5,6 +5,12 @@ from typing import Any
 from django.core.cache import cache, caches
 from django.db import connections
 
+from core.freeipa.group import _group_closure_cache
+from core.freeipa.local_cache import freeipa_local_cache
+from core.freeipa_directory import _group_index_cache, _user_email_index_cache
+from core.mattermost_webhooks import _endpoint_cache
+from core.permission_grants import _grant_cache
+
 _CACHE_VERSION_PREFIX_RE = re.compile(r"^:\d+:")
 
 
@@ -82,6 +88,8 @@ def inspect_default_cache(
             "freeipa_user_<username>",
             "freeipa_group_<cn>",
         ],
+        # Per-process: only describes the worker that served this request.
+        "freeipa_l1": freeipa_local_cache.stats(),
     }
 
     if key:
@@ -91,8 +99,23 @@ def inspect_default_cache(
     return payload
 
 
+def clear_process_caches() -> None:
+    """Drop this process's in-memory copies of shared-cache and database data.
+
+    Other workers are not affected; they drop their copies when the shared
+    generation counters change.
+    """
+    freeipa_local_cache.clear_local()
+    _group_index_cache.clear()
+    _group_closure_cache.clear()
+    _user_email_index_cache.clear()
+    _grant_cache.clear()
+    _endpoint_cache.clear()
+
+
 def clear_default_cache() -> dict[str, object]:
     backend = caches["default"]
     backend_path = f"{backend.__class__.__module__}.{backend.__class__.__name__}"
     cache.clear()
+    clear_process_caches()
     return {"backend": backend_path, "cleared": True}
\ No newline at end of file
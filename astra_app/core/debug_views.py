@@ -179,6 +179,7 @@ def signals_log_debug_view(request: HttpRequest) -> HttpResponse:
     cleared on process restart.
     """
 
+    from core.outbox import outbox_stats
     from core.signal_debug import get_signal_log
 
     log = get_signal_log()
@@ -188,6 +189,7 @@ def signals_log_debug_view(request: HttpRequest) -> HttpResponse:
         {
             "log": log,
             "event_keys": sorted(astra_signals.CANONICAL_SIGNALS.keys()),
+            "outbox_stats": outbox_stats(),
         },
     )
 
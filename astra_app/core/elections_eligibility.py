@@ -8,8 +8,9 @@ from django.core.cache import cache
 from django.utils import timezone
 
 from core.election_nominators import organization_nominator_identifier, parse_nominator_identifier
+from core.freeipa.circuit_breaker import _elections_freeipa_circuit_open
 from core.freeipa.exceptions import FreeIPAMisconfiguredError, FreeIPAUnavailableError
-from core.freeipa.group import FreeIPAGroup, get_freeipa_group_for_elections
+from core.freeipa.group import FreeIPAGroup, get_freeipa_group_for_elections, get_group_membership_closure
 from core.freeipa_directory import snapshot_freeipa_users
 from core.models import Election, Membership
 
@@ -293,6 +294,15 @@ def _freeipa_group_recursive_member_usernames(
     if not root:
         return set()
 
+    # The cached closure answers cached reads in one step. Fresh reads, an open
+    # circuit and groups that reference a missing nested group take the walk
+    # below, which fetches each group and reports failures.
+    if not require_fresh and not _elections_freeipa_circuit_open():
+        closure = get_group_membership_closure()
+        closed = closure.member_usernames(root) if closure is not None else None
+        if closed is not None and not closed.dangling:
+            return {username.strip().lower() for username in closed.usernames if username.strip()}
+
     seen_groups: set[str] = set()
     members: set[str] = set()
     pending: list[str] = [root]
@@ -1,6 +1,6 @@
 from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
-from decimal import ROUND_DOWN, Decimal, localcontext
+from decimal import ROUND_DOWN, Decimal, Rounded, localcontext
 
 # Single source of truth for the convergence parameters used by tally_meek.
 # These values are also persisted into Election.tally_result["algorithm"] so that
@@ -61,21 +61,86 @@ def _ballot_weight(ballot: Mapping[str, object]) -> Decimal:
     return _decimal(weight_val)
 
 
-def _distribute_votes(
-    *,
+@dataclass(frozen=True, slots=True)
+class _BallotGroup:
+    ranking: tuple[int, ...]
+    weight: Decimal
+    count: Decimal
+
+
+@dataclass(frozen=True, slots=True)
+class _PreparedBallots:
+    """Ballots validated and parsed once per tally.
+
+    Ballots sharing a ranking and weight are collapsed into one group, and
+    rankings only keep known candidate IDs. ``sequence`` records the group of
+    every counted ballot in input order so totals can still be accumulated in
+    exactly the order the per-ballot count used (see ``_distribute_votes``).
+    """
+
+    groups: tuple[_BallotGroup, ...]
+    sequence: tuple[int, ...]
+    total_weight: Decimal
+
+
+def _prepare_ballots(
     ballots: Iterable[Mapping[str, object]],
-    retention: Mapping[int, Decimal],
-    continuing_ids: frozenset[int],
-) -> tuple[dict[int, Decimal], dict[int, Decimal]]:
-    incoming: dict[int, Decimal] = {cid: Decimal(0) for cid in continuing_ids}
-    retained: dict[int, Decimal] = {cid: Decimal(0) for cid in continuing_ids}
+    *,
+    candidate_ids: frozenset[int],
+) -> _PreparedBallots:
+    group_index: dict[tuple[tuple[int, ...], Decimal], int] = {}
+    rankings: list[tuple[int, ...]] = []
+    weights: list[Decimal] = []
+    counts: list[int] = []
+    sequence: list[int] = []
+    total_weight = Decimal(0)
 
     for ballot in ballots:
-        remaining = _ballot_weight(ballot)
-        if remaining <= 0:
+        weight = _ballot_weight(ballot)
+        total_weight += weight
+        if weight <= 0:
+            continue
+
+        # Unknown IDs can never be continuing, so dropping them up front does
+        # not change how the ballot transfers.
+        ranking = tuple(cid for cid in _ballot_ranking(ballot) if cid in candidate_ids)
+        if not ranking:
             continue
 
-        for cid in _ballot_ranking(ballot):
+        key = (ranking, weight)
+        idx = group_index.get(key)
+        if idx is None:
+            idx = len(rankings)
+            group_index[key] = idx
+            rankings.append(ranking)
+            weights.append(weight)
+            counts.append(0)
+        counts[idx] += 1
+        sequence.append(idx)
+
+    return _PreparedBallots(
+        groups=tuple(
+            _BallotGroup(ranking=ranking, weight=weight, count=Decimal(count))
+            for ranking, weight, count in zip(rankings, weights, counts, strict=True)
+        ),
+        sequence=tuple(sequence),
+        total_weight=total_weight,
+    )
+
+
+def _distribute_votes(
+    *,
+    ballots: _PreparedBallots,
+    retention: Mapping[int, Decimal],
+    continuing_ids: frozenset[int],
+) -> tuple[dict[int, Decimal], dict[int, Decimal]]:
+    # Every ballot in a group follows the same transfer path, so compute each
+    # path once: (candidate, incoming weight, retained portion) per step.
+    paths: list[list[tuple[int, Decimal, Decimal]]] = []
+    for group in ballots.groups:
+        remaining = group.weight
+        path: list[tuple[int, Decimal, Decimal]] = []
+        for cid in group.ranking:
             if remaining <= 0:
                 break
             if cid not in continuing_ids:
@@ -85,24 +150,58 @@ def _distribute_votes(
             if r <= 0:
                 continue
 
-            incoming[cid] += remaining
             portion = remaining * r
+            path.append((cid, remaining, portion))
             if portion:
-                retained[cid] += portion
                 remaining -= portion
+        paths.append(path)
+
+    # Totals are published, so they must match the per-ballot count digit for
+    # digit. Summing group-by-group is only equivalent when no addition rounds
+    # at the working precision; all addends are positive, so if the grouped
+    # sums are exact every partial per-ballot sum is exact too. Otherwise
+    # replay the additions in ballot order.
+    with localcontext() as ctx:
+        ctx.traps[Rounded] = True
+        try:
+            return _accumulate_grouped(ballots=ballots, paths=paths, continuing_ids=continuing_ids)
+        except Rounded:
+            pass
+
+    incoming: dict[int, Decimal] = {cid: Decimal(0) for cid in continuing_ids}
+    retained: dict[int, Decimal] = {cid: Decimal(0) for cid in continuing_ids}
+    for idx in ballots.sequence:
+        for cid, remaining, portion in paths[idx]:
+            incoming[cid] += remaining
+            if portion:
+                retained[cid] += portion
+
+    return incoming, retained
 
+
+def _accumulate_grouped(
+    *,
+    ballots: _PreparedBallots,
+    paths: list[list[tuple[int, Decimal, Decimal]]],
+    continuing_ids: frozenset[int],
+) -> tuple[dict[int, Decimal], dict[int, Decimal]]:
+    incoming: dict[int, Decimal] = {cid: Decimal(0) for cid in continuing_ids}
+    retained: dict[int, Decimal] = {cid: Decimal(0) for cid in continuing_ids}
+    for group, path in zip(ballots.groups, paths, strict=True):
+        count = group.count
+        for cid, remaining, portion in path:
+            incoming[cid] += remaining * count
+            if portion:
+                retained[cid] += portion * count
     return incoming, retained
 
 
-def _first_preferences(*, ballots: Iterable[Mapping[str, object]], continuing_ids: frozenset[int]) -> dict[int, Decimal]:
+def _first_preferences(*, ballots: _PreparedBallots, continuing_ids: frozenset[int]) -> dict[int, Decimal]:
     first: dict[int, Decimal] = {cid: Decimal(0) for cid in continuing_ids}
-    for ballot in ballots:
-        w = _ballot_weight(ballot)
-        if w <= 0:
-            continue
-        for cid in _ballot_ranking(ballot):
+    for group in ballots.groups:
+        for cid in group.ranking:
             if cid in continuing_ids:
-                first[cid] += w
+                first[cid] += group.weight * group.count
                 break
     return first
 
@@ -613,7 +712,8 @@ def tally_meek(
     with localcontext() as ctx:
         ctx.prec = 80
 
-        total_weight = sum((_ballot_weight(b) for b in ballots), start=Decimal(0))
+        prepared_ballots = _prepare_ballots(ballots, candidate_ids=all_candidate_ids)
+        total_weight = prepared_ballots.total_weight
         quota = (total_weight / Decimal(seats + 1)).to_integral_value(rounding=ROUND_DOWN) + Decimal(1)
 
         retention: dict[int, Decimal] = {cid: Decimal(1) for cid in all_candidate_ids}
@@ -622,7 +722,7 @@ def tally_meek(
         forced_excluded: list[int] = []
 
         continuing_ids: set[int] = set(all_candidate_ids)
-        first_pref = _first_preferences(ballots=ballots, continuing_ids=frozenset(continuing_ids))
+        first_pref = _first_preferences(ballots=prepared_ballots, continuing_ids=frozenset(continuing_ids))
         previous_totals: dict[int, Decimal] = {cid: Decimal(0) for cid in continuing_ids}
 
         rounds: list[dict[str, object]] = []
@@ -910,7 +1010,7 @@ def tally_meek(
             # Fixed-point iteration for current continuing set.
             for iter_idx in range(1, max_iterations + 1):
                 incoming_totals, retained_totals = _distribute_votes(
-                    ballots=ballots,
+                    ballots=prepared_ballots,
                     retention=retention,
                     continuing_ids=frozenset(continuing_ids),
                 )
@@ -1017,7 +1117,7 @@ def tally_meek(
             if len(remaining_candidates) == remaining_seats:
                 # Compute current vote distribution for tie-break rule 2 (cumulative support).
                 incoming_totals, _retained_totals = _distribute_votes(
-                    ballots=ballots,
+                    ballots=prepared_ballots,
                     retention=retention,
                     continuing_ids=frozenset(continuing_ids),
                 )
@@ -1057,7 +1157,7 @@ def tally_meek(
                 break
 
             totals = _distribute_votes(
-                ballots=ballots,
+                ballots=prepared_ballots,
                 retention=retention,
                 continuing_ids=frozenset(continuing_ids),
             )
@@ -0,0 +1,267 @@
+"""Synthetic elections for benchmarking and regression-testing the Meek tally.
+
+The scenarios are fully determined by their seed, so a stored ``tally_result``
+("golden" result) pins the exact Decimal output of ``tally_meek``. Any change
+to the engine that alters a single digit of a retained total or retention
+factor shows up as a golden mismatch.
+"""
+
+import json
+import random
+import time
+import tracemalloc
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+from core.elections_meek import tally_meek
+from core.elections_sankey import build_sankey_flows
+
+BALLOT_LENGTH_MODES: tuple[str, ...] = ("full", "partial", "short")
+
+GOLDEN_RESULTS_DIR = Path(__file__).resolve().parent / "data" / "meek_golden"
+
+
+@dataclass(frozen=True, slots=True)
+class SyntheticElectionSpec:
+    name: str
+    voters: int
+    candidates: int
+    seats: int
+    exclusion_groups: int = 0
+    ballot_length: str = "partial"
+    weight_choices: tuple[int, ...] = (1,)
+    seed: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class SyntheticElection:
+    spec: SyntheticElectionSpec
+    candidates: list[dict[str, object]]
+    ballots: list[dict[str, object]]
+    exclusion_groups: list[dict[str, object]]
+
+
+@dataclass(frozen=True, slots=True)
+class TallyBenchmarkResult:
+    spec: SyntheticElectionSpec
+    tally_seconds: float
+    sankey_seconds: float
+    peak_memory_bytes: int
+    iterations_per_round: list[int]
+    tally_result: dict[str, object] = field(repr=False)
+
+
+# Scenarios with a committed golden result in GOLDEN_RESULTS_DIR. They are kept
+# small so the regression suite stays fast; use the management command with
+# custom sizes for actual timing runs.
+GOLDEN_SPECS: tuple[SyntheticElectionSpec, ...] = (
+    SyntheticElectionSpec(
+        name="full_rankings_weighted",
+        voters=120,
+        candidates=6,
+        seats=2,
+        ballot_length="full",
+        weight_choices=(1, 2, 5, 7),
+        seed=1,
+    ),
+    SyntheticElectionSpec(
+        name="partial_rankings_exclusions",
+        voters=300,
+        candidates=10,
+        seats=3,
+        exclusion_groups=2,
+        ballot_length="partial",
+        weight_choices=(1, 1, 2),
+        seed=2,
+    ),
+    SyntheticElectionSpec(
+        name="short_ballots_many_candidates",
+        voters=400,
+        candidates=16,
+        seats=4,
+        exclusion_groups=1,
+        ballot_length="short",
+        seed=3,
+    ),
+)
+
+
+def build_synthetic_election(spec: SyntheticElectionSpec) -> SyntheticElection:
+    if spec.ballot_length not in BALLOT_LENGTH_MODES:
+        raise ValueError(f"Unknown ballot length mode: {spec.ballot_length}")
+    if spec.candidates < 1 or spec.seats < 1 or spec.voters < 0:
+        raise ValueError("voters, candidates and seats must be positive")
+
+    rng = random.Random(spec.seed)
+    candidate_ids = list(range(1, spec.candidates + 1))
+    candidates: list[dict[str, object]] = [
+        {"id": cid, "name": f"Candidate {cid}", "tiebreak_uuid": str(uuid.UUID(int=rng.getrandbits(128)))}
+        for cid in candidate_ids
+    ]
+
+    # Skewed popularity so elections have surpluses to transfer rather than
+    # degenerating into near-ties everywhere.
+    popularity = [rng.random() ** 2 + 0.05 for _ in candidate_ids]
+
+    ballots: list[dict[str, object]] = []
+    for _ in range(spec.voters):
+        ranking: list[int] = []
+        pool = list(candidate_ids)
+        weights = list(popularity)
+        if spec.ballot_length == "full":
+            length = len(pool)
+        elif spec.ballot_length == "partial":
+            length = rng.randint(1, len(pool))
+        else:
+            length = rng.randint(1, min(3, len(pool)))
+        for _ in range(length):
+            idx = rng.choices(range(len(pool)), weights=weights)[0]
+            ranking.append(pool.pop(idx))
+            weights.pop(idx)
+        ballots.append({"weight": rng.choice(spec.weight_choices), "ranking": ranking})
+
+    exclusion_groups: list[dict[str, object]] = []
+    shuffled_ids = list(candidate_ids)
+    rng.shuffle(shuffled_ids)
+    for idx in range(spec.exclusion_groups):
+        members = shuffled_ids[idx * 2 : idx * 2 + 2]
+        if len(members) < 2:
+            break
+        exclusion_groups.append(
+            {
+                "public_id": f"group-{idx + 1}",
+                "name": f"Group {idx + 1}",
+                "max_elected": 1,
+                "candidate_ids": members,
+            }
+        )
+
+    return SyntheticElection(
+        spec=spec,
+        candidates=candidates,
+        ballots=ballots,
+        exclusion_groups=exclusion_groups,
+    )
+
+
+def jsonify_tally_result(result: dict[str, object]) -> dict[str, object]:
+    """Normalize a tally result the same way it is persisted on ``Election``."""
+
+    return json.loads(json.dumps(result, cls=DjangoJSONEncoder))
+
+
+def _iterations_per_round(rounds: list[dict[str, object]]) -> list[int]:
+    """Count tally iterations between elections/eliminations.
+
+    Each entry of ``tally_result["rounds"]`` is one iteration of the
+    fixed-point loop; a round ends when it elects, eliminates or excludes.
+    """
+
+    counts: list[int] = []
+    current = 0
+    for round_data in rounds:
+        current += 1
+        if round_data.get("elected") or round_data.get("eliminated") or round_data.get("forced_exclusions"):
+            counts.append(current)
+            current = 0
+    if current:
+        counts.append(current)
+    return counts
+
+
+def run_tally_benchmark(spec: SyntheticElectionSpec, *, trace_memory: bool = True) -> TallyBenchmarkResult:
+    election = build_synthetic_election(spec)
+
+    if trace_memory:
+        tracemalloc.start()
+    try:
+        started = time.perf_counter()
+        raw_result = tally_meek(
+            ballots=election.ballots,
+            candidates=election.candidates,
+            seats=spec.seats,
+            exclusion_groups=election.exclusion_groups,
+        )
+        tally_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        build_sankey_flows(
+            tally_result=raw_result,
+            candidate_username_by_id={int(c["id"]): str(c["name"]) for c in election.candidates},
+            votes_cast=len(election.ballots),
+        )
+        sankey_seconds = time.perf_counter() - started
+
+        peak_memory_bytes = tracemalloc.get_traced_memory()[1] if trace_memory else 0
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+
+    tally_result = jsonify_tally_result(raw_result)
+    rounds = tally_result.get("rounds")
+    return TallyBenchmarkResult(
+        spec=spec,
+        tally_seconds=tally_seconds,
+        sankey_seconds=sankey_seconds,
+        peak_memory_bytes=peak_memory_bytes,
+        iterations_per_round=_iterations_per_round(rounds if isinstance(rounds, list) else []),
+        tally_result=tally_result,
+    )
+
+
+def golden_result_path(spec: SyntheticElectionSpec) -> Path:
+    return GOLDEN_RESULTS_DIR / f"{spec.name}.json"
+
+
+def load_golden_result(spec: SyntheticElectionSpec) -> dict[str, object] | None:
+    path = golden_result_path(spec)
+    if not path.exists():
+        return None
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def write_golden_result(spec: SyntheticElectionSpec, tally_result: dict[str, object]) -> Path:
+    path = golden_result_path(spec)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(tally_result, indent=1, sort_keys=True) + "\n", encoding="utf-8")
+    return path
+
+
+def golden_mismatches(*, expected: dict[str, object], actual: dict[str, object]) -> list[str]:
+    """Describe where ``actual`` differs from a golden tally result.
+
+    Reports the top-level outcome first and then the first differing round,
+    which is usually where a precision regression starts.
+    """
+
+    problems: list[str] = []
+    for key in ("quota", "elected", "eliminated", "forced_excluded"):
+        if expected.get(key) != actual.get(key):
+            problems.append(f"{key}: expected {expected.get(key)!r}, got {actual.get(key)!r}")
+
+    expected_rounds = expected.get("rounds")
+    actual_rounds = actual.get("rounds")
+    if not isinstance(expected_rounds, list) or not isinstance(actual_rounds, list):
+        if expected_rounds != actual_rounds:
+            problems.append("rounds: missing or malformed")
+        return problems
+
+    if len(expected_rounds) != len(actual_rounds):
+        problems.append(f"rounds: expected {len(expected_rounds)}, got {len(actual_rounds)}")
+    for idx, (expected_round, actual_round) in enumerate(zip(expected_rounds, actual_rounds), start=1):
+        if expected_round == actual_round:
+            continue
+        keys = sorted(
+            key
+            for key in set(expected_round) | set(actual_round)
+            if expected_round.get(key) != actual_round.get(key)
+        )
+        problems.append(f"round {idx}: differs in {', '.join(keys)}")
+        break
+
+    if not problems and expected != actual:
+        problems.append("tally result differs")
+    return problems
@@ -2,16 +2,18 @@ import datetime
 import json
 import logging
 import secrets
-from collections.abc import Iterable
+import tempfile
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from urllib.parse import quote
 from zoneinfo import ZoneInfo
 
 from django.conf import settings
-from django.core.files.base import ContentFile
+from django.core.cache import cache
+from django.core.files.base import File
 from django.core.serializers.json import DjangoJSONEncoder
 from django.db import IntegrityError, transaction
-from django.db.models import Count, Q, Sum
+from django.db.models import Q
 from django.http import HttpRequest
 from django.urls import reverse
 from django.utils import timezone
@@ -20,6 +22,13 @@ from post_office.models import Email
 from core import signals as astra_signals
 from core.elections_eligibility import start_eligible_voters
 from core.elections_timestamping import get_public_payload, schedule_attestation
+from core.elections_turnout import (
+    TurnoutCounts,
+    compute_election_turnout,
+    election_turnout_counts,
+    rebuild_election_turnout,
+    record_ballot_turnout,
+)
 from core.email_context import (
     election_committee_email_context,
     user_email_context,
@@ -32,6 +41,7 @@ from core.models import (
     Ballot,
     Candidate,
     Election,
+    ElectionChainHead,
     VotingCredential,
 )
 from core.public_urls import build_public_absolute_url
@@ -42,6 +52,12 @@ ELECTION_TALLY_ALGORITHM_NAME = "Meek STV (High-Precision Variant)"
 ELECTION_TALLY_ALGORITHM_VERSION = "1.0"
 ELECTION_TALLY_ALGORITHM_SPEC_DOC = "docs/runbooks/meek-stv-elections.md"
 _MAX_RANKING_SIZE = 500
+_PUBLIC_EXPORT_CHUNK_SIZE = 2000
+# Artifacts larger than this spill from memory to a temporary file on disk.
+_PUBLIC_EXPORT_SPOOL_MAX_BYTES = 8 * 1024 * 1024
+_QUORUM_EVAL_CACHE_PREFIX = "elections:quorum_eval"
+# Upper bound on how long a crashed evaluator can hold the coalescing slot.
+_QUORUM_EVAL_LOCK_SECONDS = 60
 
 logger = logging.getLogger(__name__)
 
@@ -198,7 +214,12 @@ def candidate_username_by_id_map(candidates: Iterable[Candidate]) -> dict[int, s
     }
 
 
-def build_public_ballots_export(*, election: Election) -> dict[str, object]:
+def _iter_public_ballots(*, election: Election, chain_state: dict[str, str]) -> Iterator[dict[str, object]]:
+    """Yield public ballot records in chain order.
+
+    ``chain_state["chain_head"]`` tracks the last chain hash seen, so it holds
+    the export's chain head once the iterator is exhausted.
+    """
     candidates = Candidate.objects.filter(election=election).only("id", "freeipa_username")
     candidate_name_by_id = candidate_username_by_id_map(candidates)
 
@@ -218,8 +239,8 @@ def build_public_ballots_export(*, election: Election) -> dict[str, object]:
         .order_by("created_at", "id")
     )
 
-    ballots_payload: list[dict[str, object]] = []
-    for ballot in ballots_qs:
+    chain_state["chain_head"] = election_genesis_chain_hash(election.id)
+    for ballot in ballots_qs.iterator(chunk_size=_PUBLIC_EXPORT_CHUNK_SIZE):
         ranking_usernames: list[str] = []
         for cid in ballot.ranking or []:
             try:
@@ -229,32 +250,24 @@ def build_public_ballots_export(*, election: Election) -> dict[str, object]:
             name = candidate_name_by_id.get(candidate_id)
             ranking_usernames.append(name if name else str(candidate_id))
 
-        ballots_payload.append(
-            {
-                "ranking": ranking_usernames,
-                "weight": int(ballot.weight or 0),
-                "ballot_hash": str(ballot.ballot_hash or ""),
-                "is_counted": bool(ballot.is_counted),
-                "chain_hash": str(ballot.chain_hash or ""),
-                "previous_chain_hash": str(ballot.previous_chain_hash or ""),
-                "superseded_by": (
-                    str(ballot.superseded_by.ballot_hash)
-                    if ballot.superseded_by and ballot.superseded_by.ballot_hash
-                    else None
-                ),
-            }
-        )
-
-    last_chain_hash = ballots_qs.values_list("chain_hash", flat=True).last()
-    chain_head = str(last_chain_hash or election_genesis_chain_hash(election.id))
-
-    return {
-        "ballots": ballots_payload,
-        "chain_head": chain_head,
-    }
+        chain_state["chain_head"] = str(ballot.chain_hash or election_genesis_chain_hash(election.id))
+
+        yield {
+            "ranking": ranking_usernames,
+            "weight": int(ballot.weight or 0),
+            "ballot_hash": str(ballot.ballot_hash or ""),
+            "is_counted": bool(ballot.is_counted),
+            "chain_hash": str(ballot.chain_hash or ""),
+            "previous_chain_hash": str(ballot.previous_chain_hash or ""),
+            "superseded_by": (
+                str(ballot.superseded_by.ballot_hash)
+                if ballot.superseded_by and ballot.superseded_by.ballot_hash
+                else None
+            ),
+        }
 
 
-def build_public_audit_export(*, election: Election) -> dict[str, object]:
+def _iter_public_audit_events(*, election: Election) -> Iterator[dict[str, object]]:
     entries = (
         AuditLogEntry.objects.filter(election=election, is_public=True)
         .exclude(event_type="quorum_reached")
@@ -272,8 +285,7 @@ def build_public_audit_export(*, election: Election) -> dict[str, object]:
         .order_by("timestamp", "id")
     )
 
-    audit_log: list[dict[str, object]] = []
-    for entry in entries:
+    for entry in entries.iterator(chunk_size=_PUBLIC_EXPORT_CHUNK_SIZE):
         event: dict[str, object] = {
             "timestamp": entry.timestamp.date().isoformat(),
             "event_type": str(entry.event_type),
@@ -295,33 +307,97 @@ def build_public_audit_export(*, election: Election) -> dict[str, object]:
                 "canonical_message_version": entry.rekor_canonical_message_version,
             }
 
-        audit_log.append(event)
+        yield event
 
-    algorithm = {}
+
+def _public_audit_algorithm(*, election: Election) -> dict[str, object]:
     if isinstance(election.tally_result, dict):
         algo = election.tally_result.get("algorithm")
         if isinstance(algo, dict):
-            algorithm = algo
+            return algo
+    return {}
+
 
+def build_public_ballots_export(*, election: Election) -> dict[str, object]:
+    chain_state: dict[str, str] = {}
+    ballots_payload = list(_iter_public_ballots(election=election, chain_state=chain_state))
     return {
-        "algorithm": algorithm,
-        "audit_log": audit_log,
+        "ballots": ballots_payload,
+        "chain_head": chain_state["chain_head"],
     }
 
 
+def build_public_audit_export(*, election: Election) -> dict[str, object]:
+    return {
+        "algorithm": _public_audit_algorithm(election=election),
+        "audit_log": list(_iter_public_audit_events(election=election)),
+    }
+
+
+def _iter_sorted_json_object(fields: dict[str, object]) -> Iterator[str]:
+    """Encode a JSON object piece by piece.
+
+    The output is identical to ``json.dumps(obj, cls=DjangoJSONEncoder,
+    sort_keys=True)`` for the materialized object. A value that is an iterator
+    is written as a JSON array one element at a time; a zero-argument callable
+    is called when its key is reached, after every earlier value is written.
+    """
+    encoder = DjangoJSONEncoder(sort_keys=True)
+    yield "{"
+    for index, key in enumerate(sorted(fields)):
+        if index:
+            yield ", "
+        yield encoder.encode(key)
+        yield ": "
+        value = fields[key]
+        if isinstance(value, Iterator):
+            yield "["
+            for item_index, item in enumerate(value):
+                if item_index:
+                    yield ", "
+                yield encoder.encode(item)
+            yield "]"
+        else:
+            if callable(value):
+                value = value()
+            yield encoder.encode(value)
+    yield "}"
+
+
+def _spool_json_object(*, name: str, fields: dict[str, object]) -> File:
+    spool = tempfile.SpooledTemporaryFile(max_size=_PUBLIC_EXPORT_SPOOL_MAX_BYTES)
+    for chunk in _iter_sorted_json_object(fields):
+        spool.write(chunk.encode("utf-8"))
+    spool.seek(0)
+    return File(spool, name=name)
+
+
 def persist_public_election_artifacts(*, election: Election) -> None:
-    ballots_payload = build_public_ballots_export(election=election)
-    audit_payload = build_public_audit_export(election=election)
+    """Write the public ballot and audit artifacts to storage.
 
-    ballots_content = ContentFile(
-        json.dumps(ballots_payload, cls=DjangoJSONEncoder, sort_keys=True).encode("utf-8")
+    Both files are encoded incrementally from the database into a spooled
+    temporary file, so memory stays flat as ballot count grows; the bytes match
+    ``json.dumps(build_public_*_export(...), sort_keys=True)``.
+    """
+    chain_state: dict[str, str] = {}
+    ballots_content = _spool_json_object(
+        name="public-ballots.json",
+        fields={
+            "ballots": _iter_public_ballots(election=election, chain_state=chain_state),
+            "chain_head": lambda: chain_state["chain_head"],
+        },
     )
-    audit_content = ContentFile(
-        json.dumps(audit_payload, cls=DjangoJSONEncoder, sort_keys=True).encode("utf-8")
+    audit_content = _spool_json_object(
+        name="public-audit.json",
+        fields={
+            "algorithm": _public_audit_algorithm(election=election),
+            "audit_log": _iter_public_audit_events(election=election),
+        },
     )
 
-    election.public_ballots_file.save("public-ballots.json", ballots_content, save=False)
-    election.public_audit_file.save("public-audit.json", audit_content, save=False)
+    with ballots_content, audit_content:
+        election.public_ballots_file.save("public-ballots.json", ballots_content, save=False)
+        election.public_audit_file.save("public-audit.json", audit_content, save=False)
     election.artifacts_generated_at = timezone.now()
     election.save(update_fields=["public_ballots_file", "public_audit_file", "artifacts_generated_at"])
 
@@ -528,27 +604,31 @@ def election_quorum_status(*, election: Election) -> dict[str, int | bool]:
     """Return the election's current quorum/turnout status.
 
     Prefer issued credentials when they exist, since they represent the
-    election's frozen eligibility snapshot.
+    election's frozen eligibility snapshot. Non-draft elections read the
+    maintained `ElectionTurnout` counters.
     """
 
-    quorum_percent = int(election.quorum or 0)
-
-    credentials_qs = VotingCredential.objects.filter(election=election, weight__gt=0)
     if election.status != Election.Status.draft:
-        cred_agg = credentials_qs.aggregate(voters=Count("id"), votes=Sum("weight"))
-        eligible_voter_count = int(cred_agg.get("voters") or 0)
-        eligible_vote_weight_total = int(cred_agg.get("votes") or 0)
+        counts = election_turnout_counts(election=election)
     else:
         eligible = start_eligible_voters(election=election)
-        eligible_voter_count = len(eligible)
-        eligible_vote_weight_total = sum(v.weight for v in eligible)
+        participating = compute_election_turnout(election_id=election.id)
+        counts = {
+            "eligible_voter_count": len(eligible),
+            "eligible_vote_weight_total": sum(v.weight for v in eligible),
+            "participating_voter_count": participating["participating_voter_count"],
+            "participating_vote_weight_total": participating["participating_vote_weight_total"],
+        }
+    return quorum_status_from_counts(election=election, counts=counts)
 
-    ballot_agg = Ballot.objects.for_election(election=election).final().aggregate(
-        ballots=Count("id"),
-        weight_total=Sum("weight"),
-    )
-    participating_voter_count = int(ballot_agg.get("ballots") or 0)
-    participating_vote_weight_total = int(ballot_agg.get("weight_total") or 0)
+
+def quorum_status_from_counts(*, election: Election, counts: TurnoutCounts) -> dict[str, int | bool]:
+    """Derive the `election_quorum_status` payload from turnout counts."""
+    quorum_percent = int(election.quorum or 0)
+    eligible_voter_count = int(counts["eligible_voter_count"])
+    eligible_vote_weight_total = int(counts["eligible_vote_weight_total"])
+    participating_voter_count = int(counts["participating_voter_count"])
+    participating_vote_weight_total = int(counts["participating_vote_weight_total"])
 
     required_participating_voter_count = 0
     required_participating_vote_weight_total = 0
@@ -582,14 +662,117 @@ def election_quorum_status(*, election: Election) -> dict[str, int | bool]:
     }
 
 
+def _evaluate_quorum(*, election_id: int) -> None:
+    committed_election = Election.objects.only("id", "status", "quorum").get(pk=election_id)
+    quorum_entry = (
+        AuditLogEntry.objects.filter(election_id=election_id, event_type="quorum_reached")
+        .only("id", "rekor_log_id")
+        .first()
+    )
+    if quorum_entry is not None and quorum_entry.rekor_log_id:
+        # Participation only grows while the election is open, so once the
+        # attested entry exists there is nothing left to do.
+        return
+
+    status = election_quorum_status(election=committed_election)
+    required_participating_voter_count = int(status["required_participating_voter_count"])
+    required_participating_vote_weight_total = int(status["required_participating_vote_weight_total"])
+    quorum_met = bool(status["quorum_met"])
+    if required_participating_voter_count and required_participating_vote_weight_total and quorum_met:
+        quorum_entry, created = AuditLogEntry.objects.get_or_create(
+            election=committed_election,
+            event_type="quorum_reached",
+            defaults={"payload": status, "is_public": True},
+        )
+        if created or not quorum_entry.rekor_log_id:
+            schedule_attestation(quorum_entry)
+        if created:
+            astra_signals.election_quorum_met.send(
+                sender=Election,
+                election=committed_election,
+            )
+
+
+def _evaluate_quorum_coalesced(*, election_id: int) -> None:
+    """Run the post-vote quorum check, coalescing concurrent requests.
+
+    During a vote burst every commit asks for an evaluation. Only one worker
+    evaluates a given election at a time; the others just mark the election
+    dirty and return. The evaluating worker re-runs while the mark is set, so
+    the last ballot of a burst is always covered.
+    """
+    pending_key = f"{_QUORUM_EVAL_CACHE_PREFIX}:{election_id}:pending"
+    running_key = f"{_QUORUM_EVAL_CACHE_PREFIX}:{election_id}:running"
+    try:
+        cache.set(pending_key, True, timeout=_QUORUM_EVAL_LOCK_SECONDS)
+        while cache.add(running_key, True, timeout=_QUORUM_EVAL_LOCK_SECONDS):
+            try:
+                cache.delete(pending_key)
+                _evaluate_quorum(election_id=election_id)
+            finally:
+                cache.delete(running_key)
+            if not cache.get(pending_key):
+                break
+    except Exception:
+        logger.exception(
+            "Deferred quorum evaluation failed for election_id=%s",
+            election_id,
+            extra=current_exception_log_fields(),
+        )
+
+
+def _initial_chain_hash(*, election: Election) -> str:
+    last_chain_hash = Ballot.objects.latest_chain_head_hash_for_election(election=election)
+    return str(last_chain_hash or election_genesis_chain_hash(election.id))
+
+
+def _lock_chain_head(*, election: Election) -> ElectionChainHead:
+    """Return the election's chain head row locked with SELECT FOR UPDATE.
+
+    The row is created on first use. Elections that already have ballots start
+    from their latest ballot so the chain continues unbroken.
+    """
+    try:
+        return ElectionChainHead.objects.select_for_update().get(election_id=election.id)
+    except ElectionChainHead.DoesNotExist:
+        pass
+
+    # get_or_create() absorbs the IntegrityError when a concurrent first vote
+    # creates the row; both callers then queue on the lock below.
+    ElectionChainHead.objects.get_or_create(
+        election_id=election.id,
+        defaults={"chain_hash": _initial_chain_hash(election=election)},
+    )
+    return ElectionChainHead.objects.select_for_update().get(election_id=election.id)
+
+
+@transaction.atomic
+def reconcile_election_turnout(*, election: Election) -> tuple[TurnoutCounts, TurnoutCounts | None]:
+    """Rebuild an election's turnout counters from its credentials and ballots.
+
+    Holds the chain head lock so no ballot lands between the aggregate and the
+    write. Returns ``(rebuilt, previous)`` as `rebuild_election_turnout` does.
+    """
+    _lock_chain_head(election=election)
+    return rebuild_election_turnout(election_id=election.id)
+
+
 @transaction.atomic
 def submit_ballot(*, election: Election, credential_public_id: str, ranking: list[int]) -> BallotReceipt:
     """Record a voter's ranking for an election.
 
-    Status enforcement: the election row is fetched under SELECT FOR UPDATE so
-    that a concurrent `close_election()` call cannot race past this check.  Any
-    status other than ``open`` raises `ElectionNotOpenError` and no Ballot row
-    is created or modified.
+    Locking: everything that does not depend on the chain (credential lookup,
+    ranking validation, the ballot hash) happens before any lock is taken.
+    Appending to the chain then locks the election's `ElectionChainHead` row,
+    which serializes submissions for that election (including re-submissions
+    from the same credential) without locking the Election row itself.
+
+    Status enforcement: the status is re-read after the chain head lock is
+    held. `close_election()` locks the same row, so a concurrent close either
+    commits first (and this call raises `ElectionNotOpenError`) or waits for
+    this ballot to commit and records it in its ``chain_head``. Any status
+    other than ``open`` raises `ElectionNotOpenError` and no Ballot row is
+    created or modified.
 
     Receipt / coercion-resistance note:
     The returned `BallotReceipt` contains `(ballot_hash, nonce, chain_hash)`.  A
@@ -599,20 +782,23 @@ def submit_ballot(*, election: Election, credential_public_id: str, ranking: lis
     resistance: receipts can be used to prove how a specific ballot was ranked.
     The system does not implement mechanisms to deny or obscure a submitted ranking.
     """
-    election = Election.objects.select_for_update().get(pk=election.pk)
+    election = Election.objects.get(pk=election.pk)
     if election.status != Election.Status.open:
         raise ElectionNotOpenError("election is not open")
 
-    try:
-        credential = VotingCredential.objects.select_for_update().get(
+    credential_weight = (
+        VotingCredential.objects.filter(
             election=election,
             public_id=credential_public_id,
         )
-    except VotingCredential.DoesNotExist as exc:
-        raise InvalidCredentialError("invalid credential") from exc
+        .values_list("weight", flat=True)
+        .first()
+    )
+    if credential_weight is None:
+        raise InvalidCredentialError("invalid credential")
 
     sanitized_ranking = _sanitize_ranking(election=election, ranking=ranking)
-    weight = int(credential.weight)
+    weight = int(credential_weight)
 
     # Include a random nonce in the hash input so identical re-submissions get
     # distinct receipts. This nonce is intentionally not stored.
@@ -625,17 +811,19 @@ def submit_ballot(*, election: Election, credential_public_id: str, ranking: lis
         nonce=nonce,
     )
 
-    last_chain_hash = Ballot.objects.latest_chain_head_hash_for_election(election=election)
-    genesis_hash = election_genesis_chain_hash(election.id)
-    previous_chain_hash = str(last_chain_hash or genesis_hash)
+    chain_head = _lock_chain_head(election=election)
+    status = Election.objects.filter(pk=election.pk).values_list("status", flat=True).first()
+    if status != Election.Status.open:
+        raise ElectionNotOpenError("election is not open")
+
+    previous_chain_hash = chain_head.chain_hash
     chain_hash = election_chain_next_hash(previous_chain_hash=previous_chain_hash, ballot_hash=ballot_hash)
 
     current = (
-        Ballot.objects.select_for_update()
-        .for_election(election=election)
+        Ballot.objects.for_election(election=election)
         .final()
         .filter(credential_public_id=credential_public_id)
-        .order_by("-id")
+        .only("id", "ballot_hash", "weight")
         .first()
     )
 
@@ -677,7 +865,16 @@ def submit_ballot(*, election: Election, credential_public_id: str, ranking: lis
             superseded_by=None,
             is_counted=True,
         )
-        ballot.refresh_from_db(fields=["superseded_by", "is_counted"])
+        ballot.superseded_by = None
+        ballot.is_counted = True
+
+    chain_head.chain_hash = chain_hash
+    chain_head.save(update_fields=["chain_hash", "updated_at"])
+    record_ballot_turnout(
+        election_id=election.id,
+        voter_delta=0 if current is not None else 1,
+        weight_delta=weight - (int(current.weight) if current is not None else 0),
+    )
 
     payload: dict[str, object] = {"ballot_hash": ballot_hash}
     if supersedes_ballot_hash:
@@ -690,34 +887,9 @@ def submit_ballot(*, election: Election, credential_public_id: str, ranking: lis
         is_public=False,
     )
 
-    def _evaluate_quorum_after_commit() -> None:
-        try:
-            committed_election = Election.objects.only("id", "status", "quorum").get(pk=election.id)
-            status = election_quorum_status(election=committed_election)
-            required_participating_voter_count = int(status["required_participating_voter_count"])
-            required_participating_vote_weight_total = int(status["required_participating_vote_weight_total"])
-            quorum_met = bool(status["quorum_met"])
-            if required_participating_voter_count and required_participating_vote_weight_total and quorum_met:
-                quorum_entry, created = AuditLogEntry.objects.get_or_create(
-                    election=committed_election,
-                    event_type="quorum_reached",
-                    defaults={"payload": status, "is_public": True},
-                )
-                if created or not quorum_entry.rekor_log_id:
-                    schedule_attestation(quorum_entry)
-                if created:
-                    astra_signals.election_quorum_met.send(
-                        sender=Election,
-                        election=committed_election,
-                    )
-        except Exception:
-            logger.exception(
-                "Deferred quorum evaluation failed for election_id=%s",
-                election.id,
-                extra=current_exception_log_fields(),
-            )
-
-    transaction.on_commit(_evaluate_quorum_after_commit)
+    if int(election.quorum or 0) > 0:
+        election_id = election.id
+        transaction.on_commit(lambda: _evaluate_quorum_coalesced(election_id=election_id))
 
     return BallotReceipt(
         ballot=ballot,
@@ -916,6 +1088,7 @@ def issue_credentials_at_start_transition(*, election: Election) -> list[VotingC
 
     credentials = _issue_voting_credentials_from_memberships(election=election)
     _populate_election_roll(election=election)
+    rebuild_election_turnout(election_id=election.id)
     return credentials
 
 
@@ -979,7 +1152,9 @@ def close_election(*, election: Election, actor: str | None = None) -> None:
     """Close an open election, anonymize credentials, and record a public audit event.
 
     Sequence (all within a single transaction):
-    1. Lock the election row (SELECT FOR UPDATE) and verify status is ``open``.
+    1. Lock the election's chain head row, which ``submit_ballot`` holds while
+       appending a ballot, then lock the election row (SELECT FOR UPDATE) and
+       verify status is ``open``.
     2. Set ``status = closed`` and ``end_datetime = now``.
     3. Call :func:`anonymize_election`, which:
        - Nulls ``VotingCredential.freeipa_username`` for all election credentials.
@@ -994,14 +1169,16 @@ def close_election(*, election: Election, actor: str | None = None) -> None:
     """
     try:
         with transaction.atomic():
+            # Waits for any in-flight submit_ballot() to commit; later ones see
+            # the closed status once they get the lock. The chain head is locked
+            # before the election row because a ballot insert holding the chain
+            # head takes a key-share lock on the election for its foreign key.
+            chain_head = _lock_chain_head(election=election).chain_hash
             election = Election.objects.select_for_update().get(pk=election.pk)
             if election.status != Election.Status.open:
                 raise ElectionError("election must be open to close")
 
             ended_at = timezone.now()
-            last_chain_hash = Ballot.objects.latest_chain_head_hash_for_election(election=election)
-            genesis_hash = election_genesis_chain_hash(election.id)
-            chain_head = str(last_chain_hash or genesis_hash)
 
             election.status = Election.Status.closed
             election.end_datetime = ended_at
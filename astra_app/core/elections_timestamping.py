@@ -4,6 +4,7 @@ import base64
 import hashlib
 import json
 import logging
+from collections.abc import Sequence
 from datetime import UTC, datetime
 from typing import Any
 
@@ -14,7 +15,8 @@ from django.conf import settings
 from django.db import transaction
 
 from core.logging_extras import current_exception_log_fields
-from core.models import AuditLogEntry
+from core.models import AuditLogEntry, OutboxMessage
+from core.outbox import DeliveryFailure, enqueue_outbox_messages
 
 logger = logging.getLogger(__name__)
 
@@ -228,6 +230,11 @@ def _write_attestation_failed(entry_id: int, error_type: str) -> None:
 
 
 def schedule_attestation(entry: AuditLogEntry) -> None:
+    """Queue a Rekor attestation for ``entry`` in the outbox.
+
+    The row commits with the audit entry; `outbox_drain` performs the upload
+    and records `rekor_attestation_failed` once retries are exhausted.
+    """
     endpoint = str(settings.ELECTION_REKOR_ENDPOINT or "").strip()
     signing_key = str(settings.ELECTION_REKOR_SIGNING_KEY or "").strip()
 
@@ -236,31 +243,52 @@ def schedule_attestation(entry: AuditLogEntry) -> None:
     if entry.event_type not in ATTESTED_EVENT_TYPES:
         return
 
-    def _on_commit() -> None:
-        try:
-            try:
-                _attest_entry(entry)
-            except Exception as exc:
-                logger.exception(
-                    "Rekor attestation failed for audit entry id=%s",
-                    entry.id,
-                    extra=current_exception_log_fields(),
-                )
-                try:
-                    _write_attestation_failed(entry_id=entry.id, error_type=type(exc).__name__)
-                except Exception:
-                    pass
-        except Exception:
-            pass
-
     try:
-        if transaction.get_connection().in_atomic_block:
-            transaction.on_commit(_on_commit)
-        else:
-            _on_commit()
+        # A savepoint keeps a failed insert from breaking the caller's transaction.
+        with transaction.atomic():
+            already_queued = OutboxMessage.objects.filter(
+                kind=OutboxMessage.Kind.rekor_attestation,
+                status__in=[OutboxMessage.Status.pending, OutboxMessage.Status.running],
+                payload__audit_log_entry_id=entry.id,
+            ).exists()
+            if already_queued:
+                return
+            enqueue_outbox_messages(
+                kind=OutboxMessage.Kind.rekor_attestation,
+                payloads=[{"audit_log_entry_id": entry.id}],
+            )
     except Exception:
         logger.exception(
             "Rekor attestation scheduling failed for audit entry id=%s",
             entry.id,
             extra=current_exception_log_fields(),
         )
+
+
+def deliver_attestation_batch(messages: Sequence[OutboxMessage]) -> dict[int, DeliveryFailure]:
+    """Outbox handler: upload each queued audit entry to Rekor."""
+    entries = AuditLogEntry.objects.in_bulk(
+        {message.payload.get("audit_log_entry_id") for message in messages if message.payload.get("audit_log_entry_id")}
+    )
+    failures: dict[int, DeliveryFailure] = {}
+    for message in messages:
+        entry = entries.get(message.payload.get("audit_log_entry_id"))
+        if entry is None:
+            failures[message.pk] = DeliveryFailure(error="audit_entry_missing", retryable=False)
+            continue
+        try:
+            _attest_entry(entry)
+        except Exception as exc:
+            logger.exception(
+                "Rekor attestation failed for audit entry id=%s",
+                entry.id,
+                extra=current_exception_log_fields(),
+            )
+            failures[message.pk] = DeliveryFailure(error=type(exc).__name__)
+    return failures
+
+
+def record_attestation_gave_up(message: OutboxMessage, failure: DeliveryFailure) -> None:
+    entry_id = message.payload.get("audit_log_entry_id")
+    if entry_id:
+        _write_attestation_failed(entry_id=int(entry_id), error_type=failure.error)
@@ -0,0 +1,92 @@
+from collections.abc import Iterable
+from typing import TypedDict
+
+from django.db.models import Count, F, Sum
+from django.utils import timezone
+
+from core.models import Ballot, Election, ElectionTurnout, VotingCredential
+
+
+class TurnoutCounts(TypedDict):
+    eligible_voter_count: int
+    eligible_vote_weight_total: int
+    participating_voter_count: int
+    participating_vote_weight_total: int
+
+
+def _counts_from_row(row: ElectionTurnout) -> TurnoutCounts:
+    return {
+        "eligible_voter_count": int(row.eligible_voter_count),
+        "eligible_vote_weight_total": int(row.eligible_vote_weight_total),
+        "participating_voter_count": int(row.participating_voter_count),
+        "participating_vote_weight_total": int(row.participating_vote_weight_total),
+    }
+
+
+def compute_election_turnout(*, election_id: int) -> TurnoutCounts:
+    """Aggregate turnout from the credential and ballot tables."""
+    credential_agg = VotingCredential.objects.filter(election_id=election_id, weight__gt=0).aggregate(
+        voters=Count("id"),
+        votes=Sum("weight"),
+    )
+    ballot_agg = Ballot.objects.filter(election_id=election_id).final().aggregate(
+        ballots=Count("id"),
+        weight_total=Sum("weight"),
+    )
+    return {
+        "eligible_voter_count": int(credential_agg.get("voters") or 0),
+        "eligible_vote_weight_total": int(credential_agg.get("votes") or 0),
+        "participating_voter_count": int(ballot_agg.get("ballots") or 0),
+        "participating_vote_weight_total": int(ballot_agg.get("weight_total") or 0),
+    }
+
+
+def rebuild_election_turnout(*, election_id: int) -> tuple[TurnoutCounts, TurnoutCounts | None]:
+    """Recompute an election's counters and store them.
+
+    Returns ``(rebuilt, previous)``; ``previous`` is None when no row existed.
+    Callers that can race with ballot submission must hold the election's chain
+    head lock.
+    """
+    rebuilt = compute_election_turnout(election_id=election_id)
+    existing = ElectionTurnout.objects.filter(election_id=election_id).first()
+    previous = _counts_from_row(existing) if existing is not None else None
+    ElectionTurnout.objects.update_or_create(election_id=election_id, defaults=dict(rebuilt))
+    return rebuilt, previous
+
+
+def record_ballot_turnout(*, election_id: int, voter_delta: int, weight_delta: int) -> None:
+    """Apply a ballot submission to the participating counters.
+
+    Must run in the submitting transaction, under the chain head lock. A
+    missing row is rebuilt from the tables, which already include the new
+    ballot.
+    """
+    updated = ElectionTurnout.objects.filter(election_id=election_id).update(
+        participating_voter_count=F("participating_voter_count") + voter_delta,
+        participating_vote_weight_total=F("participating_vote_weight_total") + weight_delta,
+        updated_at=timezone.now(),
+    )
+    if not updated:
+        rebuild_election_turnout(election_id=election_id)
+
+
+def election_turnout_counts(*, election: Election) -> TurnoutCounts:
+    """Return turnout counts for a non-draft election, from counters when present."""
+    row = ElectionTurnout.objects.filter(election_id=election.id).first()
+    if row is None:
+        return compute_election_turnout(election_id=election.id)
+    return _counts_from_row(row)
+
+
+def election_turnout_counts_by_id(*, elections: Iterable[Election]) -> dict[int, TurnoutCounts]:
+    """Bulk variant of :func:`election_turnout_counts` for reports."""
+    election_ids = [election.id for election in elections]
+    counts = {
+        row.election_id: _counts_from_row(row)
+        for row in ElectionTurnout.objects.filter(election_id__in=election_ids)
+    }
+    for election_id in election_ids:
+        if election_id not in counts:
+            counts[election_id] = compute_election_turnout(election_id=election_id)
+    return counts
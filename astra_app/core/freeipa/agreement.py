@@ -2,11 +2,11 @@ from __future__ import annotations
 
 import logging
 
-from django.core.cache import cache
 from python_freeipa import ClientMeta, exceptions
 
 from core.freeipa.client import _with_freeipa_service_client_retry
 from core.freeipa.exceptions import FreeIPAOperationFailed
+from core.freeipa.local_cache import freeipa_local_cache
 from core.freeipa.user import _FreeIPAClientMixin
 from core.freeipa.utils import (
     _agreement_cache_key,
@@ -82,7 +82,7 @@ class FreeIPAFASAgreement(_FreeIPAClientMixin):
     @classmethod
     def all(cls) -> list[FreeIPAFASAgreement]:
         cache_key = _agreements_list_cache_key()
-        cached = cache.get(cache_key)
+        cached = freeipa_local_cache.get_shared(cache_key)
         if cached is not None:
             agreements = cached or []
         else:
@@ -97,7 +97,7 @@ class FreeIPAFASAgreement(_FreeIPAClientMixin):
                     ),
                 )
                 agreements = (result or {}).get("result", []) if isinstance(result, dict) else []
-                cache.set(cache_key, agreements)
+                freeipa_local_cache.set_shared(cache_key, agreements)
             except Exception as e:
                 logger.exception(
                     f"Failed to list FAS agreements: {e}",
@@ -120,7 +120,7 @@ class FreeIPAFASAgreement(_FreeIPAClientMixin):
     @classmethod
     def get(cls, cn: str) -> FreeIPAFASAgreement | None:
         cache_key = _agreement_cache_key(cn)
-        cached = cache.get(cache_key)
+        cached = freeipa_local_cache.get_shared(cache_key)
         if cached is not None:
             return cls(cn, cached)
 
@@ -136,7 +136,7 @@ class FreeIPAFASAgreement(_FreeIPAClientMixin):
             )
             if isinstance(result, dict) and isinstance(result.get("result"), dict):
                 data = result["result"]
-                cache.set(cache_key, data)
+                freeipa_local_cache.set_shared(cache_key, data)
                 return cls(cn, data)
         except Exception as e:
             logger.exception(
@@ -5,6 +5,8 @@ import requests
 from django.conf import settings
 from django.core.cache import cache
 
+from core.freeipa.local_cache import freeipa_local_cache
+
 logger = logging.getLogger("core.backends")
 
 _FREEIPA_CIRCUIT_OPEN_CACHE_KEY = "freeipa_circuit_open"
@@ -13,6 +15,10 @@ _FREEIPA_CIRCUIT_FAILURES_CACHE_KEY = "freeipa_circuit_consecutive_failures"
 _ELECTIONS_FREEIPA_CIRCUIT_CACHE_KEY = "freeipa_elections_circuit_open"
 _ELECTIONS_FREEIPA_CIRCUIT_FAILURES_CACHE_KEY = "freeipa_elections_circuit_consecutive_failures"
 
+# The open flags are checked before every FreeIPA call; workers keep their view
+# of them for a couple of seconds instead of reading the shared cache each time.
+_CIRCUIT_FLAG_LOCAL_TTL_SECONDS = 2
+
 
 def _log_circuit_breaker_transition(
     *,
@@ -45,7 +51,7 @@ def _log_circuit_breaker_transition(
 
 def _freeipa_circuit_open() -> bool:
     try:
-        return bool(cache.get(_FREEIPA_CIRCUIT_OPEN_CACHE_KEY))
+        return bool(freeipa_local_cache.get(_FREEIPA_CIRCUIT_OPEN_CACHE_KEY, local_ttl=_CIRCUIT_FLAG_LOCAL_TTL_SECONDS))
     except Exception:
         return False
 
@@ -58,6 +64,8 @@ def _open_freeipa_circuit(*, failure_count: int = 0) -> None:
         cache.add(_FREEIPA_CIRCUIT_OPEN_CACHE_KEY, True, timeout=cooldown_seconds)
     except Exception:
         return
+    if not was_open:
+        freeipa_local_cache.invalidate(_FREEIPA_CIRCUIT_OPEN_CACHE_KEY)
 
     if not was_open and _freeipa_circuit_open():
         _log_circuit_breaker_transition(
@@ -79,6 +87,7 @@ def _reset_freeipa_circuit_failures() -> None:
         return
 
     if was_open:
+        freeipa_local_cache.invalidate(_FREEIPA_CIRCUIT_OPEN_CACHE_KEY)
         _log_circuit_breaker_transition(
             breaker_name="freeipa.general",
             from_state="open",
@@ -104,7 +113,7 @@ def _record_freeipa_availability_failure() -> None:
 
 def _elections_freeipa_circuit_open() -> bool:
     try:
-        return bool(cache.get(_ELECTIONS_FREEIPA_CIRCUIT_CACHE_KEY))
+        return bool(freeipa_local_cache.get(_ELECTIONS_FREEIPA_CIRCUIT_CACHE_KEY, local_ttl=_CIRCUIT_FLAG_LOCAL_TTL_SECONDS))
     except Exception:
         return False
 
@@ -117,6 +126,8 @@ def _open_elections_freeipa_circuit(*, failure_count: int = 0) -> None:
         cache.add(_ELECTIONS_FREEIPA_CIRCUIT_CACHE_KEY, True, timeout=cooldown_seconds)
     except Exception:
         return
+    if not was_open:
+        freeipa_local_cache.invalidate(_ELECTIONS_FREEIPA_CIRCUIT_CACHE_KEY)
 
     if not was_open and _elections_freeipa_circuit_open():
         _log_circuit_breaker_transition(
@@ -138,6 +149,7 @@ def _reset_elections_freeipa_circuit_failures() -> None:
         return
 
     if was_open:
+        freeipa_local_cache.invalidate(_ELECTIONS_FREEIPA_CIRCUIT_CACHE_KEY)
         _log_circuit_breaker_transition(
             breaker_name="freeipa.elections",
             from_state="open",
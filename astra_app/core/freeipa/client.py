@@ -1,7 +1,8 @@
 import json
 import logging
 import threading
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
 from typing import override
 
 import requests
@@ -19,8 +20,10 @@ from core.freeipa.e2e_registry import (
     get_e2e_service_client,
     is_e2e_fake_freeipa_enabled,
 )
-from core.freeipa.exceptions import FreeIPAUnavailableError
+from core.freeipa.exceptions import FreeIPAOperationFailed, FreeIPAUnavailableError
+from core.freeipa.utils import _compact_repr
 from core.logging_extras import current_exception_log_fields
+from core.request_profiling import current_request_profile
 
 logger = logging.getLogger("core.backends")
 
@@ -28,6 +31,7 @@ _service_client_local = threading.local()
 _viewer_username_local = threading.local()
 
 _FREEIPA_REQUEST_TIMEOUT_SECONDS: int = settings.FREEIPA_REQUEST_TIMEOUT_SECONDS
+_FREEIPA_BATCH_CHUNK_SIZE: int = settings.FREEIPA_BATCH_CHUNK_SIZE
 
 
 def _freeipa_rpc_span_data_from_body(body: object) -> dict[str, object] | None:
@@ -89,7 +93,22 @@ def _freeipa_response_size_bytes(response: requests.Response) -> int | None:
     return None
 
 
+def _record_freeipa_response_profile(response: requests.Response) -> None:
+    profile = current_request_profile()
+    if profile is None:
+        return
+    request_body = response.request.body if response.request is not None else None
+    span_data = _freeipa_rpc_span_data_from_body(request_body)
+    method = str(span_data["freeipa.rpc_method"]) if span_data is not None else "other"
+    profile.record_freeipa_rpc(
+        method,
+        response_bytes=_freeipa_response_size_bytes(response),
+        seconds=response.elapsed.total_seconds(),
+    )
+
+
 def _annotate_freeipa_response_span(response: requests.Response, *_args: object, **_kwargs: object) -> requests.Response:
+    _record_freeipa_response_profile(response)
     raw_response = response.raw
     connection = getattr(raw_response, "connection", None) or getattr(raw_response, "_connection", None)
     span = getattr(connection, "_sentrysdk_span", None)
@@ -266,6 +285,75 @@ def _with_freeipa_service_client_retry[T](get_client: Callable[[], ClientMeta],
     return result
 
 
+@dataclass(frozen=True, slots=True)
+class FreeIPABatchCall:
+    """One JSON-RPC sub-call packed into a FreeIPA ``batch`` request.
+
+    ``params`` use the raw API option names (``all``, ``no_members``), not the
+    ``o_``-prefixed keyword arguments of python-freeipa's generated methods.
+    """
+
+    method: str
+    args: tuple[object, ...] = ()
+    params: dict[str, object] = field(default_factory=dict)
+
+    def as_payload(self) -> dict[str, object]:
+        return {"method": self.method, "params": [list(self.args), dict(self.params)]}
+
+
+def _freeipa_batch_item_error(item: object) -> exceptions.FreeIPAError | None:
+    """Map a failed ``batch`` sub-result to the exception the call would raise alone."""
+    if not isinstance(item, dict):
+        return exceptions.FreeIPAError(message=f"unexpected FreeIPA batch item: {_compact_repr(item)}")
+
+    error = item.get("error")
+    if not error:
+        return None
+
+    if isinstance(error, dict):
+        message = str(error.get("message") or error)
+        code = error.get("code")
+    else:
+        message = str(error)
+        code = item.get("error_code")
+    exception_class = exceptions.error_codes.get(code, exceptions.BadRequest)
+    return exception_class(message, code)
+
+
+def _with_freeipa_service_client_batch(
+    get_client: Callable[[], ClientMeta],
+    calls: Sequence[FreeIPABatchCall],
+    *,
+    chunk_size: int | None = None,
+) -> list[dict[str, object] | exceptions.FreeIPAError]:
+    """Run many read calls through FreeIPA's ``batch`` command.
+
+    Calls are packed ``chunk_size`` per round-trip (``FREEIPA_BATCH_CHUNK_SIZE``
+    by default). The return value has one entry per call, in order: the
+    sub-call's result payload, or the FreeIPA exception it would have raised on
+    its own. Transport and session failures raise for the whole chunk, with the
+    same retry and circuit-breaker handling as single calls.
+    """
+    size = max(1, chunk_size or _FREEIPA_BATCH_CHUNK_SIZE)
+    outcomes: list[dict[str, object] | exceptions.FreeIPAError] = []
+    for start in range(0, len(calls), size):
+        chunk = calls[start:start + size]
+        payload = [call.as_payload() for call in chunk]
+        response = _with_freeipa_service_client_retry(
+            get_client,
+            lambda client: client.batch(a_methods=payload),
+        )
+        items = response.get("results") if isinstance(response, dict) else None
+        if not isinstance(items, list) or len(items) != len(chunk):
+            raise FreeIPAOperationFailed(
+                f"FreeIPA batch returned an unexpected response for {len(chunk)} calls: {_compact_repr(response)}"
+            )
+        for item in items:
+            error = _freeipa_batch_item_error(item)
+            outcomes.append(error if error is not None else item)
+    return outcomes
+
+
 __all__ = [
     "_annotate_freeipa_response_span",
     "_FreeIPATimeoutSession",
@@ -279,4 +367,6 @@ __all__ = [
     "clear_current_viewer_username",
     "_get_current_viewer_username",
     "_with_freeipa_service_client_retry",
+    "FreeIPABatchCall",
+    "_with_freeipa_service_client_batch",
 ]
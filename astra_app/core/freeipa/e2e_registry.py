@@ -511,6 +511,25 @@ class E2EFreeIPAClient:
 
         raise exceptions.BadRequest(f"unsupported e2e fake FreeIPA method: {method}")
 
+    def batch(self, a_methods: list[dict[str, object]] | None = None, **kwargs: object) -> dict[str, object]:
+        del kwargs
+        results: list[dict[str, object]] = []
+        for call in a_methods or []:
+            method = str(call.get("method") or "")
+            call_args, call_params = cast(list[object], call.get("params") or [[], {}])
+            handler = getattr(self, method, None) if method != "batch" else None
+            try:
+                if handler is None:
+                    result = self._request(method, list(cast(list[object], call_args)), dict(cast(dict[str, object], call_params)))
+                else:
+                    option_kwargs = {f"o_{key}": value for key, value in cast(dict[str, object], call_params).items()}
+                    result = handler(*cast(list[object], call_args), **option_kwargs)
+            except exceptions.FreeIPAError as exc:
+                results.append({"error": str(exc), "error_code": getattr(exc, "code", None), "error_name": type(exc).__name__})
+                continue
+            results.append({**result, "error": None})
+        return {"count": len(results), "results": results}
+
     def user_mod(self, username: str | None = None, *args: object, **kwargs: object) -> dict[str, object]:
         del args
 
@@ -718,7 +737,7 @@ class E2EFreeIPAClient:
         del args, kwargs
         user = _registry_user(username)
         if user is None:
-            raise exceptions.BadRequest("user not found")
+            raise exceptions.NotFound("user not found")
         return {"result": user}
 
     def user_find(self, *args: object, **kwargs: object) -> dict[str, object]:
@@ -1,4 +1,8 @@
 import logging
+import threading
+import time
+from collections.abc import Collection, Iterable
+from dataclasses import dataclass
 
 from django.conf import settings
 from django.core.cache import cache
@@ -10,18 +14,25 @@ from core.freeipa.circuit_breaker import (
     _record_elections_freeipa_availability_failure,
     _reset_elections_freeipa_circuit_failures,
 )
-from core.freeipa.client import _with_freeipa_service_client_retry
+from core.freeipa.client import (
+    FreeIPABatchCall,
+    _with_freeipa_service_client_batch,
+    _with_freeipa_service_client_retry,
+)
 from core.freeipa.exceptions import (
     FreeIPAMisconfiguredError,
     FreeIPAOperationFailed,
     FreeIPAUnavailableError,
 )
+from core.freeipa.local_cache import freeipa_local_cache
 from core.freeipa.user import _FreeIPAClientMixin
 from core.freeipa.utils import (
+    _apply_group_membership_delta,
     _clean_str_list,
     _compact_repr,
     _group_cache_key,
     _groups_list_cache_key,
+    _groups_list_generation_cache_key,
     _invalidate_group_cache,
     _invalidate_groups_list_cache,
     _invalidate_user_cache,
@@ -48,7 +59,7 @@ def get_freeipa_group_for_elections(*, cn: str, require_fresh: bool = False) ->
 
     cache_key = _group_cache_key(group_cn)
     if not require_fresh:
-        cached_data = cache.get(cache_key)
+        cached_data = freeipa_local_cache.get(cache_key)
         if cached_data is not None:
             return FreeIPAGroup(group_cn, cached_data)
 
@@ -78,7 +89,7 @@ def get_freeipa_group_for_elections(*, cn: str, require_fresh: bool = False) ->
 
     _reset_elections_freeipa_circuit_failures()
 
-    cache.set(cache_key, group_data)
+    freeipa_local_cache.set(cache_key, group_data)
     return FreeIPAGroup(group_cn, group_data)
 
 
@@ -88,9 +99,12 @@ def resolve_materialized_team_leads_usernames() -> set[str]:
     if source_group is None:
         raise FreeIPAMisconfiguredError(f"FreeIPA group not found: {source_group_cn}")
 
+    closure = get_group_membership_closure()
     usernames: set[str] = set()
     for child_cn in sorted(set(source_group.member_groups), key=str.lower):
-        child_group = FreeIPAGroup.get(child_cn)
+        child_group = closure.group(child_cn) if closure is not None else None
+        if child_group is None:
+            child_group = FreeIPAGroup.get(child_cn)
         if child_group is None:
             raise FreeIPAMisconfiguredError(f"FreeIPA group not found: {child_cn}")
         usernames.update(child_group.sponsors)
@@ -233,7 +247,7 @@ class FreeIPAGroup(_FreeIPAClientMixin):
             return result.get('result', [])
 
         try:
-            groups = cache.get_or_set(_groups_list_cache_key(), _fetch_groups) or []
+            groups = freeipa_local_cache.get_or_set_shared(_groups_list_cache_key(), _fetch_groups) or []
             return [cls(g['cn'][0], g) for g in groups]
         except Exception as e:
             logger.exception(
@@ -248,7 +262,7 @@ class FreeIPAGroup(_FreeIPAClientMixin):
         Fetch a single group by cn.
         """
         cache_key = _group_cache_key(cn)
-        cached_data = cache.get(cache_key)
+        cached_data = freeipa_local_cache.get(cache_key)
 
         if cached_data is not None:
             return cls(cn, cached_data)
@@ -260,7 +274,7 @@ class FreeIPAGroup(_FreeIPAClientMixin):
             )
             if result['count'] > 0:
                 group_data = result['result'][0]
-                cache.set(cache_key, group_data)
+                freeipa_local_cache.set(cache_key, group_data)
                 return cls(cn, group_data)
         except Exception as e:
             logger.exception(
@@ -269,6 +283,56 @@ class FreeIPAGroup(_FreeIPAClientMixin):
             )
         return None
 
+    @classmethod
+    def get_many(cls, cns: Collection[str]) -> dict[str, FreeIPAGroup]:
+        """
+        Fetch several groups by cn, keyed by the cn as passed in.
+
+        Cache misses are fetched with batched ``group_find`` calls. Groups that
+        are missing or fail to load are omitted, like ``get()`` returning None.
+        """
+        wanted = list(dict.fromkeys(str(cn).strip() for cn in cns if str(cn or "").strip()))
+        if not wanted:
+            return {}
+
+        cns_by_key = {_group_cache_key(cn): cn for cn in wanted}
+        group_data_by_cn = {
+            cns_by_key[key]: group_data
+            for key, group_data in freeipa_local_cache.get_many(cns_by_key).items()
+            if group_data is not None
+        }
+
+        missing = [cn for cn in wanted if cn not in group_data_by_cn]
+        if missing:
+            try:
+                outcomes = _with_freeipa_service_client_batch(
+                    cls.get_client,
+                    [
+                        FreeIPABatchCall("group_find", params={"cn": cn, "all": True, "no_members": False})
+                        for cn in missing
+                    ],
+                )
+            except Exception as e:
+                logger.exception(
+                    f"Failed to get groups cns={missing}: {e}",
+                    extra=current_exception_log_fields(),
+                )
+                outcomes = []
+
+            fetched: dict[str, dict[str, object]] = {}
+            for cn, outcome in zip(missing, outcomes, strict=True):
+                if isinstance(outcome, Exception):
+                    logger.error("Failed to get group cn=%s: %s", cn, outcome)
+                    continue
+                if outcome.get("count", 0) > 0:
+                    fetched[cn] = outcome["result"][0]
+
+            if fetched:
+                freeipa_local_cache.set_many({_group_cache_key(cn): group_data for cn, group_data in fetched.items()})
+            group_data_by_cn.update(fetched)
+
+        return {cn: cls(cn, group_data_by_cn[cn]) for cn in wanted if cn in group_data_by_cn}
+
     @classmethod
     def create(cls, cn, description=None, fas_group: bool = False):
         """
@@ -425,6 +489,8 @@ class FreeIPAGroup(_FreeIPAClientMixin):
                 lambda client: client.group_add_member(self.cn, o_user=[username]),
             )
             _raise_if_freeipa_failed(res, action="group_add_member", subject=f"group={self.cn} user={username}")
+            if _apply_group_membership_delta(self.cn, [username], added=True, response=res):
+                return
             _invalidate_group_cache(self.cn)
             _invalidate_user_cache(username)
             _invalidate_groups_list_cache()
@@ -449,6 +515,59 @@ class FreeIPAGroup(_FreeIPAClientMixin):
             )
             raise
 
+    def add_members(self, usernames: Collection[str]) -> set[str]:
+        """Add several users with one ``group_add_member`` call.
+
+        Returns the usernames the updated group lists as members, including
+        users that already were. Users FreeIPA refused are left out rather than
+        failing the whole call, so the caller can report them one by one.
+        """
+        wanted = list(dict.fromkeys(str(username).strip() for username in usernames if str(username or "").strip()))
+        if not wanted:
+            return set()
+
+        try:
+            res = _with_freeipa_service_client_retry(
+                self.get_client,
+                lambda client: client.group_add_member(self.cn, o_user=wanted),
+            )
+        except Exception:
+            logger.exception(
+                "Failed to add members usernames=%s group=%s",
+                wanted,
+                self.cn,
+                extra=current_exception_log_fields(),
+            )
+            raise
+
+        group_data = res.get("result") if isinstance(res, dict) else None
+        if not isinstance(group_data, dict) or not _clean_str_list(group_data.get("cn")):
+            # Nothing to verify against; add and verify one user at a time.
+            added: set[str] = set()
+            for username in wanted:
+                try:
+                    self.add_member(username)
+                except Exception:
+                    continue
+                added.add(username)
+            return added
+
+        members = set(_clean_str_list(group_data.get("member_user")))
+        added = {username for username in wanted if username in members}
+        if added != set(wanted):
+            logger.error(
+                "FreeIPA group_add_member left out users group=%s usernames=%s failed=%s",
+                self.cn,
+                sorted(set(wanted) - added),
+                _compact_repr(res.get("failed")),
+            )
+        if added and not _apply_group_membership_delta(self.cn, sorted(added), added=True, response=res):
+            _invalidate_group_cache(self.cn)
+            for username in added:
+                _invalidate_user_cache(username)
+            _invalidate_groups_list_cache()
+        return added
+
     def add_sponsor(self, username: str) -> None:
         username = username.strip()
         if not username:
@@ -560,6 +679,8 @@ class FreeIPAGroup(_FreeIPAClientMixin):
                 lambda client: client.group_remove_member(self.cn, o_user=[username]),
             )
             _raise_if_freeipa_failed(res, action="group_remove_member", subject=f"group={self.cn} user={username}")
+            if _apply_group_membership_delta(self.cn, [username], added=False, response=res):
+                return
             _invalidate_group_cache(self.cn)
             _invalidate_user_cache(username)
             _invalidate_groups_list_cache()
@@ -635,7 +756,12 @@ class FreeIPAGroup(_FreeIPAClientMixin):
             cached = getattr(self, "_recursive_member_usernames_cache", None)
             if isinstance(cached, set):
                 return set(cached)
-        users = self._member_usernames_recursive(visited=set(), fas_only=fas_only)
+        closure = get_group_membership_closure()
+        closed = closure.member_usernames(self.cn, fas_only=fas_only) if closure is not None else None
+        if closed is not None:
+            users = set(closed.usernames)
+        else:
+            users = self._member_usernames_recursive(visited=set(), fas_only=fas_only)
         if not fas_only:
             self._recursive_member_usernames_cache = set(users)
         return users
@@ -651,23 +777,32 @@ class FreeIPAGroup(_FreeIPAClientMixin):
         if fas_only and not self.fas_group:
             return set()
 
+        # Expand one nesting level at a time so each level costs a single
+        # batched lookup instead of one FreeIPA round-trip per child group.
         users: set[str] = set(self.members)
-        for child_cn in sorted(set(self.member_groups), key=str.lower):
-            child = FreeIPAGroup.get(child_cn)
-            if child is None:
-                continue
-            if fas_only and not child.fas_group:
-                continue
-            try:
-                users |= child._member_usernames_recursive(visited=visited, fas_only=fas_only)
-            except Exception:
-                logger.exception(
-                    "Failed to expand nested group members parent=%s child=%s",
-                    self.cn,
-                    child_cn,
-                    extra=current_exception_log_fields(),
-                )
-                continue
+        frontier: list[FreeIPAGroup] = [self]
+        while frontier:
+            child_cns: list[str] = []
+            for group in frontier:
+                for child_cn in sorted(set(group.member_groups), key=str.lower):
+                    child_key = child_cn.lower()
+                    if child_key in visited:
+                        continue
+                    visited.add(child_key)
+                    child_cns.append(child_cn)
+            if not child_cns:
+                break
+
+            children = FreeIPAGroup.get_many(child_cns)
+            frontier = []
+            for child_cn in child_cns:
+                child = children.get(child_cn)
+                if child is None:
+                    continue
+                if fas_only and not child.fas_group:
+                    continue
+                users.update(child.members)
+                frontier.append(child)
         return users
 
     def member_count_recursive(self, *, fas_only: bool = False) -> int:
@@ -675,11 +810,187 @@ class FreeIPAGroup(_FreeIPAClientMixin):
             cached = getattr(self, "_recursive_member_usernames_cache", None)
             if isinstance(cached, set):
                 return len(cached)
+        closure = get_group_membership_closure()
+        closed = closure.member_usernames(self.cn, fas_only=fas_only) if closure is not None else None
+        if closed is not None:
+            return len(closed.usernames)
         return len(self.member_usernames_recursive(fas_only=fas_only))
 
 
+@dataclass(frozen=True, slots=True)
+class GroupMemberClosure:
+    usernames: frozenset[str]
+    # True when a nested group is missing from the snapshot the closure was built from.
+    dangling: bool = False
+
+
+class GroupMembershipClosure:
+    """Transitive user members of every group over one snapshot of ``FreeIPAGroup.all()``.
+
+    Each ``fas_only`` mode is computed on first use in a single pass over the
+    group graph: strongly connected components (nested-group cycles) are
+    collapsed, so every group in a cycle shares one member set, and components
+    are merged children-first. In ``fas_only`` mode non-FAS groups are left
+    out of the graph entirely, matching ``member_usernames_recursive``.
+    """
+
+    def __init__(self, groups: Iterable[FreeIPAGroup]) -> None:
+        self._groups = {group.cn.lower(): group for group in groups if group.cn}
+        self.complete = bool(self._groups)
+        self._lock = threading.Lock()
+        self._closures: dict[bool, dict[str, GroupMemberClosure]] = {}
+
+    def group(self, cn: str) -> FreeIPAGroup | None:
+        return self._groups.get(str(cn or "").strip().lower())
+
+    def member_usernames(self, cn: str, *, fas_only: bool = False) -> GroupMemberClosure | None:
+        """Return the members of ``cn`` and its nested groups, or None if ``cn`` is not in the snapshot."""
+        key = str(cn or "").strip().lower()
+        if key not in self._groups:
+            return None
+        closures = self._closures.get(fas_only)
+        if closures is None:
+            with self._lock:
+                closures = self._closures.get(fas_only)
+                if closures is None:
+                    closures = self._compute(fas_only=fas_only)
+                    self._closures[fas_only] = closures
+        return closures.get(key, GroupMemberClosure(usernames=frozenset()))
+
+    def _compute(self, *, fas_only: bool) -> dict[str, GroupMemberClosure]:
+        nodes = {key: group for key, group in self._groups.items() if group.fas_group or not fas_only}
+        children = {
+            key: list(dict.fromkeys(cn.lower() for cn in group.member_groups if cn.lower() in nodes))
+            for key, group in nodes.items()
+        }
+
+        # Iterative Tarjan: components come out children-first, so every
+        # nested group outside the current component is already closed.
+        closures: dict[str, GroupMemberClosure] = {}
+        index: dict[str, int] = {}
+        lowlink: dict[str, int] = {}
+        stack: list[str] = []
+        on_stack: set[str] = set()
+        for root in nodes:
+            if root in index:
+                continue
+            index[root] = lowlink[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(children[root]))]
+            while work:
+                node, pending = work[-1]
+                descended = False
+                for child in pending:
+                    if child not in index:
+                        index[child] = lowlink[child] = len(index)
+                        stack.append(child)
+                        on_stack.add(child)
+                        work.append((child, iter(children[child])))
+                        descended = True
+                        break
+                    if child in on_stack:
+                        lowlink[node] = min(lowlink[node], index[child])
+                if descended:
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] != index[node]:
+                    continue
+
+                component: list[str] = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == node:
+                        break
+
+                usernames: set[str] = set()
+                dangling = False
+                for member in component:
+                    group = nodes[member]
+                    usernames.update(group.members)
+                    for child_cn in group.member_groups:
+                        child_key = child_cn.lower()
+                        closed = closures.get(child_key)
+                        if closed is not None:
+                            usernames.update(closed.usernames)
+                            dangling = dangling or closed.dangling
+                        elif child_key not in self._groups:
+                            dangling = True
+                closure = GroupMemberClosure(usernames=frozenset(usernames), dangling=dangling)
+                for member in component:
+                    closures[member] = closure
+        return closures
+
+
+class _GroupClosureCache:
+    """Per-process `GroupMembershipClosure`, rebuilt once per group-list generation.
+
+    Works like the group search index in core/freeipa_directory.py:
+    `_invalidate_groups_list_cache` bumps the generation counter, and
+    ``FREEIPA_GROUP_CLOSURE_MAX_AGE_SECONDS`` bounds how long a closure outlives
+    a silently expired group list. A max age of 0 disables the cache.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._closure: GroupMembershipClosure | None = None
+        self._generation: object = None
+        self._built_at = 0.0
+        self._checked_at = 0.0
+
+    def get(self) -> GroupMembershipClosure | None:
+        max_age = settings.FREEIPA_GROUP_CLOSURE_MAX_AGE_SECONDS
+        if max_age <= 0:
+            return None
+
+        now = time.monotonic()
+        with self._lock:
+            closure = self._closure
+            fresh = closure is not None and now - self._built_at < max_age
+            if fresh and now - self._checked_at < settings.FREEIPA_L1_CACHE_GENERATION_CHECK_SECONDS:
+                return closure
+
+        generation = cache.get(_groups_list_generation_cache_key(), 0)
+        with self._lock:
+            if fresh and self._closure is closure and generation == self._generation:
+                self._checked_at = now
+                return closure
+
+        closure = GroupMembershipClosure(FreeIPAGroup.all())
+        if not closure.complete:
+            # FreeIPA could not be listed; callers walk the groups one level at a time.
+            return None
+        with self._lock:
+            self._closure = closure
+            self._generation = generation
+            self._built_at = now
+            self._checked_at = now
+        return closure
+
+    def clear(self) -> None:
+        with self._lock:
+            self._closure = None
+
+
+_group_closure_cache = _GroupClosureCache()
+
+
+def get_group_membership_closure() -> GroupMembershipClosure | None:
+    """Return the cached nested-membership closure, or None when it is disabled or unavailable."""
+    return _group_closure_cache.get()
+
+
 __all__ = [
     "FreeIPAGroup",
+    "GroupMemberClosure",
+    "GroupMembershipClosure",
+    "get_group_membership_closure",
     "get_freeipa_group_for_elections",
     "resolve_materialized_team_leads_usernames",
     "sync_materialized_team_leads_group",
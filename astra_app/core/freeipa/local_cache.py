@@ -0,0 +1,301 @@
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Mapping
+
+from django.conf import settings
+from django.core.cache import cache
+
+from core.request_profiling import current_request_profile
+
+_L1_GENERATION_CACHE_KEY = "freeipa_l1_generation"
+
+_MISSING = object()
+# Locally cached "not in the shared cache" marker (see ``get(local_ttl=...)``).
+_ABSENT = object()
+
+
+class FreeIPALocalCache:
+    """Bounded, TTL-based per-process cache in front of the shared Django cache.
+
+    FreeIPA user/group entries and circuit-breaker flags are read far more often
+    than they change, and every shared-cache read is a Postgres round trip plus
+    an unpickle. This layer keeps recently used values in the worker process.
+
+    Reads fall through to the shared cache on a local miss. Writes and deletes go
+    to the shared cache first. Deletes also bump a shared generation counter.
+    Every worker compares that counter with the generation it last saw (at most
+    every ``FREEIPA_L1_CACHE_GENERATION_CHECK_SECONDS``) and drops its local
+    entries when it changed, so invalidations propagate across workers.
+
+    Writes do not bump the counter. They are fills of a value just fetched from
+    FreeIPA after a miss, and the miss itself comes from an expired entry or a
+    delete that already bumped it; bumping on every fill would flush every
+    worker on every miss. Another worker's older copy of a filled key lives at
+    most ``FREEIPA_L1_CACHE_TTL_SECONDS``. A caller that replaces a value other
+    workers must stop serving right away calls ``invalidate`` after the write.
+
+    Values are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[float, object]] = OrderedDict()
+        self._generation: int | None = None
+        self._generation_checked_at = 0.0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._flushes = 0
+
+    @property
+    def enabled(self) -> bool:
+        return settings.FREEIPA_L1_CACHE_MAX_ENTRIES > 0
+
+    def get(self, key: str, default: object | None = None, *, local_ttl: int | None = None) -> object | None:
+        """Read ``key`` through the local cache.
+
+        With ``local_ttl`` the outcome is kept locally for that many seconds,
+        including "key not set"; this suits small flags that are polled on every
+        FreeIPA call, such as the circuit breaker.
+        """
+
+        if not self.enabled:
+            value = cache.get(key, _MISSING)
+            _record_get(key, hit=value is not _MISSING)
+            return default if value is _MISSING else value
+
+        self._sync_generation()
+        value = self._get_local(key)
+        if value is _ABSENT:
+            _record_get(key, hit=False)
+            return default
+        if value is not _MISSING:
+            _record_get(key, hit=True)
+            return value
+
+        value = cache.get(key, _MISSING)
+        _record_get(key, hit=value is not _MISSING)
+        if value is _MISSING:
+            if local_ttl is not None:
+                self._set_local(key, _ABSENT, ttl=local_ttl)
+            return default
+        self._set_local(key, value, ttl=local_ttl)
+        return value
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, object]:
+        keys = list(keys)
+        if not self.enabled:
+            found = cache.get_many(keys)
+            _record_get_many(keys, found)
+            return found
+
+        self._sync_generation()
+        found: dict[str, object] = {}
+        missing: list[str] = []
+        for key in keys:
+            value = self._get_local(key)
+            if value is _MISSING:
+                missing.append(key)
+            elif value is not _ABSENT:
+                found[key] = value
+
+        if missing:
+            fetched = cache.get_many(missing)
+            for key, value in fetched.items():
+                self._set_local(key, value)
+            found.update(fetched)
+        _record_get_many(keys, found)
+        return found
+
+    def set(self, key: str, value: object, timeout: int | None | object = _MISSING) -> None:
+        _record_set(key)
+        if timeout is _MISSING:
+            cache.set(key, value)
+        else:
+            cache.set(key, value, timeout=timeout)
+        if self.enabled:
+            self._sync_generation()
+            self._set_local(key, value)
+
+    def set_many(self, data: Mapping[str, object]) -> None:
+        for key in data:
+            _record_set(key)
+        cache.set_many(dict(data))
+        if self.enabled:
+            self._sync_generation()
+            for key, value in data.items():
+                self._set_local(key, value)
+
+    def get_shared(self, key: str, default: object | None = None) -> object | None:
+        """Read ``key`` from the shared cache only, keeping no local copy.
+
+        For the user and group lists and the FAS agreements, which are
+        invalidated by deleting the shared key directly, so a local copy would
+        go stale. The read is still counted in the request profile.
+        """
+
+        value = cache.get(key, _MISSING)
+        _record_get(key, hit=value is not _MISSING)
+        return default if value is _MISSING else value
+
+    def get_or_set_shared(self, key: str, fetch: Callable[[], object]) -> object:
+        """Like ``cache.get_or_set``, counted in the request profile; see ``get_shared``."""
+
+        value = self.get_shared(key, _MISSING)
+        if value is _MISSING:
+            value = fetch()
+            _record_set(key)
+            cache.add(key, value)
+        return value
+
+    def set_shared(self, key: str, value: object) -> None:
+        _record_set(key)
+        cache.set(key, value)
+
+    def delete(self, key: str) -> None:
+        cache.delete(key)
+        self.invalidate(key)
+
+    def invalidate(self, *keys: str) -> None:
+        """Drop keys locally and tell other workers to drop their copies.
+
+        Use after changing the shared cache through an API this class does not
+        wrap (for example ``cache.add``).
+        """
+
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+        try:
+            _seed_shared_generation()
+            generation = int(cache.incr(_L1_GENERATION_CACHE_KEY))
+        except Exception:
+            # Without a shared generation other workers only converge via TTL;
+            # make sure this worker at least re-reads everything.
+            self.clear_local()
+            return
+
+        with self._lock:
+            # Another worker bumped the counter since our last check, so we may
+            # have missed its invalidation: start over.
+            if self._generation is None or generation != self._generation + 1:
+                self._flush_locked()
+            self._generation = generation
+            self._generation_checked_at = time.monotonic()
+
+    def clear_local(self) -> None:
+        with self._lock:
+            self._flush_locked()
+            self._generation = None
+            self._generation_checked_at = 0.0
+
+    def stats(self) -> dict[str, object]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "enabled": self.enabled,
+                "size": len(self._entries),
+                "max_entries": settings.FREEIPA_L1_CACHE_MAX_ENTRIES,
+                "ttl_seconds": settings.FREEIPA_L1_CACHE_TTL_SECONDS,
+                "generation": self._generation,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else None,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "flushes": self._flushes,
+            }
+
+    def _sync_generation(self) -> None:
+        now = time.monotonic()
+        with self._lock:
+            if now - self._generation_checked_at < settings.FREEIPA_L1_CACHE_GENERATION_CHECK_SECONDS:
+                return
+
+        try:
+            generation = cache.get(_L1_GENERATION_CACHE_KEY)
+            if generation is None:
+                _seed_shared_generation()
+                generation = cache.get(_L1_GENERATION_CACHE_KEY)
+            generation = int(generation)
+        except Exception:
+            return
+
+        with self._lock:
+            if generation != self._generation:
+                self._flush_locked()
+                self._generation = generation
+            self._generation_checked_at = now
+
+    def _get_local(self, key: str) -> object:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return _MISSING
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self._expirations += 1
+                self._misses += 1
+                return _MISSING
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def _set_local(self, key: str, value: object, *, ttl: int | None = None) -> None:
+        max_entries = settings.FREEIPA_L1_CACHE_MAX_ENTRIES
+        if ttl is None:
+            ttl = settings.FREEIPA_L1_CACHE_TTL_SECONDS
+        expires_at = time.monotonic() + ttl
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def _flush_locked(self) -> None:
+        if self._entries:
+            self._flushes += 1
+        self._entries.clear()
+
+
+def _record_get(key: str, *, hit: bool) -> None:
+    profile = current_request_profile()
+    if profile is not None:
+        profile.record_cache_get(key, hit=hit)
+
+
+def _record_get_many(keys: list[str], found: Mapping[str, object]) -> None:
+    profile = current_request_profile()
+    if profile is not None:
+        for key in keys:
+            profile.record_cache_get(key, hit=key in found)
+
+
+def _record_set(key: str) -> None:
+    profile = current_request_profile()
+    if profile is not None:
+        profile.record_cache_set(key)
+
+
+def _seed_shared_generation() -> None:
+    # Start from a random value rather than 0 so a cleared shared cache reads
+    # as a new generation in every worker instead of matching a stale one.
+    cache.add(_L1_GENERATION_CACHE_KEY, secrets.randbelow(2**31), timeout=None)
+
+
+freeipa_local_cache = FreeIPALocalCache()
+
+
+__all__ = [
+    "FreeIPALocalCache",
+    "freeipa_local_cache",
+]
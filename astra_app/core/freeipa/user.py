@@ -1,18 +1,21 @@
 import logging
 from collections.abc import Collection
-from concurrent.futures import ThreadPoolExecutor
 
 from django.conf import settings
 from django.utils.crypto import salted_hmac
 from python_freeipa import ClientMeta, exceptions
 
 from core.freeipa.client import (
+    FreeIPABatchCall,
     _get_current_viewer_username,
     _get_freeipa_service_client_cached,
+    _with_freeipa_service_client_batch,
     _with_freeipa_service_client_retry,
 )
 from core.freeipa.exceptions import FreeIPAOperationFailed
+from core.freeipa.local_cache import freeipa_local_cache
 from core.freeipa.utils import (
+    _apply_group_membership_delta,
     _clean_str_list,
     _compact_repr,
     _first_attr_ci,
@@ -30,10 +33,6 @@ from core.logging_extras import current_exception_log_fields
 
 logger = logging.getLogger("core.backends")
 
-_LIGHTWEIGHT_LOOKUP_SERIAL_THRESHOLD = 2
-_LIGHTWEIGHT_LOOKUP_CHUNK_SIZE = 2
-_LIGHTWEIGHT_LOOKUP_MAX_WORKERS = 4
-
 
 class _FreeIPAPK:
     attname = 'username'
@@ -282,9 +281,7 @@ class FreeIPAUser(_FreeIPAClientMixin):
             return result.get('result', [])
 
         try:
-            from django.core.cache import cache
-
-            users = cache.get_or_set(_users_list_cache_key(), _fetch_users) or []
+            users = freeipa_local_cache.get_or_set_shared(_users_list_cache_key(), _fetch_users) or []
             excluded = {str(u).strip().lower() for u in settings.FREEIPA_FILTERED_USERNAMES}
             out: list[FreeIPAUser] = []
             for user_data in users:
@@ -321,17 +318,15 @@ class FreeIPAUser(_FreeIPAClientMixin):
         Usernames not found in the list are silently skipped (``get()`` will
         fall back to its normal IPA RPC call).
         """
-        from django.core.cache import cache
-
         if not usernames:
             return
 
-        users_data = cache.get(_users_list_cache_key())
+        users_data = freeipa_local_cache.get_shared(_users_list_cache_key())
         if not users_data:
             # All-users cache is cold — call all() to populate it, which makes
             # a single IPA RPC call, then re-read the cached list.
             cls.all(respect_privacy=False)
-            users_data = cache.get(_users_list_cache_key())
+            users_data = freeipa_local_cache.get_shared(_users_list_cache_key())
             if not users_data:
                 return
 
@@ -347,7 +342,7 @@ class FreeIPAUser(_FreeIPAClientMixin):
             username = str(username).strip()
             if not username or username.lower() not in wanted:
                 continue
-            cache.set(_user_cache_key(username), user_data)
+            freeipa_local_cache.set(_user_cache_key(username), user_data)
 
     @classmethod
     def _fetch_full_user(cls, client: ClientMeta, username: str):
@@ -390,10 +385,8 @@ class FreeIPAUser(_FreeIPAClientMixin):
         """
         Fetch a single user by username.
         """
-        from django.core.cache import cache
-
         cache_key = _user_cache_key(username)
-        cached_data = cache.get(cache_key)
+        cached_data = freeipa_local_cache.get(cache_key)
 
         if cached_data is not None:
             return cls(username, cached_data, respect_privacy=respect_privacy)
@@ -404,7 +397,7 @@ class FreeIPAUser(_FreeIPAClientMixin):
                 lambda client: cls._fetch_full_user(client, username),
             )
             if user_data is not None:
-                cache.set(cache_key, user_data)
+                freeipa_local_cache.set(cache_key, user_data)
                 return cls(username, user_data, respect_privacy=respect_privacy)
         except Exception as e:
             logger.exception(
@@ -414,6 +407,74 @@ class FreeIPAUser(_FreeIPAClientMixin):
             raise
         return None
 
+    @classmethod
+    def get_many(cls, usernames: Collection[str], *, respect_privacy: bool = True) -> dict[str, FreeIPAUser]:
+        """Fetch several users by username, keyed by the username as passed in.
+
+        Uses one cache read for all usernames and one batched ``user_show`` round
+        trip (per ``FREEIPA_BATCH_CHUNK_SIZE`` users) for the misses. Users that
+        FreeIPA reports as missing are omitted. A user whose ``user_show`` fails
+        for another reason is fetched again through ``get()``, which falls back
+        to ``user_find``; a failure of the whole batch raises.
+        """
+        wanted = list(dict.fromkeys(str(username).strip() for username in usernames if str(username or "").strip()))
+        if not wanted:
+            return {}
+
+        usernames_by_key = {_user_cache_key(username): username for username in wanted}
+        user_data_by_username = {
+            usernames_by_key[key]: user_data
+            for key, user_data in freeipa_local_cache.get_many(usernames_by_key).items()
+            if user_data is not None
+        }
+
+        missing = [username for username in wanted if username not in user_data_by_username]
+        if missing:
+            try:
+                outcomes = _with_freeipa_service_client_batch(
+                    cls.get_client,
+                    [
+                        FreeIPABatchCall("user_show", (username,), {"all": True, "no_members": False})
+                        for username in missing
+                    ],
+                )
+            except Exception as e:
+                logger.exception(
+                    f"Failed to get users usernames={missing}: {e}",
+                    extra=current_exception_log_fields(),
+                )
+                raise
+
+            fetched: dict[str, dict[str, object]] = {}
+            retry: list[str] = []
+            for username, outcome in zip(missing, outcomes, strict=True):
+                if isinstance(outcome, exceptions.NotFound):
+                    continue
+                if isinstance(outcome, Exception):
+                    logger.warning("Batched user_show failed username=%s: %s", username, outcome)
+                    retry.append(username)
+                    continue
+                user_data = outcome.get("result")
+                if isinstance(user_data, dict):
+                    fetched[username] = user_data
+
+            if fetched:
+                freeipa_local_cache.set_many(
+                    {_user_cache_key(username): user_data for username, user_data in fetched.items()}
+                )
+            user_data_by_username.update(fetched)
+
+            for username in retry:
+                user = cls.get(username, respect_privacy=respect_privacy)
+                if user is not None:
+                    user_data_by_username[username] = user._user_data
+
+        return {
+            username: cls(username, user_data_by_username[username], respect_privacy=respect_privacy)
+            for username in wanted
+            if username in user_data_by_username
+        }
+
     @classmethod
     def find_by_email(cls, email: str) -> FreeIPAUser | None:
         email = (email or "").strip().lower()
@@ -465,65 +526,15 @@ class FreeIPAUser(_FreeIPAClientMixin):
         if not normalized_usernames:
             return {}
 
-        def _lookup_chunk(chunk_usernames: list[str]) -> dict[str, FreeIPAUser]:
-            def _do(client: ClientMeta) -> dict[str, FreeIPAUser]:
-                users_by_username: dict[str, FreeIPAUser] = {}
-                for username in chunk_usernames:
-                    result = client.user_find(
-                        o_uid=username,
-                        o_all=False,
-                        o_no_members=True,
-                        o_sizelimit=1,
-                        o_timelimit=0,
-                    )
-                    if not isinstance(result, dict) or result.get("count", 0) <= 0:
-                        continue
-
-                    first = (result.get("result") or [None])[0]
-                    if not isinstance(first, dict):
-                        continue
-
-                    uid = first.get("uid")
-                    if isinstance(uid, list):
-                        resolved_username = (uid[0] if uid else "") or ""
-                    else:
-                        resolved_username = uid or ""
-                    resolved_username = str(resolved_username).strip().lower()
-                    if not resolved_username:
-                        continue
-
-                    users_by_username[resolved_username] = cls(resolved_username, first)
-
-                return users_by_username
-
-            return _with_freeipa_service_client_retry(cls.get_client, _do)
-
+        calls = [
+            FreeIPABatchCall(
+                "user_find",
+                params={"uid": username, "all": False, "no_members": True, "sizelimit": 1, "timelimit": 0},
+            )
+            for username in normalized_usernames
+        ]
         try:
-            if len(normalized_usernames) <= _LIGHTWEIGHT_LOOKUP_SERIAL_THRESHOLD:
-                return _lookup_chunk(normalized_usernames)
-
-            chunk_size = max(1, _LIGHTWEIGHT_LOOKUP_CHUNK_SIZE)
-            username_chunks = [
-                normalized_usernames[index:index + chunk_size]
-                for index in range(0, len(normalized_usernames), chunk_size)
-            ]
-            if len(username_chunks) == 1:
-                return _lookup_chunk(normalized_usernames)
-
-            max_workers = max(1, min(_LIGHTWEIGHT_LOOKUP_MAX_WORKERS, len(username_chunks)))
-            if max_workers == 1:
-                return _lookup_chunk(normalized_usernames)
-
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                chunk_futures = [
-                    executor.submit(_lookup_chunk, chunk_usernames)
-                    for chunk_usernames in username_chunks
-                ]
-
-                users_by_username: dict[str, FreeIPAUser] = {}
-                for chunk_future in chunk_futures:
-                    users_by_username.update(chunk_future.result())
-                return users_by_username
+            outcomes = _with_freeipa_service_client_batch(cls.get_client, calls)
         except Exception as e:
             logger.exception(
                 f"Failed to find lightweight users usernames={normalized_usernames}: {e}",
@@ -531,6 +542,31 @@ class FreeIPAUser(_FreeIPAClientMixin):
             )
             return {}
 
+        users_by_username: dict[str, FreeIPAUser] = {}
+        for username, outcome in zip(normalized_usernames, outcomes, strict=True):
+            if isinstance(outcome, Exception):
+                logger.warning("Failed to find lightweight user username=%s: %s", username, outcome)
+                continue
+            if outcome.get("count", 0) <= 0:
+                continue
+
+            first = (outcome.get("result") or [None])[0]
+            if not isinstance(first, dict):
+                continue
+
+            uid = first.get("uid")
+            if isinstance(uid, list):
+                resolved_username = (uid[0] if uid else "") or ""
+            else:
+                resolved_username = uid or ""
+            resolved_username = str(resolved_username).strip().lower()
+            if not resolved_username:
+                continue
+
+            users_by_username[resolved_username] = cls(resolved_username, first)
+
+        return users_by_username
+
     @classmethod
     def find_usernames_by_email(cls, email: str) -> list[str]:
         normalized = (email or "").strip().lower()
@@ -702,27 +738,33 @@ class FreeIPAUser(_FreeIPAClientMixin):
     def get_all_permissions(self, obj=None):
         if obj is not None:
             return set()
-        return self.get_group_permissions(obj) | self.get_user_permissions(obj)
+
+        # Resolved once per grant snapshot; within a request that snapshot is
+        # pinned, so repeated has_perm() calls do not touch the database.
+        from core.permission_grants import permission_grant_snapshot
+
+        snapshot = permission_grant_snapshot()
+        groups = tuple(self.groups_list)
+        cached = getattr(self, "_resolved_permissions", None)
+        if cached is not None and cached[0] is snapshot and cached[1] == groups:
+            return set(cached[2])
+
+        permissions = frozenset(
+            self._group_map_permissions() | snapshot.permissions_for(username=str(self.username or ""), groups=groups)
+        )
+        self._resolved_permissions = (snapshot, groups, permissions)
+        return set(permissions)
 
     def get_user_permissions(self, obj=None):
         if obj is not None:
             return set()
 
-        try:
-            from core.models import FreeIPAPermissionGrant
-        except Exception:
-            return set()
+        from core.permission_grants import permission_grant_snapshot
 
-        username = str(self.username or "").strip().lower()
+        username = str(self.username or "").strip()
         if not username:
             return set()
-
-        return set(
-            FreeIPAPermissionGrant.objects.filter(
-                principal_type=FreeIPAPermissionGrant.PrincipalType.user,
-                principal_name=username,
-            ).values_list("permission", flat=True)
-        )
+        return permission_grant_snapshot().permissions_for(username=username, groups=())
 
     def has_perm(self, perm, obj=None):
         if self.is_active and self.is_superuser:
@@ -737,33 +779,24 @@ class FreeIPAUser(_FreeIPAClientMixin):
             return True
         return any(perm.startswith(f"{app_label}.") for perm in self.get_all_permissions())
 
-    def get_group_permissions(self, obj=None):
-        if obj is not None:
-            return set()
-
+    def _group_map_permissions(self) -> set[str]:
         perms = set()
         group_permissions_map = settings.FREEIPA_GROUP_PERMISSIONS
-
         for group in self.groups_list:
             if group in group_permissions_map:
                 perms.update(group_permissions_map[group])
+        return perms
 
-        try:
-            from core.models import FreeIPAPermissionGrant
-        except Exception:
-            return perms
+    def get_group_permissions(self, obj=None):
+        if obj is not None:
+            return set()
 
-        groups = [str(g or "").strip().lower() for g in self.groups_list if str(g or "").strip()]
-        if not groups:
-            return perms
-
-        perms.update(
-            FreeIPAPermissionGrant.objects.filter(
-                principal_type=FreeIPAPermissionGrant.PrincipalType.group,
-                principal_name__in=groups,
-            ).values_list("permission", flat=True)
-        )
+        from core.permission_grants import permission_grant_snapshot
 
+        perms = self._group_map_permissions()
+        groups = [str(g or "").strip().lower() for g in self.groups_list if str(g or "").strip()]
+        if groups:
+            perms.update(permission_grant_snapshot().permissions_for(username="", groups=groups))
         return perms
 
     def __str__(self):
@@ -782,6 +815,8 @@ class FreeIPAUser(_FreeIPAClientMixin):
                 lambda client: client.group_add_member(group_name, o_user=[self.username]),
             )
             _raise_if_freeipa_failed(res, action="group_add_member", subject=f"user={self.username} group={group_name}")
+            if _apply_group_membership_delta(group_name, [self.username], added=True, response=res):
+                return
             _invalidate_user_cache(self.username)
             _invalidate_group_cache(group_name)
             _invalidate_groups_list_cache()
@@ -814,6 +849,8 @@ class FreeIPAUser(_FreeIPAClientMixin):
                 lambda client: client.group_remove_member(group_name, o_user=[self.username]),
             )
             _raise_if_freeipa_failed(res, action="group_remove_member", subject=f"user={self.username} group={group_name}")
+            if _apply_group_membership_delta(group_name, [self.username], added=False, response=res):
+                return
             _invalidate_user_cache(self.username)
             _invalidate_group_cache(group_name)
             _invalidate_groups_list_cache()
@@ -1,4 +1,5 @@
 import hashlib
+from collections.abc import Sequence
 from functools import lru_cache
 
 from django.conf import settings
@@ -6,6 +7,7 @@ from django.core.cache import cache
 from django.utils.crypto import salted_hmac
 
 from core.freeipa.exceptions import FreeIPAOperationFailed
+from core.freeipa.local_cache import freeipa_local_cache
 
 
 def _clean_str_list(values: object) -> list[str]:
@@ -213,10 +215,30 @@ def _users_list_cache_key() -> str:
     return 'freeipa_users_all'
 
 
+def _users_list_generation_cache_key() -> str:
+    return 'freeipa_users_all_generation'
+
+
+def _live_usernames_cache_key() -> str:
+    return 'freeipa_users_live_usernames'
+
+
+def _users_directory_cache_key() -> str:
+    return 'freeipa_users_directory'
+
+
+def _users_directory_fresh_cache_key() -> str:
+    return 'freeipa_users_directory_fresh'
+
+
 def _groups_list_cache_key() -> str:
     return 'freeipa_groups_all'
 
 
+def _groups_list_generation_cache_key() -> str:
+    return 'freeipa_groups_all_generation'
+
+
 def _agreements_list_cache_key() -> str:
     return "freeipa_fasagreements_all"
 
@@ -228,11 +250,24 @@ def _agreement_cache_key(cn: str) -> str:
 
 
 def _invalidate_users_list_cache() -> None:
-    cache.delete(_users_list_cache_key())
+    # The directory index is served stale while it is rebuilt in the background.
+    cache.delete_many([_users_list_cache_key(), _users_directory_fresh_cache_key()])
+    # Tells every worker to rebuild its in-memory email index.
+    try:
+        cache.incr(_users_list_generation_cache_key())
+    except ValueError:
+        cache.set(_users_list_generation_cache_key(), 1, timeout=None)
+    # Workers read both keys through their local cache.
+    freeipa_local_cache.invalidate(_users_directory_fresh_cache_key(), _users_list_generation_cache_key())
 
 
 def _invalidate_groups_list_cache() -> None:
     cache.delete(_groups_list_cache_key())
+    # Tells every worker to rebuild its in-memory group search index.
+    try:
+        cache.incr(_groups_list_generation_cache_key())
+    except ValueError:
+        cache.set(_groups_list_generation_cache_key(), 1, timeout=None)
 
 
 def _invalidate_agreements_list_cache() -> None:
@@ -240,17 +275,85 @@ def _invalidate_agreements_list_cache() -> None:
 
 
 def _invalidate_user_cache(username: str) -> None:
-    cache.delete(_user_cache_key(username))
+    freeipa_local_cache.delete(_user_cache_key(username))
 
 
 def _invalidate_group_cache(cn: str) -> None:
-    cache.delete(_group_cache_key(cn))
+    freeipa_local_cache.delete(_group_cache_key(cn))
 
 
 def _invalidate_agreement_cache(cn: str) -> None:
     cache.delete(_agreement_cache_key(cn))
 
 
+def _apply_group_membership_delta(cn: str, usernames: Sequence[str], *, added: bool, response: object) -> bool:
+    """Patch the cached records for ``usernames`` joining or leaving group ``cn``.
+
+    ``response`` is the ``group_add_member``/``group_remove_member`` result. Its
+    ``result`` is the updated group with its direct members, so the cached group
+    entry, that group's row in the cached group list and each user's
+    ``memberof_group`` are updated in place instead of being refetched. Users
+    whose indirect groups could change (the group is nested in another) are
+    dropped instead of patched.
+
+    The group-list generation is the version: the patch claims the version it
+    read with ``cache.add`` and then bumps it, which also tells workers to
+    rebuild their group indexes from the patched list. Returns False without
+    patching when the response has no usable group record, and False after a
+    lost claim or a concurrent bump; the caller then invalidates as before.
+    """
+
+    group_data = response.get("result") if isinstance(response, dict) else None
+    if not isinstance(group_data, dict) or not _clean_str_list(group_data.get("cn")):
+        return False
+    # FreeIPA leaves out attributes without values, such as the members of an emptied group.
+    member_user = _clean_str_list(group_data.get("member_user"))
+    if any((username in member_user) != added for username in usernames):
+        return False
+
+    generation_key = _groups_list_generation_cache_key()
+    cache.add(generation_key, 0, timeout=None)
+    version = cache.get(generation_key)
+    if not isinstance(version, int) or not cache.add(f"{generation_key}:patch:{version}", True, timeout=60):
+        return False
+
+    group_key = _group_cache_key(cn)
+    user_keys = [_user_cache_key(username) for username in usernames]
+    patched: dict[str, object] = {}
+
+    cached_group = freeipa_local_cache.get(group_key)
+    if isinstance(cached_group, dict):
+        patched[group_key] = {**cached_group, "member_user": member_user}
+
+    nested = bool(_clean_str_list(group_data.get("memberof_group")))
+    for user_key, cached_user in freeipa_local_cache.get_many(user_keys).items():
+        if nested or not isinstance(cached_user, dict):
+            continue
+        memberof = [group for group in _clean_str_list(cached_user.get("memberof_group")) if group.lower() != cn.lower()]
+        if added:
+            memberof.append(cn)
+        patched[user_key] = {**cached_user, "memberof_group": memberof}
+    cache.delete_many([user_key for user_key in user_keys if user_key not in patched])
+
+    groups = cache.get(_groups_list_cache_key())
+    if isinstance(groups, list):
+        patched[_groups_list_cache_key()] = [
+            {**group, "member_user": member_user}
+            if [name.lower() for name in _clean_str_list(group.get("cn"))[:1]] == [cn.lower()]
+            else group
+            for group in groups
+        ]
+
+    cache.set_many(patched)
+    # Drop this worker's copies and make the other workers drop theirs.
+    freeipa_local_cache.invalidate(group_key, *user_keys)
+    try:
+        bumped = cache.incr(generation_key)
+    except ValueError:
+        return False
+    return bumped == version + 1
+
+
 @lru_cache(maxsize=4096)
 def _session_user_id_for_username(username: str) -> int:
     """Return a stable integer id for storing in Django's session.
@@ -276,7 +379,12 @@ __all__ = [
     "_user_cache_key",
     "_group_cache_key",
     "_users_list_cache_key",
+    "_users_list_generation_cache_key",
+    "_live_usernames_cache_key",
+    "_users_directory_cache_key",
+    "_users_directory_fresh_cache_key",
     "_groups_list_cache_key",
+    "_groups_list_generation_cache_key",
     "_agreements_list_cache_key",
     "_agreement_cache_key",
     "_invalidate_users_list_cache",
@@ -285,5 +393,6 @@ __all__ = [
     "_invalidate_user_cache",
     "_invalidate_group_cache",
     "_invalidate_agreement_cache",
+    "_apply_group_membership_delta",
     "_session_user_id_for_username",
 ]
@@ -1,9 +1,28 @@
+import logging
 import re
-from collections.abc import Collection
+import threading
+import time
+from collections.abc import Collection, Iterable, Mapping
+from dataclasses import dataclass
+from typing import cast
 
 from django.conf import settings
+from django.core.cache import cache
+from django.db import close_old_connections
 
+from core.freeipa.group import FreeIPAGroup
+from core.freeipa.local_cache import freeipa_local_cache
 from core.freeipa.user import FreeIPAUser
+from core.freeipa.utils import (
+    _groups_list_generation_cache_key,
+    _live_usernames_cache_key,
+    _users_directory_cache_key,
+    _users_directory_fresh_cache_key,
+    _users_list_generation_cache_key,
+)
+from core.logging_extras import current_exception_log_fields
+
+logger = logging.getLogger(__name__)
 
 _NAME_SEARCH_SEPARATOR_RE = re.compile(r"[^0-9a-z]+")
 _SNAPSHOT_USER_ATTRS = (
@@ -16,6 +35,14 @@ _SNAPSHOT_USER_ATTRS = (
     "fasIsPrivate",
 )
 
+_USER_DIRECTORY_REFRESH_LOCK_KEY = "freeipa_users_directory_refresh_lock"
+_USER_DIRECTORY_REFRESH_LOCK_SECONDS = 120
+_USER_DIRECTORY_REFRESH_FAILED_AT_KEY = "freeipa_users_directory_refresh_failed_at"
+_USER_DIRECTORY_REFRESH_BACKOFF_SECONDS = 60
+_USER_DIRECTORY_FRESH_FLAG_LOCAL_TTL_SECONDS = 2
+_USERS_GENERATION_LOCAL_TTL_SECONDS = 2
+_GROUP_INDEX_NGRAM = 3
+
 
 def normalize_user_search_query(query: str) -> str:
     return " ".join(str(query or "").strip().lower().split())
@@ -92,7 +119,13 @@ def _snapshot_user_data(*, username: str, user_data: dict[str, object]) -> dict[
     return snapshot_data
 
 
-def snapshot_freeipa_users(*, respect_privacy: bool = True) -> list[FreeIPAUser]:
+def _fetch_directory_user_rows() -> list[tuple[str, dict[str, object]]] | None:
+    """Fetch (username, compact user data) for every visible directory account.
+
+    Returns None when FreeIPA could not be queried, so callers can tell an
+    outage apart from an empty directory.
+    """
+
     try:
         client = FreeIPAUser.get_client()
         result = client.user_find(
@@ -102,14 +135,14 @@ def snapshot_freeipa_users(*, respect_privacy: bool = True) -> list[FreeIPAUser]
             o_timelimit=0,
         )
     except Exception:
-        return []
+        return None
 
     if not isinstance(result, dict):
-        return []
+        return None
 
     raw_matches = result.get("result")
     if not isinstance(raw_matches, list):
-        return []
+        return None
 
     filtered_usernames = {
         str(username).strip().lower()
@@ -117,7 +150,7 @@ def snapshot_freeipa_users(*, respect_privacy: bool = True) -> list[FreeIPAUser]
         if str(username).strip()
     }
 
-    users: list[FreeIPAUser] = []
+    rows: list[tuple[str, dict[str, object]]] = []
     for user_data in raw_matches:
         if not isinstance(user_data, dict):
             continue
@@ -129,16 +162,130 @@ def snapshot_freeipa_users(*, respect_privacy: bool = True) -> list[FreeIPAUser]
         if username.lower() in filtered_usernames:
             continue
 
-        users.append(
-            FreeIPAUser(
-                username,
-                _snapshot_user_data(username=username, user_data=user_data),
-                respect_privacy=respect_privacy,
-            )
-        )
+        rows.append((username, _snapshot_user_data(username=username, user_data=user_data)))
+
+    rows.sort(key=lambda row: row[0].lower())
+    return rows
+
 
-    users.sort(key=lambda user: str(user.username).strip().lower())
-    return users
+def snapshot_freeipa_users(*, respect_privacy: bool = True) -> list[FreeIPAUser]:
+    rows = _fetch_directory_user_rows() or []
+    return [FreeIPAUser(username, user_data, respect_privacy=respect_privacy) for username, user_data in rows]
+
+
+@dataclass(frozen=True, slots=True)
+class UserDirectoryEntry:
+    """One row of the cached user directory index.
+
+    The search fields are lowercased once when the index is built so paging and
+    filtering never have to construct ``FreeIPAUser`` objects for the whole
+    directory. ``full_name_lower`` is the unredacted name; use
+    ``searchable_full_name()`` so private users only match on their username
+    for other viewers.
+    """
+
+    username: str
+    username_lower: str
+    full_name_lower: str
+    is_private: bool
+    user_data: dict[str, object]
+
+    def to_user(self, *, respect_privacy: bool = True) -> FreeIPAUser:
+        return FreeIPAUser(self.username, self.user_data, respect_privacy=respect_privacy)
+
+    def searchable_full_name(self, viewer_username: str | None) -> str:
+        if self.is_private and (viewer_username or "").lower() != self.username_lower:
+            return self.username_lower
+        return self.full_name_lower
+
+
+def _directory_entry(username: str, user_data: dict[str, object]) -> UserDirectoryEntry:
+    user = FreeIPAUser(username, user_data, respect_privacy=False)
+    return UserDirectoryEntry(
+        username=username,
+        username_lower=username.lower(),
+        full_name_lower=str(user.full_name or "").strip().lower(),
+        is_private=user.fas_is_private,
+        user_data=user_data,
+    )
+
+
+def refresh_user_directory() -> list[UserDirectoryEntry] | None:
+    """Rebuild the cached directory index from one FreeIPA ``user_find``.
+
+    Leaves the previous index in place (and returns None) if FreeIPA fails.
+    """
+
+    rows = _fetch_directory_user_rows()
+    if rows is None:
+        logger.warning("User directory refresh failed; keeping the previous snapshot")
+        return None
+
+    entries = [_directory_entry(username, user_data) for username, user_data in rows]
+    freeipa_local_cache.set(_users_directory_cache_key(), entries, timeout=None)
+    # Other workers still hold the previous index locally.
+    freeipa_local_cache.invalidate(_users_directory_cache_key())
+    cache.set(
+        _users_directory_fresh_cache_key(),
+        True,
+        timeout=settings.FREEIPA_USER_DIRECTORY_REFRESH_SECONDS,
+    )
+    return entries
+
+
+def _refresh_user_directory_in_background() -> None:
+    # After a failed refresh every worker keeps serving the stale index for a
+    # while instead of retrying FreeIPA on each request.
+    if cache.get(_USER_DIRECTORY_REFRESH_FAILED_AT_KEY) is not None:
+        return
+    if not cache.add(_USER_DIRECTORY_REFRESH_LOCK_KEY, True, timeout=_USER_DIRECTORY_REFRESH_LOCK_SECONDS):
+        return
+
+    def _run() -> None:
+        refreshed = True
+        try:
+            # Another worker may have finished a refresh since we looked.
+            if cache.get(_users_directory_fresh_cache_key()) is None:
+                refreshed = refresh_user_directory() is not None
+        except Exception:
+            refreshed = False
+            logger.exception("User directory background refresh failed", extra=current_exception_log_fields())
+        finally:
+            if not refreshed:
+                cache.set(
+                    _USER_DIRECTORY_REFRESH_FAILED_AT_KEY,
+                    time.time(),
+                    timeout=_USER_DIRECTORY_REFRESH_BACKOFF_SECONDS,
+                )
+            cache.delete(_USER_DIRECTORY_REFRESH_LOCK_KEY)
+            close_old_connections()
+
+    threading.Thread(target=_run, daemon=True, name="user-directory-refresh").start()
+
+
+def get_user_directory() -> list[UserDirectoryEntry]:
+    """Return the sorted user directory index, serving stale data while refreshing.
+
+    Only a cold cache blocks on FreeIPA. Once the index exists, an expired
+    freshness marker (or an invalidation through
+    ``_invalidate_users_list_cache``) schedules a background rebuild and the
+    current index keeps being served until it lands. A failed rebuild is not
+    retried for ``_USER_DIRECTORY_REFRESH_BACKOFF_SECONDS``.
+    """
+
+    entries = freeipa_local_cache.get(_users_directory_cache_key())
+    if entries is None:
+        return refresh_user_directory() or []
+
+    if (
+        freeipa_local_cache.get(
+            _users_directory_fresh_cache_key(),
+            local_ttl=_USER_DIRECTORY_FRESH_FLAG_LOCAL_TTL_SECONDS,
+        )
+        is None
+    ):
+        _refresh_user_directory_in_background()
+    return cast(list[UserDirectoryEntry], entries)
 
 
 def search_freeipa_users(
@@ -229,3 +376,325 @@ def search_freeipa_users(
 
     matches.sort(key=lambda user: str(user.username).lower())
     return matches[:limit]
+
+
+@dataclass(frozen=True, slots=True)
+class GroupIndexEntry:
+    cn: str
+    description: str
+    fas_group: bool
+    # Lowercased cn and description, newline-joined so a typed query cannot span both.
+    search_text: str
+
+
+def _group_ngrams(text: str) -> set[str]:
+    return {text[index : index + _GROUP_INDEX_NGRAM] for index in range(len(text) - _GROUP_INDEX_NGRAM + 1)}
+
+
+class GroupSearchIndex:
+    """Read-only search structure over one snapshot of ``FreeIPAGroup.all()``.
+
+    Entries are sorted by lowercased cn, so scanning stops at the first
+    ``limit`` hits and results need no re-sorting. Queries of three or more
+    characters only look at entries sharing every trigram with the query;
+    shorter ones scan the precomputed lowercase text. ``groups_by_username``
+    maps each direct member or sponsor to the entries they belong to.
+    """
+
+    def __init__(self, groups: Iterable[object]) -> None:
+        entries: list[GroupIndexEntry] = []
+        usernames_by_cn: dict[str, set[str]] = {}
+        for group in groups:
+            cn = str(getattr(group, "cn", "") or "").strip()
+            if not cn:
+                continue
+            description = str(getattr(group, "description", "") or "").strip()
+            entries.append(
+                GroupIndexEntry(
+                    cn=cn,
+                    description=description,
+                    fas_group=bool(getattr(group, "fas_group", False)),
+                    search_text=f"{cn.lower()}\n{description.lower()}",
+                )
+            )
+            # Some tests patch FreeIPAGroup objects with lightweight stubs that
+            # omit membership attributes.
+            usernames_by_cn[cn] = {
+                str(username).strip()
+                for username in [*getattr(group, "members", []), *getattr(group, "sponsors", [])]
+                if str(username).strip()
+            }
+
+        entries.sort(key=lambda entry: entry.cn.lower())
+        self.entries: tuple[GroupIndexEntry, ...] = tuple(entries)
+
+        postings: dict[str, list[int]] = {}
+        groups_by_username: dict[str, list[int]] = {}
+        for position, entry in enumerate(self.entries):
+            for ngram in _group_ngrams(entry.search_text):
+                postings.setdefault(ngram, []).append(position)
+            for username in usernames_by_cn.get(entry.cn, ()):
+                groups_by_username.setdefault(username, []).append(position)
+        self._postings = {ngram: frozenset(positions) for ngram, positions in postings.items()}
+        self._groups_by_username = {username: tuple(positions) for username, positions in groups_by_username.items()}
+
+    def _text_matches(self, q_lower: str) -> Iterable[int]:
+        if not q_lower:
+            return range(len(self.entries))
+        if len(q_lower) < _GROUP_INDEX_NGRAM:
+            return (position for position, entry in enumerate(self.entries) if q_lower in entry.search_text)
+
+        postings = sorted((self._postings.get(ngram, frozenset()) for ngram in _group_ngrams(q_lower)), key=len)
+        candidates = set(postings[0]).intersection(*postings[1:])
+        return (position for position in sorted(candidates) if q_lower in self.entries[position].search_text)
+
+    def search(
+        self,
+        q: str,
+        *,
+        fas_only: bool,
+        limit: int,
+        member_usernames: Collection[str] = (),
+    ) -> list[GroupIndexEntry]:
+        """Return up to ``limit`` groups, by lowercased cn, whose cn or description
+        contains ``q`` or that have one of ``member_usernames`` as a direct member
+        or sponsor."""
+
+        matches = self._text_matches(q.lower())
+        if member_usernames:
+            positions = set(matches)
+            for username in member_usernames:
+                positions.update(self._groups_by_username.get(username, ()))
+            matches = sorted(positions)
+
+        results: list[GroupIndexEntry] = []
+        for position in matches:
+            entry = self.entries[position]
+            if fas_only and not entry.fas_group:
+                continue
+            results.append(entry)
+            if len(results) >= limit:
+                break
+        return results
+
+
+class _GroupIndexCache:
+    """Per-process `GroupSearchIndex`, rebuilt once per group-list generation.
+
+    `_invalidate_groups_list_cache` bumps a shared generation counter; workers
+    compare it at most every ``FREEIPA_L1_CACHE_GENERATION_CHECK_SECONDS``. An
+    index older than ``FREEIPA_GROUP_INDEX_MAX_AGE_SECONDS`` is rebuilt anyway,
+    because the shared group list can also expire and be refetched without an
+    invalidation. A max age of 0 disables the cache.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._index: GroupSearchIndex | None = None
+        self._generation: object = None
+        self._built_at = 0.0
+        self._checked_at = 0.0
+
+    def get(self) -> GroupSearchIndex:
+        max_age = settings.FREEIPA_GROUP_INDEX_MAX_AGE_SECONDS
+        if max_age <= 0:
+            return GroupSearchIndex(FreeIPAGroup.all())
+
+        now = time.monotonic()
+        with self._lock:
+            index = self._index
+            fresh = index is not None and now - self._built_at < max_age
+            if fresh and now - self._checked_at < settings.FREEIPA_L1_CACHE_GENERATION_CHECK_SECONDS:
+                return index
+
+        generation = cache.get(_groups_list_generation_cache_key(), 0)
+        with self._lock:
+            if fresh and self._index is index and generation == self._generation:
+                self._checked_at = now
+                return index
+
+        index = GroupSearchIndex(FreeIPAGroup.all())
+        with self._lock:
+            self._index = index
+            self._generation = generation
+            self._built_at = now
+            self._checked_at = now
+        return index
+
+    def clear(self) -> None:
+        with self._lock:
+            self._index = None
+
+
+_group_index_cache = _GroupIndexCache()
+
+
+def get_group_search_index() -> GroupSearchIndex:
+    return _group_index_cache.get()
+
+
+def _load_live_usernames() -> frozenset[str]:
+    return frozenset(
+        normalized
+        for normalized in (str(user.username or "").strip().lower() for user in FreeIPAUser.all(respect_privacy=False))
+        if normalized
+    )
+
+
+def get_live_usernames() -> frozenset[str]:
+    """Return the lowercased usernames of every directory account.
+
+    The set is cached on its own, stamped with the user-list generation, so
+    readers unpickle one set of strings instead of every user's attribute dict.
+    `_invalidate_users_list_cache` bumps the generation and stales the stamp.
+    An empty set means FreeIPA could not be listed and is never cached.
+    """
+
+    timeout = settings.FREEIPA_LIVE_USERNAMES_CACHE_SECONDS
+    if timeout <= 0:
+        return _load_live_usernames()
+
+    generation = freeipa_local_cache.get(
+        _users_list_generation_cache_key(),
+        local_ttl=_USERS_GENERATION_LOCAL_TTL_SECONDS,
+    ) or 0
+    cached = freeipa_local_cache.get(_live_usernames_cache_key())
+    if isinstance(cached, tuple) and len(cached) == 2 and cached[0] == generation:
+        return cast(frozenset[str], cached[1])
+
+    usernames = _load_live_usernames()
+    if usernames:
+        freeipa_local_cache.set(_live_usernames_cache_key(), (generation, usernames), timeout=timeout)
+    return usernames
+
+
+def _mail_values(user: FreeIPAUser) -> list[str]:
+    value = user._user_data.get("mail")
+    values = value if isinstance(value, list) else [value]
+    return [str(item).strip().lower() for item in values if str(item or "").strip()]
+
+
+class UserEmailIndex:
+    """Lowercased mail address -> usernames over one snapshot of ``FreeIPAUser.all()``.
+
+    Every ``mail`` value is indexed, not only the primary one, so alternate
+    addresses match the way ``user_find(o_mail=...)`` does. ``complete`` is
+    False when the user list could not be fetched; callers then fall back to
+    targeted FreeIPA lookups. ``remember()`` folds such a lookup back in, so
+    an account created after the snapshot is only searched for once.
+    """
+
+    def __init__(self, users: Iterable[FreeIPAUser]) -> None:
+        usernames_by_email: dict[str, set[str]] = {}
+        usernames: set[str] = set()
+        for user in users:
+            username = str(user.username or "").strip()
+            if not username:
+                continue
+            usernames.add(username.lower())
+            for email in _mail_values(user):
+                usernames_by_email.setdefault(email, set()).add(username)
+
+        self.complete = bool(usernames)
+        self._usernames = usernames
+        self._usernames_by_email = {email: frozenset(names) for email, names in usernames_by_email.items()}
+
+    @property
+    def user_count(self) -> int:
+        return len(self._usernames)
+
+    @property
+    def usernames_by_email(self) -> Mapping[str, frozenset[str]]:
+        return self._usernames_by_email
+
+    def usernames_for(self, email: str) -> frozenset[str]:
+        return self._usernames_by_email.get(str(email or "").strip().lower(), frozenset())
+
+    def has_username(self, username: str) -> bool:
+        return str(username or "").strip().lower() in self._usernames
+
+    def remember(self, email: str, usernames: Iterable[str]) -> None:
+        normalized = str(email or "").strip().lower()
+        found = {str(username).strip() for username in usernames if str(username or "").strip()}
+        if not normalized or not found:
+            return
+        # Rebinding whole values keeps concurrent readers on a consistent entry.
+        self._usernames_by_email[normalized] = self.usernames_for(normalized) | found
+        self._usernames = self._usernames | {username.lower() for username in found}
+
+
+class _UserEmailIndexCache:
+    """Per-process `UserEmailIndex`, rebuilt once per user-list generation.
+
+    Works like `_GroupIndexCache`: `_invalidate_users_list_cache` bumps the
+    generation counter and ``FREEIPA_USER_EMAIL_INDEX_MAX_AGE_SECONDS`` bounds
+    how long an index outlives a silently expired user list. A max age of 0
+    disables the cache.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._index: UserEmailIndex | None = None
+        self._generation: object = None
+        self._built_at = 0.0
+        self._checked_at = 0.0
+
+    def get(self) -> UserEmailIndex:
+        max_age = settings.FREEIPA_USER_EMAIL_INDEX_MAX_AGE_SECONDS
+        if max_age <= 0:
+            return UserEmailIndex(FreeIPAUser.all(respect_privacy=False))
+
+        now = time.monotonic()
+        with self._lock:
+            index = self._index
+            fresh = index is not None and index.complete and now - self._built_at < max_age
+            if fresh and now - self._checked_at < settings.FREEIPA_L1_CACHE_GENERATION_CHECK_SECONDS:
+                return index
+
+        generation = cache.get(_users_list_generation_cache_key(), 0)
+        with self._lock:
+            if fresh and self._index is index and generation == self._generation:
+                self._checked_at = now
+                return index
+
+        index = UserEmailIndex(FreeIPAUser.all(respect_privacy=False))
+        with self._lock:
+            self._index = index
+            self._generation = generation
+            self._built_at = now
+            self._checked_at = now
+        return index
+
+    def refresh(self) -> UserEmailIndex:
+        """Rebuild from a direct FreeIPA listing, leaving the shared user list alone."""
+
+        generation = cache.get(_users_list_generation_cache_key(), 0)
+        index = UserEmailIndex(snapshot_freeipa_users(respect_privacy=False))
+        if settings.FREEIPA_USER_EMAIL_INDEX_MAX_AGE_SECONDS > 0:
+            now = time.monotonic()
+            with self._lock:
+                self._index = index
+                self._generation = generation
+                self._built_at = now
+                self._checked_at = now
+        return index
+
+    def clear(self) -> None:
+        with self._lock:
+            self._index = None
+
+
+_user_email_index_cache = _UserEmailIndexCache()
+
+
+def get_user_email_index(*, refresh: bool = False) -> UserEmailIndex:
+    """Return the shared email index; ``refresh`` rebuilds it from FreeIPA first.
+
+    A refreshed index is a current view of the directory, so a miss in it
+    means no account uses that address. Refreshing does not touch the cached
+    user list, so other workers keep their indexes.
+    """
+
+    if refresh:
+        return _user_email_index_cache.refresh()
+    return _user_email_index_cache.get()
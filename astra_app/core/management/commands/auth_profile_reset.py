@@ -19,7 +19,7 @@ from core.freeipa.e2e_registry import (
     is_e2e_fake_freeipa_enabled,
     reset_e2e_fake_freeipa_state,
 )
-from core.freeipa.utils import _user_cache_key
+from core.freeipa.utils import _invalidate_user_cache
 from core.models import (
     AccountDeletionRequest,
     FreeIPAPermissionGrant,
@@ -67,7 +67,7 @@ class Command(BaseCommand):
 
         for username in E2E_FREEIPA_USERNAMES:
             invalidate_sessions_for_freeipa_username(username)
-            cache.delete(_user_cache_key(username))
+            _invalidate_user_cache(username)
             clear_subject_rate_limit(scope="auth.login", subject=username)
 
         reset_e2e_fake_freeipa_state()
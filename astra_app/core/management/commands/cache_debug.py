@@ -5,6 +5,7 @@ from django.core.cache import cache, caches
 from django.core.management.base import BaseCommand
 
 from core.cache_tools import list_cache_keys_from_backend, safe_cache_preview
+from core.freeipa.local_cache import freeipa_local_cache
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +39,11 @@ class Command(BaseCommand):
             help="Truncate printed values to this many characters (0 = no truncation).",
         )
         parser.add_argument("--pretty", action="store_true", help="Pretty-print dict/list values as JSON.")
+        parser.add_argument(
+            "--l1-stats",
+            action="store_true",
+            help="Show hit/miss/eviction counters of the per-process FreeIPA L1 cache.",
+        )
 
     def handle(self, *args, **options):
         max_chars: int = options["max_chars"]
@@ -90,6 +96,10 @@ class Command(BaseCommand):
                 for k in keys:
                     logger.info(k)
 
+        if options.get("l1_stats"):
+            logger.info("FreeIPA L1 cache stats (this process only): %s", json.dumps(freeipa_local_cache.stats(), sort_keys=True))
+            logger.info("Live worker stats are in the freeipa_l1 section of /__debug__/cache/.")
+
         # Default behavior if no flags: show a tiny hint.
-        if not (delete_keys or get_keys or options.get("list") or options.get("keys")):
-            logger.info("Use --list, --keys, --get <key>, or --delete <key>.")
+        if not (delete_keys or get_keys or options.get("list") or options.get("keys") or options.get("l1_stats")):
+            logger.info("Use --list, --keys, --l1-stats, --get <key>, or --delete <key>.")
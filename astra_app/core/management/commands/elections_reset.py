@@ -14,6 +14,7 @@ from core.elections_services import (
     close_election,
     election_quorum_status,
     issue_credentials_at_start_transition,
+    reconcile_election_turnout,
     submit_ballot,
     tally_election,
 )
@@ -26,6 +27,7 @@ from core.models import (
     Candidate,
     Election,
     ElectionRoll,
+    ElectionTurnout,
     ExclusionGroup,
     FreeIPAPermissionGrant,
     Membership,
@@ -916,6 +918,7 @@ class Command(BaseCommand):
                 continue
             VotingCredential.objects.filter(election=election).delete()
             ElectionRoll.objects.filter(election=election).delete()
+            ElectionTurnout.objects.filter(election=election).delete()
             AuditLogEntry.objects.filter(election=election).delete()
             Election.objects.filter(pk=election.pk).update(
                 status=Election.Status.draft,
@@ -1055,6 +1058,8 @@ class Command(BaseCommand):
                 freeipa_username=None,
                 weight=1,
             )
+        # Direct weight rewrites bypass the maintained turnout counters.
+        reconcile_election_turnout(election=election)
 
     def _ensure_election_roll(self, *, election: Election) -> None:
         """Populate ElectionRoll from group membership if missing.
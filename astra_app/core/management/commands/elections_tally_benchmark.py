@@ -0,0 +1,165 @@
+import json
+from statistics import median
+from typing import override
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.elections_meek_benchmark import (
+    BALLOT_LENGTH_MODES,
+    GOLDEN_SPECS,
+    SyntheticElectionSpec,
+    TallyBenchmarkResult,
+    golden_mismatches,
+    load_golden_result,
+    run_tally_benchmark,
+    write_golden_result,
+)
+
+
+def _parse_weights(raw: str) -> tuple[int, ...]:
+    try:
+        weights = tuple(int(part) for part in raw.split(",") if part.strip())
+    except ValueError as exc:
+        raise CommandError(f"--weights must be a comma-separated list of integers: {raw!r}") from exc
+    if not weights or any(weight < 0 for weight in weights):
+        raise CommandError("--weights must contain at least one non-negative integer")
+    return weights
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the Meek STV tally on synthetic elections and check the stored "
+        "golden tally results."
+    )
+
+    @override
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--voters", type=int, default=1000, help="Number of ballots to generate.")
+        parser.add_argument("--candidates", type=int, default=10, help="Number of candidates.")
+        parser.add_argument("--seats", type=int, default=3, help="Number of seats.")
+        parser.add_argument(
+            "--exclusion-groups",
+            type=int,
+            default=0,
+            help="Number of two-candidate exclusion groups (max 1 elected each).",
+        )
+        parser.add_argument(
+            "--ballot-length",
+            choices=BALLOT_LENGTH_MODES,
+            default="partial",
+            help="full: rank everyone; partial: random length; short: rank at most 3.",
+        )
+        parser.add_argument("--weights", default="1", help="Comma-separated ballot weights to sample from.")
+        parser.add_argument("--seed", type=int, default=0, help="Random seed for the synthetic election.")
+        parser.add_argument("--repeat", type=int, default=1, help="Run the tally this many times and report the median.")
+        parser.add_argument(
+            "--no-memory",
+            action="store_true",
+            help="Skip tracemalloc peak-memory tracking (it slows the tally down noticeably).",
+        )
+        parser.add_argument(
+            "--golden",
+            action="store_true",
+            help="Run the built-in golden scenarios and compare against the stored tally results.",
+        )
+        parser.add_argument(
+            "--update-golden",
+            action="store_true",
+            help="Rewrite the stored golden tally results from the current engine (review the diff!).",
+        )
+        parser.add_argument("--json", action="store_true", help="Print one JSON object per scenario.")
+
+    @override
+    def handle(self, *args, **options) -> None:
+        repeat: int = options["repeat"]
+        if repeat < 1:
+            raise CommandError("--repeat must be at least 1")
+        trace_memory = not options["no_memory"]
+        as_json: bool = options["json"]
+
+        if options["golden"] or options["update_golden"]:
+            self._run_golden(
+                update=bool(options["update_golden"]),
+                repeat=repeat,
+                trace_memory=trace_memory,
+                as_json=as_json,
+            )
+            return
+
+        spec = SyntheticElectionSpec(
+            name="custom",
+            voters=options["voters"],
+            candidates=options["candidates"],
+            seats=options["seats"],
+            exclusion_groups=options["exclusion_groups"],
+            ballot_length=options["ballot_length"],
+            weight_choices=_parse_weights(options["weights"]),
+            seed=options["seed"],
+        )
+        try:
+            results = [run_tally_benchmark(spec, trace_memory=trace_memory) for _ in range(repeat)]
+        except ValueError as exc:
+            raise CommandError(str(exc)) from exc
+        self._report(results, as_json=as_json, golden_status=None)
+
+    def _run_golden(self, *, update: bool, repeat: int, trace_memory: bool, as_json: bool) -> None:
+        failures: list[str] = []
+        for spec in GOLDEN_SPECS:
+            results = [run_tally_benchmark(spec, trace_memory=trace_memory) for _ in range(repeat)]
+            actual = results[0].tally_result
+
+            if update:
+                path = write_golden_result(spec, actual)
+                self._report(results, as_json=as_json, golden_status=f"written to {path.name}")
+                continue
+
+            expected = load_golden_result(spec)
+            if expected is None:
+                failures.append(f"{spec.name}: no golden result stored")
+                self._report(results, as_json=as_json, golden_status="missing")
+                continue
+
+            problems = golden_mismatches(expected=expected, actual=actual)
+            failures.extend(f"{spec.name}: {problem}" for problem in problems)
+            self._report(results, as_json=as_json, golden_status="mismatch" if problems else "ok")
+
+        if failures:
+            raise CommandError("Golden tally results differ:\n" + "\n".join(failures))
+
+    def _report(self, results: list[TallyBenchmarkResult], *, as_json: bool, golden_status: str | None) -> None:
+        first = results[0]
+        spec = first.spec
+        payload: dict[str, object] = {
+            "scenario": spec.name,
+            "voters": spec.voters,
+            "candidates": spec.candidates,
+            "seats": spec.seats,
+            "exclusion_groups": spec.exclusion_groups,
+            "ballot_length": spec.ballot_length,
+            "seed": spec.seed,
+            "runs": len(results),
+            "tally_seconds": round(median(r.tally_seconds for r in results), 6),
+            "sankey_seconds": round(median(r.sankey_seconds for r in results), 6),
+            "peak_memory_bytes": max(r.peak_memory_bytes for r in results),
+            "iterations": sum(first.iterations_per_round),
+            "iterations_per_round": first.iterations_per_round,
+            "elected": first.tally_result.get("elected"),
+        }
+        if golden_status is not None:
+            payload["golden"] = golden_status
+
+        if as_json:
+            self.stdout.write(json.dumps(payload))
+            return
+
+        memory = f"{payload['peak_memory_bytes'] / 1024:.0f} KiB" if payload["peak_memory_bytes"] else "n/a"
+        line = (
+            f"{spec.name}: {spec.voters} voters, {spec.candidates} candidates, {spec.seats} seats"
+            f" | tally {payload['tally_seconds']:.4f}s, sankey {payload['sankey_seconds']:.4f}s"
+            f" | peak memory {memory}"
+            f" | {payload['iterations']} iterations {first.iterations_per_round}"
+            f" | elected {payload['elected']}"
+        )
+        if golden_status is not None:
+            line += f" | golden {golden_status}"
+        self.stdout.write(line)
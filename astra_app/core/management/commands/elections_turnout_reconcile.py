@@ -0,0 +1,54 @@
+from typing import override
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.elections_services import reconcile_election_turnout
+from core.elections_turnout import compute_election_turnout, election_turnout_counts
+from core.models import Election, ElectionTurnout
+
+
+class Command(BaseCommand):
+    help = "Rebuild the maintained election turnout counters from credentials and ballots."
+
+    @override
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--election-id", type=int, help="Only reconcile this election.")
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report counter drift without writing.",
+        )
+
+    @override
+    def handle(self, *args, **options) -> None:
+        election_id = options.get("election_id")
+        dry_run = bool(options.get("dry_run"))
+
+        elections = Election.objects.active().exclude(status=Election.Status.draft).order_by("id")
+        if election_id is not None:
+            elections = elections.filter(pk=election_id)
+            if not elections.exists():
+                raise CommandError(f"No non-draft election with id {election_id}.")
+
+        drifted = 0
+        for election in elections:
+            if dry_run:
+                rebuilt = compute_election_turnout(election_id=election.id)
+                tracked = ElectionTurnout.objects.filter(election_id=election.id).exists()
+                previous = election_turnout_counts(election=election) if tracked else None
+            else:
+                rebuilt, previous = reconcile_election_turnout(election=election)
+
+            if previous == rebuilt:
+                continue
+            drifted += 1
+            if previous is None:
+                self.stdout.write(f"election {election.id}: counters missing, rebuilt {rebuilt}")
+            else:
+                changes = ", ".join(
+                    f"{key} {previous[key]} -> {rebuilt[key]}" for key in rebuilt if previous[key] != rebuilt[key]
+                )
+                self.stdout.write(f"election {election.id}: {changes}")
+
+        verb = "would be rebuilt" if dry_run else "rebuilt"
+        self.stdout.write(self.style.SUCCESS(f"{drifted} election(s) {verb}."))
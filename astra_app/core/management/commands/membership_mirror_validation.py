@@ -1,4 +1,5 @@
 import logging
+from concurrent.futures import FIRST_COMPLETED, Future, wait
 from typing import override
 
 from django.core.management.base import BaseCommand, CommandError
@@ -7,6 +8,8 @@ from django.utils import timezone
 from core.membership_constants import MembershipCategoryCode
 from core.mirror_membership_validation import (
     _CLOSED_MEMBERSHIP_REQUEST_STATUSES,
+    MirrorValidationRun,
+    ValidationOutcome,
     build_validation_debug_lines,
     build_validation_note_content,
     claim_next_validation,
@@ -51,6 +54,11 @@ class Command(BaseCommand):
             type=int,
             help="Run validation directly for one membership request ID for debugging.",
         )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            help="Validations to check concurrently (default: MIRROR_VALIDATION_WORKERS).",
+        )
 
     @override
     def handle(self, *args, **options) -> None:
@@ -59,6 +67,9 @@ class Command(BaseCommand):
         dry_run: bool = bool(options.get("dry_run"))
         fix: bool = bool(options.get("fix"))
         request_id = options.get("request_id")
+        workers = options.get("workers")
+        if workers is not None and workers < 1:
+            raise CommandError("--workers must be at least 1")
 
         logger.info(
             "mirror_validation.start force=%s dry_run=%s fix=%s request_id=%s",
@@ -86,88 +97,121 @@ class Command(BaseCommand):
                 for request_id in missing_request_ids:
                     logger.info("dry-run: missing mirror validation row for request %s", request_id)
                 return
-            for validation in validations:
-                request_id = validation.membership_request.pk
-                if validation.membership_request.status in _CLOSED_MEMBERSHIP_REQUEST_STATUSES:
-                    logger.info("dry-run: would delete closed-request validation for request %s", request_id)
-                    continue
-                run_validation(membership_request=validation.membership_request)
-                logger.info("dry-run: would validate request %s status=%s", request_id, validation.status)
+            with MirrorValidationRun(workers=workers) as run:
+                checks = {
+                    validation.pk: run.submit(run_validation, membership_request=validation.membership_request)
+                    for validation in validations
+                    if validation.membership_request.status not in _CLOSED_MEMBERSHIP_REQUEST_STATUSES
+                }
+                for validation in validations:
+                    request_id = validation.membership_request.pk
+                    check = checks.get(validation.pk)
+                    if check is None:
+                        logger.info("dry-run: would delete closed-request validation for request %s", request_id)
+                        continue
+                    check.result()
+                    logger.info("dry-run: would validate request %s status=%s", request_id, validation.status)
             for request_id in missing_request_ids:
                 logger.info("dry-run: missing mirror validation row for request %s", request_id)
             return
 
         processed = 0
-        while True:
-            claimed = claim_next_validation(now=timezone.now(), force=force)
-            if claimed is None:
-                break
+        # Keep at most one claimed row per worker so no claim lease runs out while queued.
+        with MirrorValidationRun(workers=workers) as run:
+            in_flight: dict[Future[ValidationOutcome], tuple[MirrorMembershipValidation, bool]] = {}
+            exhausted = False
+            while True:
+                while not exhausted and len(in_flight) < run.workers:
+                    claimed = claim_next_validation(now=timezone.now(), force=force)
+                    if claimed is None:
+                        exhausted = True
+                        break
+                    validation, reclaimed = claimed
+                    if self._delete_if_closed(validation=validation, reclaimed=reclaimed):
+                        processed += 1
+                        continue
+                    future = run.submit(run_validation, membership_request=validation.membership_request)
+                    in_flight[future] = (validation, reclaimed)
 
-            validation, reclaimed = claimed
-            request_id = validation.membership_request.pk
-            if reclaimed:
-                logger.info(
-                    f"mirror_validation.reclaimed: {request_id}",
-                    extra={
-                        "request_id": request_id,
-                    },
-                )
+                if not in_flight:
+                    break
+                done, _pending = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    validation, reclaimed = in_flight.pop(future)
+                    self._finalize(validation=validation, reclaimed=reclaimed, outcome=future.result())
+                    processed += 1
 
-            if validation.membership_request.status in _CLOSED_MEMBERSHIP_REQUEST_STATUSES:
-                validation.delete()
-                processed += 1
+        if processed == 0:
+            logger.info("mirror_validation.none_due")
+            for request_id in self._missing_open_mirror_request_ids():
                 logger.info(
-                    f"mirror_validation.deleted_closed_request: {request_id}",
+                    f"mirror_validation.missing_row: {request_id}",
                     extra={
                         "request_id": request_id,
-                        "reclaimed": reclaimed,
                     },
                 )
-                continue
-
-            outcome = run_validation(membership_request=validation.membership_request)
-            note_content = finalize_validation(
-                validation=validation,
-                outcome=outcome,
-                now=timezone.now(),
-            )
-            validation.refresh_from_db()
-            processed += 1
 
+    def _delete_if_closed(self, *, validation: MirrorMembershipValidation, reclaimed: bool) -> bool:
+        request_id = validation.membership_request.pk
+        if reclaimed:
             logger.info(
-                f"mirror_validation.processed: {request_id}",
+                f"mirror_validation.reclaimed: {request_id}",
                 extra={
                     "request_id": request_id,
-                    "validation_status": validation.status,
-                    "attempt_count": validation.attempt_count,
-                    "reclaimed": reclaimed,
                 },
             )
+
+        if validation.membership_request.status not in _CLOSED_MEMBERSHIP_REQUEST_STATUSES:
+            return False
+        validation.delete()
+        logger.info(
+            f"mirror_validation.deleted_closed_request: {request_id}",
+            extra={
+                "request_id": request_id,
+                "reclaimed": reclaimed,
+            },
+        )
+        return True
+
+    def _finalize(
+        self,
+        *,
+        validation: MirrorMembershipValidation,
+        reclaimed: bool,
+        outcome: ValidationOutcome,
+    ) -> None:
+        request_id = validation.membership_request.pk
+        note_content = finalize_validation(
+            validation=validation,
+            outcome=outcome,
+            now=timezone.now(),
+        )
+        validation.refresh_from_db()
+
+        logger.info(
+            f"mirror_validation.processed: {request_id}",
+            extra={
+                "request_id": request_id,
+                "validation_status": validation.status,
+                "attempt_count": validation.attempt_count,
+                "reclaimed": reclaimed,
+            },
+        )
+        logger.info(
+            f"mirror_validation.processed_stdout: {request_id}",
+            extra={
+                "request_id": request_id,
+                "validation_status": validation.status,
+            },
+        )
+        self._write_debug_output(request_id=request_id, result=validation.result)
+        if note_content is not None:
             logger.info(
-                f"mirror_validation.processed_stdout: {request_id}",
+                f"mirror_validation.wrote_note: {request_id}",
                 extra={
                     "request_id": request_id,
-                    "validation_status": validation.status,
                 },
             )
-            self._write_debug_output(request_id=request_id, result=validation.result)
-            if note_content is not None:
-                logger.info(
-                    f"mirror_validation.wrote_note: {request_id}",
-                    extra={
-                        "request_id": request_id,
-                    },
-                )
-
-        if processed == 0:
-            logger.info("mirror_validation.none_due")
-            for request_id in self._missing_open_mirror_request_ids():
-                logger.info(
-                    f"mirror_validation.missing_row: {request_id}",
-                    extra={
-                        "request_id": request_id,
-                    },
-                )
 
     def _missing_open_mirror_request_ids(self) -> list[int]:
         queryset = (
@@ -6,7 +6,7 @@ from django.core.management.base import BaseCommand
 from django.utils import timezone
 
 from core.email_context import membership_committee_email_context
-from core.freeipa.user import FreeIPAUser
+from core.freeipa_directory import get_live_usernames
 from core.membership import visible_committee_membership_requests
 from core.membership_notifications import (
     committee_recipient_emails_for_permission_graceful,
@@ -43,15 +43,14 @@ class Command(BaseCommand):
         dry_run: bool = bool(options.get("dry_run"))
         today = timezone.localdate()
 
-        all_freeipa_users = FreeIPAUser.all()
-        live_users_by_username = {freeipa_user.username: freeipa_user for freeipa_user in all_freeipa_users if freeipa_user.username}
+        live_usernames = get_live_usernames()
 
         pending_count = len(
             visible_committee_membership_requests(
                 MembershipRequest.objects.select_related("requested_organization")
                 .filter(status=MembershipRequest.Status.pending)
                 .order_by("requested_at", "pk"),
-                live_users_by_username=live_users_by_username,
+                live_usernames=live_usernames,
             )
         )
         if pending_count <= 0:
@@ -89,7 +88,7 @@ class Command(BaseCommand):
             return
 
         oldest_wait_time = oldest_pending_membership_request_wait_time(
-            live_users_by_username=live_users_by_username,
+            live_usernames=live_usernames,
         )
 
         if dry_run:
@@ -0,0 +1,29 @@
+from typing import override
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from core.membership_stats import rebuild_membership_stats_rollups
+
+
+class Command(BaseCommand):
+    help = "Rebuild the daily membership statistics rollups from the membership log."
+
+    @override
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Count the rows a rebuild would write without replacing the rollups.",
+        )
+
+    @override
+    def handle(self, *args, **options) -> None:
+        dry_run: bool = bool(options.get("dry_run"))
+        day_rows, cohort_rows = rebuild_membership_stats_rollups(now=timezone.now(), dry_run=dry_run)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{'Would write' if dry_run else 'Wrote'} {day_rows} daily row(s) "
+                f"and {cohort_rows} retention cohort(s)."
+            )
+        )
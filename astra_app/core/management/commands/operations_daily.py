@@ -10,7 +10,8 @@ logger = logging.getLogger(__name__)
 class Command(BaseCommand):
     help = (
         "Run the daily operations: expiration warnings, expired cleanup, "
-        "committee pending-request notifications, team-leads sync, and embargoed-members notifications."
+        "committee pending-request notifications, team-leads sync, embargoed-members notifications, "
+        "and membership statistics rollups."
     )
 
     @override
@@ -46,6 +47,7 @@ class Command(BaseCommand):
             ("membership_embargoed_members", {"force": force, "dry_run": dry_run}),
             ("selfservice_lifecycle_cleanup", {"dry_run": dry_run}),
             ("account_invitations_refresh", {}),
+            ("membership_stats_rollup", {"dry_run": dry_run}),
         ):
             logger.info("operations_daily: running %s", command_name)
             call_command(command_name, **command_kwargs)
@@ -0,0 +1,137 @@
+import logging
+import signal
+import threading
+import time
+from typing import override
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.db.models import Count
+from django.utils import timezone
+
+from core.logging_extras import current_exception_log_fields
+from core.outbox import drain_outbox, due_outbox_queryset, purge_delivered_outbox
+
+logger = logging.getLogger(__name__)
+
+# A long-running drain purges old delivered rows at most this often.
+_PURGE_INTERVAL_SECONDS = 3600
+
+
+class Command(BaseCommand):
+    help = "Deliver queued outbox messages (Mattermost webhooks, Rekor attestations, SES events)."
+
+    @override
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=50,
+            help="Messages claimed per batch.",
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep polling for new messages instead of exiting once nothing is due.",
+        )
+        parser.add_argument(
+            "--max-seconds",
+            type=float,
+            default=0.0,
+            help="With --loop, stop polling after this many seconds (0 runs until stopped).",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=2.0,
+            help="With --loop, seconds to sleep when nothing is due.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report due messages by kind without delivering them.",
+        )
+
+    @override
+    def handle(self, *args, **options) -> None:
+        batch_size = int(options["batch_size"])
+        loop = bool(options.get("loop"))
+        max_seconds = float(options["max_seconds"])
+        poll_interval = float(options["poll_interval"])
+        if batch_size <= 0:
+            raise CommandError("--batch-size must be positive")
+        if loop and poll_interval <= 0:
+            raise CommandError("--poll-interval must be positive")
+
+        if options.get("dry_run"):
+            due = (
+                due_outbox_queryset(now=timezone.now())
+                .values("kind")
+                .annotate(count=Count("id"))
+                .order_by("kind")
+            )
+            for row in due:
+                self.stdout.write(f"{row['kind']}: {row['count']} due")
+            return
+
+        stop = threading.Event()
+        previous_handlers = (
+            {signum: signal.signal(signum, lambda *_args: stop.set()) for signum in (signal.SIGTERM, signal.SIGINT)}
+            if loop
+            else {}
+        )
+        started_at = time.monotonic()
+        purged_at = started_at
+        totals = {"claimed": 0, "delivered": 0, "retried": 0, "failed": 0, "purged": 0}
+        try:
+            # A signal arriving mid-batch only stops the loop once the batch's rows are saved.
+            while not stop.is_set():
+                try:
+                    result = drain_outbox(batch_size=batch_size)
+                except Exception:
+                    if not loop:
+                        raise
+                    logger.exception("outbox_drain: drain iteration failed", extra=current_exception_log_fields())
+                    # The connection is kept between polls; reconnect in case the database went away.
+                    connection.close()
+                    if max_seconds and time.monotonic() - started_at + poll_interval >= max_seconds:
+                        break
+                    stop.wait(poll_interval)
+                    continue
+                for key in ("claimed", "delivered", "retried", "failed"):
+                    totals[key] += getattr(result, key)
+                if result.claimed:
+                    logger.info(
+                        "outbox.drained",
+                        extra={
+                            "claimed": result.claimed,
+                            "reclaimed": result.reclaimed,
+                            "delivered": result.delivered,
+                            "retried": result.retried,
+                            "failed": result.failed,
+                            "max_latency_ms": result.max_latency_ms,
+                        },
+                    )
+                    if result.claimed == batch_size and (
+                        not loop or not max_seconds or time.monotonic() - started_at < max_seconds
+                    ):
+                        continue
+
+                now = time.monotonic()
+                if now - purged_at >= _PURGE_INTERVAL_SECONDS:
+                    totals["purged"] += purge_delivered_outbox(now=timezone.now())
+                    purged_at = now
+                if not loop or (max_seconds and now - started_at + poll_interval >= max_seconds):
+                    break
+                stop.wait(poll_interval)
+        finally:
+            for signum, handler in previous_handlers.items():
+                signal.signal(signum, handler)
+
+        totals["purged"] += purge_delivered_outbox(now=timezone.now())
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{totals['delivered']} delivered, {totals['retried']} to retry, "
+                f"{totals['failed']} failed, {totals['purged']} purged."
+            )
+        )
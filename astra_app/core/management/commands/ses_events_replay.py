@@ -0,0 +1,112 @@
+import logging
+from collections import Counter
+from typing import Any, override
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from core.models import OutboxMessage
+from core.ses_signals import SESMilestoneEvent, ingest_ses_events
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "Re-run batched ingestion for SES events stored in the outbox."
+
+    @override
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "ids",
+            nargs="*",
+            type=int,
+            help="Outbox message ids to replay (default: every stored SES event matching --status/--since).",
+        )
+        parser.add_argument(
+            "--status",
+            choices=OutboxMessage.Status.values,
+            default=OutboxMessage.Status.failed_terminal,
+            help="Only replay messages in this outbox status when no ids are given (default: failed_terminal).",
+        )
+        parser.add_argument(
+            "--since",
+            default="",
+            help="Only replay messages created at or after this ISO 8601 timestamp.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Events ingested per batch.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report how many messages would be replayed without ingesting them.",
+        )
+
+    @override
+    def handle(self, *args: Any, **options: Any) -> None:
+        batch_size = int(options["batch_size"])
+        if batch_size <= 0:
+            raise CommandError("--batch-size must be positive")
+
+        messages = OutboxMessage.objects.filter(kind=OutboxMessage.Kind.ses_event)
+        ids: list[int] = list(options.get("ids") or [])
+        if ids:
+            messages = messages.filter(pk__in=ids)
+        else:
+            messages = messages.filter(status=options["status"])
+
+        since_raw = str(options.get("since") or "").strip()
+        if since_raw:
+            since = parse_datetime(since_raw)
+            if since is None:
+                raise CommandError("--since must be an ISO 8601 timestamp")
+            if timezone.is_naive(since):
+                since = timezone.make_aware(since)
+            messages = messages.filter(created_at__gte=since)
+
+        messages = messages.exclude(status=OutboxMessage.Status.running).order_by("created_at", "pk")
+        if options.get("dry_run"):
+            self.stdout.write(f"[dry-run] Would replay {messages.count()} SES events.")
+            return
+
+        outcomes: Counter[str] = Counter()
+        invalid = 0
+        batch: list[OutboxMessage] = []
+        for message in messages.iterator(chunk_size=batch_size):
+            batch.append(message)
+            if len(batch) >= batch_size:
+                invalid += self._replay_batch(batch, outcomes)
+                batch = []
+        if batch:
+            invalid += self._replay_batch(batch, outcomes)
+
+        summary = ", ".join(f"{count} {outcome}" for outcome, count in sorted(outcomes.items())) or "nothing replayed"
+        logger.info("ses_events_replay.done", extra={"outcomes": dict(outcomes), "invalid": invalid})
+        self.stdout.write(self.style.SUCCESS(f"Replayed SES events: {summary}; {invalid} invalid."))
+
+    def _replay_batch(self, batch: list[OutboxMessage], outcomes: Counter[str]) -> int:
+        events: list[SESMilestoneEvent] = []
+        replayed: list[OutboxMessage] = []
+        invalid = 0
+        for message in batch:
+            try:
+                events.append(SESMilestoneEvent.from_payload(message.payload))
+            except (KeyError, TypeError, ValueError):
+                invalid += 1
+                continue
+            replayed.append(message)
+
+        outcomes.update(ingest_ses_events(events))
+
+        now = timezone.now()
+        settled = [message for message in replayed if message.status != OutboxMessage.Status.delivered]
+        for message in settled:
+            message.status = OutboxMessage.Status.delivered
+            message.delivered_at = now
+            message.last_error = ""
+        OutboxMessage.objects.bulk_update(settled, fields=["status", "delivered_at", "last_error"])
+        return invalid
@@ -4,10 +4,15 @@ import json
 import logging
 import re
 import threading
-from collections.abc import Callable
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 
 import requests
 from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
 from django.template import Context, Template
 from django.urls import reverse
 
@@ -16,7 +21,8 @@ from core.membership_notifications import (
     membership_extend_url,
     membership_requests_url,
 )
-from core.models import Ballot, MattermostWebhookEndpoint
+from core.models import Ballot, MattermostWebhookEndpoint, OutboxMessage
+from core.outbox import DeliveryFailure, enqueue_outbox_messages
 from core.public_urls import build_public_absolute_url
 from core.signal_receivers import connect_once, safe_receiver
 from core.signals import CANONICAL_SIGNALS
@@ -24,6 +30,7 @@ from core.tokens import election_genesis_chain_hash
 
 logger = logging.getLogger("core.mattermost_webhooks")
 _URL_RE = re.compile(r"https?://\S+")
+_ENDPOINT_GENERATION_CACHE_KEY = "mattermost_webhook_endpoints_generation"
 
 _GREEN_EVENTS = {
     "account_invitation_accepted",
@@ -1110,7 +1117,14 @@ def _apply_endpoint_overrides(
 
 
 def _build_payload(endpoint: MattermostWebhookEndpoint, event_key: str, kwargs: dict[str, object]) -> dict[str, object]:
-    template_context = _build_template_context(event_key, kwargs)
+    return _payload_from_context(endpoint, event_key, _build_template_context(event_key, kwargs))
+
+
+def _payload_from_context(
+    endpoint: MattermostWebhookEndpoint,
+    event_key: str,
+    template_context: dict[str, object],
+) -> dict[str, object]:
     payload = _apply_endpoint_overrides(
         endpoint=endpoint,
         base_payload=_default_payload(event_key, template_context),
@@ -1200,6 +1214,23 @@ def _apply_default_identity(payload: dict[str, object]) -> dict[str, object]:
     return outbound_payload
 
 
+_session_local = threading.local()
+
+
+def _http_session() -> requests.Session:
+    """Return this thread's keep-alive session for webhook posts.
+
+    ``requests.Session`` is not thread-safe, so each fan-out worker keeps
+    its own; the workers are long-lived, so connections to a Mattermost
+    host are reused across events instead of paying a TLS handshake per post.
+    """
+    session = getattr(_session_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        _session_local.session = session
+    return session
+
+
 def post_mattermost_payload(
     endpoint: MattermostWebhookEndpoint,
     payload: dict[str, object],
@@ -1209,7 +1240,7 @@ def post_mattermost_payload(
 
     try:
         outbound_payload = _apply_default_identity(payload)
-        response = requests.post(
+        response = _http_session().post(
             endpoint.url,
             json=outbound_payload,
             timeout=settings.MATTERMOST_WEBHOOK_TIMEOUT_SECONDS,
@@ -1224,11 +1255,14 @@ def post_mattermost_payload(
     return True, response.status_code, "", None, None
 
 
-def _post_to_endpoint(endpoint: MattermostWebhookEndpoint, payload: dict[str, object]) -> None:
-    success, status_code, error, exc_type, response_excerpt = post_mattermost_payload(endpoint, payload)
-    if success:
-        return
-
+def _log_post_failure(
+    endpoint: MattermostWebhookEndpoint,
+    *,
+    status_code: int | None,
+    error: str,
+    exc_type: str | None,
+    response_excerpt: str | None,
+) -> None:
     logger.error(
         "mattermost.post_failed endpoint_id=%s url_hash=%s status_code=%s error=%s exc_type=%s response_excerpt=%s",
         endpoint.pk,
@@ -1248,81 +1282,236 @@ def _post_to_endpoint(endpoint: MattermostWebhookEndpoint, payload: dict[str, ob
     )
 
 
-def dispatch_mattermost_event(event_key: str, **kwargs: object) -> None:
-    try:
-        if event_key not in CANONICAL_SIGNALS:
-            logger.warning("mattermost.unknown_event_key", extra={"event_key": event_key})
-            return
+def _log_dispatch_error(*, endpoint: MattermostWebhookEndpoint, event_key: str, exc: Exception) -> None:
+    logger.error(
+        "mattermost.dispatch_error",
+        extra={
+            "endpoint_id": endpoint.pk,
+            "url_hash": _url_hash(endpoint.url),
+            "event_key": event_key,
+            "exc_type": type(exc).__name__,
+        },
+        exc_info=exc,
+    )
 
-        raw_count = kwargs.get("count")
-        numeric_count: int | None = None
-        if raw_count is not None:
-            try:
-                numeric_count = int(raw_count)
-            except (TypeError, ValueError):
-                logger.warning(
-                    "mattermost.invalid_event_count",
-                    extra={"event_key": event_key, "count": raw_count},
-                )
-        if numeric_count is not None and numeric_count <= 0:
-            logger.info(
-                "mattermost.zero_count_event_suppressed",
+
+_fan_out_lock = threading.Lock()
+_fan_out_executor: ThreadPoolExecutor | None = None
+
+
+def _fan_out_pool() -> ThreadPoolExecutor:
+    global _fan_out_executor
+
+    with _fan_out_lock:
+        if _fan_out_executor is None:
+            _fan_out_executor = ThreadPoolExecutor(
+                max_workers=settings.MATTERMOST_WEBHOOK_FANOUT_WORKERS,
+                thread_name_prefix="mattermost-post",
+            )
+        return _fan_out_executor
+
+
+def _subscribed_endpoints(event_key: str, kwargs: dict[str, object]) -> list[MattermostWebhookEndpoint]:
+    """Return the enabled endpoints subscribed to ``event_key``, or none if the event is suppressed."""
+    if event_key not in CANONICAL_SIGNALS:
+        logger.warning("mattermost.unknown_event_key", extra={"event_key": event_key})
+        return []
+
+    raw_count = kwargs.get("count")
+    numeric_count: int | None = None
+    if raw_count is not None:
+        try:
+            numeric_count = int(raw_count)
+        except (TypeError, ValueError):
+            logger.warning(
+                "mattermost.invalid_event_count",
                 extra={"event_key": event_key, "count": raw_count},
             )
-            return
+    if numeric_count is not None and numeric_count <= 0:
+        logger.info(
+            "mattermost.zero_count_event_suppressed",
+            extra={"event_key": event_key, "count": raw_count},
+        )
+        return []
+
+    if event_key in _MEMBERSHIP_REQUEST_DETAIL_EVENTS and kwargs.get("membership_request") is None:
+        logger.warning("mattermost.membership_request_missing_context", extra={"event_key": event_key})
+        return []
+
+    subscribed: list[MattermostWebhookEndpoint] = []
+    for endpoint in _endpoint_cache.enabled_endpoints():
+        if not isinstance(endpoint.events, list):
+            logger.error(
+                "mattermost.invalid_events_field",
+                extra={
+                    "endpoint_id": endpoint.pk,
+                    "url_hash": _url_hash(endpoint.url),
+                    "event_key": event_key,
+                },
+            )
+            continue
+
+        unknown_keys = [item for item in endpoint.events if isinstance(item, str) and item not in CANONICAL_SIGNALS]
+        if unknown_keys:
+            logger.warning(
+                "mattermost.unknown_configured_event_keys",
+                extra={
+                    "endpoint_id": endpoint.pk,
+                    "url_hash": _url_hash(endpoint.url),
+                    "unknown_keys": sorted(unknown_keys),
+                },
+            )
+
+        if event_key in endpoint.events:
+            subscribed.append(endpoint)
+    return subscribed
 
-        if event_key in _MEMBERSHIP_REQUEST_DETAIL_EVENTS and kwargs.get("membership_request") is None:
-            logger.warning("mattermost.membership_request_missing_context", extra={"event_key": event_key})
-            return
 
-        endpoints = MattermostWebhookEndpoint.objects.filter(enabled=True)
+def _enqueue_dispatch(event_key: str, kwargs: dict[str, object]) -> None:
+    """Render an event's payload for each subscribed endpoint and queue it for `outbox_drain`.
+
+    Rendering happens here so each message describes the event as it was when
+    the signal fired, even if the objects change or are deleted before the
+    drain posts it. The template context is built once per event.
+    """
+    try:
+        endpoints = _subscribed_endpoints(event_key, kwargs)
+        if not endpoints:
+            return
+        template_context = _build_template_context(event_key, kwargs)
+        payloads: list[dict[str, object]] = []
         for endpoint in endpoints:
             try:
-                if not isinstance(endpoint.events, list):
-                    logger.error(
-                        "mattermost.invalid_events_field",
-                        extra={
-                            "endpoint_id": endpoint.pk,
-                            "url_hash": _url_hash(endpoint.url),
-                            "event_key": event_key,
-                        },
-                    )
-                    continue
-
-                unknown_keys = [item for item in endpoint.events if isinstance(item, str) and item not in CANONICAL_SIGNALS]
-                if unknown_keys:
-                    logger.warning(
-                        "mattermost.unknown_configured_event_keys",
-                        extra={
-                            "endpoint_id": endpoint.pk,
-                            "url_hash": _url_hash(endpoint.url),
-                            "unknown_keys": sorted(unknown_keys),
-                        },
-                    )
-
-                if event_key not in endpoint.events:
-                    continue
-
-                payload = _build_payload(endpoint, event_key, dict(kwargs))
-                _post_to_endpoint(endpoint, payload)
+                body = _payload_from_context(endpoint, event_key, template_context)
             except Exception as exc:
-                logger.error(
-                    "mattermost.dispatch_error",
-                    extra={
-                        "endpoint_id": endpoint.pk,
-                        "url_hash": _url_hash(endpoint.url),
-                        "event_key": event_key,
-                        "exc_type": type(exc).__name__,
-                    },
-                    exc_info=True,
-                )
+                _log_dispatch_error(endpoint=endpoint, event_key=event_key, exc=exc)
+                continue
+            payloads.append({"endpoint_id": endpoint.pk, "event_key": event_key, "body": body})
+        if not payloads:
+            return
+        # A savepoint keeps a failed insert from breaking the caller's transaction.
+        with transaction.atomic():
+            enqueue_outbox_messages(kind=OutboxMessage.Kind.mattermost_webhook, payloads=payloads)
     except Exception:
         logger.exception(
-            "mattermost.dispatch.error",
+            "mattermost.enqueue.error",
             extra={"event_key": event_key},
         )
 
 
+def _is_retryable_post_failure(*, status_code: int | None, error: str) -> bool:
+    if status_code is None:
+        return error != "invalid_url"
+    return status_code == 429 or status_code >= 500
+
+
+def deliver_webhook_batch(messages: Sequence[OutboxMessage]) -> dict[int, DeliveryFailure]:
+    """Outbox handler: post a batch of rendered payloads, in parallel across endpoints."""
+    endpoints = MattermostWebhookEndpoint.objects.in_bulk(
+        {message.payload.get("endpoint_id") for message in messages if message.payload.get("endpoint_id")}
+    )
+    failures: dict[int, DeliveryFailure] = {}
+    posts: list[tuple[OutboxMessage, MattermostWebhookEndpoint, dict[str, object]]] = []
+    for message in messages:
+        endpoint = endpoints.get(message.payload.get("endpoint_id"))
+        if endpoint is None or not endpoint.enabled:
+            failures[message.pk] = DeliveryFailure(error="endpoint_unavailable", retryable=False)
+            continue
+        body = message.payload.get("body")
+        if not isinstance(body, dict):
+            failures[message.pk] = DeliveryFailure(error="invalid_payload", retryable=False)
+            continue
+        posts.append((message, endpoint, body))
+
+    if len(posts) <= 1 or settings.MATTERMOST_WEBHOOK_FANOUT_WORKERS <= 1:
+        results = [post_mattermost_payload(endpoint, body) for _message, endpoint, body in posts]
+    else:
+        executor = _fan_out_pool()
+        futures = [executor.submit(post_mattermost_payload, endpoint, body) for _message, endpoint, body in posts]
+        results = [future.result() for future in futures]
+
+    for (message, endpoint, _body), (success, status_code, error, exc_type, response_excerpt) in zip(
+        posts, results, strict=True
+    ):
+        if success:
+            continue
+        _log_post_failure(
+            endpoint,
+            status_code=status_code,
+            error=error,
+            exc_type=exc_type,
+            response_excerpt=response_excerpt,
+        )
+        failures[message.pk] = DeliveryFailure(
+            error=f"{error} status_code={status_code}" if status_code is not None else error,
+            retryable=_is_retryable_post_failure(status_code=status_code, error=error),
+        )
+    return failures
+
+
+class _EndpointCache:
+    """Per-process copy of the enabled webhook endpoints.
+
+    Saving or deleting an endpoint clears this process's copy and, once the
+    change commits, bumps a shared generation counter; other workers compare that counter at most
+    every ``MATTERMOST_WEBHOOK_ENDPOINT_CACHE_SECONDS`` and reload when it
+    changed. A value of 0 disables the cache.
+
+    The cached endpoint instances are shared across threads and must be
+    treated as read-only.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._endpoints: tuple[MattermostWebhookEndpoint, ...] | None = None
+        self._generation: object = None
+        self._checked_at = 0.0
+
+    def enabled_endpoints(self) -> tuple[MattermostWebhookEndpoint, ...]:
+        recheck_seconds = settings.MATTERMOST_WEBHOOK_ENDPOINT_CACHE_SECONDS
+        if recheck_seconds <= 0:
+            return tuple(MattermostWebhookEndpoint.objects.filter(enabled=True))
+
+        now = time.monotonic()
+        with self._lock:
+            if self._endpoints is not None and now - self._checked_at < recheck_seconds:
+                return self._endpoints
+
+        generation = cache.get(_ENDPOINT_GENERATION_CACHE_KEY, 0)
+        with self._lock:
+            if self._endpoints is not None and generation == self._generation:
+                self._checked_at = now
+                return self._endpoints
+
+        endpoints = tuple(MattermostWebhookEndpoint.objects.filter(enabled=True))
+        with self._lock:
+            self._endpoints = endpoints
+            self._generation = generation
+            self._checked_at = now
+        return endpoints
+
+    def clear(self) -> None:
+        with self._lock:
+            self._endpoints = None
+
+    def invalidate(self) -> None:
+        self.clear()
+        try:
+            cache.incr(_ENDPOINT_GENERATION_CACHE_KEY)
+        except ValueError:
+            cache.set(_ENDPOINT_GENERATION_CACHE_KEY, 1, timeout=None)
+
+
+_endpoint_cache = _EndpointCache()
+
+
+def _invalidate_endpoint_cache(**_kwargs: object) -> None:
+    # Bumping the shared generation before commit would let another worker
+    # reload the old rows and keep them under the new generation.
+    _endpoint_cache.clear()
+    transaction.on_commit(_endpoint_cache.invalidate)
+
+
 _RECEIVER_FUNCTIONS: dict[str, Callable[..., None]] = {}
 
 
@@ -1332,17 +1521,21 @@ def connect_mattermost_receivers() -> None:
         @safe_receiver(event_key)
         def _receiver(*args: object, __event_key: str = event_key, **kwargs: object) -> None:
             _ = args
-            # Defer webhook dispatch to a background thread so it doesn't block the HTTP request.
+            # Record the posts in the outbox so Mattermost latency never blocks the HTTP request.
             # This is critical for endpoints like membership RFI that trigger multiple webhooks
             # and would otherwise timeout waiting for Mattermost responses.
-            thread = threading.Thread(
-                target=dispatch_mattermost_event,
-                args=(__event_key,),
-                kwargs=dict(kwargs),
-                daemon=True,
-                name=f"mattermost-dispatch-{__event_key}",
-            )
-            thread.start()
+            _enqueue_dispatch(__event_key, dict(kwargs))
 
         _RECEIVER_FUNCTIONS[event_key] = _receiver
         signal.connect(_receiver, dispatch_uid=f"core.mattermost_webhooks.{event_key}")
+
+    post_save.connect(
+        _invalidate_endpoint_cache,
+        sender=MattermostWebhookEndpoint,
+        dispatch_uid="core.mattermost_webhooks.endpoint_saved",
+    )
+    post_delete.connect(
+        _invalidate_endpoint_cache,
+        sender=MattermostWebhookEndpoint,
+        dispatch_uid="core.mattermost_webhooks.endpoint_deleted",
+    )
@@ -11,6 +11,7 @@ from django.db.models import Case, IntegerField, QuerySet, Value, When
 from django.utils import timezone
 
 from core.freeipa.user import FreeIPAUser
+from core.freeipa_directory import get_live_usernames
 from core.logging_extras import current_exception_log_fields
 from core.models import Membership, MembershipLog, MembershipRequest, MembershipType, Organization
 
@@ -713,11 +714,11 @@ def _normalize_live_usernames(
     live_usernames: Iterable[str] | None,
     *,
     live_users_by_username: Mapping[str, FreeIPAUser] | None = None,
-) -> set[str]:
+) -> set[str] | frozenset[str]:
     if live_users_by_username is not None:
         live_usernames = live_users_by_username.keys()
     elif live_usernames is None:
-        live_usernames = (user.username for user in FreeIPAUser.all())
+        return get_live_usernames()
 
     return {
         normalized
@@ -762,6 +763,8 @@ def auto_ignore_pending_requests_for_deleted_users() -> int:
     try:
         live_usernames = _normalize_live_usernames(None)
     except Exception:
+        live_usernames = frozenset()
+    if not live_usernames:
         # If FreeIPA is unavailable, don't auto-ignore anything
         logger.debug("skipped_auto_ignore_freeipa_unavailable")
         return 0
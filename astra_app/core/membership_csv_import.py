@@ -27,6 +27,7 @@ from core.csv_import_utils import (
 )
 from core.forms_membership import MembershipRequestForm
 from core.freeipa.user import FreeIPAUser
+from core.freeipa_directory import UserEmailIndex, get_user_email_index
 from core.logging_extras import current_exception_log_fields
 from core.membership_notes import add_note
 from core.membership_request_workflow import approve_membership_request, record_membership_request_created
@@ -298,7 +299,7 @@ class MembershipCSVImportResource(resources.ModelResource):
 
         self._question_header_by_name: dict[str, str | None] = {}
 
-        self._email_to_usernames: dict[str, set[str]] = {}
+        self._email_index = UserEmailIndex(())
         self._email_lookup_cache: dict[str, set[str]] = {}
         self._unmatched: list[dict[str, str]] = []
 
@@ -562,27 +563,22 @@ class MembershipCSVImportResource(resources.ModelResource):
 
         self._email_lookup_cache = {}
 
-        # Prefer a full (cached) directory scan for large imports, but fall
-        # back to per-email search if listing is unavailable in this deployment.
-        self._email_to_usernames = {}
-        self._name_to_usernames = {}
-        # Admin imports need the directory's real display names and emails;
-        # profile redaction is a user-facing concern, not an admin lookup rule.
-        users = FreeIPAUser.all(respect_privacy=False)
-        if not users:
+        # Prefer the shared (cached) directory email index for large imports,
+        # but fall back to per-email search if listing is unavailable in this
+        # deployment. The index is unredacted: admin imports need the
+        # directory's real emails; profile redaction is a user-facing concern.
+        self._email_index = get_user_email_index()
+        if not self._email_index.complete:
             logger.warning(
                 "Membership CSV import: FreeIPAUser.all() returned 0 users; email matching will use per-email search"
             )
-        for user in users:
-            email = normalize_csv_email(user.email)
-            username = _normalize_str(user.username)
-            if not email or not username:
-                continue
-            self._email_to_usernames.setdefault(email, set()).add(username)
 
-            if self._enable_name_matching:
+        self._name_to_usernames = {}
+        if self._enable_name_matching:
+            for user in FreeIPAUser.all(respect_privacy=False):
+                username = _normalize_str(user.username)
                 key = normalize_csv_name(user.full_name)
-                if key:
+                if username and key:
                     self._name_to_usernames.setdefault(key, set()).add(username)
 
         logger.info(
@@ -595,8 +591,8 @@ class MembershipCSVImportResource(resources.ModelResource):
             self._resolved_headers.get("membership_end_date"),
             self._resolved_headers.get("committee_notes"),
             self._resolved_headers.get("membership_type"),
-            len(users),
-            len(self._email_to_usernames),
+            self._email_index.user_count,
+            len(self._email_index.usernames_by_email),
         )
 
         question_columns = {name: header for name, header in self._question_header_by_name.items() if header}
@@ -621,8 +617,8 @@ class MembershipCSVImportResource(resources.ModelResource):
             return cached
 
         # If the directory listing worked, use it.
-        if self._email_to_usernames:
-            usernames = set(self._email_to_usernames.get(normalized, set()))
+        if self._email_index.complete:
+            usernames = set(self._email_index.usernames_for(normalized))
             if usernames:
                 self._email_lookup_cache[normalized] = usernames
                 # Email is PII; keep this at DEBUG level.
@@ -637,6 +633,7 @@ class MembershipCSVImportResource(resources.ModelResource):
             # the email (stale cache or incomplete attribute set).
             user = FreeIPAUser.find_by_email(normalized)
             usernames = {user.username} if user and user.username else set()
+            self._email_index.remember(normalized, usernames)
             self._email_lookup_cache[normalized] = usernames
             # Email is PII; keep this at DEBUG level.
             logger.debug(
@@ -1,7 +1,9 @@
 import dataclasses
 import datetime
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import Any
 
 from django.conf import settings
@@ -20,6 +22,7 @@ from core.email_context import (
     system_email_context,
     user_email_context_from_user,
 )
+from core.freeipa.group import FreeIPAGroup
 from core.freeipa.user import FreeIPAUser
 from core.logging_extras import current_exception_log_fields
 from core.membership import (
@@ -443,6 +446,171 @@ def _realign_membership_term_start(
     return approval_log
 
 
+@dataclasses.dataclass(frozen=True, slots=True)
+class _PendingGroupAdd:
+    username: str
+    group_cn: str
+    request_id: int | None
+    log_prefix: str
+    on_success: Callable[[], None] | None
+
+
+def _add_to_group_now(item: _PendingGroupAdd) -> None:
+    """Add one approved user to their group and run the approval's success callback."""
+    callback_should_run = False
+    try:
+        user_for_group_add = FreeIPAUser.get(item.username)
+    except Exception:
+        logger.exception(
+            "%s: on_commit FreeIPAUser.get failed request_id=%s target=%r",
+            item.log_prefix,
+            item.request_id,
+            item.username,
+            extra=current_exception_log_fields(),
+        )
+        return
+
+    if user_for_group_add is None:
+        logger.warning(
+            "%s: on_commit user missing for group add request_id=%s target=%r",
+            item.log_prefix,
+            item.request_id,
+            item.username,
+        )
+        return
+
+    try:
+        user_for_group_add.add_to_group(group_name=item.group_cn)
+    except Exception as exc:
+        if _is_freeipa_noop_error(error=exc, is_add=True):
+            callback_should_run = True
+            logger.info(
+                "astra.membership.freeipa_group.already_member group_cn=%s outcome=noop",
+                item.group_cn,
+                extra={
+                    "event": "astra.freeipa.group.mutation",
+                    "component": "membership",
+                    "outcome": "already_member",
+                },
+            )
+        else:
+            logger.exception(
+                "%s: on_commit add_to_group failed request_id=%s target=%r group_cn=%r",
+                item.log_prefix,
+                item.request_id,
+                item.username,
+                item.group_cn,
+                extra=current_exception_log_fields(),
+            )
+            return
+    else:
+        callback_should_run = True
+
+    if callback_should_run and item.on_success is not None:
+        try:
+            item.on_success()
+        except Exception:
+            logger.exception(
+                "%s: on_commit post-group-add callback failed request_id=%s target=%r group_cn=%r",
+                item.log_prefix,
+                item.request_id,
+                item.username,
+                item.group_cn,
+                extra=current_exception_log_fields(),
+            )
+
+
+_pending_group_adds: ContextVar[list[_PendingGroupAdd] | None] = ContextVar("pending_group_adds", default=None)
+
+
+@contextmanager
+def coalesced_group_adds() -> Iterator[None]:
+    """Send the FreeIPA group adds of approvals committed inside the block together.
+
+    Each approval commits on its own and normally adds its user to the group
+    right after the commit. Inside this block the adds are queued instead, and
+    leaving the block sends one ``group_add_member`` per group for all queued
+    users, then runs each approval's ``on_group_add_success``. If the batched
+    user lookup or a group's batched add fails, the affected approvals fall
+    back to one add per user. Failures are logged per request, as for a
+    single approval.
+    """
+    pending: list[_PendingGroupAdd] = []
+    token = _pending_group_adds.set(pending)
+    try:
+        yield
+    finally:
+        _pending_group_adds.reset(token)
+        _flush_group_adds(pending)
+
+
+def _flush_group_adds(pending: list[_PendingGroupAdd]) -> None:
+    if not pending:
+        return
+
+    try:
+        existing_users = FreeIPAUser.get_many([item.username for item in pending], respect_privacy=False)
+    except Exception:
+        logger.exception(
+            "coalesced_group_adds: FreeIPAUser.get_many failed request_ids=%s",
+            [item.request_id for item in pending],
+            extra=current_exception_log_fields(),
+        )
+        for item in pending:
+            _add_to_group_now(item)
+        return
+
+    pending_by_group: dict[str, list[_PendingGroupAdd]] = {}
+    for item in pending:
+        if item.username not in existing_users:
+            logger.warning(
+                "%s: on_commit user missing for group add request_id=%s target=%r",
+                item.log_prefix,
+                item.request_id,
+                item.username,
+            )
+            continue
+        pending_by_group.setdefault(item.group_cn, []).append(item)
+
+    for group_cn, items in pending_by_group.items():
+        try:
+            added = FreeIPAGroup(group_cn).add_members([item.username for item in items])
+        except Exception:
+            logger.exception(
+                "coalesced_group_adds: add_members failed request_ids=%s group_cn=%r",
+                [item.request_id for item in items],
+                group_cn,
+                extra=current_exception_log_fields(),
+            )
+            for item in items:
+                _add_to_group_now(item)
+            continue
+
+        for item in items:
+            if item.username not in added:
+                logger.error(
+                    "%s: on_commit add_to_group failed request_id=%s target=%r group_cn=%r",
+                    item.log_prefix,
+                    item.request_id,
+                    item.username,
+                    group_cn,
+                )
+                continue
+            if item.on_success is None:
+                continue
+            try:
+                item.on_success()
+            except Exception:
+                logger.exception(
+                    "%s: on_commit post-group-add callback failed request_id=%s target=%r group_cn=%r",
+                    item.log_prefix,
+                    item.request_id,
+                    item.username,
+                    group_cn,
+                    extra=current_exception_log_fields(),
+                )
+
+
 def _execute_membership_grant(
     *,
     actor_username: str,
@@ -567,67 +735,18 @@ def _execute_membership_grant(
         username_to_add, group_cn_to_add = group_add_payload
 
         def _on_commit_add_user_to_group() -> None:
-            callback_should_run = False
-            try:
-                user_for_group_add = FreeIPAUser.get(username_to_add)
-            except Exception:
-                logger.exception(
-                    "%s: on_commit FreeIPAUser.get failed request_id=%s target=%r",
-                    log_prefix,
-                    request_id,
-                    username_to_add,
-                    extra=current_exception_log_fields(),
-                )
-                return
-
-            if user_for_group_add is None:
-                logger.warning(
-                    "%s: on_commit user missing for group add request_id=%s target=%r",
-                    log_prefix,
-                    request_id,
-                    username_to_add,
-                )
+            item = _PendingGroupAdd(
+                username=username_to_add,
+                group_cn=group_cn_to_add,
+                request_id=request_id,
+                log_prefix=log_prefix,
+                on_success=on_group_add_success,
+            )
+            pending = _pending_group_adds.get()
+            if pending is not None:
+                pending.append(item)
                 return
-
-            try:
-                user_for_group_add.add_to_group(group_name=group_cn_to_add)
-            except Exception as exc:
-                if _is_freeipa_noop_error(error=exc, is_add=True):
-                    callback_should_run = True
-                    logger.info(
-                        "astra.membership.freeipa_group.already_member group_cn=%s outcome=noop",
-                        group_cn_to_add,
-                        extra={
-                            "event": "astra.freeipa.group.mutation",
-                            "component": "membership",
-                            "outcome": "already_member",
-                        },
-                    )
-                else:
-                    logger.exception(
-                        "%s: on_commit add_to_group failed request_id=%s target=%r group_cn=%r",
-                        log_prefix,
-                        request_id,
-                        user_for_group_add.username,
-                        group_cn_to_add,
-                        extra=current_exception_log_fields(),
-                    )
-                    return
-            else:
-                callback_should_run = True
-
-            if callback_should_run and on_group_add_success is not None:
-                try:
-                    on_group_add_success()
-                except Exception:
-                    logger.exception(
-                        "%s: on_commit post-group-add callback failed request_id=%s target=%r group_cn=%r",
-                        log_prefix,
-                        request_id,
-                        username_to_add,
-                        group_cn_to_add,
-                        extra=current_exception_log_fields(),
-                    )
+            _add_to_group_now(item)
 
         transaction.on_commit(_on_commit_add_user_to_group)
     elif on_group_add_success is not None:
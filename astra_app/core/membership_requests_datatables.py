@@ -1,13 +1,14 @@
 from collections.abc import Callable, Mapping, Sequence
 from datetime import datetime
 
-from django.db.models import Prefetch, Q, QuerySet
+from django.db.models import Count, Exists, OuterRef, Prefetch, Q, QuerySet
 from django.templatetags.static import static
 from django.utils.formats import date_format
 from django.utils.timezone import localtime
 
 from core.avatar_providers import resolve_avatar_urls_for_users
 from core.freeipa.user import FreeIPAUser
+from core.freeipa_directory import get_live_usernames
 from core.membership import membership_request_queryset, visible_committee_membership_requests
 from core.membership_constants import MembershipCategoryCode
 from core.membership_notes import CUSTOS, last_votes
@@ -439,82 +440,101 @@ def build_membership_request_queue_summary(
     }
 
 
-def build_pending_membership_request_queue(
+_PENDING_CATEGORY_FILTERS: dict[str, str] = {
+    "individuals": MembershipCategoryCode.individual,
+    "mirrors": MembershipCategoryCode.mirror,
+    "sponsorships": MembershipCategoryCode.sponsorship,
+}
+_IS_RENEWAL_Q = Q(renews_user_membership=True) | Q(renews_organization_membership=True)
+
+
+def _annotate_is_renewal(queryset: QuerySet[MembershipRequest]) -> QuerySet[MembershipRequest]:
+    active_memberships = Membership.objects.active().filter(membership_type_id=OuterRef("membership_type_id"))
+    return queryset.annotate(
+        renews_user_membership=Exists(
+            active_memberships.exclude(target_username="").filter(target_username=OuterRef("requested_username"))
+        ),
+        renews_organization_membership=Exists(
+            active_memberships.filter(target_organization_id=OuterRef("requested_organization_id"))
+        ),
+    )
+
+
+def _visible_pending_membership_request_queryset(
     *,
-    selected_filter: str,
-    visible_membership_requests: Callable[..., list[MembershipRequest]] = visible_committee_membership_requests,
-    resolve_requested_by_func: Callable[..., tuple[str, bool]] = resolve_requested_by,
-    lookup_users: Callable[[set[str]], Mapping[str, FreeIPAUser]] = FreeIPAUser.find_lightweight_by_usernames,
-    include_rows: bool = True,
-) -> dict[str, object]:
-    pending_requests_all = _load_membership_request_section(
+    lookup_users: Callable[[set[str]], Mapping[str, FreeIPAUser]],
+) -> QuerySet[MembershipRequest]:
+    queryset = _membership_request_section_queryset(
         status=MembershipRequest.Status.pending,
-        ordering=("requested_at",),
+        ordering=("requested_at", "pk"),
     )
-    users_by_username = lookup_users(
-        _build_lookup_usernames(pending_requests_all, include_requested_by=include_rows)
+    requested_usernames = set(
+        queryset.exclude(requested_username="").values_list("requested_username", flat=True).distinct()
     )
-    pending_visible, pending_rows_all = _build_membership_request_rows(
-        requests=pending_requests_all,
-        users_by_username=users_by_username,
-        visible_membership_requests=visible_membership_requests,
-        resolve_requested_by_func=resolve_requested_by_func,
-        include_rows=include_rows,
+    live_usernames = get_live_usernames()
+    if not live_usernames:
+        # The cached directory listing is unavailable; ask FreeIPA about the queued users only.
+        live_usernames = frozenset(
+            _normalize_str(username).lower()
+            for username in lookup_users({_normalize_str(username).lower() for username in requested_usernames})
+        )
+    hidden_usernames = [
+        username for username in requested_usernames if _normalize_str(username).lower() not in live_usernames
+    ]
+    return queryset.filter(
+        Q(requested_username="", requested_organization__isnull=False)
+        | (~Q(requested_username="") & ~Q(requested_username__in=hidden_usernames))
     )
 
-    category_filters = {
-        "individuals": MembershipCategoryCode.individual,
-        "mirrors": MembershipCategoryCode.mirror,
-        "sponsorships": MembershipCategoryCode.sponsorship,
-    }
-    is_renewal_by_id = _build_is_renewal_by_id(pending_visible)
-
-    for row in pending_rows_all:
-        row["is_renewal"] = is_renewal_by_id.get(int(row["r"].pk), False)
-
-    filter_counts = {
-        "all": len(pending_visible),
-        "renewals": 0,
-        "sponsorships": 0,
-        "individuals": 0,
-        "mirrors": 0,
-    }
-    for membership_request in pending_visible:
-        if is_renewal_by_id.get(membership_request.pk, False):
-            filter_counts["renewals"] += 1
 
-        category_id = membership_request.membership_type.category_id
-        if category_id == MembershipCategoryCode.individual:
-            filter_counts["individuals"] += 1
-        elif category_id == MembershipCategoryCode.mirror:
-            filter_counts["mirrors"] += 1
-        elif category_id == MembershipCategoryCode.sponsorship:
-            filter_counts["sponsorships"] += 1
+def build_pending_membership_request_page(
+    *,
+    selected_filter: str,
+    start: int,
+    length: int,
+    resolve_requested_by_func: Callable[..., tuple[str, bool]] = resolve_requested_by,
+    lookup_users: Callable[[set[str]], Mapping[str, FreeIPAUser]] = FreeIPAUser.find_lightweight_by_usernames,
+) -> dict[str, object]:
+    """Server-side DataTables page of the pending queue.
+
+    Visibility, renewal flags, filter counts, ordering and paging are computed
+    in SQL; FreeIPA display data is looked up for the requested page only.
+    """
+    queryset = _annotate_is_renewal(_visible_pending_membership_request_queryset(lookup_users=lookup_users))
+    filter_counts = queryset.aggregate(
+        all=Count("pk"),
+        renewals=Count("pk", filter=_IS_RENEWAL_Q),
+        **{
+            name: Count("pk", filter=Q(membership_type__category_id=category))
+            for name, category in _PENDING_CATEGORY_FILTERS.items()
+        },
+    )
 
-    if selected_filter == "all":
-        pending_requests = pending_visible
-        pending_rows = pending_rows_all
-    else:
-        if selected_filter == "renewals":
-            match_ids = {membership_request.pk for membership_request in pending_visible if is_renewal_by_id.get(membership_request.pk, False)}
-        else:
-            category = category_filters.get(selected_filter)
-            match_ids = {
-                membership_request.pk
-                for membership_request in pending_visible
-                if membership_request.membership_type.category_id == category
-            }
-        pending_requests = [membership_request for membership_request in pending_visible if membership_request.pk in match_ids]
-        pending_rows = [row for row in pending_rows_all if row["r"].pk in match_ids]
+    if selected_filter == "renewals":
+        queryset = queryset.filter(_IS_RENEWAL_Q)
+    elif selected_filter in _PENDING_CATEGORY_FILTERS:
+        queryset = queryset.filter(membership_type__category_id=_PENDING_CATEGORY_FILTERS[selected_filter])
+    records_filtered = filter_counts.get(selected_filter, filter_counts["all"])
 
-    filter_options = _build_filter_options(filter_counts=filter_counts)
+    page_requests = list(queryset[start : start + length])
+    users_by_username = lookup_users(_build_lookup_usernames(page_requests, include_requested_by=True))
+    _page_visible, page_rows = _build_membership_request_rows(
+        requests=page_requests,
+        users_by_username=users_by_username,
+        visible_membership_requests=visible_committee_membership_requests,
+        resolve_requested_by_func=resolve_requested_by_func,
+        include_rows=True,
+    )
+    for row in page_rows:
+        membership_request = row["r"]
+        row["is_renewal"] = membership_request.renews_user_membership or membership_request.renews_organization_membership
 
     return {
-        "pending_requests": pending_requests,
-        "pending_rows": pending_rows,
+        "pending_rows": page_rows,
+        "records_filtered": records_filtered,
         "filter_counts": filter_counts,
-        "filter_options": filter_options,
-        "filter_empty": selected_filter != "all" and not pending_requests,
+        "filter_options": _build_filter_options(filter_counts=filter_counts),
+        "filter_empty": selected_filter != "all" and records_filtered == 0,
     }
 
 
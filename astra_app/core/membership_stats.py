@@ -0,0 +1,394 @@
+"""Materialized membership statistics and the statistics payload cache.
+
+``membership_stats_rollup`` (run by ``operations_daily``) replays the
+membership log once a night into `MembershipStatsDay` and
+`MembershipRetentionCohort` rows covering everything before local midnight.
+While those rollups run through yesterday, the statistics endpoints read
+completed periods from them and only replay the memberships that changed or
+expired since midnight; otherwise they replay the whole log as before.
+
+`cached_stats_payload` serves endpoint payloads stale-while-revalidate: once a
+payload is older than ``MEMBERSHIP_STATS_CACHE_FRESH_SECONDS`` the request
+that takes the recompute lock rebuilds it while concurrent requests keep
+getting the previous payload.
+"""
+
+import datetime
+import time
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Sequence
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Max, Q
+from django.utils import timezone
+
+from core.models import MembershipLog, MembershipRetentionCohort, MembershipStatsDay, MembershipType
+
+_STATS_RECOMPUTE_LOCK_SECONDS = 120
+
+ACTIVITY_ACTIONS = (
+    MembershipLog.Action.approved,
+    MembershipLog.Action.expiry_changed,
+    MembershipLog.Action.terminated,
+)
+
+type ActivityInterval = tuple[datetime.datetime, datetime.datetime | None]
+type MembershipKey = tuple[str, str]
+type RetentionCohort = dict[str, int]
+
+
+def cached_stats_payload(cache_key: str, compute: Callable[[], dict[str, object]]) -> dict[str, object]:
+    """Return the cached payload for ``cache_key``, recomputing it single-flight once it is stale."""
+    entry = cache.get(cache_key)
+    if not (isinstance(entry, tuple) and len(entry) == 2):
+        entry = None
+    if entry is not None and time.time() - entry[0] < settings.MEMBERSHIP_STATS_CACHE_FRESH_SECONDS:
+        return entry[1]
+
+    lock_key = f"{cache_key}:recompute_lock"
+    if not cache.add(lock_key, True, timeout=_STATS_RECOMPUTE_LOCK_SECONDS):
+        if entry is not None:
+            return entry[1]
+        # Cold cache while another request fills it: answer without storing.
+        return compute()
+
+    try:
+        payload = compute()
+        cache.set(cache_key, (time.time(), payload), timeout=settings.MEMBERSHIP_STATS_CACHE_STALE_SECONDS)
+    finally:
+        cache.delete(lock_key)
+    return payload
+
+
+def _local_midnight(now: datetime.datetime) -> datetime.datetime:
+    return timezone.localtime(now).replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def rollups_are_current(*, now: datetime.datetime) -> bool:
+    latest_day = MembershipStatsDay.objects.aggregate(latest=Max("day"))["latest"]
+    return latest_day is not None and latest_day == _local_midnight(now).date() - datetime.timedelta(days=1)
+
+
+def membership_activity_events(queryset=None) -> list[MembershipLog]:
+    if queryset is None:
+        queryset = MembershipLog.objects.all()
+    return list(
+        queryset.filter(action__in=ACTIVITY_ACTIONS)
+        .select_related("membership_type", "target_organization")
+        .order_by(
+            "membership_type_id",
+            "target_username",
+            "target_organization_code",
+            "created_at",
+            "id",
+        )
+    )
+
+
+def _membership_key(event: MembershipLog) -> MembershipKey:
+    target_key = f"user:{event.target_username}" if event.target_username else f"org:{event.organization_identifier}"
+    return target_key, str(event.membership_type_id)
+
+
+def membership_type_names(events: Iterable[MembershipLog]) -> dict[str, str]:
+    return {str(event.membership_type_id): str(event.membership_type.name) for event in events}
+
+
+def membership_activity_intervals(events: Iterable[MembershipLog]) -> dict[str, list[ActivityInterval]]:
+    """Replay approvals, expiry changes and terminations into active intervals per membership type."""
+    events_by_membership: dict[MembershipKey, list[MembershipLog]] = defaultdict(list)
+    for event in events:
+        events_by_membership[_membership_key(event)].append(event)
+
+    intervals_by_type: dict[str, list[ActivityInterval]] = defaultdict(list)
+    for (_target_key, membership_type_id), membership_events in events_by_membership.items():
+        current_start: datetime.datetime | None = None
+        current_end: datetime.datetime | None = None
+        for event in membership_events:
+            event_created_at = event.created_at.astimezone(datetime.UTC)
+            event_expires_at = event.expires_at.astimezone(datetime.UTC) if event.expires_at is not None else None
+            if event.action in {MembershipLog.Action.approved, MembershipLog.Action.expiry_changed}:
+                if current_start is None or (current_end is not None and current_end <= event_created_at):
+                    current_start = event_created_at
+                current_end = event_expires_at
+                continue
+
+            if current_start is None:
+                continue
+
+            interval_end = event_created_at if current_end is None else min(event_created_at, current_end)
+            if interval_end > current_start:
+                intervals_by_type[membership_type_id].append((current_start, interval_end))
+            current_start = None
+            current_end = None
+
+        if current_start is not None and (current_end is None or current_end > current_start):
+            intervals_by_type[membership_type_id].append((current_start, current_end))
+    return intervals_by_type
+
+
+def active_counts_at(
+    intervals_by_type: dict[str, list[ActivityInterval]],
+    *,
+    checkpoints_at: Sequence[datetime.datetime],
+    membership_type_ids: Iterable[str],
+) -> dict[str, list[int]]:
+    """Count the intervals open at each (sorted) checkpoint, per membership type."""
+    counts_by_type: dict[str, list[int]] = {}
+    for membership_type_id in membership_type_ids:
+        deltas = [0] * (len(checkpoints_at) + 1)
+        for interval_start, interval_end in intervals_by_type.get(membership_type_id, ()):
+            start_index = bisect_right(checkpoints_at, interval_start)
+            if start_index >= len(checkpoints_at):
+                continue
+            end_index = len(checkpoints_at) if interval_end is None else bisect_left(checkpoints_at, interval_end)
+            deltas[start_index] += 1
+            deltas[end_index] -= 1
+
+        running = 0
+        counts: list[int] = []
+        for delta in deltas[:-1]:
+            running += delta
+            counts.append(running)
+        counts_by_type[membership_type_id] = counts
+    return counts_by_type
+
+
+def rolled_up_active_counts(
+    *,
+    checkpoints_at: Sequence[datetime.datetime],
+    now: datetime.datetime,
+) -> tuple[dict[str, str], dict[str, list[int]]]:
+    """Active counts per type from the daily rollups; requires `rollups_are_current`.
+
+    Every checkpoint but the last must be a local midnight no later than
+    today's; the last one is ``now``. Only memberships with log entries since
+    midnight, or whose term expired since midnight, are replayed for it.
+    """
+    midnight = _local_midnight(now)
+    midnight_utc = midnight.astimezone(datetime.UTC)
+    yesterday = midnight.date() - datetime.timedelta(days=1)
+    # Each rollup row counts memberships active at the end of its day, i.e. at the next midnight.
+    checkpoint_days = [
+        timezone.localtime(checkpoint_at).date() - datetime.timedelta(days=1) for checkpoint_at in checkpoints_at[:-1]
+    ]
+    day_counts: dict[tuple[datetime.date, str], int] = {}
+    for day, membership_type_id, active_count in MembershipStatsDay.objects.filter(
+        day__in={yesterday, *checkpoint_days}
+    ).values_list("day", "membership_type_id", "active_count"):
+        day_counts[(day, membership_type_id)] = active_count
+
+    changed = MembershipLog.objects.filter(action__in=ACTIVITY_ACTIONS).filter(
+        Q(created_at__gte=midnight_utc)
+        | Q(
+            action__in=[MembershipLog.Action.approved, MembershipLog.Action.expiry_changed],
+            expires_at__gt=midnight_utc,
+            expires_at__lte=now,
+        )
+    )
+    changed_keys = {_membership_key(event) for event in changed.select_related("target_organization")}
+    changed_events: list[MembershipLog] = []
+    if changed_keys:
+        target_filter = Q()
+        for target_key, _membership_type_id in changed_keys:
+            kind, identifier = target_key.split(":", 1)
+            if kind == "user":
+                target_filter |= Q(target_username=identifier)
+            else:
+                target_filter |= Q(target_username="", target_organization_code=identifier)
+                if identifier.isdigit():
+                    target_filter |= Q(target_username="", target_organization_id=int(identifier))
+        candidates = MembershipLog.objects.filter(
+            membership_type_id__in={membership_type_id for _target_key, membership_type_id in changed_keys},
+        ).filter(target_filter)
+        changed_events = [
+            event for event in membership_activity_events(candidates) if _membership_key(event) in changed_keys
+        ]
+
+    membership_type_ids = {membership_type_id for _day, membership_type_id in day_counts}
+    membership_type_ids.update(str(event.membership_type_id) for event in changed_events)
+    type_names = dict(MembershipType.objects.filter(code__in=membership_type_ids).values_list("code", "name"))
+
+    # The rollup for yesterday counted the changed memberships as they stood
+    # at midnight; swap that contribution for their current state.
+    before_midnight = active_counts_at(
+        membership_activity_intervals(event for event in changed_events if event.created_at < midnight_utc),
+        checkpoints_at=[midnight_utc],
+        membership_type_ids=type_names,
+    )
+    current = active_counts_at(
+        membership_activity_intervals(changed_events),
+        checkpoints_at=[now.astimezone(datetime.UTC)],
+        membership_type_ids=type_names,
+    )
+
+    counts_by_type: dict[str, list[int]] = {membership_type_id: [] for membership_type_id in type_names}
+    for day in checkpoint_days:
+        for membership_type_id, counts in counts_by_type.items():
+            counts.append(day_counts.get((day, membership_type_id), 0))
+    if checkpoints_at:
+        for membership_type_id, counts in counts_by_type.items():
+            counts.append(
+                day_counts.get((yesterday, membership_type_id), 0)
+                - before_midnight[membership_type_id][0]
+                + current[membership_type_id][0]
+            )
+    return type_names, counts_by_type
+
+
+def _month_start_utc(value: datetime.datetime) -> datetime.datetime:
+    value_utc = value.astimezone(datetime.UTC)
+    return datetime.datetime(value_utc.year, value_utc.month, 1, tzinfo=datetime.UTC)
+
+
+def _add_months_utc(value: datetime.datetime, months: int) -> datetime.datetime:
+    month_index = value.month - 1 + months
+    year = value.year + (month_index // 12)
+    month = (month_index % 12) + 1
+    return value.replace(year=year, month=month, day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def _compute_retention_cohorts_12m(*, now: datetime.datetime) -> dict[str, RetentionCohort]:
+    events = list(
+        MembershipLog.objects.filter(
+            membership_type__category__is_individual=True,
+            action__in=[MembershipLog.Action.approved, MembershipLog.Action.terminated],
+        )
+        .exclude(target_username="")
+        .select_related("membership_type")
+        .order_by("target_username", "created_at", "id")
+    )
+
+    events_by_username: dict[str, list[MembershipLog]] = defaultdict(list)
+    for event in events:
+        username = str(event.target_username).strip()
+        if not username:
+            continue
+        events_by_username[username].append(event)
+
+    now_utc = now.astimezone(datetime.UTC)
+    cohorts: dict[str, RetentionCohort] = {}
+
+    for username, user_events in events_by_username.items():
+        approvals = [event for event in user_events if event.action == MembershipLog.Action.approved]
+        if not approvals:
+            continue
+        termination_times = [
+            event.created_at.astimezone(datetime.UTC)
+            for event in user_events
+            if event.action == MembershipLog.Action.terminated
+        ]
+
+        first_approval = approvals[0]
+        first_approval_at = first_approval.created_at.astimezone(datetime.UTC)
+        first_expires_at = first_approval.expires_at
+        if first_expires_at is not None:
+            first_expires_at = first_expires_at.astimezone(datetime.UTC)
+        cohort_start = _month_start_utc(first_approval_at)
+        horizon = _add_months_utc(cohort_start, 12)
+        if horizon > now_utc:
+            continue
+
+        next_approval = next(
+            (approval for approval in approvals[1:] if approval.created_at.astimezone(datetime.UTC) <= horizon),
+            None,
+        )
+
+        cohort_label = cohort_start.strftime("%Y-%m")
+        cohort_row = cohorts.setdefault(
+            cohort_label,
+            {
+                "cohort_size": 0,
+                "retained": 0,
+                "lapsed_then_renewed": 0,
+                "lapsed_not_renewed": 0,
+            },
+        )
+        cohort_row["cohort_size"] += 1
+
+        if next_approval is not None:
+            next_approval_at = next_approval.created_at.astimezone(datetime.UTC)
+            terminated_before_renewal = any(terminated_at <= next_approval_at for terminated_at in termination_times)
+            if not terminated_before_renewal and first_expires_at is not None and next_approval_at <= first_expires_at:
+                cohort_row["retained"] += 1
+            else:
+                cohort_row["lapsed_then_renewed"] += 1
+            continue
+
+        terminated_before_horizon = any(terminated_at <= horizon for terminated_at in termination_times)
+        if not terminated_before_horizon and (first_expires_at is None or first_expires_at >= horizon):
+            cohort_row["retained"] += 1
+        else:
+            cohort_row["lapsed_not_renewed"] += 1
+
+    return cohorts
+
+
+def retention_cohorts_12m(*, now: datetime.datetime) -> dict[str, RetentionCohort]:
+    """Closed 12-month retention cohorts keyed by ``YYYY-MM`` cohort month."""
+    # A cohort closes at a UTC month start, which can fall after local midnight.
+    if rollups_are_current(now=now) and _month_start_utc(now) <= _local_midnight(now):
+        return {
+            row.cohort_month.strftime("%Y-%m"): {
+                "cohort_size": row.cohort_size,
+                "retained": row.retained,
+                "lapsed_then_renewed": row.lapsed_then_renewed,
+                "lapsed_not_renewed": row.lapsed_not_renewed,
+            }
+            for row in MembershipRetentionCohort.objects.all()
+        }
+    return _compute_retention_cohorts_12m(now=now)
+
+
+def rebuild_membership_stats_rollups(*, now: datetime.datetime, dry_run: bool = False) -> tuple[int, int]:
+    """Replace the rollups with a replay of the log up to local midnight.
+
+    Returns the number of day rows and cohort rows written, or that would be
+    written when ``dry_run`` is set.
+    """
+    midnight = _local_midnight(now)
+    midnight_utc = midnight.astimezone(datetime.UTC)
+    local_tz = timezone.get_current_timezone()
+    events = membership_activity_events(MembershipLog.objects.filter(created_at__lt=midnight_utc))
+
+    day_rows: list[MembershipStatsDay] = []
+    if events:
+        first_day = timezone.localtime(min(event.created_at for event in events), local_tz).date()
+        days = [first_day + datetime.timedelta(days=offset) for offset in range((midnight.date() - first_day).days)]
+        ends_of_days = [
+            datetime.datetime.combine(day + datetime.timedelta(days=1), datetime.time.min, tzinfo=local_tz).astimezone(
+                datetime.UTC
+            )
+            for day in days
+        ]
+        counts_by_type = active_counts_at(
+            membership_activity_intervals(events),
+            checkpoints_at=ends_of_days,
+            membership_type_ids=sorted(membership_type_names(events)),
+        )
+        day_rows = [
+            MembershipStatsDay(day=day, membership_type_id=membership_type_id, active_count=counts[index])
+            for membership_type_id, counts in counts_by_type.items()
+            for index, day in enumerate(days)
+        ]
+
+    cohort_rows = [
+        MembershipRetentionCohort(
+            cohort_month=datetime.date.fromisoformat(f"{label}-01"),
+            **cohort,
+        )
+        for label, cohort in sorted(_compute_retention_cohorts_12m(now=midnight).items())
+    ]
+
+    if dry_run:
+        return len(day_rows), len(cohort_rows)
+
+    with transaction.atomic():
+        MembershipStatsDay.objects.all().delete()
+        MembershipStatsDay.objects.bulk_create(day_rows, batch_size=1000)
+        MembershipRetentionCohort.objects.all().delete()
+        MembershipRetentionCohort.objects.bulk_create(cohort_rows, batch_size=1000)
+    return len(day_rows), len(cohort_rows)
@@ -8,6 +8,7 @@ import sentry_sdk
 from django.conf import settings
 from django.contrib.auth import get_user as django_get_user
 from django.contrib.auth.models import AnonymousUser
+from django.core.exceptions import MiddlewareNotUsed
 from django.http import HttpResponse, JsonResponse
 from django.shortcuts import redirect
 from django.utils import timezone
@@ -25,6 +26,8 @@ from core.freeipa.exceptions import FreeIPAUnavailableError
 from core.freeipa.user import DegradedFreeIPAUser, FreeIPAUser
 from core.ipa_user_attrs import _first
 from core.logging_extras import exception_log_fields
+from core.permission_grants import begin_permission_request_scope, end_permission_request_scope
+from core.request_profiling import current_request_profile, profile_request
 from core.views_utils import get_username, try_get_username_from_user
 
 logger = logging.getLogger(__name__)
@@ -328,6 +331,25 @@ class FreeIPAServiceClientReuseMiddleware:
                 clear_freeipa_service_client_cache()
 
 
+class PermissionGrantScopeMiddleware:
+    """Request-scoped snapshot of the FreeIPA permission grant table.
+
+    Context processors, permission decorators and templates call
+    ``has_perm`` many times per request; pinning one grant snapshot lets
+    ``FreeIPAUser`` resolve its permissions once and reuse them.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        begin_permission_request_scope()
+        try:
+            return self.get_response(request)
+        finally:
+            end_permission_request_scope()
+
+
 class SentryRequestContextMiddleware:
     """Attach searchable per-request metadata to Sentry logs/events."""
 
@@ -368,6 +390,25 @@ class SentryRequestContextMiddleware:
             reset_request_log_context(context_token)
 
 
+class RequestProfilingMiddleware:
+    """Count FreeIPA RPCs, FreeIPA cache lookups and ORM queries per request.
+
+    Enabled by ``REQUEST_PROFILING_ENABLED``. The totals are added to the
+    access log line and returned in a ``Server-Timing`` header.
+    """
+
+    def __init__(self, get_response):
+        if not settings.REQUEST_PROFILING_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with profile_request() as profile:
+            response = self.get_response(request)
+        response["Server-Timing"] = profile.server_timing()
+        return response
+
+
 class StructuredAccessLogMiddleware:
     """Emit structured, user-aware access logs from Django request context."""
 
@@ -430,6 +471,10 @@ class StructuredAccessLogMiddleware:
                 if error is not None:
                     extra |= exception_log_fields(error)
 
+                profile = current_request_profile()
+                if profile is not None:
+                    extra |= profile.log_fields()
+
                 access_atoms = _build_access_log_atoms(
                     request,
                     status_code=status_code,
@@ -0,0 +1,39 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_chain_heads(apps, schema_editor) -> None:
+    Ballot = apps.get_model("core", "Ballot")
+    ElectionChainHead = apps.get_model("core", "ElectionChainHead")
+
+    election_ids = Ballot.objects.values_list("election_id", flat=True).distinct()
+    heads: list[object] = []
+    for election_id in election_ids:
+        chain_hash = (
+            Ballot.objects.filter(election_id=election_id)
+            .order_by("-created_at", "-id")
+            .values_list("chain_hash", flat=True)
+            .first()
+        )
+        if chain_hash:
+            heads.append(ElectionChainHead(election_id=election_id, chain_hash=chain_hash))
+    ElectionChainHead.objects.bulk_create(heads, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0098_create_election_voting_reminder_and_concluded_email_templates'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ElectionChainHead',
+            fields=[
+                ('election', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='chain_head', serialize=False, to='core.election')),
+                ('chain_hash', models.CharField(max_length=64)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.RunPython(backfill_chain_heads, migrations.RunPython.noop),
+    ]
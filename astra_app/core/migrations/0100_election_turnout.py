@@ -0,0 +1,60 @@
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Sum
+
+
+def backfill_turnout(apps, schema_editor) -> None:
+    Ballot = apps.get_model("core", "Ballot")
+    Election = apps.get_model("core", "Election")
+    ElectionTurnout = apps.get_model("core", "ElectionTurnout")
+    VotingCredential = apps.get_model("core", "VotingCredential")
+
+    eligible = {
+        row["election_id"]: row
+        for row in VotingCredential.objects.filter(weight__gt=0)
+        .values("election_id")
+        .annotate(voters=Count("id"), votes=Sum("weight"))
+    }
+    participating = {
+        row["election_id"]: row
+        for row in Ballot.objects.filter(superseded_by__isnull=True)
+        .values("election_id")
+        .annotate(ballots=Count("id"), weight_total=Sum("weight"))
+    }
+
+    rows: list[object] = []
+    for election_id in Election.objects.exclude(status="draft").values_list("id", flat=True):
+        eligible_row = eligible.get(election_id, {})
+        participating_row = participating.get(election_id, {})
+        rows.append(
+            ElectionTurnout(
+                election_id=election_id,
+                eligible_voter_count=int(eligible_row.get("voters") or 0),
+                eligible_vote_weight_total=int(eligible_row.get("votes") or 0),
+                participating_voter_count=int(participating_row.get("ballots") or 0),
+                participating_vote_weight_total=int(participating_row.get("weight_total") or 0),
+            )
+        )
+    ElectionTurnout.objects.bulk_create(rows, batch_size=500, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0099_election_chain_head'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ElectionTurnout',
+            fields=[
+                ('election', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='turnout', serialize=False, to='core.election')),
+                ('eligible_voter_count', models.PositiveIntegerField(default=0)),
+                ('eligible_vote_weight_total', models.PositiveBigIntegerField(default=0)),
+                ('participating_voter_count', models.PositiveIntegerField(default=0)),
+                ('participating_vote_weight_total', models.PositiveBigIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.RunPython(backfill_turnout, migrations.RunPython.noop),
+    ]
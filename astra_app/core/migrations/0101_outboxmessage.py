@@ -0,0 +1,38 @@
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0100_election_turnout'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OutboxMessage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('mattermost_webhook', 'Mattermost webhook'), ('rekor_attestation', 'Rekor attestation')], max_length=32)),
+                ('payload', models.JSONField(blank=True, default=dict)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('running', 'Running'), ('delivered', 'Delivered'), ('failed_terminal', 'Failed (terminal)')], default='pending', max_length=32)),
+                ('attempt_count', models.PositiveIntegerField(default=0)),
+                ('last_attempt_at', models.DateTimeField(blank=True, null=True)),
+                ('last_error', models.CharField(blank=True, default='', max_length=255)),
+                ('next_run_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('claimed_at', models.DateTimeField(blank=True, null=True)),
+                ('claim_expires_at', models.DateTimeField(blank=True, null=True)),
+                ('delivered_at', models.DateTimeField(blank=True, null=True)),
+                ('delivery_latency_ms', models.PositiveIntegerField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'ordering': ('next_run_at', 'pk'),
+                'indexes': [
+                    models.Index(fields=['status', 'next_run_at'], name='outbox_status_next'),
+                    models.Index(fields=['status', 'claim_expires_at'], name='outbox_status_claim'),
+                    models.Index(fields=['status', 'delivered_at'], name='outbox_status_delivered'),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0102_alter_outboxmessage_kind'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='outboxmessage',
+            name='kind',
+            field=models.CharField(choices=[('mattermost_webhook', 'Mattermost webhook'), ('rekor_attestation', 'Rekor attestation'), ('ses_event', 'SES event'), ('send_mail_chunk', 'Send Mail chunk')], max_length=32),
+        ),
+    ]
@@ -0,0 +1,37 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0103_alter_outboxmessage_kind'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MembershipRetentionCohort',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('cohort_month', models.DateField(unique=True)),
+                ('cohort_size', models.PositiveIntegerField(default=0)),
+                ('retained', models.PositiveIntegerField(default=0)),
+                ('lapsed_then_renewed', models.PositiveIntegerField(default=0)),
+                ('lapsed_not_renewed', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='MembershipStatsDay',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('active_count', models.PositiveIntegerField(default=0)),
+                ('membership_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='core.membershiptype')),
+            ],
+            options={
+                'constraints': [
+                    models.UniqueConstraint(fields=('day', 'membership_type'), name='uniq_membershipstatsday_day_type'),
+                ],
+            },
+        ),
+    ]
@@ -1,3 +1,4 @@
+import copy
 import datetime
 import hashlib
 import ipaddress
@@ -5,11 +6,17 @@ import json
 import logging
 import re
 import socket
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import AbstractContextManager, nullcontext
+from contextvars import ContextVar, Token, copy_context
 from dataclasses import dataclass
 from urllib.parse import SplitResult, urlsplit, urlunsplit
 
 import requests
 import urllib3
+from django.conf import settings
 from django.db import transaction
 from django.utils import timezone
 
@@ -43,6 +50,7 @@ _RETRY_BACKOFF_SCHEDULE = (
 _ALLOWED_SCHEMES = {"http", "https"}
 _NON_HTTP_URL_SCHEME_PREFIXES = {"data", "file", "ftp", "javascript", "mailto", "ssh", "tel"}
 _GITHUB_HOSTS = {"github.com", "www.github.com"}
+_MIRROR_NETWORK_HOST = "raw.githubusercontent.com"
 _GITHUB_RETRYABLE_STATUS_CODES = {403, 429, 500, 502, 503, 504}
 _NOTE_SUCCESS_STATUSES = {"reachable", "up_to_date", "found", "registered", "valid", "commit"}
 _NOTE_UNKNOWN_STATUSES = {
@@ -144,6 +152,117 @@ class _BoundHTTPResponse:
         return self._response.read(amt, decode_content=decode_content)
 
 
+class MirrorValidationRun:
+    """Shared state for validating many mirror requests in one job run.
+
+    ``submit`` runs validations on a pool of ``workers`` threads, and each
+    validation's timestamp, mirror-network and GitHub checks run in parallel
+    once its domain check has passed. Check results are shared for the
+    lifetime of the run, so requests naming the same mirror or pull request
+    are checked once, and at most ``per_host_limit`` checks talk to any one
+    host at a time. With a single worker everything runs inline on the
+    calling thread.
+
+    DNS answers are deliberately not shared: every fetch resolves its target
+    again and refuses non-public addresses, which is what stops a mirror
+    from rebinding to an internal address between fetches.
+
+    Worker threads never touch the database: callers pass membership
+    requests whose ``membership_type`` is already loaded.
+    """
+
+    def __init__(self, *, workers: int | None = None, per_host_limit: int | None = None) -> None:
+        self.workers = max(1, settings.MIRROR_VALIDATION_WORKERS if workers is None else workers)
+        self._per_host_limit = max(
+            1,
+            settings.MIRROR_VALIDATION_PER_HOST_CONCURRENCY if per_host_limit is None else per_host_limit,
+        )
+        self._lock = threading.Lock()
+        self._results: dict[tuple[str, ...], Future] = {}
+        self._host_slots: dict[str, threading.BoundedSemaphore] = {}
+        self._validation_executor: ThreadPoolExecutor | None = None
+        self._check_executor: ThreadPoolExecutor | None = None
+        if self.workers > 1:
+            self._validation_executor = ThreadPoolExecutor(
+                max_workers=self.workers,
+                thread_name_prefix="mirror-validation",
+            )
+            # Each validation waits on up to three checks; a separate pool keeps
+            # those waits from starving the checks themselves.
+            self._check_executor = ThreadPoolExecutor(
+                max_workers=self.workers * 3,
+                thread_name_prefix="mirror-validation-check",
+            )
+        self._token: Token[MirrorValidationRun | None] | None = None
+
+    def __enter__(self) -> MirrorValidationRun:
+        self._token = _current_run.set(self)
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        for executor in (self._validation_executor, self._check_executor):
+            if executor is not None:
+                executor.shutdown(wait=True)
+        if self._token is not None:
+            _current_run.reset(self._token)
+            self._token = None
+
+    def submit[T](self, fn: Callable[..., T], /, **kwargs: object) -> Future[T]:
+        return self._spawn(self._validation_executor, lambda: fn(**kwargs))
+
+    def shared[T](self, key: tuple[str, ...], compute: Callable[[], T], *, host: str = "") -> T:
+        """Return ``compute()``, evaluating it once per key for this run.
+
+        Concurrent callers with the same key wait for the first one. Errors
+        are shared the same way as results.
+        """
+        with self._lock:
+            future = self._results.get(key)
+            owner = future is None
+            if future is None:
+                future = Future[T]()
+                self._results[key] = future
+        if owner:
+            try:
+                with self._host_slot(host):
+                    future.set_result(compute())
+            except Exception as exc:
+                future.set_exception(exc)
+        return future.result()
+
+    def start_check(
+        self,
+        key: tuple[str, ...],
+        compute: Callable[[], dict[str, object]],
+        *,
+        host: str,
+    ) -> Future[dict[str, object]]:
+        return self._spawn(self._check_executor, lambda: self.shared(key, compute, host=host))
+
+    def _spawn[T](self, executor: ThreadPoolExecutor | None, fn: Callable[[], T]) -> Future[T]:
+        if executor is None:
+            future: Future[T] = Future()
+            try:
+                future.set_result(fn())
+            except Exception as exc:
+                future.set_exception(exc)
+            return future
+        return executor.submit(copy_context().run, fn)
+
+    def _host_slot(self, host: str) -> AbstractContextManager[object]:
+        if not host:
+            return nullcontext()
+        with self._lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = threading.BoundedSemaphore(self._per_host_limit)
+                self._host_slots[host] = slot
+            return slot
+
+
+_current_run: ContextVar[MirrorValidationRun | None] = ContextVar("mirror_validation_run", default=None)
+
+
 def is_mirror_membership_request(membership_request: MembershipRequest) -> bool:
     return membership_request.membership_type.category_id == MembershipCategoryCode.mirror
 
@@ -258,9 +377,13 @@ def eligible_validation_queryset(*, now: datetime.datetime, force: bool) -> obje
 
 @transaction.atomic
 def claim_next_validation(*, now: datetime.datetime, force: bool) -> tuple[MirrorMembershipValidation, bool] | None:
-    queryset = eligible_validation_queryset(now=now, force=force).select_for_update(skip_locked=True).order_by(
-        "next_run_at",
-        "pk",
+    queryset = (
+        eligible_validation_queryset(now=now, force=force)
+        .select_related("membership_request__membership_type")
+        # Lock only the validation and its request: every mirror request shares one
+        # membership type row, and locking it would make concurrent claimers skip everything.
+        .select_for_update(skip_locked=True, of=("self", "membership_request"))
+        .order_by("next_run_at", "pk")
     )
     validation = queryset.first()
     if validation is None:
@@ -275,7 +398,11 @@ def claim_next_validation(*, now: datetime.datetime, force: bool) -> tuple[Mirro
 
 
 def dry_run_validations(*, now: datetime.datetime, force: bool) -> list[MirrorMembershipValidation]:
-    return list(eligible_validation_queryset(now=now, force=force).order_by("next_run_at", "pk"))
+    return list(
+        eligible_validation_queryset(now=now, force=force)
+        .select_related("membership_request__membership_type")
+        .order_by("next_run_at", "pk")
+    )
 
 
 @transaction.atomic
@@ -343,24 +470,24 @@ def run_validation(*, membership_request: MembershipRequest) -> ValidationOutcom
             should_retry=False,
         )
 
-    domain_result = _validate_domain(answers.domain_url)
-    if domain_result["status"] == "reachable":
-        timestamp_result = _validate_timestamp_files(answers.domain_url)
-        almalinux_mirror_network_result = _validate_almalinux_mirror_network_registration(answers.domain_url)
+    run = _current_run.get()
+    if run is not None:
+        domain_result, timestamp_result, almalinux_mirror_network_result, github_result = _run_checks_concurrently(
+            run=run,
+            answers=answers,
+        )
     else:
-        timestamp_result = {
-            "status": "not_checked",
-            "detail": f"domain status was {domain_result['status']}",
-            "checked_urls": [],
-        }
-        almalinux_mirror_network_result = {
-            "status": "not_checked",
-            "detail": f"domain status was {domain_result['status']}",
-        }
-    github_result = _validate_github_reference(
-        answers.pull_request_url,
-        expected_file_path=str(almalinux_mirror_network_result.get("expected_file_path") or "") or None,
-    )
+        domain_result = _validate_domain(answers.domain_url)
+        if domain_result["status"] == "reachable":
+            timestamp_result = _validate_timestamp_files(answers.domain_url)
+            almalinux_mirror_network_result = _validate_almalinux_mirror_network_registration(answers.domain_url)
+        else:
+            timestamp_result = _domain_not_checked_result(domain_result, checked_urls=True)
+            almalinux_mirror_network_result = _domain_not_checked_result(domain_result)
+        github_result = _validate_github_reference(
+            answers.pull_request_url,
+            expected_file_path=str(almalinux_mirror_network_result.get("expected_file_path") or "") or None,
+        )
     sanitized_answers = answers.as_dict()
     sanitized_answers["domain_url"] = _sanitize_http_url_for_storage(answers.domain_url, keep_path=False)
     sanitized_answers["pull_request_url"] = _sanitize_github_url_for_storage(answers.pull_request_url)
@@ -419,6 +546,73 @@ def run_validation(*, membership_request: MembershipRequest) -> ValidationOutcom
     )
 
 
+def _domain_not_checked_result(domain_result: dict[str, object], *, checked_urls: bool = False) -> dict[str, object]:
+    result: dict[str, object] = {
+        "status": "not_checked",
+        "detail": f"domain status was {domain_result['status']}",
+    }
+    if checked_urls:
+        result["checked_urls"] = []
+    return result
+
+
+def _run_checks_concurrently(
+    *,
+    run: MirrorValidationRun,
+    answers: MirrorRequestAnswers,
+) -> tuple[dict[str, object], dict[str, object], dict[str, object], dict[str, object]]:
+    """Run one request's checks with ``run``'s shared caches and limits.
+
+    The domain check gates the rest; the mirror-network file path that the
+    GitHub check looks for depends only on the domain's hostname, so the
+    remaining three checks run in parallel.
+    """
+    domain_url = answers.domain_url
+    mirror_host = _url_hostname(domain_url)
+    domain_result = run.shared(("domain", domain_url), lambda: _validate_domain(domain_url), host=mirror_host)
+
+    expected_file_path: str | None = None
+    if domain_result["status"] == "reachable":
+        timestamp_future = run.start_check(
+            ("timestamp", domain_url),
+            lambda: _validate_timestamp_files(domain_url),
+            host=mirror_host,
+        )
+        network_future = run.start_check(
+            ("almalinux_mirror_network", domain_url),
+            lambda: _validate_almalinux_mirror_network_registration(domain_url),
+            host=_MIRROR_NETWORK_HOST,
+        )
+        if mirror_host:
+            expected_file_path = _mirror_network_file_path(mirror_host)
+    else:
+        timestamp_future = Future()
+        timestamp_future.set_result(_domain_not_checked_result(domain_result, checked_urls=True))
+        network_future = Future()
+        network_future.set_result(_domain_not_checked_result(domain_result))
+
+    pull_request_url = answers.pull_request_url
+    github_future = run.start_check(
+        ("github", pull_request_url, expected_file_path or ""),
+        lambda: _validate_github_reference(pull_request_url, expected_file_path=expected_file_path),
+        host=_url_hostname(pull_request_url),
+    )
+    # Results may be shared with other requests in the run; each request stores its own copy.
+    return (
+        copy.deepcopy(domain_result),
+        copy.deepcopy(timestamp_future.result()),
+        copy.deepcopy(network_future.result()),
+        copy.deepcopy(github_future.result()),
+    )
+
+
+def _url_hostname(url: str) -> str:
+    try:
+        return urlsplit(_normalize_http_url(url)).hostname or ""
+    except MirrorValidationError:
+        return ""
+
+
 @transaction.atomic
 def finalize_validation(
     *,
@@ -884,7 +1078,7 @@ def _validate_almalinux_mirror_network_registration(url: str) -> dict[str, objec
     if hostname is None:
         return {"status": "not_checked", "detail": "missing_hostname"}
 
-    expected_file_path = f"mirrors.d/{hostname}.yml"
+    expected_file_path = _mirror_network_file_path(hostname)
     lookup_url = f"https://raw.githubusercontent.com/AlmaLinux/mirrors/refs/heads/master/{expected_file_path}"
     try:
         response = requests.get(
@@ -934,6 +1128,10 @@ def _validate_almalinux_mirror_network_registration(url: str) -> dict[str, objec
         response.close()
 
 
+def _mirror_network_file_path(hostname: str) -> str:
+    return f"mirrors.d/{hostname}.yml"
+
+
 def _normalize_http_url(url: str) -> str:
     split = urlsplit(str(url or "").strip())
     if split.scheme not in _ALLOWED_SCHEMES or not split.netloc:
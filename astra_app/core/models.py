@@ -15,7 +15,7 @@ from django.core.files.base import ContentFile
 from django.core.files.uploadedfile import UploadedFile
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import IntegrityError, models, transaction
-from django.db.models import Q
+from django.db.models import F, Q
 from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from django.utils import timezone
@@ -1211,6 +1211,44 @@ class MembershipLog(models.Model):
         )
 
 
+class MembershipStatsDay(models.Model):
+    """Active memberships of one type at the end of a completed local day.
+
+    Rebuilt nightly from the membership log by ``membership_stats_rollup`` so
+    the active-memberships chart does not replay the whole log per request.
+    """
+
+    day = models.DateField()
+    membership_type = models.ForeignKey(MembershipType, on_delete=models.CASCADE, related_name="+")
+    active_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["day", "membership_type"], name="uniq_membershipstatsday_day_type"),
+        ]
+
+    def __str__(self) -> str:
+        return f"MembershipStatsDay({self.day}, {self.membership_type_id})"
+
+
+class MembershipRetentionCohort(models.Model):
+    """12-month retention outcome of an individual membership cohort.
+
+    A cohort is the users whose first approval fell in ``cohort_month``; rows
+    exist only for cohorts whose 12-month horizon had passed when
+    ``membership_stats_rollup`` last ran, so their counts no longer change.
+    """
+
+    cohort_month = models.DateField(unique=True)
+    cohort_size = models.PositiveIntegerField(default=0)
+    retained = models.PositiveIntegerField(default=0)
+    lapsed_then_renewed = models.PositiveIntegerField(default=0)
+    lapsed_not_renewed = models.PositiveIntegerField(default=0)
+
+    def __str__(self) -> str:
+        return f"MembershipRetentionCohort({self.cohort_month:%Y-%m})"
+
+
 class MembershipTerminationFeedback(models.Model):
     class TriggerSource(models.TextChoices):
         settings_membership_tab = "settings_membership_tab", "Settings membership tab"
@@ -1594,7 +1632,16 @@ class VotingCredential(models.Model):
     @override
     def save(self, *args, **kwargs) -> None:
         self._validate_not_issued_after_anonymization()
+        adding = self._state.adding
         super().save(*args, **kwargs)
+        if adding and self.weight > 0:
+            # Keep maintained turnout counters in step with per-row issuance;
+            # bulk issuance rebuilds them instead.
+            ElectionTurnout.objects.filter(election_id=self.election_id).update(
+                eligible_voter_count=F("eligible_voter_count") + 1,
+                eligible_vote_weight_total=F("eligible_vote_weight_total") + self.weight,
+                updated_at=timezone.now(),
+            )
 
     @classmethod
     def generate_public_id(cls) -> str:
@@ -1715,6 +1762,55 @@ class Ballot(models.Model):
         return hashlib.sha256(data).hexdigest()
 
 
+class ElectionChainHead(models.Model):
+    """Current tip of an election's ballot hash chain.
+
+    Ballot submission locks this row (not the Election row) to append to the
+    chain, so votes stay strictly ordered without blocking unrelated election
+    updates, and the previous hash is a primary-key read instead of a
+    latest-ballot query. ``close_election()`` takes the same lock after locking
+    the election, which is what keeps a ballot from landing after close.
+    """
+
+    election = models.OneToOneField(
+        Election,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="chain_head",
+    )
+    chain_hash = models.CharField(max_length=64)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self) -> str:
+        return f"ElectionChainHead(election_id={self.election_id}, chain_hash={self.chain_hash[:12]})"
+
+
+class ElectionTurnout(models.Model):
+    """Maintained turnout counters behind quorum checks and the turnout report.
+
+    Eligible totals cover credentials with a positive weight; participating
+    totals cover final (non-superseded) ballots. Ballot submission updates the
+    participating totals under the chain head lock, credential issuance updates
+    the eligible totals, and ``elections_turnout_reconcile`` rebuilds rows from
+    the underlying tables.
+    """
+
+    election = models.OneToOneField(
+        Election,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="turnout",
+    )
+    eligible_voter_count = models.PositiveIntegerField(default=0)
+    eligible_vote_weight_total = models.PositiveBigIntegerField(default=0)
+    participating_voter_count = models.PositiveIntegerField(default=0)
+    participating_vote_weight_total = models.PositiveBigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self) -> str:
+        return f"ElectionTurnout(election_id={self.election_id})"
+
+
 class AuditLogEntry(models.Model):
     election = models.ForeignKey(Election, on_delete=models.CASCADE, related_name="audit_log", null=True, blank=True)
     organization = models.ForeignKey(
@@ -1796,6 +1892,46 @@ class MattermostWebhookEndpoint(models.Model):
             )
 
 
+class OutboxMessage(models.Model):
+    """A third-party side effect recorded by a request and delivered by `outbox_drain`."""
+
+    class Kind(models.TextChoices):
+        mattermost_webhook = "mattermost_webhook", "Mattermost webhook"
+        rekor_attestation = "rekor_attestation", "Rekor attestation"
+        ses_event = "ses_event", "SES event"
+        send_mail_chunk = "send_mail_chunk", "Send Mail chunk"
+
+    class Status(models.TextChoices):
+        pending = "pending", "Pending"
+        running = "running", "Running"
+        delivered = "delivered", "Delivered"
+        failed_terminal = "failed_terminal", "Failed (terminal)"
+
+    kind = models.CharField(max_length=32, choices=Kind.choices)
+    payload = models.JSONField(blank=True, default=dict)
+    status = models.CharField(max_length=32, choices=Status.choices, default=Status.pending)
+    attempt_count = models.PositiveIntegerField(default=0)
+    last_attempt_at = models.DateTimeField(blank=True, null=True)
+    last_error = models.CharField(max_length=255, blank=True, default="")
+    next_run_at = models.DateTimeField(default=timezone.now)
+    claimed_at = models.DateTimeField(blank=True, null=True)
+    claim_expires_at = models.DateTimeField(blank=True, null=True)
+    delivered_at = models.DateTimeField(blank=True, null=True)
+    delivery_latency_ms = models.PositiveIntegerField(blank=True, null=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["status", "next_run_at"], name="outbox_status_next"),
+            models.Index(fields=["status", "claim_expires_at"], name="outbox_status_claim"),
+            models.Index(fields=["status", "delivered_at"], name="outbox_status_delivered"),
+        ]
+        ordering = ("next_run_at", "pk")
+
+    def __str__(self) -> str:
+        return f"{self.kind} #{self.pk} ({self.status})"
+
+
 class FreeIPAPermissionGrant(models.Model):
     """Grant an arbitrary Django permission string to a FreeIPA user or group.
 
@@ -1906,6 +2042,19 @@ def _cleanup_credentials_on_election_soft_delete(
     VotingCredential.objects.filter(election=instance).delete()
 
 
+@receiver(post_save, sender=FreeIPAPermissionGrant)
+@receiver(post_delete, sender=FreeIPAPermissionGrant)
+def _invalidate_permission_grants_on_change(
+    sender: type[FreeIPAPermissionGrant],
+    instance: FreeIPAPermissionGrant,
+    **kwargs: object,
+) -> None:
+    """Drop cached grant snapshots when a grant changes."""
+    from core.permission_grants import invalidate_permission_grants
+
+    invalidate_permission_grants()
+
+
 @receiver(post_save, sender=MembershipRequest)
 def _invalidate_badge_cache_on_membership_request_change(
     sender: type[MembershipRequest],
@@ -20,6 +20,7 @@ from core.csv_import_utils import (
     set_form_column_field_choices,
 )
 from core.freeipa.user import FreeIPAUser
+from core.freeipa_directory import UserEmailIndex, get_user_email_index
 from core.models import Organization
 from core.public_urls import build_public_absolute_url
 from core.views_utils import _normalize_str
@@ -237,7 +238,7 @@ class OrganizationCSVImportResource(resources.ModelResource):
 
         self._username_cache: dict[str, FreeIPAUser] = {}
         self._username_lookup_cache: dict[str, FreeIPAUser | None] = {}
-        self._email_to_usernames: dict[str, set[str]] = {}
+        self._email_index = UserEmailIndex(())
         self._email_lookup_cache: dict[str, list[str]] = {}
         self._full_address_parts_cache: dict[str, dict[str, str]] = {}
         self._address_parts_cache: dict[str, dict[str, str]] = {}
@@ -289,10 +290,8 @@ class OrganizationCSVImportResource(resources.ModelResource):
                 continue
             self._username_cache[username] = user
             self._username_lookup_cache[username] = user
-            email = normalize_csv_email(user.email)
-            if email:
-                self._email_to_usernames.setdefault(email, set()).add(username)
 
+        self._email_index = get_user_email_index()
         self._email_lookup_cache = {}
 
         counts: dict[tuple[str, str], int] = {}
@@ -417,10 +416,11 @@ class OrganizationCSVImportResource(resources.ModelResource):
         if cached is not None:
             return cached
 
-        usernames = sorted(self._email_to_usernames.get(normalized, set()))
+        usernames = sorted({u.lower() for u in self._email_index.usernames_for(normalized)})
         if not usernames:
             # Tier 2 fallback: query all usernames for this exact email.
             usernames = sorted({u.lower() for u in FreeIPAUser.find_usernames_by_email(normalized) if _normalize_str(u)})
+            self._email_index.remember(normalized, usernames)
 
         if not usernames:
             # Tier 3 fallback: find the first matching user object.
@@ -0,0 +1,237 @@
+"""Durable outbox for side effects that call third-party endpoints.
+
+Requests only insert `OutboxMessage` rows, in their own transaction, so a
+rolled-back request never notifies anyone and a slow Mattermost or Rekor
+endpoint never holds a web worker. The `outbox_drain` command claims due rows
+with ``SKIP LOCKED``, hands each kind's batch to its handler, and reschedules
+failures with backoff. Delivery is at-least-once: a worker that dies after
+posting but before recording the result leaves the row to be reclaimed when
+its lease expires.
+"""
+
+import datetime
+import logging
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+
+from django.db import transaction
+from django.db.models import Count, F, Min, Q
+from django.utils import timezone
+
+from core.models import OutboxMessage
+
+logger = logging.getLogger(__name__)
+
+_CLAIM_LEASE = datetime.timedelta(minutes=5)
+_RETRY_BACKOFF_SCHEDULE = (
+    datetime.timedelta(minutes=1),
+    datetime.timedelta(minutes=5),
+    datetime.timedelta(minutes=15),
+    datetime.timedelta(hours=1),
+    datetime.timedelta(hours=6),
+)
+_MAX_ATTEMPTS = len(_RETRY_BACKOFF_SCHEDULE) + 1
+_DELIVERED_RETENTION = datetime.timedelta(days=7)
+_LAST_ERROR_MAX_CHARS = 255
+
+
+@dataclass(frozen=True, slots=True)
+class DeliveryFailure:
+    error: str
+    retryable: bool = True
+
+
+# A handler receives one kind's claimed batch and returns the failed messages
+# by pk; every message missing from the result counts as delivered.
+type BatchDeliverer = Callable[[Sequence[OutboxMessage]], dict[int, DeliveryFailure]]
+
+
+@dataclass(frozen=True, slots=True)
+class OutboxHandler:
+    deliver: BatchDeliverer
+    give_up: Callable[[OutboxMessage, DeliveryFailure], None] | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class DrainResult:
+    claimed: int
+    reclaimed: int
+    delivered: int
+    retried: int
+    failed: int
+    max_latency_ms: int | None
+
+
+def enqueue_outbox_messages(*, kind: str, payloads: Sequence[dict[str, object]]) -> None:
+    """Record side effects for the drain worker; they become visible when the caller commits."""
+    if not payloads:
+        return
+    OutboxMessage.objects.bulk_create([OutboxMessage(kind=kind, payload=payload) for payload in payloads])
+
+
+def _handlers() -> dict[str, OutboxHandler]:
+    # Imported lazily: the delivery modules enqueue through this one.
+    from core.elections_timestamping import deliver_attestation_batch, record_attestation_gave_up
+    from core.mattermost_webhooks import deliver_webhook_batch
+    from core.send_mail_delivery import deliver_send_mail_chunks
+    from core.ses_signals import deliver_ses_event_batch
+
+    return {
+        OutboxMessage.Kind.mattermost_webhook: OutboxHandler(deliver=deliver_webhook_batch),
+        OutboxMessage.Kind.rekor_attestation: OutboxHandler(
+            deliver=deliver_attestation_batch,
+            give_up=record_attestation_gave_up,
+        ),
+        OutboxMessage.Kind.ses_event: OutboxHandler(deliver=deliver_ses_event_batch),
+        OutboxMessage.Kind.send_mail_chunk: OutboxHandler(deliver=deliver_send_mail_chunks),
+    }
+
+
+def due_outbox_queryset(*, now: datetime.datetime):
+    due = Q(status=OutboxMessage.Status.pending, next_run_at__lte=now)
+    expired_running = Q(status=OutboxMessage.Status.running, claim_expires_at__lte=now)
+    return OutboxMessage.objects.filter(due | expired_running)
+
+
+@transaction.atomic
+def claim_outbox_batch(*, now: datetime.datetime, batch_size: int) -> tuple[list[OutboxMessage], int]:
+    """Lease up to ``batch_size`` due messages; returns ``(batch, reclaimed_count)``."""
+    batch = list(
+        due_outbox_queryset(now=now).select_for_update(skip_locked=True).order_by("next_run_at", "pk")[:batch_size]
+    )
+    if not batch:
+        return [], 0
+
+    reclaimed = sum(1 for message in batch if message.status == OutboxMessage.Status.running)
+    claim_expires_at = now + _CLAIM_LEASE
+    OutboxMessage.objects.filter(pk__in=[message.pk for message in batch]).update(
+        status=OutboxMessage.Status.running,
+        attempt_count=F("attempt_count") + 1,
+        last_attempt_at=now,
+        claimed_at=now,
+        claim_expires_at=claim_expires_at,
+    )
+    for message in batch:
+        message.status = OutboxMessage.Status.running
+        message.attempt_count += 1
+        message.last_attempt_at = now
+        message.claimed_at = now
+        message.claim_expires_at = claim_expires_at
+    return batch, reclaimed
+
+
+def _deliver_kind(*, kind: str, messages: list[OutboxMessage], handler: OutboxHandler | None) -> dict[int, DeliveryFailure]:
+    if handler is None:
+        logger.error("outbox.unknown_kind", extra={"kind": kind, "count": len(messages)})
+        return {message.pk: DeliveryFailure(error="unknown_kind", retryable=False) for message in messages}
+    try:
+        return handler.deliver(messages)
+    except Exception as exc:
+        logger.exception("outbox.handler_error", extra={"kind": kind, "count": len(messages)})
+        return {message.pk: DeliveryFailure(error=type(exc).__name__) for message in messages}
+
+
+def _retry_delay(attempt_count: int) -> datetime.timedelta:
+    index = min(max(attempt_count, 1), len(_RETRY_BACKOFF_SCHEDULE)) - 1
+    return _RETRY_BACKOFF_SCHEDULE[index]
+
+
+def drain_outbox(*, batch_size: int) -> DrainResult:
+    """Claim and deliver one batch of due messages."""
+    batch, reclaimed = claim_outbox_batch(now=timezone.now(), batch_size=batch_size)
+    if not batch:
+        return DrainResult(claimed=0, reclaimed=0, delivered=0, retried=0, failed=0, max_latency_ms=None)
+
+    by_kind: dict[str, list[OutboxMessage]] = {}
+    for message in batch:
+        by_kind.setdefault(message.kind, []).append(message)
+
+    handlers = _handlers()
+    failures: dict[int, DeliveryFailure] = {}
+    for kind, messages in by_kind.items():
+        failures.update(_deliver_kind(kind=kind, messages=messages, handler=handlers.get(kind)))
+
+    now = timezone.now()
+    delivered: list[OutboxMessage] = []
+    settled: list[OutboxMessage] = []
+    gave_up: list[tuple[OutboxMessage, DeliveryFailure]] = []
+    for message in batch:
+        message.claimed_at = None
+        message.claim_expires_at = None
+        failure = failures.get(message.pk)
+        if failure is None:
+            message.status = OutboxMessage.Status.delivered
+            message.delivered_at = now
+            message.delivery_latency_ms = max(0, int((now - message.created_at).total_seconds() * 1000))
+            message.last_error = ""
+            delivered.append(message)
+            continue
+
+        message.last_error = failure.error[:_LAST_ERROR_MAX_CHARS]
+        if failure.retryable and message.attempt_count < _MAX_ATTEMPTS:
+            message.status = OutboxMessage.Status.pending
+            message.next_run_at = now + _retry_delay(message.attempt_count)
+        else:
+            message.status = OutboxMessage.Status.failed_terminal
+            gave_up.append((message, failure))
+        settled.append(message)
+
+    OutboxMessage.objects.bulk_update(
+        [*delivered, *settled],
+        fields=[
+            "status",
+            "last_error",
+            "next_run_at",
+            "claimed_at",
+            "claim_expires_at",
+            "delivered_at",
+            "delivery_latency_ms",
+        ],
+    )
+
+    for message, failure in gave_up:
+        logger.error(
+            "outbox.gave_up",
+            extra={
+                "outbox_id": message.pk,
+                "kind": message.kind,
+                "attempt_count": message.attempt_count,
+                "error": failure.error,
+            },
+        )
+        handler = handlers.get(message.kind)
+        if handler is not None and handler.give_up is not None:
+            try:
+                handler.give_up(message, failure)
+            except Exception:
+                logger.exception("outbox.give_up_error", extra={"outbox_id": message.pk, "kind": message.kind})
+
+    return DrainResult(
+        claimed=len(batch),
+        reclaimed=reclaimed,
+        delivered=len(delivered),
+        retried=len(settled) - len(gave_up),
+        failed=len(gave_up),
+        max_latency_ms=max((message.delivery_latency_ms or 0 for message in delivered), default=None),
+    )
+
+
+def purge_delivered_outbox(*, now: datetime.datetime) -> int:
+    deleted, _detail = OutboxMessage.objects.filter(
+        status=OutboxMessage.Status.delivered,
+        delivered_at__lt=now - _DELIVERED_RETENTION,
+    ).delete()
+    return deleted
+
+
+def outbox_stats() -> dict[str, int]:
+    """Return outbox row counts by status plus the age of the oldest due row."""
+    now = timezone.now()
+    counts = {
+        row["status"]: row["count"]
+        for row in OutboxMessage.objects.values("status").annotate(count=Count("id")).order_by()
+    }
+    oldest_due = due_outbox_queryset(now=now).aggregate(oldest=Min("created_at"))["oldest"]
+    stats = {status: int(counts.get(status, 0)) for status in OutboxMessage.Status.values}
+    stats["oldest_due_age_seconds"] = int((now - oldest_due).total_seconds()) if oldest_due is not None else 0
+    return stats
@@ -0,0 +1,132 @@
+import threading
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+_GRANTS_GENERATION_CACHE_KEY = "freeipa_permission_grants_generation"
+
+
+@dataclass(frozen=True, slots=True)
+class PermissionGrantSnapshot:
+    """Every `FreeIPAPermissionGrant`, keyed by lowercased principal name."""
+
+    user_permissions: dict[str, frozenset[str]]
+    group_permissions: dict[str, frozenset[str]]
+
+    def permissions_for(self, *, username: str, groups: Iterable[str]) -> set[str]:
+        permissions = set(self.user_permissions.get(username.strip().lower(), ()))
+        for group in groups:
+            permissions.update(self.group_permissions.get(str(group or "").strip().lower(), ()))
+        return permissions
+
+
+def _load_snapshot() -> PermissionGrantSnapshot:
+    from core.models import FreeIPAPermissionGrant
+
+    user_permissions: dict[str, set[str]] = {}
+    group_permissions: dict[str, set[str]] = {}
+    for principal_type, principal_name, permission in FreeIPAPermissionGrant.objects.values_list(
+        "principal_type",
+        "principal_name",
+        "permission",
+    ):
+        if principal_type == FreeIPAPermissionGrant.PrincipalType.user:
+            user_permissions.setdefault(principal_name, set()).add(permission)
+        elif principal_type == FreeIPAPermissionGrant.PrincipalType.group:
+            group_permissions.setdefault(principal_name, set()).add(permission)
+    return PermissionGrantSnapshot(
+        user_permissions={name: frozenset(perms) for name, perms in user_permissions.items()},
+        group_permissions={name: frozenset(perms) for name, perms in group_permissions.items()},
+    )
+
+
+class _PermissionGrantCache:
+    """Per-process copy of the grant table.
+
+    Saving or deleting a grant clears this process's copy at once and bumps a
+    shared generation counter on commit; other workers compare that counter at
+    most every ``FREEIPA_PERMISSION_GRANT_CACHE_SECONDS`` and reload when it
+    changed. A value of 0 disables the cache.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._snapshot: PermissionGrantSnapshot | None = None
+        self._generation: object = None
+        self._checked_at = 0.0
+
+    def snapshot(self) -> PermissionGrantSnapshot:
+        recheck_seconds = settings.FREEIPA_PERMISSION_GRANT_CACHE_SECONDS
+        if recheck_seconds <= 0:
+            return _load_snapshot()
+
+        now = time.monotonic()
+        with self._lock:
+            if self._snapshot is not None and now - self._checked_at < recheck_seconds:
+                return self._snapshot
+
+        generation = cache.get(_GRANTS_GENERATION_CACHE_KEY, 0)
+        with self._lock:
+            if self._snapshot is not None and generation == self._generation:
+                self._checked_at = now
+                return self._snapshot
+
+        snapshot = _load_snapshot()
+        with self._lock:
+            self._snapshot = snapshot
+            self._generation = generation
+            self._checked_at = now
+        return snapshot
+
+    def clear(self) -> None:
+        with self._lock:
+            self._snapshot = None
+
+    def invalidate(self) -> None:
+        self.clear()
+        try:
+            cache.incr(_GRANTS_GENERATION_CACHE_KEY)
+        except ValueError:
+            cache.set(_GRANTS_GENERATION_CACHE_KEY, 1, timeout=None)
+
+
+_grant_cache = _PermissionGrantCache()
+_request_local = threading.local()
+
+
+def begin_permission_request_scope() -> None:
+    """Pin one grant snapshot for the rest of this thread's request."""
+    _request_local.active = True
+    _request_local.snapshot = None
+
+
+def end_permission_request_scope() -> None:
+    _request_local.active = False
+    _request_local.snapshot = None
+
+
+def permission_grant_snapshot() -> PermissionGrantSnapshot:
+    """Return the grant snapshot, loading it at most once per request."""
+    if not getattr(_request_local, "active", False):
+        return _grant_cache.snapshot()
+
+    snapshot = getattr(_request_local, "snapshot", None)
+    if snapshot is None:
+        snapshot = _grant_cache.snapshot()
+        _request_local.snapshot = snapshot
+    return snapshot
+
+
+def invalidate_permission_grants() -> None:
+    """Drop this process's snapshots now and tell other workers once committed.
+
+    Bumping the shared generation before commit would let another worker
+    reload the old rows and keep them under the new generation.
+    """
+    _request_local.snapshot = None
+    _grant_cache.clear()
+    transaction.on_commit(_grant_cache.invalidate)
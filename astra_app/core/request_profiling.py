@@ -0,0 +1,126 @@
+"""Opt-in per-request accounting of FreeIPA RPCs, FreeIPA cache use and ORM queries.
+
+`RequestProfilingMiddleware` (enabled by ``REQUEST_PROFILING_ENABLED``) wraps
+each request in `profile_request()`. The FreeIPA session response hook, the
+FreeIPA cache layer and a database execute wrapper report into the active
+`RequestProfile`; the access log line carries its totals and the response gets
+a ``Server-Timing`` header. `profile_request()` also works on its own, for
+example around a view call in a shell.
+"""
+
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Iterator
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from django.db import connections
+
+# Per-entry FreeIPA cache keys end in a username, cn or digest; count them by prefix.
+_CACHE_KEY_FAMILIES = (
+    "freeipa_user_",
+    "freeipa_group_",
+    "freeipa_fasagreement_",
+)
+
+
+def cache_key_family(key: str) -> str:
+    for prefix in _CACHE_KEY_FAMILIES:
+        if key.startswith(prefix):
+            return prefix.rstrip("_")
+    return key
+
+
+@dataclass
+class RequestProfile:
+    freeipa_calls: Counter[str] = field(default_factory=Counter)
+    freeipa_bytes: int = 0
+    freeipa_seconds: float = 0.0
+    cache_hits: Counter[str] = field(default_factory=Counter)
+    cache_misses: Counter[str] = field(default_factory=Counter)
+    cache_sets: Counter[str] = field(default_factory=Counter)
+    db_queries: int = 0
+    db_seconds: float = 0.0
+    # FreeIPA batches and mirror checks can report from worker threads.
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record_freeipa_rpc(self, method: str, *, response_bytes: int | None, seconds: float) -> None:
+        with self._lock:
+            self.freeipa_calls[method] += 1
+            self.freeipa_bytes += response_bytes or 0
+            self.freeipa_seconds += seconds
+
+    def record_cache_get(self, key: str, *, hit: bool) -> None:
+        with self._lock:
+            (self.cache_hits if hit else self.cache_misses)[cache_key_family(key)] += 1
+
+    def record_cache_set(self, key: str) -> None:
+        with self._lock:
+            self.cache_sets[cache_key_family(key)] += 1
+
+    def record_db_query(self, seconds: float) -> None:
+        with self._lock:
+            self.db_queries += 1
+            self.db_seconds += seconds
+
+    def log_fields(self) -> dict[str, int | str]:
+        """Totals for the structured access log line."""
+        return {
+            "freeipa_rpc_count": self.freeipa_calls.total(),
+            "freeipa_rpc_methods": _format_counter(self.freeipa_calls),
+            "freeipa_response_bytes": self.freeipa_bytes,
+            "freeipa_duration_ms": int(round(self.freeipa_seconds * 1000)),
+            "freeipa_cache_hits": self.cache_hits.total(),
+            "freeipa_cache_misses": self.cache_misses.total(),
+            "freeipa_cache_sets": self.cache_sets.total(),
+            "freeipa_cache_misses_by_family": _format_counter(self.cache_misses),
+            "db_query_count": self.db_queries,
+            "db_duration_ms": int(round(self.db_seconds * 1000)),
+        }
+
+    def server_timing(self) -> str:
+        return ", ".join(
+            (
+                f'freeipa;dur={self.freeipa_seconds * 1000:.1f};desc="{self.freeipa_calls.total()} rpc"',
+                f'db;dur={self.db_seconds * 1000:.1f};desc="{self.db_queries} queries"',
+                f'cache;desc="{self.cache_hits.total()} hit {self.cache_misses.total()} miss"',
+            )
+        )
+
+
+def _format_counter(counter: Counter[str]) -> str:
+    return ",".join(f"{name}={count}" for name, count in sorted(counter.items()))
+
+
+_current_profile: ContextVar[RequestProfile | None] = ContextVar("request_profile", default=None)
+
+
+def current_request_profile() -> RequestProfile | None:
+    return _current_profile.get()
+
+
+def _db_execute_wrapper(profile: RequestProfile) -> Callable[..., object]:
+    def wrapper(execute, sql, params, many, context):
+        started_at = time.monotonic()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            profile.record_db_query(time.monotonic() - started_at)
+
+    return wrapper
+
+
+@contextmanager
+def profile_request() -> Iterator[RequestProfile]:
+    """Collect a `RequestProfile` for the code run inside the block on this thread."""
+    profile = RequestProfile()
+    token = _current_profile.set(profile)
+    try:
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(_db_execute_wrapper(profile)))
+            yield profile
+    finally:
+        _current_profile.reset(token)
@@ -0,0 +1,276 @@
+"""Queue Send Mail messages for many recipients.
+
+The subject, text and HTML sources are compiled once per send, and rendered
+emails are inserted in chunks of ``SEND_MAIL_CHUNK_SIZE`` so memory stays flat
+as the recipient list grows. Sends with at least
+``SEND_MAIL_BACKGROUND_THRESHOLD`` recipients are not rendered in the request:
+they are split into one outbox message per chunk, which `outbox_drain` renders
+and inserts, and `send_mail_job_progress` reports how far the job has got.
+"""
+
+import logging
+import uuid
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from post_office.models import Email
+
+from core.logging_extras import current_exception_log_fields
+from core.models import OutboxMessage
+from core.outbox import DeliveryFailure, enqueue_outbox_messages
+from core.templated_email import ComposedEmail, bulk_save_emails, queue_composed_email
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class QueuedRecipients:
+    queued: int = 0
+    failed: int = 0
+    first_error: Exception | None = None
+
+
+def _recipient_email(recipient: Mapping[str, object]) -> str:
+    return str(recipient.get("email") or "").strip()
+
+
+def queue_recipient_emails(
+    *,
+    recipients: Iterable[Mapping[str, object]],
+    subject: str,
+    text_content: str,
+    html_content: str,
+    cc: list[str],
+    bcc: list[str],
+    reply_to: list[str],
+    on_saved: Callable[[list[Email]], None] | None = None,
+) -> QueuedRecipients:
+    """Render and insert one email per recipient with an ``email`` value.
+
+    Recipients whose email fails to render are logged and counted, and the
+    rest are still queued. ``on_saved`` is called with each inserted chunk.
+    """
+    result = QueuedRecipients()
+    try:
+        composer = ComposedEmail(subject_source=subject, text_source=text_content, html_source=html_content)
+    except Exception as exc:
+        # Broken sources fail every recipient the same way.
+        result.first_error = exc
+        result.failed = sum(1 for recipient in recipients if _recipient_email(recipient))
+        logger.exception(
+            "Send mail template failed recipients=%s",
+            result.failed,
+            extra=current_exception_log_fields(),
+        )
+        return result
+
+    chunk_size = max(1, settings.SEND_MAIL_CHUNK_SIZE)
+    pending: list[Email] = []
+    queued: list[Email] = []
+
+    def flush() -> None:
+        bulk_save_emails(pending, batch_size=chunk_size)
+        if on_saved is not None and queued:
+            on_saved(list(queued))
+        pending.clear()
+        queued.clear()
+
+    with composer:
+        for recipient in recipients:
+            to_email = _recipient_email(recipient)
+            if not to_email:
+                continue
+            try:
+                queued_email = queue_composed_email(
+                    recipients=[to_email],
+                    sender=settings.DEFAULT_FROM_EMAIL,
+                    subject_source=subject,
+                    text_source=text_content,
+                    html_source=html_content,
+                    context=recipient,
+                    cc=cc,
+                    bcc=bcc,
+                    reply_to=reply_to,
+                    commit=False,
+                    composer=composer,
+                )
+
+                raw_election_id = recipient.get("election_id")
+                if raw_election_id is not None:
+                    try:
+                        queued_email.context = {"election_id": int(raw_election_id)}
+                    except (TypeError, ValueError):
+                        pass
+
+                if isinstance(queued_email, Email):
+                    pending.append(queued_email)
+                queued.append(queued_email)
+                result.queued += 1
+            except Exception as exc:
+                if result.first_error is None:
+                    result.first_error = exc
+                result.failed += 1
+                logger.exception(
+                    "Send mail failed email=%s",
+                    to_email,
+                    extra=current_exception_log_fields(),
+                )
+
+            if len(queued) >= chunk_size:
+                flush()
+        flush()
+    return result
+
+
+def check_recipient_templates(
+    *,
+    recipients: Iterable[Mapping[str, object]],
+    subject: str,
+    text_content: str,
+    html_content: str,
+) -> Exception | None:
+    """Compile the sources and render them for the first addressed recipient.
+
+    Background sends are only rendered by `outbox_drain`, so the request
+    runs this first to report a broken template before anything is queued.
+    """
+    first = next((recipient for recipient in recipients if _recipient_email(recipient)), None)
+    try:
+        with ComposedEmail(subject_source=subject, text_source=text_content, html_source=html_content) as composer:
+            if first is not None:
+                composer.render(first)
+    except Exception as exc:
+        return exc
+    return None
+
+
+def should_send_in_background(*, recipient_count: int) -> bool:
+    threshold = settings.SEND_MAIL_BACKGROUND_THRESHOLD
+    return threshold > 0 and recipient_count >= threshold
+
+
+def enqueue_send_mail_job(
+    *,
+    recipients: Sequence[Mapping[str, object]],
+    subject: str,
+    text_content: str,
+    html_content: str,
+    cc: list[str],
+    bcc: list[str],
+    reply_to: list[str],
+    actor_username: str,
+) -> str:
+    """Split a send into outbox chunks and return the job id."""
+    job_id = uuid.uuid4().hex
+    chunk_size = max(1, settings.SEND_MAIL_CHUNK_SIZE)
+    addressed = [dict(recipient) for recipient in recipients if _recipient_email(recipient)]
+    payloads: list[dict[str, object]] = []
+    for index, start in enumerate(range(0, len(addressed), chunk_size)):
+        chunk = addressed[start : start + chunk_size]
+        payloads.append(
+            {
+                "job_id": job_id,
+                "chunk": index,
+                "actor_username": actor_username,
+                "subject": subject,
+                "text_content": text_content,
+                "html_content": html_content,
+                "cc": cc,
+                "bcc": bcc,
+                "reply_to": reply_to,
+                "recipient_count": len(chunk),
+                "recipients": chunk,
+            }
+        )
+    enqueue_outbox_messages(kind=OutboxMessage.Kind.send_mail_chunk, payloads=payloads)
+    logger.info(
+        "send_mail_job.queued job_id=%s recipients=%s chunks=%s",
+        job_id,
+        len(addressed),
+        len(payloads),
+        extra={"job_id": job_id, "actor_username": actor_username},
+    )
+    return job_id
+
+
+def deliver_send_mail_chunks(messages: Sequence[OutboxMessage]) -> dict[int, DeliveryFailure]:
+    """Outbox handler: render and insert each queued Send Mail chunk.
+
+    A chunk's outbox row is marked delivered in the transaction that inserts
+    its emails, so a worker dying before the drain records the batch does not
+    queue the chunk's emails a second time when the claim is reclaimed.
+    """
+    failures: dict[int, DeliveryFailure] = {}
+    for message in messages:
+        payload = message.payload
+        try:
+            with transaction.atomic():
+                result = queue_recipient_emails(
+                    recipients=list(payload["recipients"]),
+                    subject=str(payload["subject"]),
+                    text_content=str(payload["text_content"]),
+                    html_content=str(payload["html_content"]),
+                    cc=list(payload.get("cc") or []),
+                    bcc=list(payload.get("bcc") or []),
+                    reply_to=list(payload.get("reply_to") or []),
+                )
+                if result.queued or result.first_error is None:
+                    OutboxMessage.objects.filter(pk=message.pk).update(
+                        status=OutboxMessage.Status.delivered,
+                        delivered_at=timezone.now(),
+                    )
+        except (KeyError, TypeError) as exc:
+            failures[message.pk] = DeliveryFailure(error=f"invalid_payload: {exc}", retryable=False)
+            continue
+        except Exception as exc:
+            failures[message.pk] = DeliveryFailure(error=f"{type(exc).__name__}: {exc}")
+            continue
+
+        logger.info(
+            "send_mail_job.chunk_done job_id=%s chunk=%s queued=%s failed=%s",
+            payload.get("job_id"),
+            payload.get("chunk"),
+            result.queued,
+            result.failed,
+            extra={"job_id": payload.get("job_id"), "queued": result.queued, "failed": result.failed},
+        )
+        if result.queued == 0 and result.first_error is not None:
+            failures[message.pk] = DeliveryFailure(error=f"template_error: {result.first_error}", retryable=False)
+    return failures
+
+
+def send_mail_job_progress(job_id: str) -> dict[str, object] | None:
+    """Summarize a background send from its outbox chunks, or None if unknown."""
+    rows = list(
+        OutboxMessage.objects.filter(kind=OutboxMessage.Kind.send_mail_chunk, payload__job_id=job_id).values_list(
+            "status",
+            "payload__recipient_count",
+        )
+    )
+    if not rows:
+        return None
+
+    recipients = 0
+    processed_recipients = 0
+    chunks_by_status: dict[str, int] = {}
+    for status, recipient_count in rows:
+        count = int(recipient_count or 0)
+        recipients += count
+        chunks_by_status[status] = chunks_by_status.get(status, 0) + 1
+        if status == OutboxMessage.Status.delivered:
+            processed_recipients += count
+
+    failed_chunks = chunks_by_status.get(OutboxMessage.Status.failed_terminal, 0)
+    done_chunks = chunks_by_status.get(OutboxMessage.Status.delivered, 0) + failed_chunks
+    return {
+        "job_id": job_id,
+        "chunks": len(rows),
+        "done_chunks": done_chunks,
+        "failed_chunks": failed_chunks,
+        "recipients": recipients,
+        "processed_recipients": processed_recipients,
+        "finished": done_chunks == len(rows),
+    }
@@ -1,7 +1,8 @@
 import hashlib
 import hmac
 import logging
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
 from typing import Any
 
 from django.conf import settings
@@ -23,7 +24,8 @@ from post_office.models import Log as PostOfficeLog
 from post_office.models import RecipientDeliveryStatus
 
 from core.logging_extras import current_exception_log_fields
-from core.models import SESEmailCorrelationAttempt
+from core.models import OutboxMessage, SESEmailCorrelationAttempt
+from core.outbox import DeliveryFailure, enqueue_outbox_messages
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +42,55 @@ _RECIPIENT_STATUS_PRECEDENCE: dict[int, int] = {
 }
 
 
+@dataclass(frozen=True, slots=True)
+class SESMilestoneEvent:
+    """One SES notification reduced to what recording its milestone needs."""
+
+    ses_event_type: str
+    mail_obj: dict[str, Any] | None
+    recipient_domain: str | None
+    event_source: str
+    recipient_delivery_status: int
+    exception_type: str
+    message: str
+    mark_unsent_as_failed: bool = False
+
+    def to_payload(self) -> dict[str, object]:
+        # Keep only the identifiers used for correlation; the rest of the SES
+        # mail object carries recipient addresses and headers.
+        provider_message_id = _provider_message_id(self.mail_obj)
+        smtp_message_id = _smtp_message_id(self.mail_obj)
+        mail_obj: dict[str, object] = {}
+        if provider_message_id is not None:
+            mail_obj["messageId"] = provider_message_id
+        if smtp_message_id is not None:
+            mail_obj["commonHeaders"] = {"messageId": smtp_message_id}
+        return {
+            "ses_event_type": self.ses_event_type,
+            "mail_obj": mail_obj,
+            "recipient_domain": self.recipient_domain,
+            "event_source": self.event_source,
+            "recipient_delivery_status": int(self.recipient_delivery_status),
+            "exception_type": self.exception_type,
+            "message": self.message,
+            "mark_unsent_as_failed": self.mark_unsent_as_failed,
+        }
+
+    @classmethod
+    def from_payload(cls, payload: dict[str, Any]) -> SESMilestoneEvent:
+        mail_obj = payload.get("mail_obj")
+        return cls(
+            ses_event_type=str(payload["ses_event_type"]),
+            mail_obj=mail_obj if isinstance(mail_obj, dict) else None,
+            recipient_domain=payload.get("recipient_domain") or None,
+            event_source=str(payload["event_source"]),
+            recipient_delivery_status=RecipientDeliveryStatus(int(payload["recipient_delivery_status"])),
+            exception_type=str(payload["exception_type"]),
+            message=str(payload["message"]),
+            mark_unsent_as_failed=bool(payload.get("mark_unsent_as_failed")),
+        )
+
+
 def _message_id_hash(raw_message_id: str | None) -> str | None:
     raw_message_id = str(raw_message_id or "").strip()
     if not raw_message_id:
@@ -288,34 +339,25 @@ def _bounce_delivery_status(bounce_obj: dict[str, Any] | None) -> int:
     return RecipientDeliveryStatus.UNDETERMINED_BOUNCED
 
 
-def _resolve_post_office_email_match(
+def _classify_post_office_email_match(
     *,
-    mail_obj: dict[str, Any] | None,
+    provider_message_id: str | None,
+    smtp_message_id: str | None,
+    provider_email_id: int | None,
+    smtp_email_ids: Sequence[int],
+    smtp_email_has_attempts: Callable[[int], bool],
 ) -> dict[str, object]:
-    provider_message_id = _provider_message_id(mail_obj)
-    smtp_message_id = _smtp_message_id(mail_obj)
-    matched_smtp_emails = _smtp_matched_post_office_emails(smtp_message_id) if smtp_message_id else []
-    provider_attempt = None
-    if provider_message_id is not None:
-        provider_attempt = (
-            SESEmailCorrelationAttempt.objects.select_related("post_office_email")
-            .filter(ses_provider_message_id=provider_message_id)
-            .first()
-        )
-
-    if provider_attempt is not None:
-        provider_email = provider_attempt.post_office_email
-        if len(matched_smtp_emails) == 1 and matched_smtp_emails[0].pk != provider_email.pk:
+    if provider_email_id is not None:
+        if len(smtp_email_ids) == 1 and smtp_email_ids[0] != provider_email_id:
             return {
                 "outcome": "provider_id_conflict",
                 "correlation_source": "provider_id_conflict",
-                "provider_post_office_email_id": provider_email.pk,
-                "smtp_post_office_email_id": matched_smtp_emails[0].pk,
+                "provider_post_office_email_id": provider_email_id,
+                "smtp_post_office_email_id": smtp_email_ids[0],
             }
 
         return {
-            "email": provider_email,
-            "post_office_email_id": provider_email.pk,
+            "post_office_email_id": provider_email_id,
             "correlation_source": "provider_message_id",
         }
 
@@ -325,41 +367,71 @@ def _resolve_post_office_email_match(
             "correlation_source": "missing_message_id",
         }
 
-    if not matched_smtp_emails:
+    if not smtp_email_ids:
         return {
             "outcome": "missing_match",
             "correlation_source": "missing_match",
         }
 
-    if len(matched_smtp_emails) > 1:
+    if len(smtp_email_ids) > 1:
         return {
             "outcome": "ambiguous_match",
             "correlation_source": "ambiguous_match",
-            "match_count": len(matched_smtp_emails),
+            "match_count": len(smtp_email_ids),
         }
 
-    smtp_email = matched_smtp_emails[0]
+    smtp_email_id = smtp_email_ids[0]
     if provider_message_id is None:
         return {
-            "email": smtp_email,
-            "post_office_email_id": smtp_email.pk,
+            "post_office_email_id": smtp_email_id,
             "correlation_source": "smtp_message_id_fallback_no_provider_id",
         }
 
-    if smtp_email.ses_correlation_attempts.exists():
+    if smtp_email_has_attempts(smtp_email_id):
         return {
             "outcome": "provider_id_conflict",
             "correlation_source": "provider_id_conflict",
-            "smtp_post_office_email_id": smtp_email.pk,
+            "smtp_post_office_email_id": smtp_email_id,
         }
 
     return {
-        "email": smtp_email,
-        "post_office_email_id": smtp_email.pk,
+        "post_office_email_id": smtp_email_id,
         "correlation_source": "smtp_message_id_fallback_no_provider_metadata",
     }
 
 
+def _resolve_post_office_email_match(
+    *,
+    mail_obj: dict[str, Any] | None,
+) -> dict[str, object]:
+    provider_message_id = _provider_message_id(mail_obj)
+    smtp_message_id = _smtp_message_id(mail_obj)
+    matched_smtp_emails = _smtp_matched_post_office_emails(smtp_message_id) if smtp_message_id else []
+    provider_attempt = None
+    if provider_message_id is not None:
+        provider_attempt = (
+            SESEmailCorrelationAttempt.objects.select_related("post_office_email")
+            .filter(ses_provider_message_id=provider_message_id)
+            .first()
+        )
+
+    emails_by_id = {email.pk: email for email in matched_smtp_emails}
+    if provider_attempt is not None:
+        emails_by_id[provider_attempt.post_office_email.pk] = provider_attempt.post_office_email
+
+    resolution = _classify_post_office_email_match(
+        provider_message_id=provider_message_id,
+        smtp_message_id=smtp_message_id,
+        provider_email_id=provider_attempt.post_office_email_id if provider_attempt is not None else None,
+        smtp_email_ids=[email.pk for email in matched_smtp_emails],
+        smtp_email_has_attempts=lambda email_id: emails_by_id[email_id].ses_correlation_attempts.exists(),
+    )
+    matched_email_id = resolution.get("post_office_email_id")
+    if matched_email_id is not None:
+        resolution["email"] = emails_by_id[matched_email_id]
+    return resolution
+
+
 def _matched_post_office_email(
     *,
     ses_event_type: str,
@@ -573,6 +645,169 @@ def _record_post_office_milestone(
     )
 
 
+def _resolve_post_office_email_matches(mail_objs: Sequence[dict[str, Any] | None]) -> list[dict[str, object]]:
+    """Set-based `_resolve_post_office_email_match` for a batch of events.
+
+    Three queries cover the whole batch: provider-id attempts, SMTP
+    Message-ID candidates, and which of those emails already have attempts.
+    """
+    identifiers = [(_provider_message_id(mail_obj), _smtp_message_id(mail_obj)) for mail_obj in mail_objs]
+    provider_ids = {provider_id for provider_id, _smtp_id in identifiers if provider_id is not None}
+    smtp_candidates = {
+        candidate for _provider_id, smtp_id in identifiers for candidate in _smtp_message_id_candidates(smtp_id)
+    }
+
+    provider_email_ids: dict[str, int] = {}
+    if provider_ids:
+        provider_email_ids = dict(
+            SESEmailCorrelationAttempt.objects.filter(ses_provider_message_id__in=provider_ids).values_list(
+                "ses_provider_message_id",
+                "post_office_email_id",
+            )
+        )
+
+    email_ids_by_message_id: dict[str, list[int]] = {}
+    if smtp_candidates:
+        for email_id, message_id in (
+            PostOfficeEmail.objects.filter(message_id__in=smtp_candidates).order_by("pk").values_list("pk", "message_id")
+        ):
+            email_ids_by_message_id.setdefault(message_id, []).append(email_id)
+
+    smtp_email_ids = {email_id for email_ids in email_ids_by_message_id.values() for email_id in email_ids}
+    emails_with_attempts: set[int] = set()
+    if smtp_email_ids:
+        emails_with_attempts = set(
+            SESEmailCorrelationAttempt.objects.filter(post_office_email_id__in=smtp_email_ids).values_list(
+                "post_office_email_id",
+                flat=True,
+            )
+        )
+
+    resolutions: list[dict[str, object]] = []
+    for provider_id, smtp_id in identifiers:
+        matched_ids = sorted(
+            {
+                email_id
+                for candidate in _smtp_message_id_candidates(smtp_id)
+                for email_id in email_ids_by_message_id.get(candidate, ())
+            }
+        )[:2]
+        resolutions.append(
+            _classify_post_office_email_match(
+                provider_message_id=provider_id,
+                smtp_message_id=smtp_id,
+                provider_email_id=provider_email_ids.get(provider_id) if provider_id is not None else None,
+                smtp_email_ids=matched_ids,
+                smtp_email_has_attempts=emails_with_attempts.__contains__,
+            )
+        )
+    return resolutions
+
+
+def _optional_int(value: object) -> int | None:
+    return value if isinstance(value, int) else None
+
+
+def ingest_ses_events(events: Sequence[SESMilestoneEvent]) -> list[str]:
+    """Record a batch of SES milestones and return each event's outcome.
+
+    Events are applied in order with the same precedence rules as the
+    per-event signal path, but correlation takes three queries for the whole
+    batch, matched emails are locked together, and status changes and
+    milestone logs are written with one bulk update and one bulk insert.
+    Replaying events is harmless: repeats come out as ``stale_or_duplicate``.
+    """
+    if not events:
+        return []
+
+    resolutions = _resolve_post_office_email_matches([event.mail_obj for event in events])
+    matched_ids = {
+        email_id for resolution in resolutions if isinstance(email_id := resolution.get("post_office_email_id"), int)
+    }
+    outcomes: list[str] = []
+    with transaction.atomic():
+        emails_by_id = {
+            email.pk: email
+            for email in PostOfficeEmail.objects.select_for_update().filter(pk__in=matched_ids).order_by("pk")
+        }
+        changed: dict[int, PostOfficeEmail] = {}
+        milestone_logs: list[PostOfficeLog] = []
+        for event, resolution in zip(events, resolutions, strict=True):
+            email_id = resolution.get("post_office_email_id")
+            email = emails_by_id.get(email_id) if isinstance(email_id, int) else None
+            if email is None:
+                outcomes.append(str(resolution.get("outcome") or "missing_match"))
+                continue
+
+            if _recipient_status_precedence(event.recipient_delivery_status) <= _recipient_status_precedence(
+                email.recipient_delivery_status
+            ):
+                outcomes.append("stale_or_duplicate")
+                continue
+
+            email.recipient_delivery_status = event.recipient_delivery_status
+            if event.mark_unsent_as_failed and email.status in (
+                POST_OFFICE_STATUS.queued,
+                POST_OFFICE_STATUS.requeued,
+            ):
+                email.status = POST_OFFICE_STATUS.failed
+            changed[email.pk] = email
+            milestone_logs.append(
+                PostOfficeLog(
+                    email=email,
+                    status=event.recipient_delivery_status,
+                    exception_type=event.exception_type,
+                    message=event.message,
+                )
+            )
+            outcomes.append("recorded")
+
+        if changed:
+            PostOfficeEmail.objects.bulk_update(changed.values(), ["recipient_delivery_status", "status"])
+            PostOfficeLog.objects.bulk_create(milestone_logs)
+
+    for event, resolution, outcome in zip(events, resolutions, outcomes, strict=True):
+        matched = outcome in {"recorded", "stale_or_duplicate"}
+        _log_ses_event_outcome(
+            ses_event_type=event.ses_event_type,
+            mail_obj=event.mail_obj,
+            recipient_domain=event.recipient_domain,
+            event_source=event.event_source,
+            outcome=outcome,
+            correlation_source=str(resolution.get("correlation_source") or "missing_match"),
+            match_count=_optional_int(resolution.get("match_count")),
+            normalized_status=event.recipient_delivery_status if matched else None,
+            post_office_email_id=_optional_int(resolution.get("post_office_email_id")) if matched else None,
+            provider_post_office_email_id=_optional_int(resolution.get("provider_post_office_email_id")),
+            smtp_post_office_email_id=_optional_int(resolution.get("smtp_post_office_email_id")),
+        )
+    return outcomes
+
+
+def deliver_ses_event_batch(messages: Sequence[OutboxMessage]) -> dict[int, DeliveryFailure]:
+    """Outbox handler: ingest queued SES notifications as one batch."""
+    events: list[SESMilestoneEvent] = []
+    failures: dict[int, DeliveryFailure] = {}
+    for message in messages:
+        try:
+            events.append(SESMilestoneEvent.from_payload(message.payload))
+        except (KeyError, TypeError, ValueError):
+            failures[message.pk] = DeliveryFailure(error="invalid_payload", retryable=False)
+    ingest_ses_events(events)
+    return failures
+
+
+def _queue_ses_post_office_event(event: SESMilestoneEvent) -> None:
+    try:
+        enqueue_outbox_messages(kind=OutboxMessage.Kind.ses_event, payloads=[event.to_payload()])
+    except Exception:
+        logger.exception(
+            "ses_signals: failed to queue %s for batched ingestion",
+            event.ses_event_type,
+            extra=current_exception_log_fields(),
+        )
+
+
 def _handle_ses_post_office_event(
     *,
     ses_event_type: str,
@@ -584,6 +819,21 @@ def _handle_ses_post_office_event(
     message: str,
     mark_unsent_as_failed: bool = False,
 ) -> None:
+    if settings.SES_EVENT_BATCHING_ENABLED:
+        _queue_ses_post_office_event(
+            SESMilestoneEvent(
+                ses_event_type=ses_event_type,
+                mail_obj=mail_obj,
+                recipient_domain=recipient_domain,
+                event_source=event_source,
+                recipient_delivery_status=recipient_delivery_status,
+                exception_type=exception_type,
+                message=message,
+                mark_unsent_as_failed=mark_unsent_as_failed,
+            )
+        )
+        return
+
     try:
         _record_post_office_milestone(
             ses_event_type=ses_event_type,
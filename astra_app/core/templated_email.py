@@ -2,7 +2,8 @@ import logging
 import os
 import re
 import tempfile
-from collections.abc import Iterable, Mapping
+from collections.abc import Callable, Iterable, Mapping
+from email.mime.base import MIMEBase
 from pathlib import PurePosixPath
 from urllib.parse import urlsplit
 
@@ -318,8 +319,10 @@ def queue_templated_email(
 
 
 def _attachments_from_html_template(*, html_template: Template, rendered_html: str) -> dict[str, object]:
-    attachments: dict[str, object] = {}
+    return _attachments_from_images(_attached_images(html_template=html_template, rendered_html=rendered_html))
+
 
+def _attached_images(*, html_template: Template, rendered_html: str) -> list[MIMEBase]:
     # `_attached_images` is provided by the post_office template backend when
     # `{% inline_image %}` is used. We guard with `hasattr` because plain Django
     # templates do not expose this attribute.
@@ -338,7 +341,12 @@ def _attachments_from_html_template(*, html_template: Template, rendered_html: s
             for attachment in probe.attachments
             if hasattr(attachment, "get") and hasattr(attachment, "get_payload")
         ]
-    for image in attached_images or []:
+    return list(attached_images or [])
+
+
+def _attachments_from_images(images: Iterable[MIMEBase]) -> dict[str, object]:
+    attachments: dict[str, object] = {}
+    for image in images:
         cid = str(image.get("Content-ID") or "").strip().strip("<>")
         if not cid:
             continue
@@ -360,6 +368,84 @@ def _attachments_from_html_template(*, html_template: Template, rendered_html: s
     return attachments
 
 
+class ComposedEmail:
+    """Subject, text and HTML sources compiled once for many recipients.
+
+    Storage-backed inline images are staged into temp files and every
+    template is parsed when the object is created; ``render`` then only
+    evaluates the compiled templates against one recipient's context. The
+    inline images referenced by the HTML are the same for every recipient,
+    so the attachments are built from the first render. Use as a context
+    manager (or call ``close``) so the staged temp files are removed.
+    """
+
+    def __init__(
+        self,
+        *,
+        subject_source: str,
+        text_source: str,
+        html_source: str,
+        strict_inline_images: bool = False,
+        template_name: str = "unknown",
+    ) -> None:
+        staged_html_content, self._staged_files = stage_inline_images_for_sending(
+            html_source,
+            strict=strict_inline_images,
+            template_name=template_name,
+        )
+        try:
+            template_engine = engines["post_office"]
+            self._render_subject = compile_template_string(subject_source, autoescape=False)
+            self._text_template = template_engine.from_string(preview_drop_inline_image_tags(text_source))
+            self._html_template = template_engine.from_string(staged_html_content)
+        except BaseException:
+            self.close()
+            raise
+        self._system_context = system_email_context()
+        self._images: list[MIMEBase] | None = None
+
+    def __enter__(self) -> ComposedEmail:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def render(self, context: Mapping[str, object]) -> tuple[str, str, str]:
+        """Return the rendered (subject, text, html) for one recipient."""
+        rendered_context = {
+            **self._system_context,
+            **dict(context),
+        }
+        rendered_subject = validate_email_subject(self._render_subject(rendered_context))
+        rendered_text = self._text_template.render(rendered_context)
+        rendered_html = self._html_template.render(rendered_context)
+        if self._images is None:
+            self._images = _attached_images(html_template=self._html_template, rendered_html=rendered_html)
+        # The inline_image tag appends to the compiled template on every render.
+        inner_images = getattr(getattr(self._html_template, "template", None), "_attached_images", None)
+        if isinstance(inner_images, list):
+            inner_images.clear()
+        return rendered_subject, rendered_text, rendered_html
+
+    def attachments(self) -> dict[str, object]:
+        """Inline-image attachments for the rendered HTML (call after ``render``)."""
+        return _attachments_from_images(self._images or [])
+
+    def close(self) -> None:
+        for path in self._staged_files:
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            except Exception:
+                logger.exception(
+                    "Failed to delete temp inline image path=%s",
+                    path,
+                    extra=current_exception_log_fields(),
+                )
+        self._staged_files = []
+
+
 def queue_composed_email(
     *,
     recipients: list[str],
@@ -374,6 +460,7 @@ def queue_composed_email(
     strict_inline_images: bool = False,
     template_name: str = "unknown",
     commit: bool = True,
+    composer: ComposedEmail | None = None,
 ) -> Email:
     """Queue operator/template-composed email through the SSOT pipeline.
 
@@ -385,39 +472,29 @@ def queue_composed_email(
     saved to the database.  The caller is responsible for persisting it (e.g.
     via ``Email.objects.bulk_create``).  Attachments are not supported in
     deferred-commit mode.
+
+    Callers sending the same sources to many recipients pass a *composer*
+    built from those sources so the templates are compiled only once.
     """
 
-    staged_files: list[str] = []
-    try:
-        staged_html_content, staged_files = stage_inline_images_for_sending(
-            html_source,
-            strict=strict_inline_images,
+    owns_composer = composer is None
+    if composer is None:
+        composer = ComposedEmail(
+            subject_source=subject_source,
+            text_source=text_source,
+            html_source=html_source,
+            strict_inline_images=strict_inline_images,
             template_name=template_name,
         )
-
-        template_engine = engines["post_office"]
-        text_template = template_engine.from_string(preview_drop_inline_image_tags(text_source))
-        html_template = template_engine.from_string(staged_html_content)
-
-        rendered_context = {
-            **system_email_context(),
-            **dict(context),
-        }
-        rendered_subject = validate_email_subject(
-            render_template_string(subject_source, rendered_context, autoescape=False)
-        )
-        rendered_text = text_template.render(rendered_context)
-        rendered_html = html_template.render(rendered_context)
-        attachments = _attachments_from_html_template(
-            html_template=html_template,
-            rendered_html=rendered_html,
-        )
+    try:
+        rendered_subject, rendered_text, rendered_html = composer.render(context)
 
         headers: dict[str, str] | None = None
         if reply_to:
             headers = {"Reply-To": ", ".join(reply_to)}
 
         if commit:
+            attachments = composer.attachments()
             return post_office.mail.send(
                 recipients=recipients,
                 sender=sender,
@@ -449,17 +526,8 @@ def queue_composed_email(
             commit=False,
         )
     finally:
-        for path in staged_files:
-            try:
-                os.unlink(path)
-            except FileNotFoundError:
-                pass
-            except Exception:
-                logger.exception(
-                    "Failed to delete temp inline image path=%s",
-                    path,
-                    extra=current_exception_log_fields(),
-                )
+        if owns_composer:
+            composer.close()
 
 
 def bulk_save_emails(emails: list[Email], batch_size: int = 500) -> None:
@@ -625,6 +693,16 @@ def render_template_string(value: str, context: Mapping[str, object], *, autoesc
     surface user-facing messages.
     """
 
+    return compile_template_string(value, autoescape=autoescape)(context)
+
+
+def compile_template_string(value: str, *, autoescape: bool = True) -> Callable[[Mapping[str, object]], str]:
+    """Parse a template string once and return a function that renders it.
+
+    Errors are raised as ValueError, from parsing or from rendering, like
+    `render_template_string`.
+    """
+
     post_office_engine = None
     try:
         post_office_engine = engines["post_office"]
@@ -634,20 +712,43 @@ def render_template_string(value: str, context: Mapping[str, object], *, autoesc
     if post_office_engine is not None:
         try:
             if not autoescape:
-                return post_office_engine.engine.from_string(value or "").render(
-                    Context(dict(context), autoescape=False)
-                )
-            return post_office_engine.from_string(value or "").render(dict(context))
+                raw_template = post_office_engine.engine.from_string(value or "")
+
+                def render_raw(context: Mapping[str, object]) -> str:
+                    try:
+                        return raw_template.render(Context(dict(context), autoescape=False))
+                    except Exception as exc:
+                        raise ValueError(str(exc)) from exc
+
+                return render_raw
+
+            backend_template = post_office_engine.from_string(value or "")
         except TemplateSyntaxError as exc:
             raise ValueError(str(exc)) from exc
         except Exception as exc:
             raise ValueError(str(exc)) from exc
 
+        def render_backend(context: Mapping[str, object]) -> str:
+            try:
+                return backend_template.render(dict(context))
+            except Exception as exc:
+                raise ValueError(str(exc)) from exc
+
+        return render_backend
+
     try:
-        return Template(value or "").render(Context(dict(context), autoescape=autoescape))
+        django_template = Template(value or "")
     except TemplateSyntaxError as exc:
         raise ValueError(str(exc)) from exc
 
+    def render_django(context: Mapping[str, object]) -> str:
+        try:
+            return django_template.render(Context(dict(context), autoescape=autoescape))
+        except TemplateSyntaxError as exc:
+            raise ValueError(str(exc)) from exc
+
+    return render_django
+
 
 def execute_email_template_save(
     *,
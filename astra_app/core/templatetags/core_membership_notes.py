@@ -219,12 +219,8 @@ def _current_username_from_request(http_request: HttpRequest | None) -> str:
 
 
 def _avatar_users_by_username(notes: list[Note]) -> dict[str, object]:
-    avatar_users_by_username: dict[str, object] = {}
-    for username in {str(n.username or "").strip() for n in notes if n.username and n.username != CUSTOS}:
-        user_obj = FreeIPAUser.get(username)
-        if user_obj is not None:
-            avatar_users_by_username[username.lower()] = user_obj
-    return avatar_users_by_username
+    usernames = {str(n.username or "").strip() for n in notes if n.username and n.username != CUSTOS}
+    return {username.lower(): user_obj for username, user_obj in FreeIPAUser.get_many(usernames).items()}
 
 
 def _note_display_username(note: Note) -> str:
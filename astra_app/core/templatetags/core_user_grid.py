@@ -2,10 +2,16 @@ from typing import Any, cast
 
 from django.template import Context, Library
 
+from core.freeipa.client import _get_current_viewer_username
 from core.freeipa.group import FreeIPAGroup
 from core.freeipa.user import FreeIPAUser
 from core.freeipa.utils import _clean_str_list
-from core.freeipa_directory import normalize_user_search_query, search_freeipa_users, user_matches_search_query
+from core.freeipa_directory import (
+    UserDirectoryEntry,
+    normalize_user_search_query,
+    search_freeipa_users,
+    user_matches_search_query,
+)
 from core.templatetags._grid_tag_utils import paginate_grid_items, render_widget_grid, resolve_grid_request
 from core.templatetags._user_helpers import try_get_full_name
 from core.views_utils import _normalize_str, try_get_username_from_user
@@ -47,6 +53,41 @@ def build_user_grid_page(
     return users_page, paginator, page_obj, page_numbers, show_first, show_last
 
 
+def build_user_directory_grid_page(
+    *,
+    entries: list[UserDirectoryEntry],
+    q: str,
+    page_number: str | None,
+    per_page: int,
+) -> tuple[list[FreeIPAUser], Any, Any, list[int], bool, bool]:
+    """Page the cached directory index (see ``get_user_directory``).
+
+    The entries are already sorted and lowercased, so only the query filter
+    walks the index; ``FreeIPAUser`` objects are built for the current page only.
+    """
+
+    if q:
+        normalized_query = normalize_user_search_query(q)
+        viewer_username = _get_current_viewer_username()
+        entries = [
+            entry
+            for entry in entries
+            if user_matches_search_query(
+                normalized_query=normalized_query,
+                username=entry.username_lower,
+                full_name=entry.searchable_full_name(viewer_username),
+            )
+        ]
+
+    paginator, page_obj, page_numbers, show_first, show_last = paginate_grid_items(
+        cast(list[object], entries),
+        page_number=page_number,
+        per_page=per_page,
+    )
+    users_page = [cast(UserDirectoryEntry, entry).to_user() for entry in page_obj.object_list]
+    return users_page, paginator, page_obj, page_numbers, show_first, show_last
+
+
 @register.simple_tag(takes_context=True, name="user_grid")
 def user_grid(context: Context, **kwargs: Any) -> str:
     http_request, q, page_number, base_query, page_url_prefix = resolve_grid_request(context)
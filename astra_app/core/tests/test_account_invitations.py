@@ -5,6 +5,7 @@ from unittest.mock import patch
 from urllib.parse import quote
 
 from django.conf import settings
+from django.core.cache import cache
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.core.management import call_command
 from django.test import TestCase, override_settings
@@ -18,8 +19,10 @@ from core.account_invitations import (
     build_freeipa_email_lookup,
     find_account_invitation_matches,
     parse_invitation_csv,
+    refresh_account_invitations,
 )
 from core.freeipa.user import FreeIPAUser
+from core.freeipa.utils import _users_list_generation_cache_key
 from core.models import AccountInvitation, AccountInvitationSend, FreeIPAPermissionGrant, Organization
 from core.permissions import ASTRA_ADD_MEMBERSHIP
 
@@ -27,9 +30,9 @@ from core.permissions import ASTRA_ADD_MEMBERSHIP
 class AccountInvitationFreeIPAServiceTests(TestCase):
     def test_build_freeipa_email_lookup_uses_delivery_safe_privacy_override(self) -> None:
         private_user = FreeIPAUser(
-            "privateuser",
+            "PrivateUser",
             {
-                "uid": ["privateuser"],
+                "uid": ["PrivateUser"],
                 "mail": ["private@example.com"],
                 "memberof_group": [],
             },
@@ -54,11 +57,59 @@ class AccountInvitationFreeIPAServiceTests(TestCase):
             ],
         }
 
-        with patch("core.freeipa.user._with_freeipa_service_client_retry", return_value=response):
+        confirmed = {
+            "alice": FreeIPAUser("alice", {"uid": ["alice"]}),
+            "bob": FreeIPAUser("bob", {"uid": ["bob"]}),
+        }
+
+        with (
+            patch("core.freeipa.user._with_freeipa_service_client_retry", return_value=response),
+            patch("core.account_invitations.FreeIPAUser.get_many", return_value=confirmed) as get_many_mock,
+        ):
             usernames = find_account_invitation_matches("team@example.com")
 
+        get_many_mock.assert_called_once_with(["alice", "bob"])
+
         self.assertEqual(usernames, ["alice", "bob"])
 
+    def test_refresh_answers_every_invitation_from_one_directory_listing(self) -> None:
+        matched = AccountInvitation.objects.create(email="alt@example.com", invited_by_username="committee")
+        unmatched = AccountInvitation.objects.create(email="nobody@example.com", invited_by_username="committee")
+        stale = AccountInvitation.objects.create(
+            email="stale@example.com",
+            invited_by_username="committee",
+            accepted_at=timezone.now(),
+            freeipa_matched_usernames=["gone", "alice"],
+        )
+        users = [
+            FreeIPAUser("alice", {"uid": ["alice"], "mail": ["alice@example.com", "Alt@Example.com"]}),
+        ]
+
+        cache.set(_users_list_generation_cache_key(), 3, timeout=None)
+
+        with (
+            patch("core.freeipa_directory.snapshot_freeipa_users", return_value=users) as snapshot_mock,
+            patch("core.freeipa_directory.FreeIPAUser.all", side_effect=AssertionError("shared user list")),
+            patch(
+                "core.account_invitations.FreeIPAUser.find_usernames_by_email",
+                side_effect=AssertionError("per-invitation search"),
+            ),
+            patch("core.account_invitations.FreeIPAUser.get_many", side_effect=AssertionError("per-invitation lookup")),
+        ):
+            summary = refresh_account_invitations(actor_username="system", now=timezone.now())
+
+        snapshot_mock.assert_called_once_with(respect_privacy=False)
+        self.assertEqual(cache.get(_users_list_generation_cache_key()), 3)
+        self.assertEqual((summary.pending_checked, summary.accepted_checked), (2, 1))
+        matched.refresh_from_db()
+        unmatched.refresh_from_db()
+        stale.refresh_from_db()
+        self.assertIsNotNone(matched.accepted_at)
+        self.assertEqual(matched.freeipa_matched_usernames, ["alice"])
+        self.assertIsNone(unmatched.accepted_at)
+        self.assertIsNotNone(unmatched.freeipa_last_checked_at)
+        self.assertEqual(stale.freeipa_matched_usernames, ["alice"])
+
     def test_parse_invitation_csv_supports_cr_separated_rows_with_multiline_notes(self) -> None:
         rows = parse_invitation_csv(
             'email,full_name,note\ruser@example.com,Alice,"First line\rSecond line"\r',
@@ -1094,19 +1094,19 @@ class AdminImportMembershipsCSVTests(TestCase):
                 "memberof_group": ["admins"],
             },
         )
-        bob_user = SimpleNamespace(
-            username="bob",
-            email="bob@example.org",
-            full_name="Bob Example",
-            is_active=True,
-            is_staff=False,
-            is_superuser=False,
-            is_authenticated=True,
-            is_anonymous=False,
-            get_username=lambda: "bob",
-        )
-
-        def _all_users(*, respect_privacy: bool = True) -> list[SimpleNamespace]:
+        bob_user = FreeIPAUser(
+            "bob",
+            {
+                "uid": ["bob"],
+                "mail": ["bob@example.org"],
+                "displayname": ["Bob Example"],
+                "fasIsPrivate": ["TRUE"],
+                "memberof_group": [],
+            },
+            respect_privacy=False,
+        )
+
+        def _all_users(*, respect_privacy: bool = True) -> list[FreeIPAUser]:
             self.assertFalse(respect_privacy)
             return [admin_user, bob_user]
 
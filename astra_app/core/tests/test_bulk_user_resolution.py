@@ -0,0 +1,68 @@
+from unittest.mock import patch
+
+from avatar.utils import get_cache_key
+from django.core.cache import cache
+from django.test import TestCase
+
+from core.avatar_providers import resolve_avatar_urls_for_users
+from core.freeipa.user import FreeIPAUser
+from core.models import Note
+from core.templatetags.core_membership_notes import _avatar_users_by_username
+from core.views_elections._helpers import _load_candidate_users
+
+
+def _user(username: str) -> FreeIPAUser:
+    return FreeIPAUser(username, {"uid": [username], "displayname": [username.title()], "memberof_group": []})
+
+
+class BulkUserResolutionTests(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        cache.clear()
+
+    def test_note_authors_resolve_with_one_bulk_lookup(self) -> None:
+        notes = [Note(username=username, content="note") for username in ("Bob", "carol", "bob", "carol", "dave")]
+        users = {"Bob": _user("Bob"), "bob": _user("bob"), "carol": _user("carol")}
+
+        with (
+            patch(
+                "core.freeipa.user.FreeIPAUser.get_many",
+                side_effect=lambda usernames, **_: {u: users[u] for u in usernames if u in users},
+            ) as get_many,
+            patch("core.freeipa.user.FreeIPAUser.get", side_effect=AssertionError("per-author lookup")),
+        ):
+            resolved = _avatar_users_by_username(notes)
+
+        get_many.assert_called_once()
+        self.assertEqual(set(get_many.call_args.args[0]), {"Bob", "bob", "carol", "dave"})
+        self.assertEqual(set(resolved), {"bob", "carol"})
+
+    def test_candidate_users_use_one_bulk_lookup_and_fall_back_for_missing(self) -> None:
+        with (
+            patch(
+                "core.freeipa.user.FreeIPAUser.get_many",
+                return_value={"alice": _user("alice")},
+            ) as get_many,
+            patch("core.freeipa.user.FreeIPAUser.get", side_effect=AssertionError("per-candidate lookup")),
+        ):
+            users = _load_candidate_users({"alice", "deleted"})
+
+        get_many.assert_called_once()
+        self.assertEqual(users["alice"].full_name, "Alice")
+        self.assertEqual(users["deleted"].username, "deleted")
+
+    def test_avatar_urls_come_from_one_cache_read_when_warm(self) -> None:
+        users = [_user("alice"), _user("bob")]
+        # Entries as django-avatar's cached avatar_url tag stores them.
+        for user in users:
+            cache.set(get_cache_key(user, "avatar_url", 40, 40), f"/a/{user.username}.png")
+
+        with (
+            patch("core.avatar_providers.avatar_url", side_effect=AssertionError("per-user avatar resolution")),
+            patch("core.avatar_providers.cache.get_many", wraps=cache.get_many) as get_many,
+        ):
+            urls, resolved, fallback = resolve_avatar_urls_for_users(users, width=40, height=40)
+
+        self.assertEqual(urls, {"alice": "/a/alice.png", "bob": "/a/bob.png"})
+        self.assertEqual(get_many.call_count, 1)
+        self.assertEqual((resolved, fallback), (2, 0))
@@ -18,7 +18,7 @@ from core.models import (
     VotingCredential,
 )
 from core.permissions import ASTRA_ADD_ELECTION
-from core.tests.utils_test_data import ensure_core_categories
+from core.tests.utils_test_data import GetManyViaGetMixin, ensure_core_categories
 
 
 class _CoreCategoriesTestCase(TestCase):
@@ -139,7 +139,7 @@ class ElectionRollPopulationTests(_CoreCategoriesTestCase):
         )
 
 
-class ElectionRollEligibleVotersApiTests(_CoreCategoriesTestCase):
+class ElectionRollEligibleVotersApiTests(GetManyViaGetMixin, _CoreCategoriesTestCase):
     """The eligible voters API must use ElectionRoll for closed/tallied elections."""
 
     def _login_as_freeipa_user(self, username: str) -> None:
@@ -2,12 +2,13 @@
 import datetime
 import json
 
-from django.test import TestCase
+from django.core.serializers.json import DjangoJSONEncoder
+from django.test import TestCase, override_settings
 from django.urls import reverse
 from django.utils import timezone
 
 from core import elections_services
-from core.models import AuditLogEntry, Ballot, Candidate, Election
+from core.models import AuditLogEntry, Ballot, Candidate, Election, VotingCredential
 from core.tests.ballot_chain import compute_chain_hash
 from core.tokens import election_genesis_chain_hash
 
@@ -257,3 +258,69 @@ class ElectionArtifactGenerationTests(TestCase):
         self.assertEqual(payload["audit_log"][0]["event_type"], "rekor_attestation_failed")
         self.assertEqual(payload["audit_log"][0]["payload"], {})
         self.assertNotIn("ConnectionError", json.dumps(payload))
+
+    @override_settings(
+        STORAGES={
+            "default": {"BACKEND": "django.core.files.storage.InMemoryStorage"},
+            "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+        },
+    )
+    def test_persisted_artifacts_match_sorted_json_of_exports_byte_for_byte(self) -> None:
+        now = timezone.now()
+        election = Election.objects.create(
+            name="Artifact streaming election",
+            description="",
+            start_datetime=now - datetime.timedelta(days=2),
+            end_datetime=now + datetime.timedelta(days=1),
+            number_of_seats=1,
+            status=Election.Status.open,
+        )
+        alice = Candidate.objects.create(election=election, freeipa_username="alice", nominated_by="nominator")
+        bob = Candidate.objects.create(election=election, freeipa_username="bob", nominated_by="nominator")
+        for index in range(5):
+            VotingCredential.objects.create(
+                election=election,
+                public_id=f"cred-stream-{index}",
+                freeipa_username=f"voter{index}",
+                weight=1 + index,
+            )
+            elections_services.submit_ballot(
+                election=election,
+                credential_public_id=f"cred-stream-{index}",
+                ranking=[alice.id, bob.id] if index % 2 else [bob.id],
+            )
+        elections_services.submit_ballot(election=election, credential_public_id="cred-stream-0", ranking=[alice.id])
+
+        Election.objects.filter(pk=election.pk).update(
+            status=Election.Status.tallied,
+            tally_result={"algorithm": {"name": "Meek STV", "version": "1.0"}},
+        )
+        election.refresh_from_db()
+        AuditLogEntry.objects.create(
+            election=election,
+            event_type="election_closed",
+            payload={"chain_head": "f" * 64, "note": "café"},
+            is_public=True,
+        )
+
+        elections_services.persist_public_election_artifacts(election=election)
+        election.refresh_from_db()
+
+        expected_ballots = json.dumps(
+            elections_services.build_public_ballots_export(election=election),
+            cls=DjangoJSONEncoder,
+            sort_keys=True,
+        ).encode("utf-8")
+        expected_audit = json.dumps(
+            elections_services.build_public_audit_export(election=election),
+            cls=DjangoJSONEncoder,
+            sort_keys=True,
+        ).encode("utf-8")
+        with election.public_ballots_file.open("rb") as fh:
+            self.assertEqual(fh.read(), expected_ballots)
+        with election.public_audit_file.open("rb") as fh:
+            self.assertEqual(fh.read(), expected_audit)
+
+        ballots_payload = json.loads(expected_ballots)
+        self.assertEqual(len(ballots_payload["ballots"]), 6)
+        self.assertEqual(ballots_payload["chain_head"], ballots_payload["ballots"][-1]["chain_hash"])
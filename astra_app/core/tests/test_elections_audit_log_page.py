@@ -11,11 +11,12 @@ from core.freeipa.user import FreeIPAUser
 from core.models import AuditLogEntry, Ballot, Candidate, Election, FreeIPAPermissionGrant
 from core.permissions import ASTRA_ADD_ELECTION
 from core.tests.ballot_chain import compute_chain_hash
+from core.tests.utils_test_data import GetManyViaGetMixin
 from core.tokens import election_genesis_chain_hash
 from core.views_elections._helpers import _elected_candidate_display
 
 
-class ElectionAuditLogPageTests(TestCase):
+class ElectionAuditLogPageTests(GetManyViaGetMixin, TestCase):
     def _login_as_freeipa_user(self, username: str) -> None:
         session = self.client.session
         session["_freeipa_username"] = username
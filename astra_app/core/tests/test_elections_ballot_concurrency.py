@@ -0,0 +1,166 @@
+import datetime
+import queue
+import threading
+
+from django.db import close_old_connections, connection
+from django.test import TransactionTestCase
+from django.utils import timezone
+
+from core.elections_services import ElectionNotOpenError, close_election, submit_ballot
+from core.models import AuditLogEntry, Ballot, Candidate, Election, ElectionChainHead, VotingCredential
+from core.tokens import election_chain_next_hash, election_genesis_chain_hash
+
+_VOTERS = 500
+_RESUBMITTING_VOTERS = 100
+_WORKERS = 16
+
+
+class BallotSubmissionLoadTests(TransactionTestCase):
+    """Reproduce an opening-hour vote burst against a single election."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        if not connection.features.has_select_for_update:
+            self.skipTest("database does not support select_for_update")
+
+        now = timezone.now()
+        self.election = Election.objects.create(
+            name="Vote burst election",
+            description="",
+            start_datetime=now - datetime.timedelta(hours=1),
+            end_datetime=now + datetime.timedelta(days=7),
+            number_of_seats=2,
+            quorum=50,
+            status=Election.Status.open,
+        )
+        self.candidate_ids = [
+            Candidate.objects.create(
+                election=self.election,
+                freeipa_username=f"candidate{index}",
+                nominated_by="nominator",
+            ).id
+            for index in range(4)
+        ]
+        VotingCredential.objects.bulk_create(
+            [
+                VotingCredential(
+                    election=self.election,
+                    public_id=f"burst-cred-{index}",
+                    freeipa_username=f"voter{index}",
+                    weight=1 + index % 2,
+                )
+                for index in range(_VOTERS)
+            ]
+        )
+
+    def _submissions(self) -> list[tuple[str, list[int]]]:
+        submissions: list[tuple[str, list[int]]] = []
+        for index in range(_VOTERS):
+            offset = index % len(self.candidate_ids)
+            ranking = self.candidate_ids[offset:] + self.candidate_ids[:offset]
+            submissions.append((f"burst-cred-{index}", ranking))
+        for index in range(_RESUBMITTING_VOTERS):
+            submissions.append((f"burst-cred-{index}", list(reversed(self.candidate_ids))))
+        return submissions
+
+    def _run_burst(
+        self,
+        *,
+        submissions: list[tuple[str, list[int]]],
+        close_after: int | None = None,
+    ) -> tuple[int, int]:
+        work: queue.Queue[tuple[str, list[int]]] = queue.Queue()
+        for submission in submissions:
+            work.put(submission)
+
+        errors: queue.Queue[BaseException] = queue.Queue()
+        lock = threading.Lock()
+        counts = {"accepted": 0, "rejected": 0}
+        close_started = threading.Event()
+
+        def worker() -> None:
+            close_old_connections()
+            try:
+                while True:
+                    try:
+                        credential_public_id, ranking = work.get_nowait()
+                    except queue.Empty:
+                        return
+                    try:
+                        submit_ballot(
+                            election=self.election,
+                            credential_public_id=credential_public_id,
+                            ranking=ranking,
+                        )
+                    except ElectionNotOpenError:
+                        with lock:
+                            counts["rejected"] += 1
+                        continue
+                    with lock:
+                        counts["accepted"] += 1
+                        if close_after is not None and counts["accepted"] == close_after:
+                            close_started.set()
+            except BaseException as exc:  # pragma: no cover - assertion surfaced below
+                errors.put(exc)
+            finally:
+                connection.close()
+
+        def closer() -> None:
+            close_old_connections()
+            try:
+                close_started.wait(timeout=30)
+                close_election(election=self.election, actor="admin")
+            except BaseException as exc:  # pragma: no cover - assertion surfaced below
+                errors.put(exc)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=worker) for _ in range(_WORKERS)]
+        if close_after is not None:
+            threads.append(threading.Thread(target=closer))
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=120)
+            self.assertFalse(thread.is_alive(), "worker thread did not finish")
+
+        if not errors.empty():
+            raise errors.get()
+        return counts["accepted"], counts["rejected"]
+
+    def _assert_chain_is_linear(self) -> str:
+        expected_previous = election_genesis_chain_hash(self.election.id)
+        for ballot in Ballot.objects.filter(election=self.election).order_by("created_at", "id"):
+            self.assertEqual(ballot.previous_chain_hash, expected_previous)
+            self.assertEqual(
+                ballot.chain_hash,
+                election_chain_next_hash(previous_chain_hash=expected_previous, ballot_hash=ballot.ballot_hash),
+            )
+            expected_previous = ballot.chain_hash
+        self.assertEqual(ElectionChainHead.objects.get(election=self.election).chain_hash, expected_previous)
+        return expected_previous
+
+    def test_concurrent_burst_keeps_chain_ordered_and_logs_quorum_once(self) -> None:
+        accepted, rejected = self._run_burst(submissions=self._submissions())
+
+        self.assertEqual(accepted, _VOTERS + _RESUBMITTING_VOTERS)
+        self.assertEqual(rejected, 0)
+        self.assertEqual(Ballot.objects.filter(election=self.election).count(), _VOTERS + _RESUBMITTING_VOTERS)
+        self.assertEqual(Ballot.objects.filter(election=self.election).final().count(), _VOTERS)
+        self.assertEqual(Ballot.objects.filter(election=self.election, is_counted=True).count(), _VOTERS)
+        self._assert_chain_is_linear()
+        self.assertEqual(
+            AuditLogEntry.objects.filter(election=self.election, event_type="quorum_reached").count(),
+            1,
+        )
+
+    def test_close_during_burst_records_final_chain_head(self) -> None:
+        accepted, rejected = self._run_burst(submissions=self._submissions(), close_after=200)
+
+        self.assertGreaterEqual(accepted, 200)
+        self.assertEqual(accepted + rejected, _VOTERS + _RESUBMITTING_VOTERS)
+        self.assertEqual(Ballot.objects.filter(election=self.election).count(), accepted)
+
+        final_chain_hash = self._assert_chain_is_linear()
+        closed_entry = AuditLogEntry.objects.get(election=self.election, event_type="election_closed")
+        self.assertEqual(closed_entry.payload["chain_head"], final_chain_hash)
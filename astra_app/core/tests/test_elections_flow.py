@@ -35,7 +35,7 @@ from core.freeipa.group import FreeIPAGroup
 from core.freeipa.user import FreeIPAUser
 from core.models import AuditLogEntry, Ballot, Candidate, Election, Membership, MembershipType, VotingCredential
 from core.tests.ballot_chain import compute_chain_hash
-from core.tests.utils_test_data import ensure_core_categories, ensure_email_templates
+from core.tests.utils_test_data import GetManyViaGetMixin, ensure_core_categories, ensure_email_templates
 from core.tokens import election_genesis_chain_hash
 
 
@@ -2284,7 +2284,7 @@ class ElectionVoteEndpointTests(TestCase):
         self.assertIn("error", resp2.json())
 
 
-class ElectionPublicPagesTests(TestCase):
+class ElectionPublicPagesTests(GetManyViaGetMixin, TestCase):
     def _login_as_freeipa_user(self, username: str) -> None:
         session = self.client.session
         session["_freeipa_username"] = username
@@ -23,7 +23,7 @@ from core.models import (
 )
 from core.permissions import ASTRA_ADD_ELECTION
 from core.tests.ballot_chain import compute_chain_hash
-from core.tests.utils_test_data import ensure_core_categories
+from core.tests.utils_test_data import GetManyViaGetMixin, ensure_core_categories
 from core.tokens import election_genesis_chain_hash
 
 
@@ -282,7 +282,7 @@ class ElectionsDeletedVisibilityTests(TestCase):
 
 
 @override_settings(ELECTION_ELIGIBILITY_MIN_MEMBERSHIP_AGE_DAYS=1)
-class ElectionDetailManagerUIStatsTests(TestCase):
+class ElectionDetailManagerUIStatsTests(GetManyViaGetMixin, TestCase):
     @classmethod
     def setUpTestData(cls) -> None:
         ensure_core_categories()
@@ -0,0 +1,86 @@
+import copy
+import json
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.test import SimpleTestCase
+
+from core.elections_meek_benchmark import (
+    GOLDEN_SPECS,
+    SyntheticElectionSpec,
+    build_synthetic_election,
+    golden_mismatches,
+    load_golden_result,
+    run_tally_benchmark,
+)
+
+
+class MeekGoldenResultTests(SimpleTestCase):
+    """Pin the exact Decimal output of tally_meek on seeded synthetic elections.
+
+    If an intentional algorithm change alters these results, regenerate them with
+    `python manage.py elections_tally_benchmark --update-golden` and review the diff.
+    """
+
+    def test_tally_results_match_golden_files(self) -> None:
+        for spec in GOLDEN_SPECS:
+            with self.subTest(scenario=spec.name):
+                expected = load_golden_result(spec)
+                self.assertIsNotNone(expected, f"missing golden result for {spec.name}")
+
+                result = run_tally_benchmark(spec, trace_memory=False)
+
+                self.assertEqual(golden_mismatches(expected=expected, actual=result.tally_result), [])
+                self.assertEqual(sum(result.iterations_per_round), len(result.tally_result["rounds"]))
+
+    def test_mismatch_reports_first_differing_round(self) -> None:
+        spec = GOLDEN_SPECS[0]
+        expected = load_golden_result(spec)
+        actual = copy.deepcopy(expected)
+        actual["rounds"][1]["retained_totals"]["1"] += "1"
+
+        self.assertEqual(golden_mismatches(expected=expected, actual=actual), ["round 2: differs in retained_totals"])
+
+    def test_synthetic_election_is_deterministic(self) -> None:
+        spec = SyntheticElectionSpec(name="det", voters=50, candidates=6, seats=2, exclusion_groups=2, seed=9)
+
+        first = build_synthetic_election(spec)
+        second = build_synthetic_election(spec)
+
+        self.assertEqual(first.ballots, second.ballots)
+        self.assertEqual(first.candidates, second.candidates)
+        self.assertEqual(len(first.exclusion_groups), 2)
+        self.assertTrue(all(1 <= len(b["ranking"]) <= 6 for b in first.ballots))
+
+
+class ElectionsTallyBenchmarkCommandTests(SimpleTestCase):
+    def test_golden_run_reports_ok(self) -> None:
+        out = StringIO()
+        call_command("elections_tally_benchmark", "--golden", "--no-memory", "--json", stdout=out)
+
+        rows = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertEqual([row["scenario"] for row in rows], [spec.name for spec in GOLDEN_SPECS])
+        self.assertTrue(all(row["golden"] == "ok" for row in rows))
+
+    def test_custom_scenario_reports_timings_and_memory(self) -> None:
+        out = StringIO()
+        call_command(
+            "elections_tally_benchmark",
+            "--voters=80",
+            "--candidates=5",
+            "--seats=2",
+            "--ballot-length=short",
+            "--weights=1,2",
+            "--json",
+            stdout=out,
+        )
+
+        row = json.loads(out.getvalue())
+        self.assertEqual(row["scenario"], "custom")
+        self.assertEqual(len(row["elected"]), 2)
+        self.assertGreater(row["peak_memory_bytes"], 0)
+        self.assertGreaterEqual(row["tally_seconds"], 0)
+
+    def test_invalid_weights_are_rejected(self) -> None:
+        with self.assertRaisesMessage(CommandError, "--weights"):
+            call_command("elections_tally_benchmark", "--weights=a,b", stdout=StringIO())
@@ -0,0 +1,99 @@
+import random
+from collections.abc import Mapping
+from decimal import Decimal, localcontext
+
+from django.test import SimpleTestCase
+
+from core.elections_meek import _ballot_ranking, _ballot_weight, _distribute_votes, _prepare_ballots
+
+
+def _per_ballot_distribution(
+    *,
+    ballots: list[dict[str, object]],
+    retention: Mapping[int, Decimal],
+    continuing_ids: frozenset[int],
+) -> tuple[dict[int, Decimal], dict[int, Decimal]]:
+    """Reference: the straightforward ballot-by-ballot transfer loop."""
+
+    incoming: dict[int, Decimal] = {cid: Decimal(0) for cid in continuing_ids}
+    retained: dict[int, Decimal] = {cid: Decimal(0) for cid in continuing_ids}
+    for ballot in ballots:
+        remaining = _ballot_weight(ballot)
+        if remaining <= 0:
+            continue
+        for cid in _ballot_ranking(ballot):
+            if remaining <= 0:
+                break
+            if cid not in continuing_ids:
+                continue
+            r = retention[cid]
+            if r <= 0:
+                continue
+            incoming[cid] += remaining
+            portion = remaining * r
+            if portion:
+                retained[cid] += portion
+                remaining -= portion
+    return incoming, retained
+
+
+class MeekGroupedBallotTests(SimpleTestCase):
+    def _ballots(self, *, rng: random.Random, n: int) -> list[dict[str, object]]:
+        pool = [rng.sample(range(1, 9), rng.randint(1, 6)) for _ in range(12)]
+        ballots: list[dict[str, object]] = []
+        for _ in range(n):
+            ranking: list[object] = list(rng.choice(pool))
+            if rng.random() < 0.1:
+                ranking.append(99)
+            ballots.append({"ranking": ranking, "weight": rng.choice([0, 1, 1, 2, 5])})
+        return ballots
+
+    def test_prepare_collapses_identical_ballots_and_drops_unknown_candidates(self) -> None:
+        prepared = _prepare_ballots(
+            [
+                {"ranking": [1, 2], "weight": 1},
+                {"ranking": [1, 99, 2], "weight": 1},
+                {"ranking": [1, 2], "weight": 3},
+                {"ranking": [2], "weight": 0},
+                {"ranking": [99], "weight": 2},
+            ],
+            candidate_ids=frozenset({1, 2}),
+        )
+
+        self.assertEqual(
+            [(group.ranking, group.weight, group.count) for group in prepared.groups],
+            [((1, 2), Decimal(1), Decimal(2)), ((1, 2), Decimal(3), Decimal(1))],
+        )
+        self.assertEqual(prepared.sequence, (0, 0, 1))
+        self.assertEqual(prepared.total_weight, Decimal(7))
+
+    def test_prepare_rejects_invalid_weight(self) -> None:
+        with self.assertRaisesMessage(ValueError, "out of valid range"):
+            _prepare_ballots([{"ranking": [1], "weight": -1}], candidate_ids=frozenset({1}))
+
+    def test_distribution_matches_per_ballot_count_digit_for_digit(self) -> None:
+        rng = random.Random(4)
+        ballots = self._ballots(rng=rng, n=400)
+        continuing_ids = frozenset(range(1, 9))
+
+        with localcontext() as ctx:
+            ctx.prec = 80
+            prepared = _prepare_ballots(ballots, candidate_ids=continuing_ids)
+            retention_cases = [
+                {cid: Decimal(1) for cid in continuing_ids},
+                {**{cid: Decimal(1) for cid in continuing_ids}, 3: Decimal(1) / Decimal(2)},
+                {cid: Decimal(rng.randint(1, 97)) / Decimal(97) for cid in continuing_ids},
+            ]
+            for retention in retention_cases:
+                expected = _per_ballot_distribution(
+                    ballots=ballots,
+                    retention=retention,
+                    continuing_ids=continuing_ids,
+                )
+                actual = _distribute_votes(ballots=prepared, retention=retention, continuing_ids=continuing_ids)
+
+                for expected_totals, actual_totals in zip(expected, actual, strict=True):
+                    self.assertEqual(
+                        {cid: str(value) for cid, value in actual_totals.items()},
+                        {cid: str(value) for cid, value in expected_totals.items()},
+                    )
@@ -20,6 +20,7 @@ from django.utils import timezone
 from core.freeipa.user import FreeIPAUser
 from core.models import AuditLogEntry, Ballot, Candidate, Election
 from core.tests.ballot_chain import compute_chain_hash
+from core.tests.utils_test_data import GetManyViaGetMixin
 from core.tokens import election_genesis_chain_hash
 
 
@@ -136,7 +137,7 @@ class ElectionStartedAuditPayloadTests(TestCase):
         self.assertEqual(by_username["charlie"]["tiebreak_uuid"], str(c2.tiebreak_uuid))
 
 
-class ElectionStartedAuditLogTemplateTests(TestCase):
+class ElectionStartedAuditLogTemplateTests(GetManyViaGetMixin, TestCase):
     """Audit log template must render candidate tiebreak UUIDs from election_started payload."""
 
     def _login_as_freeipa_user(self, username: str) -> None:
@@ -0,0 +1,84 @@
+import datetime
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from core.elections_services import election_quorum_status, submit_ballot
+from core.elections_turnout import compute_election_turnout
+from core.models import Candidate, Election, ElectionTurnout, VotingCredential
+from core.views_elections.reporting import _build_elections_turnout_report_rows
+
+
+class ElectionTurnoutCounterTests(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        now = timezone.now()
+        self.election = Election.objects.create(
+            name="Turnout counters",
+            description="",
+            start_datetime=now - datetime.timedelta(days=1),
+            end_datetime=now + datetime.timedelta(days=1),
+            number_of_seats=1,
+            quorum=50,
+            status=Election.Status.open,
+        )
+        self.alice = Candidate.objects.create(election=self.election, freeipa_username="alice", nominated_by="n")
+        self.bob = Candidate.objects.create(election=self.election, freeipa_username="bob", nominated_by="n")
+        VotingCredential.objects.create(election=self.election, public_id="turnout-1", freeipa_username="v1", weight=1)
+        VotingCredential.objects.create(election=self.election, public_id="turnout-2", freeipa_username="v2", weight=3)
+
+    def _counters(self) -> dict[str, int]:
+        row = ElectionTurnout.objects.get(election=self.election)
+        return {
+            "eligible_voter_count": row.eligible_voter_count,
+            "eligible_vote_weight_total": row.eligible_vote_weight_total,
+            "participating_voter_count": row.participating_voter_count,
+            "participating_vote_weight_total": row.participating_vote_weight_total,
+        }
+
+    def test_submit_and_supersede_keep_counters_in_step(self) -> None:
+        submit_ballot(election=self.election, credential_public_id="turnout-2", ranking=[self.alice.id])
+        self.assertEqual(self._counters()["participating_voter_count"], 1)
+        self.assertEqual(self._counters()["participating_vote_weight_total"], 3)
+
+        submit_ballot(election=self.election, credential_public_id="turnout-2", ranking=[self.bob.id])
+        submit_ballot(election=self.election, credential_public_id="turnout-1", ranking=[self.bob.id])
+
+        self.assertEqual(self._counters(), dict(compute_election_turnout(election_id=self.election.id)))
+        self.assertEqual(self._counters()["participating_voter_count"], 2)
+        self.assertEqual(self._counters()["participating_vote_weight_total"], 4)
+
+    def test_credential_issued_after_tracking_updates_eligible_counters(self) -> None:
+        submit_ballot(election=self.election, credential_public_id="turnout-1", ranking=[self.alice.id])
+        VotingCredential.objects.create(election=self.election, public_id="turnout-3", freeipa_username="v3", weight=2)
+
+        counters = self._counters()
+        self.assertEqual(counters["eligible_voter_count"], 3)
+        self.assertEqual(counters["eligible_vote_weight_total"], 6)
+
+    def test_quorum_status_and_report_read_counters(self) -> None:
+        submit_ballot(election=self.election, credential_public_id="turnout-1", ranking=[self.alice.id])
+        ElectionTurnout.objects.filter(election=self.election).update(participating_voter_count=2)
+
+        self.assertEqual(election_quorum_status(election=self.election)["participating_voter_count"], 2)
+        rows = [row for row in _build_elections_turnout_report_rows() if row["election"].id == self.election.id]
+        self.assertEqual(rows[0]["participating_count"], 2)
+
+    def test_reconcile_command_rebuilds_drifted_counters(self) -> None:
+        submit_ballot(election=self.election, credential_public_id="turnout-1", ranking=[self.alice.id])
+        ElectionTurnout.objects.filter(election=self.election).update(
+            participating_voter_count=7,
+            eligible_vote_weight_total=0,
+        )
+
+        dry_run_out = StringIO()
+        call_command("elections_turnout_reconcile", "--dry-run", stdout=dry_run_out)
+        self.assertIn("participating_voter_count 7 -> 1", dry_run_out.getvalue())
+        self.assertEqual(self._counters()["participating_voter_count"], 7)
+
+        out = StringIO()
+        call_command("elections_turnout_reconcile", f"--election-id={self.election.id}", stdout=out)
+        self.assertIn("1 election(s) rebuilt.", out.getvalue())
+        self.assertEqual(self._counters(), dict(compute_election_turnout(election_id=self.election.id)))
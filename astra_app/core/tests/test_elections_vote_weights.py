@@ -30,10 +30,11 @@ from core.models import (
     Organization,
     VotingCredential,
 )
+from core.tests.utils_test_data import GetManyViaGetMixin
 
 
 @override_settings(ELECTION_ELIGIBILITY_MIN_MEMBERSHIP_AGE_DAYS=1)
-class ElectionVoteWeightsTests(TestCase):
+class ElectionVoteWeightsTests(GetManyViaGetMixin, TestCase):
     def setUp(self) -> None:
         super().setUp()
         self._coc_patcher = patch("core.views_elections.vote.has_signed_coc", return_value=True)
@@ -1,9 +1,25 @@
+from types import SimpleNamespace
 from unittest.mock import patch
 
 from django.core.cache import cache
-from django.test import TestCase
-
-from core.freeipa_directory import search_freeipa_users, snapshot_freeipa_users
+from django.test import TestCase, override_settings
+
+from core.freeipa.client import clear_current_viewer_username, set_current_viewer_username
+from core.freeipa.local_cache import freeipa_local_cache
+from core.freeipa.user import FreeIPAUser
+from core.freeipa.utils import _invalidate_groups_list_cache, _invalidate_users_list_cache
+from core.freeipa_directory import (
+    GroupSearchIndex,
+    UserEmailIndex,
+    _GroupIndexCache,
+    _refresh_user_directory_in_background,
+    _UserEmailIndexCache,
+    get_live_usernames,
+    get_user_directory,
+    search_freeipa_users,
+    snapshot_freeipa_users,
+)
+from core.templatetags.core_user_grid import build_user_directory_grid_page
 
 
 class _DummyUserFindClient:
@@ -16,6 +32,14 @@ class _DummyUserFindClient:
         return self.result
 
 
+class _InlineThread:
+    def __init__(self, *, target, **_kwargs: object) -> None:
+        self._target = target
+
+    def start(self) -> None:
+        self._target()
+
+
 class _BranchingUserFindClient:
     def __init__(self, results_by_criteria: dict[str, dict[str, object]]) -> None:
         self.results_by_criteria = results_by_criteria
@@ -311,3 +335,216 @@ class FreeIPADirectoryPerformanceTests(TestCase):
                 "o_timelimit": 0,
             },
         )
+
+
+class UserDirectorySnapshotTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+
+    def _client(self) -> _DummyUserFindClient:
+        return _DummyUserFindClient(
+            {
+                "result": [
+                    {"uid": ["carol"], "displayname": ["Carol Common"]},
+                    {"uid": ["Alice"], "displayname": ["Alice Example"], "mail": ["alice@example.org"]},
+                    {"uid": ["bob"], "displayname": ["Bob Hidden"], "fasIsPrivate": ["TRUE"]},
+                ]
+            }
+        )
+
+    def test_cold_directory_is_built_once_and_then_served_from_cache(self) -> None:
+        client = self._client()
+
+        with patch("core.freeipa_directory.FreeIPAUser.get_client", return_value=client):
+            first = get_user_directory()
+            second = get_user_directory()
+
+        self.assertEqual([entry.username for entry in first], ["Alice", "bob", "carol"])
+        self.assertEqual([entry.username for entry in second], ["Alice", "bob", "carol"])
+        self.assertEqual(first[0].full_name_lower, "alice example")
+        self.assertEqual(len(client.calls), 1)
+
+    def test_invalidated_directory_is_served_stale_while_refreshing(self) -> None:
+        with patch("core.freeipa_directory.FreeIPAUser.get_client", return_value=self._client()):
+            get_user_directory()
+
+        _invalidate_users_list_cache()
+
+        with (
+            patch(
+                "core.freeipa_directory.FreeIPAUser.get_client",
+                side_effect=AssertionError("stale snapshot must not block on FreeIPA"),
+            ),
+            patch("core.freeipa_directory._refresh_user_directory_in_background") as refresh_mock,
+        ):
+            entries = get_user_directory()
+
+        self.assertEqual(len(entries), 3)
+        refresh_mock.assert_called_once_with()
+
+    def test_failed_background_refresh_is_not_retried_during_the_backoff(self) -> None:
+        with patch("core.freeipa_directory.FreeIPAUser.get_client", return_value=self._client()):
+            get_user_directory()
+
+        _invalidate_users_list_cache()
+
+        with (
+            patch("core.freeipa_directory.FreeIPAUser.get_client", side_effect=RuntimeError("FreeIPA is down")) as get_client,
+            patch("core.freeipa_directory.threading.Thread", _InlineThread),
+            patch("core.freeipa_directory.close_old_connections"),
+            self.assertLogs("core.freeipa_directory", level="WARNING"),
+        ):
+            for _ in range(3):
+                _refresh_user_directory_in_background()
+
+        self.assertEqual(get_client.call_count, 1)
+        self.assertEqual(len(get_user_directory()), 3)
+
+    def test_grid_page_filters_index_and_keeps_private_names_hidden(self) -> None:
+        with patch("core.freeipa_directory.FreeIPAUser.get_client", return_value=self._client()):
+            entries = get_user_directory()
+
+        users_page, paginator, *_rest = build_user_directory_grid_page(
+            entries=entries,
+            q="hidden",
+            page_number=None,
+            per_page=28,
+        )
+        self.assertEqual(users_page, [])
+        self.assertEqual(paginator.count, 0)
+
+        set_current_viewer_username("bob")
+        self.addCleanup(clear_current_viewer_username)
+        users_page, paginator, *_rest = build_user_directory_grid_page(
+            entries=entries,
+            q="hidden",
+            page_number=None,
+            per_page=28,
+        )
+        self.assertEqual([user.username for user in users_page], ["bob"])
+
+    def test_grid_page_builds_users_for_the_requested_page_only(self) -> None:
+        with patch("core.freeipa_directory.FreeIPAUser.get_client", return_value=self._client()):
+            entries = get_user_directory()
+
+        users_page, paginator, page_obj, *_rest = build_user_directory_grid_page(
+            entries=entries,
+            q="",
+            page_number="2",
+            per_page=2,
+        )
+
+        self.assertEqual(paginator.count, 3)
+        self.assertEqual(page_obj.number, 2)
+        self.assertEqual([user.username for user in users_page], ["carol"])
+        self.assertEqual(users_page[0].full_name, "Carol Common")
+
+
+class GroupSearchIndexTests(TestCase):
+    def _groups(self) -> list[SimpleNamespace]:
+        return [
+            SimpleNamespace(cn="Zulu-infra", description="Infrastructure", fas_group=True, members=["bob"], sponsors=[]),
+            SimpleNamespace(cn="alpha", description="Release team", fas_group=True, members=[], sponsors=["alice"]),
+            SimpleNamespace(cn="ipa-only-infra", description="", fas_group=False, members=["alice"], sponsors=[]),
+            SimpleNamespace(cn="beta", description="", fas_group=True),
+        ]
+
+    def test_search_matches_substrings_in_sorted_order(self) -> None:
+        index = GroupSearchIndex(self._groups())
+
+        self.assertEqual([entry.cn for entry in index.search("INFRA", fas_only=False, limit=10)], ["ipa-only-infra", "Zulu-infra"])
+        self.assertEqual([entry.cn for entry in index.search("infra", fas_only=True, limit=10)], ["Zulu-infra"])
+        self.assertEqual([entry.cn for entry in index.search("ase t", fas_only=True, limit=10)], ["alpha"])
+        self.assertEqual([entry.cn for entry in index.search("a", fas_only=True, limit=2)], ["alpha", "beta"])
+        self.assertEqual(index.search("nomatch", fas_only=False, limit=10), [])
+
+    def test_search_includes_groups_of_matched_members_and_sponsors(self) -> None:
+        index = GroupSearchIndex(self._groups())
+
+        matches = index.search("zzz", fas_only=True, limit=10, member_usernames={"alice", "bob"})
+
+        self.assertEqual([entry.cn for entry in matches], ["alpha", "Zulu-infra"])
+
+    @override_settings(FREEIPA_GROUP_INDEX_MAX_AGE_SECONDS=300, FREEIPA_L1_CACHE_GENERATION_CHECK_SECONDS=0)
+    def test_index_is_rebuilt_only_when_the_group_list_is_invalidated(self) -> None:
+        index_cache = _GroupIndexCache()
+
+        with patch("core.freeipa_directory.FreeIPAGroup.all", return_value=self._groups()) as all_mock:
+            first = index_cache.get()
+            self.assertIs(index_cache.get(), first)
+            self.assertEqual(all_mock.call_count, 1)
+
+            _invalidate_groups_list_cache()
+
+            self.assertIsNot(index_cache.get(), first)
+            self.assertEqual(all_mock.call_count, 2)
+
+
+class UserEmailIndexTests(TestCase):
+    def _users(self) -> list[FreeIPAUser]:
+        return [
+            FreeIPAUser("alice", {"uid": ["alice"], "mail": ["Alice@Example.com", "alice@old.example.org"]}),
+            FreeIPAUser("bob", {"uid": ["bob"], "mail": ["shared@example.com"]}),
+            FreeIPAUser("carol", {"uid": ["carol"], "mail": "shared@example.com"}),
+        ]
+
+    def test_index_covers_alternate_addresses_and_remembers_targeted_hits(self) -> None:
+        index = UserEmailIndex(self._users())
+
+        self.assertTrue(index.complete)
+        self.assertEqual(index.usernames_for(" alice@example.COM "), {"alice"})
+        self.assertEqual(index.usernames_for("alice@old.example.org"), {"alice"})
+        self.assertEqual(index.usernames_for("shared@example.com"), {"bob", "carol"})
+        self.assertEqual(index.usernames_for("new@example.com"), frozenset())
+
+        index.remember("New@example.com", ["dave"])
+
+        self.assertEqual(index.usernames_for("new@example.com"), {"dave"})
+        self.assertTrue(index.has_username("Dave"))
+        self.assertFalse(UserEmailIndex([]).complete)
+
+    @override_settings(FREEIPA_USER_EMAIL_INDEX_MAX_AGE_SECONDS=300, FREEIPA_L1_CACHE_GENERATION_CHECK_SECONDS=0)
+    def test_index_is_rebuilt_only_when_the_user_list_is_invalidated(self) -> None:
+        index_cache = _UserEmailIndexCache()
+
+        with patch("core.freeipa_directory.FreeIPAUser.all", return_value=self._users()) as all_mock:
+            first = index_cache.get()
+            self.assertIs(index_cache.get(), first)
+            self.assertEqual(all_mock.call_count, 1)
+
+            _invalidate_users_list_cache()
+
+            self.assertIsNot(index_cache.get(), first)
+            self.assertEqual(all_mock.call_count, 2)
+        all_mock.assert_called_with(respect_privacy=False)
+
+
+class LiveUsernamesTests(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        cache.clear()
+        freeipa_local_cache.clear_local()
+        self.addCleanup(freeipa_local_cache.clear_local)
+
+    @override_settings(FREEIPA_LIVE_USERNAMES_CACHE_SECONDS=60, FREEIPA_L1_CACHE_MAX_ENTRIES=100)
+    def test_username_set_is_cached_until_the_user_list_is_invalidated(self) -> None:
+        users = [FreeIPAUser("Alice", {"uid": ["Alice"]}), FreeIPAUser("bob", {"uid": ["bob"]})]
+
+        with patch("core.freeipa_directory.FreeIPAUser.all", return_value=users) as all_mock:
+            self.assertEqual(get_live_usernames(), {"alice", "bob"})
+            self.assertEqual(get_live_usernames(), {"alice", "bob"})
+            self.assertEqual(all_mock.call_count, 1)
+
+            _invalidate_users_list_cache()
+            all_mock.return_value = users[:1]
+
+            self.assertEqual(get_live_usernames(), {"alice"})
+            self.assertEqual(all_mock.call_count, 2)
+
+    @override_settings(FREEIPA_LIVE_USERNAMES_CACHE_SECONDS=60)
+    def test_failed_listing_is_not_cached(self) -> None:
+        with patch("core.freeipa_directory.FreeIPAUser.all", return_value=[]) as all_mock:
+            self.assertEqual(get_live_usernames(), frozenset())
+            self.assertEqual(get_live_usernames(), frozenset())
+
+        self.assertEqual(all_mock.call_count, 2)
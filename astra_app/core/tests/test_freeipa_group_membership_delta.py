@@ -0,0 +1,103 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from core.freeipa.group import FreeIPAGroup
+from core.freeipa.user import FreeIPAUser
+from core.freeipa.utils import (
+    _group_cache_key,
+    _groups_list_cache_key,
+    _groups_list_generation_cache_key,
+    _user_cache_key,
+)
+
+
+class _MembershipClient:
+    def __init__(self, members: list[str]) -> None:
+        self.members = members
+
+    def group_add_member(self, cn: str, **kwargs: object) -> dict[str, object]:
+        self.members = [*self.members, *kwargs["o_user"]]
+        return {"completed": 1, "failed": {"member": {"user": [], "group": []}}, "result": self._group(cn)}
+
+    def group_remove_member(self, cn: str, **kwargs: object) -> dict[str, object]:
+        self.members = [member for member in self.members if member not in kwargs["o_user"]]
+        return {"completed": 1, "failed": {"member": {"user": [], "group": []}}, "result": self._group(cn)}
+
+    def _group(self, cn: str) -> dict[str, object]:
+        group: dict[str, object] = {"cn": [cn]}
+        if self.members:
+            group["member_user"] = list(self.members)
+        return group
+
+    def group_find(self, *_args: object, **_kwargs: object) -> dict[str, object]:
+        raise AssertionError("group membership change refetched a group")
+
+    def user_show(self, *_args: object, **_kwargs: object) -> dict[str, object]:
+        raise AssertionError("group membership change refetched a user")
+
+
+class FreeIPAGroupMembershipDeltaTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        cache.set(_groups_list_generation_cache_key(), 5, timeout=None)
+        cache.set(
+            _group_cache_key("packagers"),
+            {"cn": ["packagers"], "member_user": ["bob"], "fasgroup": ["TRUE"]},
+        )
+        cache.set(
+            _groups_list_cache_key(),
+            [
+                {"cn": ["packagers"], "member_user": ["bob"], "fasgroup": ["TRUE"]},
+                {"cn": ["testers"], "member_user": ["alice"]},
+            ],
+        )
+        cache.set(_user_cache_key("alice"), {"uid": ["alice"], "memberof_group": ["testers"]})
+
+    def _patch_client(self, client: _MembershipClient):
+        def run(_get_client, fn):
+            return fn(client)
+
+        return (
+            patch("core.freeipa.user._with_freeipa_service_client_retry", side_effect=run),
+            patch("core.freeipa.group._with_freeipa_service_client_retry", side_effect=run),
+        )
+
+    def test_membership_changes_patch_cached_records_in_place(self) -> None:
+        client = _MembershipClient(["bob"])
+        user_rpc, group_rpc = self._patch_client(client)
+        with user_rpc, group_rpc:
+            FreeIPAUser.get("alice").add_to_group("packagers")
+
+            group = FreeIPAGroup.get("packagers")
+            self.assertEqual(group.members, ["bob", "alice"])
+            self.assertTrue(group.fas_group)
+            self.assertEqual(FreeIPAUser.get("alice").direct_groups_list, ["testers", "packagers"])
+            listed = {group.cn: group.members for group in FreeIPAGroup.all()}
+            self.assertEqual(listed, {"packagers": ["bob", "alice"], "testers": ["alice"]})
+            self.assertEqual(cache.get(_groups_list_generation_cache_key()), 6)
+
+            FreeIPAGroup.get("packagers").remove_member("bob")
+            FreeIPAGroup.get("packagers").remove_member("alice")
+
+        self.assertEqual(cache.get(_group_cache_key("packagers"))["member_user"], [])
+        self.assertEqual(cache.get(_user_cache_key("alice"))["memberof_group"], ["testers"])
+        self.assertEqual(cache.get(_groups_list_generation_cache_key()), 8)
+
+    def test_concurrent_patch_of_the_same_version_falls_back_to_invalidation(self) -> None:
+        cache.add(f"{_groups_list_generation_cache_key()}:patch:5", True)
+        client = _MembershipClient(["bob"])
+        user_rpc, group_rpc = self._patch_client(client)
+        with (
+            user_rpc,
+            group_rpc,
+            patch("core.freeipa.user.FreeIPAUser.get", return_value=FreeIPAUser("alice", {"memberof_group": ["packagers"]})),
+            patch("core.freeipa.group.FreeIPAGroup.get") as group_get,
+        ):
+            FreeIPAUser("alice", {"uid": ["alice"]}).add_to_group("packagers")
+
+        group_get.assert_called_once_with("packagers")
+        self.assertIsNone(cache.get(_group_cache_key("packagers")))
+        self.assertIsNone(cache.get(_groups_list_cache_key()))
+        self.assertIsNone(cache.get(_user_cache_key("alice")))
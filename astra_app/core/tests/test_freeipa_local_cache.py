@@ -0,0 +1,93 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from core.freeipa.circuit_breaker import _freeipa_circuit_open, _record_freeipa_availability_failure
+from core.freeipa.local_cache import FreeIPALocalCache, freeipa_local_cache
+from core.freeipa.user import FreeIPAUser
+from core.freeipa.utils import _invalidate_user_cache, _user_cache_key
+
+
+@override_settings(
+    FREEIPA_L1_CACHE_MAX_ENTRIES=3,
+    FREEIPA_L1_CACHE_TTL_SECONDS=30,
+    FREEIPA_L1_CACHE_GENERATION_CHECK_SECONDS=60,
+)
+class FreeIPALocalCacheTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        freeipa_local_cache.clear_local()
+        self.addCleanup(freeipa_local_cache.clear_local)
+
+    def test_repeat_reads_are_served_locally(self) -> None:
+        local = FreeIPALocalCache()
+        cache.set("freeipa_user_alice", {"uid": ["alice"]})
+
+        self.assertEqual(local.get("freeipa_user_alice"), {"uid": ["alice"]})
+        with patch("core.freeipa.local_cache.cache.get", side_effect=AssertionError("shared cache hit")):
+            self.assertEqual(local.get("freeipa_user_alice"), {"uid": ["alice"]})
+
+        stats = local.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+
+    def test_least_recently_used_entry_is_evicted(self) -> None:
+        local = FreeIPALocalCache()
+        local.set_many({"a": 1, "b": 2, "c": 3})
+        local.get("a")
+        local.set("d", 4)
+
+        cache.delete_many(["a", "b", "c", "d"])
+        self.assertEqual(local.get_many(["a", "b", "c", "d"]), {"a": 1, "c": 3, "d": 4})
+        self.assertEqual(local.stats()["evictions"], 1)
+
+    def test_invalidation_in_another_worker_flushes_local_entries(self) -> None:
+        worker_a = FreeIPALocalCache()
+        worker_b = FreeIPALocalCache()
+        worker_a.set("freeipa_user_alice", {"uid": ["alice"], "mail": ["old@example.com"]})
+        self.assertEqual(worker_a.get("freeipa_user_alice")["mail"], ["old@example.com"])
+
+        worker_b.delete("freeipa_user_alice")
+        cache.set("freeipa_user_alice", {"uid": ["alice"], "mail": ["new@example.com"]})
+
+        with override_settings(FREEIPA_L1_CACHE_GENERATION_CHECK_SECONDS=0):
+            self.assertEqual(worker_a.get("freeipa_user_alice")["mail"], ["new@example.com"])
+        self.assertEqual(worker_a.stats()["flushes"], 1)
+
+    def test_writes_reach_other_workers_only_after_invalidate(self) -> None:
+        worker_a = FreeIPALocalCache()
+        worker_b = FreeIPALocalCache()
+        cache.set("freeipa_users_directory", ["old"])
+        self.assertEqual(worker_a.get("freeipa_users_directory"), ["old"])
+
+        with override_settings(FREEIPA_L1_CACHE_GENERATION_CHECK_SECONDS=0):
+            worker_b.set("freeipa_users_directory", ["new"])
+            self.assertEqual(worker_a.get("freeipa_users_directory"), ["old"])
+
+            worker_b.invalidate("freeipa_users_directory")
+            self.assertEqual(worker_a.get("freeipa_users_directory"), ["new"])
+
+    def test_invalidate_user_cache_drops_local_copy(self) -> None:
+        cache.set(_user_cache_key("alice"), {"uid": ["alice"], "mail": ["alice@example.com"]})
+        self.assertEqual(FreeIPAUser.get("alice").email, "alice@example.com")
+
+        _invalidate_user_cache("alice")
+
+        with patch.object(FreeIPAUser, "_fetch_full_user", return_value=None), patch.object(FreeIPAUser, "get_client"):
+            self.assertIsNone(FreeIPAUser.get("alice"))
+
+    def test_circuit_open_is_visible_immediately_in_the_opening_worker(self) -> None:
+        self.assertFalse(_freeipa_circuit_open())
+
+        for _ in range(3):
+            _record_freeipa_availability_failure()
+
+        self.assertTrue(_freeipa_circuit_open())
+
+    def test_disabled_cache_reads_straight_from_shared_cache(self) -> None:
+        local = FreeIPALocalCache()
+        with override_settings(FREEIPA_L1_CACHE_MAX_ENTRIES=0):
+            local.set("freeipa_group_admins", {"cn": ["admins"]})
+            cache.set("freeipa_group_admins", {"cn": ["changed"]})
+            self.assertEqual(local.get("freeipa_group_admins"), {"cn": ["changed"]})
+            self.assertEqual(local.stats()["size"], 0)
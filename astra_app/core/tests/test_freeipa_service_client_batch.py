@@ -0,0 +1,108 @@
+from unittest.mock import Mock, patch
+
+from django.core.cache import cache
+from django.test import TestCase
+from python_freeipa import exceptions
+
+from core.freeipa.client import FreeIPABatchCall, _with_freeipa_service_client_batch
+from core.freeipa.exceptions import FreeIPAOperationFailed
+from core.freeipa.user import FreeIPAUser
+from core.freeipa.utils import _user_cache_key
+
+
+class FreeIPAServiceClientBatchTests(TestCase):
+    def setUp(self) -> None:
+        cache.delete_many([_user_cache_key("alice"), _user_cache_key("bob"), _user_cache_key("ghost")])
+
+    def test_batch_packs_calls_into_chunks_and_preserves_order(self) -> None:
+        client = Mock()
+        client.batch.side_effect = lambda a_methods: {
+            "count": len(a_methods),
+            "results": [{"result": call["params"][0][0], "error": None} for call in a_methods],
+        }
+        calls = [FreeIPABatchCall("user_show", (f"user{index}",), {"all": True}) for index in range(5)]
+
+        outcomes = _with_freeipa_service_client_batch(lambda: client, calls, chunk_size=2)
+
+        self.assertEqual([outcome["result"] for outcome in outcomes], [f"user{index}" for index in range(5)])
+        self.assertEqual(client.batch.call_count, 3)
+        self.assertEqual(
+            client.batch.call_args_list[0].kwargs["a_methods"],
+            [
+                {"method": "user_show", "params": [["user0"], {"all": True}]},
+                {"method": "user_show", "params": [["user1"], {"all": True}]},
+            ],
+        )
+
+    def test_batch_maps_item_errors_to_freeipa_exceptions(self) -> None:
+        client = Mock()
+        client.batch.return_value = {
+            "count": 3,
+            "results": [
+                {"result": {"uid": ["alice"]}, "error": None},
+                {"error": "ghost: user not found", "error_code": 4001, "error_name": "NotFound"},
+                {"error": "something odd", "error_code": 9999, "error_name": "Weird"},
+            ],
+        }
+        calls = [FreeIPABatchCall("user_show", (username,)) for username in ("alice", "ghost", "odd")]
+
+        outcomes = _with_freeipa_service_client_batch(lambda: client, calls)
+
+        self.assertEqual(outcomes[0]["result"], {"uid": ["alice"]})
+        self.assertIsInstance(outcomes[1], exceptions.NotFound)
+        self.assertEqual(str(outcomes[1]), "ghost: user not found")
+        self.assertIsInstance(outcomes[2], exceptions.BadRequest)
+
+    def test_batch_rejects_result_count_mismatch(self) -> None:
+        client = Mock()
+        client.batch.return_value = {"count": 1, "results": [{"result": {}, "error": None}]}
+
+        with self.assertRaises(FreeIPAOperationFailed):
+            _with_freeipa_service_client_batch(
+                lambda: client,
+                [FreeIPABatchCall("user_show", ("alice",)), FreeIPABatchCall("user_show", ("bob",))],
+            )
+
+    def test_get_many_reads_cache_and_batches_only_misses(self) -> None:
+        cache.set(_user_cache_key("alice"), {"uid": ["alice"], "mail": ["alice@example.com"]})
+        client = Mock()
+        client.batch.return_value = {
+            "count": 2,
+            "results": [
+                {"result": {"uid": ["bob"], "mail": ["bob@example.com"]}, "error": None},
+                {"error": "ghost: user not found", "error_code": 4001, "error_name": "NotFound"},
+            ],
+        }
+
+        with patch("core.freeipa.user.FreeIPAUser.get_client", return_value=client):
+            users = FreeIPAUser.get_many(["alice", "bob", "ghost", "bob"])
+
+        self.assertEqual(set(users), {"alice", "bob"})
+        self.assertEqual(users["bob"].email, "bob@example.com")
+        sub_calls = client.batch.call_args.kwargs["a_methods"]
+        self.assertEqual([call["params"][0] for call in sub_calls], [["bob"], ["ghost"]])
+        self.assertEqual(cache.get(_user_cache_key("bob")), {"uid": ["bob"], "mail": ["bob@example.com"]})
+        self.assertIsNone(cache.get(_user_cache_key("ghost")))
+
+    def test_get_many_refetches_an_unexpected_item_error_through_get(self) -> None:
+        client = Mock()
+        client.batch.return_value = {
+            "count": 2,
+            "results": [
+                {"error": "something odd", "error_code": 9999, "error_name": "Weird"},
+                {"result": {"uid": ["bob"]}, "error": None},
+            ],
+        }
+        client.user_show.side_effect = exceptions.BadRequest("something odd", 9999)
+        client.user_find.return_value = {"count": 1, "result": [{"uid": ["alice"], "mail": ["alice@example.com"]}]}
+
+        with (
+            patch("core.freeipa.user.FreeIPAUser.get_client", return_value=client),
+            self.assertLogs("core.backends", level="WARNING"),
+        ):
+            users = FreeIPAUser.get_many(["alice", "bob"])
+
+        self.assertEqual(set(users), {"alice", "bob"})
+        self.assertEqual(users["alice"].email, "alice@example.com")
+        client.user_find.assert_called_once()
+        self.assertEqual(cache.get(_user_cache_key("alice")), {"uid": ["alice"], "mail": ["alice@example.com"]})
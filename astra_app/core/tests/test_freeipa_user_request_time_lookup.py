@@ -28,6 +28,7 @@ class _ShapeLookupClient:
         self.user_show_results = dict(user_show_results or {})
         self.user_find_calls: list[dict[str, object]] = []
         self.user_show_calls: list[tuple[str, dict[str, object]]] = []
+        self.batch_calls: list[list[dict[str, object]]] = []
 
     def user_find(self, *args: object, **kwargs: object) -> dict[str, object]:
         del args
@@ -49,6 +50,16 @@ class _ShapeLookupClient:
         self.user_show_calls.append((username, dict(kwargs)))
         return {"result": self.user_show_results[username]}
 
+    def batch(self, a_methods: list[dict[str, object]] | None = None, **kwargs: object) -> dict[str, object]:
+        del kwargs
+        self.batch_calls.append(list(a_methods or []))
+        results: list[dict[str, object]] = []
+        for call in a_methods or []:
+            call_args, call_params = call["params"]
+            option_kwargs = {f"o_{key}": value for key, value in call_params.items()}
+            results.append({**getattr(self, str(call["method"]))(*call_args, **option_kwargs), "error": None})
+        return {"count": len(results), "results": results}
+
 
 class _LookupExecutionTracker:
     def __init__(
@@ -61,6 +72,7 @@ class _LookupExecutionTracker:
         self.client_count = 0
         self.active_calls = 0
         self.max_active_calls = 0
+        self.batch_count = 0
         self.lookup_counts_by_username: dict[str, int] = {}
         self.transient_unauthorized_by_username = dict(transient_unauthorized_by_username or {})
         self.fatal_usernames = set(fatal_usernames or set())
@@ -70,12 +82,14 @@ class _LookupExecutionTracker:
             self.client_count += 1
             return self.client_count
 
-    def begin_lookup(self, username: str) -> None:
+    def begin_batch(self, usernames: list[str]) -> None:
         with self._lock:
+            self.batch_count += 1
             self.active_calls += 1
             if self.active_calls > self.max_active_calls:
                 self.max_active_calls = self.active_calls
-            self.lookup_counts_by_username[username] = self.lookup_counts_by_username.get(username, 0) + 1
+            for username in usernames:
+                self.lookup_counts_by_username[username] = self.lookup_counts_by_username.get(username, 0) + 1
 
     def end_lookup(self) -> None:
         with self._lock:
@@ -102,17 +116,18 @@ class _TrackingShapeLookupClient(_ShapeLookupClient):
         self.tracker = tracker
         self.pause_seconds = pause_seconds
 
-    def user_find(self, *args: object, **kwargs: object) -> dict[str, object]:
-        username = str(kwargs.get("o_uid") or "").strip().lower()
-        self.tracker.begin_lookup(username)
+    def batch(self, a_methods: list[dict[str, object]] | None = None, **kwargs: object) -> dict[str, object]:
+        usernames = [str(call["params"][1].get("uid") or "").strip().lower() for call in a_methods or []]
+        self.tracker.begin_batch(usernames)
         try:
             if self.pause_seconds:
                 time.sleep(self.pause_seconds)
-            if username in self.tracker.fatal_usernames:
-                raise RuntimeError(f"boom for {username}")
-            if self.tracker.consume_transient_unauthorized(username):
-                raise exceptions.Unauthorized()
-            return super().user_find(*args, **kwargs)
+            for username in usernames:
+                if self.tracker.consume_transient_unauthorized(username):
+                    raise exceptions.Unauthorized()
+            if any(username in self.tracker.fatal_usernames for username in usernames):
+                raise RuntimeError(f"boom for {usernames}")
+            return super().batch(a_methods, **kwargs)
         finally:
             self.tracker.end_lookup()
 
@@ -228,8 +243,9 @@ class FreeIPAUserRequestTimeLookupTests(TestCase):
                 },
             ],
         )
+        self.assertEqual(len(client.batch_calls), 1)
 
-    def test_find_lightweight_by_usernames_uses_serial_fast_path_for_small_inputs(self) -> None:
+    def test_find_lightweight_by_usernames_uses_single_batch_round_trip(self) -> None:
         tracker = _LookupExecutionTracker()
 
         def build_client() -> _TrackingShapeLookupClient:
@@ -240,23 +256,18 @@ class FreeIPAUserRequestTimeLookupTests(TestCase):
                     "alice": {"count": 1, "result": [_lightweight_row("alice", full_name="Alice Example")]},
                     "bob": {"count": 1, "result": [_lightweight_row("bob", full_name="Bob Example")]},
                 },
-                pause_seconds=0.01,
             )
 
-        with (
-            patch("core.freeipa.user._LIGHTWEIGHT_LOOKUP_SERIAL_THRESHOLD", 2, create=True),
-            patch("core.freeipa.user.FreeIPAUser.get_client", side_effect=build_client),
-        ):
+        with patch("core.freeipa.user.FreeIPAUser.get_client", side_effect=build_client):
             users_by_username = FreeIPAUser.find_lightweight_by_usernames(["alice", "bob"])
 
         self.assertEqual(set(users_by_username), {"alice", "bob"})
         self.assertEqual(tracker.client_count, 1)
-        self.assertEqual(tracker.max_active_calls, 1)
+        self.assertEqual(tracker.batch_count, 1)
 
-    def test_find_lightweight_by_usernames_bounds_service_client_fanout(self) -> None:
+    def test_find_lightweight_by_usernames_chunks_batches_by_configured_size(self) -> None:
         tracker = _LookupExecutionTracker()
         usernames = [f"user{index}" for index in range(8)]
-        max_workers = 3
         username_results = {
             username: {"count": 1, "result": [_lightweight_row(username, full_name=f"{username} Example")]}
             for username in usernames
@@ -264,16 +275,10 @@ class FreeIPAUserRequestTimeLookupTests(TestCase):
 
         def build_client(*_args: object, **_kwargs: object) -> _TrackingShapeLookupClient:
             tracker.register_client()
-            return _TrackingShapeLookupClient(
-                tracker=tracker,
-                username_results=username_results,
-                pause_seconds=0.02,
-            )
+            return _TrackingShapeLookupClient(tracker=tracker, username_results=username_results)
 
         with (
-            patch("core.freeipa.user._LIGHTWEIGHT_LOOKUP_SERIAL_THRESHOLD", 2, create=True),
-            patch("core.freeipa.user._LIGHTWEIGHT_LOOKUP_CHUNK_SIZE", 2, create=True),
-            patch("core.freeipa.user._LIGHTWEIGHT_LOOKUP_MAX_WORKERS", max_workers, create=True),
+            patch("core.freeipa.client._FREEIPA_BATCH_CHUNK_SIZE", 3),
             patch("core.freeipa.client._get_freeipa_client", side_effect=build_client),
         ):
             clear_freeipa_service_client_cache()
@@ -281,11 +286,11 @@ class FreeIPAUserRequestTimeLookupTests(TestCase):
             clear_freeipa_service_client_cache()
 
         self.assertEqual(set(users_by_username), set(usernames))
-        self.assertGreater(tracker.client_count, 1)
-        self.assertLessEqual(tracker.client_count, max_workers)
-        self.assertGreater(tracker.max_active_calls, 1)
+        self.assertEqual(tracker.client_count, 1)
+        self.assertEqual(tracker.batch_count, 3)
+        self.assertEqual(tracker.max_active_calls, 1)
 
-    def test_find_lightweight_by_usernames_retries_unauthorized_within_worker_chunk(self) -> None:
+    def test_find_lightweight_by_usernames_retries_unauthorized_for_failed_chunk_only(self) -> None:
         tracker = _LookupExecutionTracker(transient_unauthorized_by_username={"charlie": 1})
         usernames = ["alice", "bob", "charlie", "dave"]
         username_results = {
@@ -298,9 +303,7 @@ class FreeIPAUserRequestTimeLookupTests(TestCase):
             return _TrackingShapeLookupClient(tracker=tracker, username_results=username_results)
 
         with (
-            patch("core.freeipa.user._LIGHTWEIGHT_LOOKUP_SERIAL_THRESHOLD", 2, create=True),
-            patch("core.freeipa.user._LIGHTWEIGHT_LOOKUP_CHUNK_SIZE", 2, create=True),
-            patch("core.freeipa.user._LIGHTWEIGHT_LOOKUP_MAX_WORKERS", 2, create=True),
+            patch("core.freeipa.client._FREEIPA_BATCH_CHUNK_SIZE", 2),
             patch("core.freeipa.user.FreeIPAUser.get_client", side_effect=build_client),
         ):
             users_by_username = FreeIPAUser.find_lightweight_by_usernames(usernames)
@@ -309,9 +312,9 @@ class FreeIPAUserRequestTimeLookupTests(TestCase):
         self.assertEqual(tracker.lookup_counts_by_username.get("alice"), 1)
         self.assertEqual(tracker.lookup_counts_by_username.get("bob"), 1)
         self.assertEqual(tracker.lookup_counts_by_username.get("charlie"), 2)
-        self.assertEqual(tracker.lookup_counts_by_username.get("dave"), 1)
+        self.assertEqual(tracker.lookup_counts_by_username.get("dave"), 2)
 
-    def test_find_lightweight_by_usernames_returns_empty_dict_when_any_worker_fails(self) -> None:
+    def test_find_lightweight_by_usernames_returns_empty_dict_when_batch_request_fails(self) -> None:
         tracker = _LookupExecutionTracker(fatal_usernames={"charlie"})
         usernames = ["alice", "bob", "charlie", "dave"]
         username_results = {
@@ -324,15 +327,36 @@ class FreeIPAUserRequestTimeLookupTests(TestCase):
             return _TrackingShapeLookupClient(tracker=tracker, username_results=username_results)
 
         with (
-            patch("core.freeipa.user._LIGHTWEIGHT_LOOKUP_SERIAL_THRESHOLD", 2, create=True),
-            patch("core.freeipa.user._LIGHTWEIGHT_LOOKUP_CHUNK_SIZE", 2, create=True),
-            patch("core.freeipa.user._LIGHTWEIGHT_LOOKUP_MAX_WORKERS", 2, create=True),
+            patch("core.freeipa.client._FREEIPA_BATCH_CHUNK_SIZE", 2),
             patch("core.freeipa.user.FreeIPAUser.get_client", side_effect=build_client),
         ):
             users_by_username = FreeIPAUser.find_lightweight_by_usernames(usernames)
 
         self.assertEqual(users_by_username, {})
 
+    def test_find_lightweight_by_usernames_omits_usernames_with_item_errors(self) -> None:
+        client = _ShapeLookupClient(
+            username_results={
+                "alice": {"count": 1, "result": [_lightweight_row("alice", full_name="Alice Example")]},
+            }
+        )
+        original_batch = client.batch
+
+        def batch_with_item_error(a_methods: list[dict[str, object]] | None = None, **kwargs: object) -> dict[str, object]:
+            ok_calls = [call for call in a_methods or [] if call["params"][1].get("uid") != "broken"]
+            response = original_batch(ok_calls, **kwargs)
+            results = list(response["results"])
+            for index, call in enumerate(a_methods or []):
+                if call["params"][1].get("uid") == "broken":
+                    results.insert(index, {"error": "insufficient access", "error_code": 2100, "error_name": "ACIError"})
+            return {"count": len(results), "results": results}
+
+        client.batch = batch_with_item_error
+        with patch("core.freeipa.user.FreeIPAUser.get_client", return_value=client):
+            users_by_username = FreeIPAUser.find_lightweight_by_usernames(["alice", "broken"])
+
+        self.assertEqual(set(users_by_username), {"alice"})
+
     def test_find_lightweight_by_usernames_omits_missing_usernames(self) -> None:
         client = _ShapeLookupClient(
             username_results={
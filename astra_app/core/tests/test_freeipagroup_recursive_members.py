@@ -1,9 +1,11 @@
 
 from unittest.mock import patch
 
-from django.test import TestCase
+from django.core.cache import cache
+from django.test import TestCase, override_settings
 
-from core.freeipa.group import FreeIPAGroup
+from core.freeipa.group import FreeIPAGroup, _group_closure_cache, get_group_membership_closure
+from core.freeipa.utils import _invalidate_groups_list_cache
 
 
 class FreeIPAGroupRecursiveMembersTests(TestCase):
@@ -36,14 +38,17 @@ class FreeIPAGroupRecursiveMembersTests(TestCase):
             },
         )
 
-        def _fake_get(cn: str):
-            return {"parent": parent, "child": child, "grand": grand}.get(cn)
+        groups = {"parent": parent, "child": child, "grand": grand}
 
-        with patch("core.freeipa.group.FreeIPAGroup.get", side_effect=_fake_get):
+        def _fake_get_many(cns: list[str]):
+            return {cn: groups[cn] for cn in cns if cn in groups}
+
+        with patch("core.freeipa.group.FreeIPAGroup.get_many", side_effect=_fake_get_many) as get_many:
             usernames = parent.member_usernames_recursive()
 
         self.assertEqual(usernames, {"alice", "bob", "carol"})
         self.assertEqual(parent.member_count_recursive(), 3)
+        self.assertEqual([call.args[0] for call in get_many.call_args_list], [["child"], ["grand"]])
 
     def test_recursive_member_count_skips_non_fasgroup_nested_groups(self) -> None:
         parent = FreeIPAGroup(
@@ -74,10 +79,119 @@ class FreeIPAGroupRecursiveMembersTests(TestCase):
             },
         )
 
-        def _fake_get(cn: str):
-            return {"child": child, "legacy": legacy}.get(cn)
+        groups = {"child": child, "legacy": legacy}
+
+        def _fake_get_many(cns: list[str]):
+            return {cn: groups[cn] for cn in cns if cn in groups}
 
-        with patch("core.freeipa.group.FreeIPAGroup.get", side_effect=_fake_get):
+        with patch("core.freeipa.group.FreeIPAGroup.get_many", side_effect=_fake_get_many):
             usernames = parent.member_usernames_recursive(fas_only=True)
 
         self.assertEqual(usernames, {"alice", "bob"})
+
+    def test_recursive_members_fetch_each_nesting_level_in_one_batch(self) -> None:
+        parent = FreeIPAGroup(
+            "parent",
+            {"cn": ["parent"], "member_user": [], "member_group": ["a", "b", "c"]},
+        )
+        group_rows = {
+            "a": {"cn": ["a"], "member_user": ["alice"], "member_group": ["parent"]},
+            "b": {"cn": ["b"], "member_user": ["bob"], "member_group": ["a"]},
+            "c": {"cn": ["c"], "member_user": ["carol"], "member_group": []},
+        }
+
+        class _BatchClient:
+            def __init__(self) -> None:
+                self.batch_calls: list[list[dict[str, object]]] = []
+
+            def batch(self, a_methods: list[dict[str, object]] | None = None, **_kwargs: object) -> dict[str, object]:
+                self.batch_calls.append(list(a_methods or []))
+                results = []
+                for call in a_methods or []:
+                    cn = call["params"][1]["cn"]
+                    row = group_rows.get(cn)
+                    results.append({"count": 1 if row else 0, "result": [row] if row else [], "error": None})
+                return {"count": len(results), "results": results}
+
+        client = _BatchClient()
+        with (
+            patch("core.freeipa.group.cache.get_many", return_value={}),
+            patch("core.freeipa.group.cache.set_many"),
+            patch("core.freeipa.group.FreeIPAGroup.get_client", return_value=client),
+        ):
+            usernames = parent.member_usernames_recursive()
+
+        self.assertEqual(usernames, {"alice", "bob", "carol"})
+        self.assertEqual(len(client.batch_calls), 1)
+        self.assertEqual(
+            [call["params"][1]["cn"] for call in client.batch_calls[0]],
+            ["a", "b", "c"],
+        )
+
+
+def _group(cn: str, *, members: list[str], member_groups: list[str], fas: bool = True) -> FreeIPAGroup:
+    return FreeIPAGroup(
+        cn,
+        {"cn": [cn], "member_user": members, "member_group": member_groups, "fasgroup": fas},
+    )
+
+
+@override_settings(FREEIPA_GROUP_CLOSURE_MAX_AGE_SECONDS=300, FREEIPA_L1_CACHE_GENERATION_CHECK_SECONDS=0)
+class GroupMembershipClosureTests(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        cache.clear()
+        _group_closure_cache.clear()
+        self.addCleanup(_group_closure_cache.clear)
+
+    def test_closure_answers_nested_cycles_and_both_modes_from_one_group_list(self) -> None:
+        groups = [
+            _group("top", members=["alice"], member_groups=["Ring-A", "legacy"]),
+            _group("ring-a", members=["bob"], member_groups=["ring-b"]),
+            _group("ring-b", members=["carol"], member_groups=["ring-a", "leaf"]),
+            _group("leaf", members=["dave"], member_groups=[]),
+            _group("legacy", members=["erin"], member_groups=["leaf"], fas=False),
+        ]
+
+        with (
+            patch("core.freeipa.group.FreeIPAGroup.all", return_value=groups) as all_mock,
+            patch("core.freeipa.group.FreeIPAGroup.get_many", side_effect=AssertionError("per-level lookup")),
+        ):
+            top = groups[0]
+            self.assertEqual(top.member_usernames_recursive(), {"alice", "bob", "carol", "dave", "erin"})
+            self.assertEqual(top.member_count_recursive(fas_only=True), 4)
+            self.assertEqual(groups[2].member_usernames_recursive(), {"bob", "carol", "dave"})
+            self.assertEqual(groups[4].member_usernames_recursive(fas_only=True), set())
+
+        all_mock.assert_called_once()
+        closure = get_group_membership_closure()
+        assert closure is not None
+        ring = closure.member_usernames("ring-a")
+        assert ring is not None
+        self.assertIs(ring, closure.member_usernames("RING-B"))
+        self.assertFalse(ring.dangling)
+
+    def test_group_list_invalidation_rebuilds_and_missing_groups_fall_back(self) -> None:
+        groups = [_group("parent", members=["alice"], member_groups=["gone"])]
+
+        with patch("core.freeipa.group.FreeIPAGroup.all", return_value=groups) as all_mock:
+            closure = get_group_membership_closure()
+            assert closure is not None
+            closed = closure.member_usernames("parent")
+            assert closed is not None
+            self.assertTrue(closed.dangling)
+            self.assertIsNone(closure.member_usernames("unknown"))
+
+            self.assertIs(get_group_membership_closure(), closure)
+            _invalidate_groups_list_cache()
+            self.assertIsNot(get_group_membership_closure(), closure)
+
+        self.assertEqual(all_mock.call_count, 2)
+
+        outsider = _group("outsider", members=["zoe"], member_groups=[])
+        with (
+            patch("core.freeipa.group.FreeIPAGroup.all", return_value=groups),
+            patch("core.freeipa.group.FreeIPAGroup.get_many", return_value={}) as get_many,
+        ):
+            self.assertEqual(outsider.member_usernames_recursive(), {"zoe"})
+        get_many.assert_not_called()
@@ -7,9 +7,10 @@ from django.urls import reverse
 
 from core.freeipa.group import FreeIPAGroup
 from core.freeipa.user import FreeIPAUser
+from core.tests.utils_test_data import GetManyViaGetMixin
 
 
-class GroupDetailPromoteMemberToSponsorTests(TestCase):
+class GroupDetailPromoteMemberToSponsorTests(GetManyViaGetMixin, TestCase):
     def _login_as_freeipa(self, username: str) -> None:
         session = self.client.session
         session["_freeipa_username"] = username
@@ -10,9 +10,10 @@ from core.freeipa.group import FreeIPAGroup
 from core.freeipa.user import FreeIPAUser
 from core.models import FreeIPAPermissionGrant
 from core.permissions import ASTRA_ADD_ELECTION
+from core.tests.utils_test_data import GetManyViaGetMixin
 
 
-class GroupsApiTests(TestCase):
+class GroupsApiTests(GetManyViaGetMixin, TestCase):
     def _login_as_freeipa_user(self, username: str) -> None:
         session = self.client.session
         session["_freeipa_username"] = username
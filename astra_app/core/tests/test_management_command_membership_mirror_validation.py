@@ -141,3 +141,25 @@ class MembershipMirrorValidationCommandTests(TestCase):
             call_command("membership_mirror_validation", "--fix")
 
         self.assertFalse(MirrorMembershipValidation.objects.filter(membership_request=closed_request).exists())
+
+    def test_workers_process_every_due_validation_once(self) -> None:
+        validations = [
+            MirrorMembershipValidation.objects.create(
+                membership_request=self._create_mirror_request(username=username),
+                status=MirrorMembershipValidation.Status.pending,
+                next_run_at=timezone.now() - datetime.timedelta(minutes=1),
+            )
+            for username in ("erin", "frank", "grace", "heidi")
+        ]
+
+        with patch(
+            "core.management.commands.membership_mirror_validation.run_validation",
+            autospec=True,
+            return_value=self._fake_validation_outcome(),
+        ) as run_validation_mock:
+            call_command("membership_mirror_validation", "--workers", "3")
+
+        self.assertEqual(run_validation_mock.call_count, len(validations))
+        for validation in validations:
+            validation.refresh_from_db()
+            self.assertEqual(validation.status, MirrorMembershipValidation.Status.completed)
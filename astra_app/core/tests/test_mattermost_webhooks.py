@@ -1,24 +1,38 @@
 import datetime
 import json
+import threading
 import warnings
 from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
 import requests
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.test import SimpleTestCase, TestCase, override_settings
 from django.urls import reverse
 
 from core.freeipa.user import FreeIPAUser
 from core.mattermost_webhooks import (
+    _ENDPOINT_GENERATION_CACHE_KEY,
     _build_payload,
     _default_payload,
-    _post_to_endpoint,
+    _endpoint_cache,
+    _enqueue_dispatch,
     _render_template,
-    dispatch_mattermost_event,
+    deliver_webhook_batch,
 )
-from core.models import AccountInvitation, MattermostWebhookEndpoint, MembershipLog, Organization
+from core.models import (
+    AccountDeletionRequest,
+    AccountInvitation,
+    MattermostWebhookEndpoint,
+    MembershipLog,
+    MembershipType,
+    Organization,
+    OutboxMessage,
+)
+from core.outbox import DeliveryFailure, drain_outbox
 from core.signals import CANONICAL_SIGNALS
+from core.tests.utils_test_data import ensure_core_categories
 from core.tokens import election_genesis_chain_hash
 
 
@@ -517,69 +531,76 @@ class MattermostWebhookTemplateAndPayloadTests(SimpleTestCase):
 
 
 @override_settings(MATTERMOST_WEBHOOK_TIMEOUT_SECONDS=3)
-class MattermostWebhookPostTests(SimpleTestCase):
+class MattermostWebhookPostTests(TestCase):
     def _endpoint(self, *, url: str = "https://hooks.example.invalid/abc") -> MattermostWebhookEndpoint:
-        return MattermostWebhookEndpoint(label="Ops", url=url, events=["election_opened"], enabled=True)
+        return MattermostWebhookEndpoint.objects.create(label="Ops", url=url, events=["election_opened"], enabled=True)
+
+    def _deliver(self, endpoint: MattermostWebhookEndpoint, payload: dict[str, object]) -> dict[int, DeliveryFailure]:
+        message = OutboxMessage.objects.create(
+            kind=OutboxMessage.Kind.mattermost_webhook,
+            payload={"endpoint_id": endpoint.pk, "event_key": "election_opened", "body": payload},
+        )
+        return deliver_webhook_batch([message])
 
-    def test_post_to_endpoint_success_2xx(self) -> None:
+    def test_deliver_success_2xx(self) -> None:
         response = Mock()
         response.status_code = 200
         response.text = "ok"
 
-        with patch("core.mattermost_webhooks.requests.post", return_value=response) as post_mock:
-            _post_to_endpoint(self._endpoint(), {"text": "hello"})
+        with patch("core.mattermost_webhooks.requests.Session.post", return_value=response) as post_mock:
+            self._deliver(self._endpoint(), {"text": "hello"})
 
         post_mock.assert_called_once()
         _, kwargs = post_mock.call_args
         self.assertEqual(kwargs["timeout"], 3)
         self.assertFalse(kwargs["allow_redirects"])
 
-    def test_post_to_endpoint_http_error_logged_and_swallowed(self) -> None:
+    def test_deliver_http_error_logged_and_returned(self) -> None:
         response = Mock()
         response.status_code = 500
         response.text = "boom"
 
         with (
-            patch("core.mattermost_webhooks.requests.post", return_value=response),
+            patch("core.mattermost_webhooks.requests.Session.post", return_value=response),
             self.assertLogs("core.mattermost_webhooks", level="ERROR") as captured,
         ):
-            _post_to_endpoint(self._endpoint(), {"text": "hello"})
+            self._deliver(self._endpoint(), {"text": "hello"})
 
         self.assertTrue(captured.records)
         self.assertTrue(any("response_excerpt=boom" in record.getMessage() for record in captured.records))
         self.assertTrue(any(getattr(record, "response_excerpt", None) == "boom" for record in captured.records))
 
-    def test_post_to_endpoint_exception_logged_and_swallowed(self) -> None:
+    def test_deliver_exception_logged_and_returned(self) -> None:
         with (
-            patch("core.mattermost_webhooks.requests.post", side_effect=requests.Timeout("timeout")),
+            patch("core.mattermost_webhooks.requests.Session.post", side_effect=requests.Timeout("timeout")),
             self.assertLogs("core.mattermost_webhooks", level="ERROR") as captured,
         ):
-            _post_to_endpoint(self._endpoint(), {"text": "hello"})
+            self._deliver(self._endpoint(), {"text": "hello"})
 
         self.assertTrue(captured.records)
 
-    def test_post_to_endpoint_blocks_non_https(self) -> None:
+    def test_deliver_blocks_non_https(self) -> None:
         endpoint = self._endpoint(url="http://hooks.example.invalid/insecure")
 
         with (
-            patch("core.mattermost_webhooks.requests.post") as post_mock,
+            patch("core.mattermost_webhooks.requests.Session.post") as post_mock,
             self.assertLogs("core.mattermost_webhooks", level="ERROR") as captured,
         ):
-            _post_to_endpoint(endpoint, {"text": "hello"})
+            self._deliver(endpoint, {"text": "hello"})
 
         post_mock.assert_not_called()
         self.assertTrue(captured.records)
 
-    def test_post_to_endpoint_treats_redirect_as_failure(self) -> None:
+    def test_deliver_treats_redirect_as_failure(self) -> None:
         response = Mock()
         response.status_code = 302
         response.text = "redirect"
 
         with (
-            patch("core.mattermost_webhooks.requests.post", return_value=response),
+            patch("core.mattermost_webhooks.requests.Session.post", return_value=response),
             self.assertLogs("core.mattermost_webhooks", level="ERROR") as captured,
         ):
-            _post_to_endpoint(self._endpoint(), {"text": "hello"})
+            self._deliver(self._endpoint(), {"text": "hello"})
 
         self.assertTrue(captured.records)
 
@@ -589,13 +610,13 @@ class MattermostWebhookPostTests(SimpleTestCase):
         MATTERMOST_WEBHOOK_DEFAULT_ICON_URL="/core/static/core/images/almalinux_astra_small.png",
         PUBLIC_BASE_URL="https://accounts.example.org",
     )
-    def test_post_to_endpoint_applies_default_identity_from_settings(self) -> None:
+    def test_deliver_applies_default_identity_from_settings(self) -> None:
         response = Mock()
         response.status_code = 200
         response.text = "ok"
 
-        with patch("core.mattermost_webhooks.requests.post", return_value=response) as post_mock:
-            _post_to_endpoint(self._endpoint(), {"text": "hello"})
+        with patch("core.mattermost_webhooks.requests.Session.post", return_value=response) as post_mock:
+            self._deliver(self._endpoint(), {"text": "hello"})
 
         _, kwargs = post_mock.call_args
         payload = kwargs["json"]
@@ -610,13 +631,13 @@ class MattermostWebhookPostTests(SimpleTestCase):
         MATTERMOST_WEBHOOK_DEFAULT_USERNAME="AlmaLinux Astra",
         MATTERMOST_WEBHOOK_DEFAULT_ICON_URL="/core/static/core/images/almalinux_astra_small.png",
     )
-    def test_post_to_endpoint_keeps_explicit_payload_identity(self) -> None:
+    def test_deliver_keeps_explicit_payload_identity(self) -> None:
         response = Mock()
         response.status_code = 200
         response.text = "ok"
 
-        with patch("core.mattermost_webhooks.requests.post", return_value=response) as post_mock:
-            _post_to_endpoint(
+        with patch("core.mattermost_webhooks.requests.Session.post", return_value=response) as post_mock:
+            self._deliver(
                 self._endpoint(),
                 {
                     "text": "hello",
@@ -630,14 +651,14 @@ class MattermostWebhookPostTests(SimpleTestCase):
         self.assertEqual(payload["username"], "Custom Username")
         self.assertEqual(payload["icon_url"], "https://cdn.example.org/custom-icon.png")
 
-    def test_post_to_endpoint_never_logs_raw_url(self) -> None:
+    def test_deliver_never_logs_raw_url(self) -> None:
         endpoint = self._endpoint(url="https://hooks.example.invalid/secret-token-value")
 
         with (
-            patch("core.mattermost_webhooks.requests.post", side_effect=requests.Timeout("timeout")),
+            patch("core.mattermost_webhooks.requests.Session.post", side_effect=requests.Timeout("timeout")),
             self.assertLogs("core.mattermost_webhooks", level="ERROR") as captured,
         ):
-            _post_to_endpoint(endpoint, {"text": "hello"})
+            self._deliver(endpoint, {"text": "hello"})
 
         output = "\n".join(captured.output)
         self.assertNotIn(endpoint.url, output)
@@ -648,27 +669,27 @@ class MattermostWebhookPostTests(SimpleTestCase):
 
         with (
             patch(
-                "core.mattermost_webhooks.requests.post",
+                "core.mattermost_webhooks.requests.Session.post",
                 side_effect=requests.exceptions.ConnectionError(f"Failed to connect to {secret_url}"),
             ),
             self.assertLogs("core.mattermost_webhooks", level="ERROR") as captured,
         ):
-            _post_to_endpoint(endpoint, {"text": "test"})
+            self._deliver(endpoint, {"text": "test"})
 
         for record in captured.records:
             for val in record.__dict__.values():
                 self.assertNotIn(secret_url, str(val), f"URL leaked in log record field: {val!r}")
 
 
-class MattermostWebhookDispatchTests(TestCase):
-    def _dispatch_thread_patch(self):
-        def _make_thread(*thread_ctor_args: object, target=None, args=(), kwargs=None, **_thread_kwargs: object):
-            del thread_ctor_args
-            call_kwargs = dict(kwargs or {})
-            call_args = tuple(args or ())
-            return SimpleNamespace(start=lambda: target(*call_args, **call_kwargs) if target is not None else None)
+_POSTED = (True, 200, "", None, None)
+
 
-        return patch("core.mattermost_webhooks.threading.Thread", side_effect=_make_thread)
+def _dispatch(event_key: str, **kwargs: object) -> None:
+    _enqueue_dispatch(event_key, kwargs)
+    drain_outbox(batch_size=50)
+
+
+class MattermostWebhookDispatchTests(TestCase):
 
     def test_dispatch_skips_membership_request_event_when_membership_request_missing(self) -> None:
         MattermostWebhookEndpoint.objects.create(
@@ -679,10 +700,10 @@ class MattermostWebhookDispatchTests(TestCase):
         )
 
         with (
-            patch("core.mattermost_webhooks._post_to_endpoint") as post_mock,
+            patch("core.mattermost_webhooks.post_mattermost_payload", return_value=_POSTED) as post_mock,
             self.assertLogs("core.mattermost_webhooks", level="WARNING") as captured,
         ):
-            dispatch_mattermost_event("membership_request_submitted", actor="alice")
+            _dispatch("membership_request_submitted", actor="alice")
 
         post_mock.assert_not_called()
         self.assertTrue(any(record.getMessage() == "mattermost.membership_request_missing_context" for record in captured.records))
@@ -696,10 +717,10 @@ class MattermostWebhookDispatchTests(TestCase):
         )
 
         with (
-            patch("core.mattermost_webhooks._post_to_endpoint") as post_mock,
+            patch("core.mattermost_webhooks.post_mattermost_payload", return_value=_POSTED) as post_mock,
             self.assertLogs("core.mattermost_webhooks", level="WARNING") as captured,
         ):
-            dispatch_mattermost_event(
+            _dispatch(
                 "organization_membership_request_submitted",
                 actor="alice",
                 organization_id=123,
@@ -729,8 +750,8 @@ class MattermostWebhookDispatchTests(TestCase):
             events=["membership_expired"],
         )
 
-        with patch("core.mattermost_webhooks._post_to_endpoint") as post_mock:
-            dispatch_mattermost_event("election_opened", actor="alice")
+        with patch("core.mattermost_webhooks.post_mattermost_payload", return_value=_POSTED) as post_mock:
+            _dispatch("election_opened", actor="alice")
 
         post_mock.assert_called_once()
         endpoint_arg = post_mock.call_args.args[0]
@@ -745,10 +766,10 @@ class MattermostWebhookDispatchTests(TestCase):
         )
 
         with (
-            patch("core.mattermost_webhooks._post_to_endpoint") as post_mock,
+            patch("core.mattermost_webhooks.post_mattermost_payload", return_value=_POSTED) as post_mock,
             self.assertLogs("core.mattermost_webhooks", level="ERROR") as captured,
         ):
-            dispatch_mattermost_event("election_opened", actor="alice")
+            _dispatch("election_opened", actor="alice")
 
         post_mock.assert_not_called()
         self.assertTrue(captured.records)
@@ -761,8 +782,8 @@ class MattermostWebhookDispatchTests(TestCase):
             events=["membership_expired"],
         )
 
-        with patch("core.mattermost_webhooks._post_to_endpoint") as post_mock:
-            dispatch_mattermost_event("membership_expired", count=0, membership_type="all", actor="system")
+        with patch("core.mattermost_webhooks.post_mattermost_payload", return_value=_POSTED) as post_mock:
+            _dispatch("membership_expired", count=0, membership_type="all", actor="system")
 
         post_mock.assert_not_called()
 
@@ -774,8 +795,8 @@ class MattermostWebhookDispatchTests(TestCase):
             events=["election_opened"],
         )
 
-        with patch("core.mattermost_webhooks._post_to_endpoint") as post_mock:
-            dispatch_mattermost_event("election_opened", count=0, actor="system")
+        with patch("core.mattermost_webhooks.post_mattermost_payload", return_value=_POSTED) as post_mock:
+            _dispatch("election_opened", count=0, actor="system")
 
         post_mock.assert_not_called()
 
@@ -787,8 +808,8 @@ class MattermostWebhookDispatchTests(TestCase):
             events=["membership_expiring_soon"],
         )
 
-        with patch("core.mattermost_webhooks._post_to_endpoint") as post_mock:
-            dispatch_mattermost_event("membership_expiring_soon", count=0, membership_type="all", actor="system")
+        with patch("core.mattermost_webhooks.post_mattermost_payload", return_value=_POSTED) as post_mock:
+            _dispatch("membership_expiring_soon", count=0, membership_type="all", actor="system")
 
         post_mock.assert_not_called()
 
@@ -800,8 +821,8 @@ class MattermostWebhookDispatchTests(TestCase):
             events=["election_opened"],
         )
 
-        with patch("core.mattermost_webhooks._post_to_endpoint") as post_mock:
-            dispatch_mattermost_event("election_opened", count="two", actor="system")
+        with patch("core.mattermost_webhooks.post_mattermost_payload", return_value=_POSTED) as post_mock:
+            _dispatch("election_opened", count="two", actor="system")
 
         post_mock.assert_called_once()
         self.assertEqual(post_mock.call_args.args[0].pk, endpoint.pk)
@@ -815,17 +836,17 @@ class MattermostWebhookDispatchTests(TestCase):
         )
 
         with (
-            patch("core.mattermost_webhooks._post_to_endpoint") as post_mock,
+            patch("core.mattermost_webhooks.post_mattermost_payload", return_value=_POSTED) as post_mock,
             self.assertLogs("core.mattermost_webhooks", level="WARNING") as captured,
         ):
-            dispatch_mattermost_event("election_opened", actor="alice")
+            _dispatch("election_opened", actor="alice")
 
         post_mock.assert_not_called()
         self.assertTrue(captured.records)
 
     @patch("core.mattermost_webhooks.MattermostWebhookEndpoint.objects.filter", side_effect=RuntimeError("DB down"))
     def test_dispatch_never_raises_on_db_error(self, _mock_filter: Mock) -> None:
-        dispatch_mattermost_event("election_opened", actor="test")
+        _enqueue_dispatch("election_opened", {"actor": "test"})
 
     def test_account_invitation_accepted_signal_posts_through_connected_receiver(self) -> None:
         endpoint = MattermostWebhookEndpoint.objects.create(
@@ -841,15 +862,13 @@ class MattermostWebhookDispatchTests(TestCase):
             accepted_username="alice",
         )
 
-        with (
-            patch("core.mattermost_webhooks._post_to_endpoint") as post_mock,
-            self._dispatch_thread_patch(),
-        ):
+        with patch("core.mattermost_webhooks.post_mattermost_payload", return_value=_POSTED) as post_mock:
             CANONICAL_SIGNALS["account_invitation_accepted"].send(
                 sender=AccountInvitation,
                 account_invitation=invitation,
                 actor="alice",
             )
+            drain_outbox(batch_size=10)
 
         post_mock.assert_called_once()
         self.assertEqual(post_mock.call_args.args[0].pk, endpoint.pk)
@@ -865,15 +884,13 @@ class MattermostWebhookDispatchTests(TestCase):
         )
         organization = Organization.objects.create(name="Claimed Org")
 
-        with (
-            patch("core.mattermost_webhooks._post_to_endpoint") as post_mock,
-            self._dispatch_thread_patch(),
-        ):
+        with patch("core.mattermost_webhooks.post_mattermost_payload", return_value=_POSTED) as post_mock:
             CANONICAL_SIGNALS["organization_claimed"].send(
                 sender=Organization,
                 organization=organization,
                 actor="alice",
             )
+            drain_outbox(batch_size=10)
 
         post_mock.assert_called_once()
         self.assertEqual(post_mock.call_args.args[0].pk, endpoint.pk)
@@ -887,18 +904,20 @@ class MattermostWebhookDispatchTests(TestCase):
             enabled=True,
             events=["membership_self_terminated"],
         )
-        membership_type = SimpleNamespace(code="individual", name="Individual")
+        ensure_core_categories()
+        membership_type, _created = MembershipType.objects.update_or_create(
+            code="individual",
+            defaults={"name": "Individual", "category_id": "individual", "enabled": True},
+        )
 
-        with (
-            patch("core.mattermost_webhooks._post_to_endpoint") as post_mock,
-            self._dispatch_thread_patch(),
-        ):
+        with patch("core.mattermost_webhooks.post_mattermost_payload", return_value=_POSTED) as post_mock:
             CANONICAL_SIGNALS["membership_self_terminated"].send(
                 sender=MembershipLog,
                 actor="alice",
                 username="alice",
                 membership_type=membership_type,
             )
+            drain_outbox(batch_size=10)
 
         post_mock.assert_called_once()
         self.assertEqual(post_mock.call_args.args[0].pk, endpoint.pk)
@@ -912,23 +931,19 @@ class MattermostWebhookDispatchTests(TestCase):
             enabled=True,
             events=["account_deletion_completed"],
         )
-        deletion_request = SimpleNamespace(
-            pk=42,
+        deletion_request = AccountDeletionRequest.objects.create(
             username="alice",
-            status="completed",
-            manual_review_required=False,
-            blocker_codes=[],
+            status=AccountDeletionRequest.Status.completed,
+            reason_category=AccountDeletionRequest.ReasonCategory.privacy,
         )
 
-        with (
-            patch("core.mattermost_webhooks._post_to_endpoint") as post_mock,
-            self._dispatch_thread_patch(),
-        ):
+        with patch("core.mattermost_webhooks.post_mattermost_payload", return_value=_POSTED) as post_mock:
             CANONICAL_SIGNALS["account_deletion_completed"].send(
-                sender=type(deletion_request),
+                sender=AccountDeletionRequest,
                 account_deletion_request=deletion_request,
                 actor="admin",
             )
+            drain_outbox(batch_size=10)
 
         post_mock.assert_called_once()
         self.assertEqual(post_mock.call_args.args[0].pk, endpoint.pk)
@@ -936,10 +951,167 @@ class MattermostWebhookDispatchTests(TestCase):
         self.assertEqual(payload["text"], "Account deletion completed")
         self.assertTrue(
             payload["attachments"][0]["title_link"].endswith(
-                reverse("admin:core_accountdeletionrequest_change", args=[42])
+                reverse("admin:core_accountdeletionrequest_change", args=[deletion_request.pk])
+            )
+        )
+
+
+class MattermostWebhookDeliveryPoolTests(TestCase):
+    @override_settings(MATTERMOST_WEBHOOK_FANOUT_WORKERS=4)
+    def test_dispatch_posts_to_matching_endpoints_in_parallel(self) -> None:
+        for index in range(2):
+            MattermostWebhookEndpoint.objects.create(
+                label=f"Parallel {index}",
+                url=f"https://hooks.example.invalid/parallel-{index}",
+                enabled=True,
+                events=["election_opened"],
+            )
+        barrier = threading.Barrier(2, timeout=5)
+        posted_urls: list[str] = []
+
+        def _post(endpoint: MattermostWebhookEndpoint, payload: dict[str, object]) -> tuple[bool, int, str, None, None]:
+            # Only returns if both posts are in flight at the same time.
+            barrier.wait()
+            posted_urls.append(endpoint.url)
+            return _POSTED
+
+        with patch("core.mattermost_webhooks.post_mattermost_payload", side_effect=_post):
+            _dispatch("election_opened", actor="alice")
+
+        self.assertEqual(
+            sorted(posted_urls),
+            ["https://hooks.example.invalid/parallel-0", "https://hooks.example.invalid/parallel-1"],
+        )
+
+    def test_signal_records_outbox_rows_that_drain_delivers(self) -> None:
+        endpoint = MattermostWebhookEndpoint.objects.create(
+            label="Outbox",
+            url="https://hooks.example.invalid/outbox",
+            enabled=True,
+            events=["election_opened"],
+        )
+
+        with patch("core.mattermost_webhooks.requests.Session.post") as post_mock:
+            CANONICAL_SIGNALS["election_opened"].send(sender=None, actor="alice")
+            post_mock.assert_not_called()
+
+            message = OutboxMessage.objects.get(kind=OutboxMessage.Kind.mattermost_webhook)
+            self.assertEqual(message.payload["endpoint_id"], endpoint.pk)
+            self.assertEqual(message.payload["event_key"], "election_opened")
+
+            post_mock.return_value = Mock(status_code=200, text="ok")
+            result = drain_outbox(batch_size=10)
+
+        self.assertEqual(result.delivered, 1)
+        post_mock.assert_called_once()
+        self.assertEqual(post_mock.call_args.args[0], endpoint.url)
+        message.refresh_from_db()
+        self.assertEqual(message.status, OutboxMessage.Status.delivered)
+        self.assertIsNotNone(message.delivery_latency_ms)
+
+    def test_signal_queues_the_payload_as_rendered_when_the_event_fired(self) -> None:
+        endpoint = MattermostWebhookEndpoint.objects.create(
+            label="Organizations",
+            url="https://hooks.example.invalid/orgs",
+            enabled=True,
+            events=["organization_claimed"],
+        )
+        organization = Organization.objects.create(name="Claimed Org")
+        CANONICAL_SIGNALS["organization_claimed"].send(sender=Organization, organization=organization, actor="alice")
+
+        message = OutboxMessage.objects.get(kind=OutboxMessage.Kind.mattermost_webhook)
+        self.assertEqual(message.payload["endpoint_id"], endpoint.pk)
+        self.assertEqual(message.payload["event_key"], "organization_claimed")
+        self.assertIn("Claimed Org", json.dumps(message.payload["body"]))
+
+        Organization.objects.filter(pk=organization.pk).update(name="Renamed Org")
+        with patch("core.mattermost_webhooks.post_mattermost_payload", return_value=_POSTED) as post_mock:
+            drain_outbox(batch_size=10)
+
+        post_mock.assert_called_once()
+        posted = json.dumps(post_mock.call_args.args[1])
+        self.assertIn("Claimed Org", posted)
+        self.assertNotIn("Renamed Org", posted)
+
+    def test_drain_posts_the_event_after_its_object_was_deleted(self) -> None:
+        MattermostWebhookEndpoint.objects.create(
+            label="Organizations",
+            url="https://hooks.example.invalid/orgs",
+            enabled=True,
+            events=["organization_claimed"],
+        )
+        organization = Organization.objects.create(name="Short-lived Org")
+        CANONICAL_SIGNALS["organization_claimed"].send(sender=Organization, organization=organization, actor="alice")
+        organization.delete()
+
+        with patch("core.mattermost_webhooks.post_mattermost_payload", return_value=_POSTED) as post_mock:
+            result = drain_outbox(batch_size=10)
+
+        self.assertEqual(result.delivered, 1)
+        self.assertIn("Short-lived Org", json.dumps(post_mock.call_args.args[1]))
+
+    def test_drain_retries_server_errors_and_gives_up_on_client_errors(self) -> None:
+        for suffix in ("flaky", "gone"):
+            MattermostWebhookEndpoint.objects.create(
+                label=suffix,
+                url=f"https://hooks.example.invalid/{suffix}",
+                enabled=True,
+                events=["election_opened"],
             )
+        CANONICAL_SIGNALS["election_opened"].send(sender=None, actor="alice")
+
+        def _post(url: str, **kwargs: object) -> Mock:
+            return Mock(status_code=503 if url.endswith("flaky") else 404, text="error")
+
+        with (
+            patch("core.mattermost_webhooks.requests.Session.post", side_effect=_post),
+            self.assertLogs("core.mattermost_webhooks", level="ERROR"),
+        ):
+            result = drain_outbox(batch_size=10)
+
+        self.assertEqual((result.retried, result.failed), (1, 1))
+        flaky = OutboxMessage.objects.get(payload__endpoint_id=MattermostWebhookEndpoint.objects.get(label="flaky").pk)
+        self.assertEqual(flaky.status, OutboxMessage.Status.pending)
+        self.assertEqual(flaky.attempt_count, 1)
+        self.assertGreater(flaky.next_run_at, flaky.last_attempt_at)
+        gone = OutboxMessage.objects.get(payload__endpoint_id=MattermostWebhookEndpoint.objects.get(label="gone").pk)
+        self.assertEqual(gone.status, OutboxMessage.Status.failed_terminal)
+        self.assertEqual(gone.last_error, "http_error status_code=404")
+
+    @override_settings(MATTERMOST_WEBHOOK_ENDPOINT_CACHE_SECONDS=60)
+    def test_endpoint_cache_reuses_config_until_an_endpoint_is_saved(self) -> None:
+        _endpoint_cache.invalidate()
+        self.addCleanup(_endpoint_cache.invalidate)
+        first = MattermostWebhookEndpoint.objects.create(
+            label="Cached",
+            url="https://hooks.example.invalid/cached",
+            enabled=True,
+            events=["election_opened"],
         )
 
+        self.assertEqual([endpoint.pk for endpoint in _endpoint_cache.enabled_endpoints()], [first.pk])
+        with self.assertNumQueries(0):
+            _endpoint_cache.enabled_endpoints()
+
+        first.enabled = False
+        first.save(update_fields=["enabled"])
+
+        self.assertEqual(_endpoint_cache.enabled_endpoints(), ())
+
+    def test_endpoint_changes_bump_the_shared_generation_on_commit(self) -> None:
+        generation = cache.get(_ENDPOINT_GENERATION_CACHE_KEY)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            MattermostWebhookEndpoint.objects.create(
+                label="Pending",
+                url="https://hooks.example.invalid/pending",
+                enabled=True,
+                events=["election_opened"],
+            )
+            self.assertEqual(cache.get(_ENDPOINT_GENERATION_CACHE_KEY), generation)
+
+        self.assertNotEqual(cache.get(_ENDPOINT_GENERATION_CACHE_KEY), generation)
+
 
 class MattermostWebhookAdminTests(TestCase):
     def _login_as_freeipa_admin(self, username: str = "alice") -> None:
@@ -1092,7 +1264,7 @@ class MattermostWebhookAdminTests(TestCase):
 
         with (
             patch("core.freeipa.user.FreeIPAUser.get", return_value=self._admin_user()),
-            patch("core.mattermost_webhooks.requests.post", return_value=response),
+            patch("core.mattermost_webhooks.requests.Session.post", return_value=response),
             self.assertLogs("core.mattermost_webhooks", level="INFO") as captured,
         ):
             url = reverse("admin:core_mattermostwebhookendpoint_test", args=[endpoint.pk])
@@ -1122,7 +1294,7 @@ class MattermostWebhookAdminTests(TestCase):
 
         with (
             patch("core.freeipa.user.FreeIPAUser.get", return_value=self._admin_user()),
-            patch("core.mattermost_webhooks.requests.post", return_value=response),
+            patch("core.mattermost_webhooks.requests.Session.post", return_value=response),
             self.assertLogs("core.mattermost_webhooks", level="ERROR") as captured,
         ):
             url = reverse("admin:core_mattermostwebhookendpoint_test", args=[endpoint.pk])
@@ -1164,7 +1336,7 @@ class MattermostWebhookAdminTests(TestCase):
         with (
             patch("core.freeipa.user.FreeIPAUser.get", return_value=self._admin_user()),
             patch(
-                "core.mattermost_webhooks.requests.post",
+                "core.mattermost_webhooks.requests.Session.post",
                 side_effect=requests.exceptions.ConnectionError(f"Failed to connect to {endpoint.url}"),
             ),
             self.assertLogs("core.mattermost_webhooks", level="ERROR") as captured,
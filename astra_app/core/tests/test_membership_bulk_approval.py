@@ -0,0 +1,137 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from core.freeipa.user import FreeIPAUser
+from core.membership_request_workflow import approve_membership_request, coalesced_group_adds
+from core.models import MembershipLog, MembershipRequest, MembershipType
+from core.tests.utils_test_data import ensure_core_categories, ensure_email_templates
+
+
+class _GroupClient:
+    def __init__(self, *, refused: set[str]) -> None:
+        self.refused = refused
+        self.calls: list[tuple[str, list[str]]] = []
+
+    def group_add_member(self, cn: str, **kwargs: object) -> dict[str, object]:
+        usernames = list(kwargs["o_user"])
+        self.calls.append((cn, usernames))
+        return {
+            "completed": len(usernames) - len(self.refused),
+            "failed": {"member": {"user": [[username, "no such entry"] for username in sorted(self.refused)], "group": []}},
+            "result": {"cn": [cn], "member_user": [username for username in usernames if username not in self.refused]},
+        }
+
+
+class CoalescedGroupAddTests(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        super().setUpTestData()
+        ensure_core_categories()
+        ensure_email_templates()
+
+    def setUp(self) -> None:
+        super().setUp()
+        cache.clear()
+        MembershipType.objects.update_or_create(
+            code="individual",
+            defaults={"name": "Individual", "group_cn": "almalinux-individual", "category_id": "individual", "enabled": True},
+        )
+
+    def test_approvals_in_the_block_share_one_group_add_per_group(self) -> None:
+        usernames = ["alice", "bob", "carol"]
+        requests = [
+            MembershipRequest.objects.create(requested_username=username, membership_type_id="individual")
+            for username in usernames
+        ]
+        users = {
+            username: FreeIPAUser(username, {"uid": [username], "mail": [f"{username}@example.com"]})
+            for username in usernames
+        }
+        client = _GroupClient(refused={"carol"})
+        succeeded: list[str] = []
+
+        with (
+            patch("core.freeipa.user.FreeIPAUser.get", side_effect=lambda username, **_kwargs: users.get(username)),
+            patch("core.freeipa.user.FreeIPAUser.get_many", side_effect=lambda names, **_kwargs: {n: users[n] for n in names}),
+            patch("core.freeipa.group._with_freeipa_service_client_retry", side_effect=lambda _get_client, fn: fn(client)),
+            patch.object(FreeIPAUser, "add_to_group", side_effect=AssertionError("per-user group add")),
+            patch("post_office.mail.send", autospec=True),
+            self.assertLogs("core.membership_request_workflow", level="ERROR") as logs,
+        ):
+            with coalesced_group_adds():
+                with self.captureOnCommitCallbacks(execute=True):
+                    for req in requests:
+                        approve_membership_request(
+                            membership_request=req,
+                            actor_username="reviewer",
+                            send_approved_email=True,
+                            on_group_add_success=lambda username=req.requested_username: succeeded.append(username),
+                        )
+                self.assertEqual(client.calls, [])
+
+        self.assertEqual(client.calls, [("almalinux-individual", usernames)])
+        self.assertEqual(succeeded, ["alice", "bob"])
+        self.assertIn(f"request_id={requests[2].pk} target='carol'", "\n".join(logs.output))
+        self.assertEqual(
+            MembershipLog.objects.filter(action=MembershipLog.Action.approved, target_username__in=usernames).count(),
+            3,
+        )
+
+    def _approve_in_block(self, requests: list[MembershipRequest], succeeded: list[str]) -> None:
+        with coalesced_group_adds():
+            with self.captureOnCommitCallbacks(execute=True):
+                for req in requests:
+                    approve_membership_request(
+                        membership_request=req,
+                        actor_username="reviewer",
+                        send_approved_email=True,
+                        on_group_add_success=lambda username=req.requested_username: succeeded.append(username),
+                    )
+
+    def test_failed_user_lookup_falls_back_to_one_add_per_request(self) -> None:
+        usernames = ["alice", "bob"]
+        requests = [
+            MembershipRequest.objects.create(requested_username=username, membership_type_id="individual")
+            for username in usernames
+        ]
+        users = {username: FreeIPAUser(username, {"uid": [username]}) for username in usernames}
+        succeeded: list[str] = []
+
+        with (
+            patch("core.freeipa.user.FreeIPAUser.get", side_effect=lambda username, **_kwargs: users.get(username)),
+            patch("core.freeipa.user.FreeIPAUser.get_many", side_effect=RuntimeError("FreeIPA down")),
+            patch.object(FreeIPAUser, "add_to_group", autospec=True) as add_to_group,
+            patch("post_office.mail.send", autospec=True),
+            self.assertLogs("core.membership_request_workflow", level="ERROR"),
+        ):
+            self._approve_in_block(requests, succeeded)
+
+        self.assertEqual([call.args[0].username for call in add_to_group.call_args_list], usernames)
+        self.assertEqual(succeeded, usernames)
+
+    def test_failed_group_add_is_retried_per_user(self) -> None:
+        usernames = ["alice", "bob"]
+        requests = [
+            MembershipRequest.objects.create(requested_username=username, membership_type_id="individual")
+            for username in usernames
+        ]
+        users = {username: FreeIPAUser(username, {"uid": [username]}) for username in usernames}
+        succeeded: list[str] = []
+
+        with (
+            patch("core.freeipa.user.FreeIPAUser.get", side_effect=lambda username, **_kwargs: users.get(username)),
+            patch("core.freeipa.user.FreeIPAUser.get_many", side_effect=lambda names, **_kwargs: {n: users[n] for n in names}),
+            patch("core.freeipa.group.FreeIPAGroup.add_members", side_effect=RuntimeError("batch refused")),
+            patch.object(FreeIPAUser, "add_to_group", autospec=True) as add_to_group,
+            patch("post_office.mail.send", autospec=True),
+            self.assertLogs("core.membership_request_workflow", level="ERROR"),
+        ):
+            self._approve_in_block(requests, succeeded)
+
+        self.assertEqual(
+            [(call.args[0].username, call.kwargs["group_name"]) for call in add_to_group.call_args_list],
+            [("alice", "almalinux-individual"), ("bob", "almalinux-individual")],
+        )
+        self.assertEqual(succeeded, usernames)
@@ -21,10 +21,10 @@ from core.permissions import (
     ASTRA_DELETE_MEMBERSHIP,
     ASTRA_VIEW_MEMBERSHIP,
 )
-from core.tests.utils_test_data import ensure_core_categories
+from core.tests.utils_test_data import GetManyViaGetMixin, ensure_core_categories
 
 
-class MembershipNotesAjaxTests(TestCase):
+class MembershipNotesAjaxTests(GetManyViaGetMixin, TestCase):
     def setUp(self) -> None:
         super().setUp()
         ensure_core_categories()
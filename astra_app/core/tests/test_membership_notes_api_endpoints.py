@@ -9,10 +9,10 @@ from core.freeipa.user import FreeIPAUser
 from core.membership_notes import CUSTOS
 from core.models import FreeIPAPermissionGrant, MembershipRequest, MembershipType, Note
 from core.permissions import ASTRA_ADD_MEMBERSHIP, ASTRA_CHANGE_MEMBERSHIP, ASTRA_DELETE_MEMBERSHIP
-from core.tests.utils_test_data import ensure_core_categories
+from core.tests.utils_test_data import GetManyViaGetMixin, ensure_core_categories
 
 
-class MembershipNotesApiEndpointTests(TestCase):
+class MembershipNotesApiEndpointTests(GetManyViaGetMixin, TestCase):
     def setUp(self) -> None:
         super().setUp()
         ensure_core_categories()
@@ -60,7 +60,7 @@ class MembershipNotesReceiversTests(TestCase):
 
         user = IPAUser(username="nobody")
 
-        with patch("core.mattermost_webhooks.dispatch_mattermost_event", autospec=True):
+        with patch("core.mattermost_webhooks._enqueue_dispatch", autospec=True):
             astra_signals.user_country_changed.send(
                 sender=user.__class__,
                 username=user.username,
@@ -87,7 +87,7 @@ class MembershipNotesReceiversTests(TestCase):
             status=MembershipRequest.Status.approved,
         )
 
-        with patch("core.mattermost_webhooks.dispatch_mattermost_event", autospec=True):
+        with patch("core.mattermost_webhooks._enqueue_dispatch", autospec=True):
             astra_signals.user_country_changed.send(
                 sender=self.__class__,
                 username="alice",
@@ -120,7 +120,7 @@ class MembershipNotesReceiversTests(TestCase):
 
         with (
             patch("core.membership_notes_receivers.add_note", side_effect=_maybe_fail),
-            patch("core.mattermost_webhooks.dispatch_mattermost_event", autospec=True),
+            patch("core.mattermost_webhooks._enqueue_dispatch", autospec=True),
             self.assertLogs("core.membership_notes_receivers", level="ERROR") as captured,
         ):
             astra_signals.user_country_changed.send(
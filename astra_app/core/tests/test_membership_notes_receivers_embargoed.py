@@ -49,7 +49,7 @@ class MembershipNotesReceiversEmbargoedTests(TestCase):
         from core import membership_notes_receivers
 
         membership_notes_receivers.connect_membership_notes_receivers()
-        self.mattermost_patch = patch("core.mattermost_webhooks.dispatch_mattermost_event", autospec=True)
+        self.mattermost_patch = patch("core.mattermost_webhooks._enqueue_dispatch", autospec=True)
         self.mattermost_patch.start()
         self.addCleanup(self.mattermost_patch.stop)
 
@@ -386,7 +386,7 @@ class MembershipRequestViewRegressionTests(TestCase):
             patch("core.freeipa.user.FreeIPAUser.get", return_value=freeipa_user),
             patch("core.views_membership.user.block_action_without_coc", return_value=None),
             patch("core.views_membership.user.block_action_without_country_code", return_value=None),
-            patch("core.mattermost_webhooks.dispatch_mattermost_event", autospec=True),
+            patch("core.mattermost_webhooks._enqueue_dispatch", autospec=True),
             patch("core.membership_notes.add_note", autospec=True) as add_note_mock,
         ):
             response = self.client.post(
@@ -13,7 +13,7 @@ from core.freeipa.user import FreeIPAUser
 from core.membership_notes import add_note
 from core.models import FreeIPAPermissionGrant, MembershipRequest, MembershipType
 from core.permissions import ASTRA_VIEW_MEMBERSHIP
-from core.tests.utils_test_data import ensure_core_categories
+from core.tests.utils_test_data import GetManyViaGetMixin, ensure_core_categories
 
 
 class MembershipEmailModalTemplateTests(SimpleTestCase):
@@ -55,7 +55,7 @@ class MembershipEmailModalTemplateTests(SimpleTestCase):
         self.assertNotIn("2026-04-21 12:34 UTC", rendered)
 
 
-class MembershipRequestEmailModalTests(TestCase):
+class MembershipRequestEmailModalTests(GetManyViaGetMixin, TestCase):
     def setUp(self) -> None:
         super().setUp()
         ensure_core_categories()
@@ -8,15 +8,25 @@ from django.urls import reverse
 from django.utils import timezone
 from post_office.models import STATUS, Email, Log
 
+from core.freeipa.client import clear_freeipa_service_client_cache
 from core.freeipa.user import FreeIPAUser
-from core.models import FreeIPAPermissionGrant, MembershipLog, MembershipRequest, MembershipType, Note
+from core.models import (
+    FreeIPAPermissionGrant,
+    Membership,
+    MembershipLog,
+    MembershipRequest,
+    MembershipType,
+    Note,
+)
 from core.permissions import ASTRA_ADD_MEMBERSHIP
-from core.tests.utils_test_data import ensure_core_categories
+from core.tests.utils_test_data import GetManyViaGetMixin, ensure_core_categories
 
 
-class MembershipRequestsDataTablesApiTests(TestCase):
+class MembershipRequestsDataTablesApiTests(GetManyViaGetMixin, TestCase):
     def setUp(self) -> None:
         super().setUp()
+        # Pending-queue visibility lists the directory; drop any fake client an earlier test left cached.
+        clear_freeipa_service_client_cache()
         ensure_core_categories()
         FreeIPAPermissionGrant.objects.get_or_create(
             permission=ASTRA_ADD_MEMBERSHIP,
@@ -326,6 +336,68 @@ class MembershipRequestsDataTablesApiTests(TestCase):
         self.assertNotIn("note_summary", row)
         self.assertNotIn("note_details", row)
 
+    def test_pending_endpoint_pages_in_sql_and_looks_up_only_the_visible_page(self) -> None:
+        now = timezone.now()
+        for offset, username in enumerate(["alice", "bob", "carol", "ghost"]):
+            request = MembershipRequest.objects.create(
+                requested_username=username,
+                membership_type_id="individual",
+                status=MembershipRequest.Status.pending,
+            )
+            MembershipRequest.objects.filter(pk=request.pk).update(requested_at=now - datetime.timedelta(days=10 - offset))
+        Membership.objects.create(
+            target_username="carol",
+            membership_type_id="individual",
+            expires_at=now + datetime.timedelta(days=30),
+        )
+
+        reviewer = self._make_freeipa_user(
+            "reviewer",
+            email="reviewer@example.com",
+            groups=[settings.FREEIPA_MEMBERSHIP_COMMITTEE_GROUP],
+        )
+        users = {username: self._make_freeipa_user(username) for username in ("alice", "bob", "carol")}
+        self._login_as_committee()
+
+        with (
+            patch("core.freeipa.user.FreeIPAUser.get", return_value=reviewer),
+            patch(
+                "core.membership_requests_datatables.get_live_usernames",
+                return_value=frozenset({"reviewer", *users}),
+            ),
+            patch(
+                "core.freeipa.user.FreeIPAUser.find_lightweight_by_usernames",
+                side_effect=lambda usernames: {name: users[name] for name in usernames if name in users},
+            ) as lookup_mock,
+        ):
+            response = self.client.get(
+                "/api/v1/membership/requests/pending",
+                data={
+                    **self._datatables_query(order_name="requested_at", length=1),
+                    "start": "1",
+                    "queue_filter": "all",
+                },
+                HTTP_ACCEPT="application/json",
+            )
+            renewals = self.client.get(
+                "/api/v1/membership/requests/pending",
+                data={
+                    **self._datatables_query(order_name="requested_at", length=10),
+                    "queue_filter": "renewals",
+                },
+                HTTP_ACCEPT="application/json",
+            ).json()
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertEqual((payload["recordsTotal"], payload["recordsFiltered"]), (3, 3))
+        self.assertEqual([row["target"]["username"] for row in payload["data"]], ["bob"])
+        self.assertEqual(set(lookup_mock.call_args_list[0].args[0]), {"bob"})
+        self.assertEqual((renewals["recordsTotal"], renewals["recordsFiltered"]), (3, 1))
+        self.assertEqual([row["target"]["username"] for row in renewals["data"]], ["carol"])
+        self.assertTrue(renewals["data"][0]["is_renewal"])
+        self.assertEqual(renewals["pending_filter"]["options"][1], {"value": "renewals", "label": "Renewals", "count": 1})
+
     def test_membership_request_note_summary_endpoint_returns_summary_only(self) -> None:
         pending_request = MembershipRequest.objects.create(
             requested_username="alice",
@@ -7,6 +7,7 @@ from django.test import TestCase
 from django.urls import reverse
 from django.utils import timezone
 
+from core.freeipa.client import clear_freeipa_service_client_cache
 from core.freeipa.user import FreeIPAUser
 from core.models import FreeIPAPermissionGrant, MembershipLog, MembershipRequest, MembershipType
 from core.permissions import ASTRA_ADD_MEMBERSHIP
@@ -16,6 +17,8 @@ from core.tests.utils_test_data import ensure_core_categories
 class MembershipRequestsOnHoldSplitTests(TestCase):
     def setUp(self) -> None:
         super().setUp()
+        # Pending-queue visibility lists the directory; drop any fake client an earlier test left cached.
+        clear_freeipa_service_client_cache()
         ensure_core_categories()
         FreeIPAPermissionGrant.objects.get_or_create(
             permission=ASTRA_ADD_MEMBERSHIP,
@@ -732,11 +732,11 @@ class MembershipStatsDashboardTests(TestCase):
         reviewer = self._reviewer_user()
         seen_keys: list[str] = []
 
-        def _cache_get_or_set(key: str, compute_payload, timeout: int) -> dict[str, object]:
+        def _cached_stats_payload(key: str, compute_payload) -> dict[str, object]:
             seen_keys.append(key)
             return compute_payload()
 
-        with patch("core.views_membership_admin.cache.get_or_set", side_effect=_cache_get_or_set):
+        with patch("core.views_membership_admin.cached_stats_payload", side_effect=_cached_stats_payload):
             with patch("core.freeipa.user.FreeIPAUser.get", return_value=reviewer):
                 with patch("core.freeipa.user.FreeIPAUser.all", return_value=[]):
                     resp_30 = self.client.get(reverse("api-stats-membership-trends-charts-detail"), {"days": "30"})
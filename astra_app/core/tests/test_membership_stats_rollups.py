@@ -0,0 +1,121 @@
+import datetime
+import time
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+
+from core.membership_stats import cached_stats_payload, retention_cohorts_12m, rollups_are_current
+from core.models import MembershipLog, MembershipRetentionCohort, MembershipType, MembershipTypeCategory
+from core.views_membership_admin import _build_membership_stats_active_memberships_chart_payloads
+
+NOW = datetime.datetime(2026, 3, 15, 12, 0, tzinfo=datetime.UTC)
+
+
+def _at(year: int, month: int, day: int, hour: int = 0) -> datetime.datetime:
+    return datetime.datetime(year, month, day, hour, tzinfo=datetime.UTC)
+
+
+class MembershipStatsRollupTests(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        cache.clear()
+        MembershipTypeCategory.objects.update_or_create(
+            name="individual",
+            defaults={"is_individual": True, "is_organization": False, "sort_order": 0},
+        )
+        MembershipType.objects.update_or_create(
+            code="individual",
+            defaults={"name": "Individual", "group_cn": "almalinux-individual", "category_id": "individual"},
+        )
+
+    def _log(
+        self,
+        username: str,
+        action: str,
+        created_at: datetime.datetime,
+        expires_at: datetime.datetime | None = None,
+    ) -> None:
+        log = MembershipLog.objects.create(
+            actor_username="committee",
+            target_username=username,
+            membership_type_id="individual",
+            action=action,
+            expires_at=expires_at,
+        )
+        MembershipLog.objects.filter(pk=log.pk).update(created_at=created_at)
+
+    def test_rollups_match_a_full_replay(self) -> None:
+        approved = MembershipLog.Action.approved
+        self._log("alice", approved, _at(2025, 6, 1), _at(2027, 6, 1))
+        self._log("bob", approved, _at(2025, 9, 1), _at(2026, 3, 15, 6))
+        self._log("carol", approved, _at(2025, 10, 1), _at(2027, 10, 1))
+        self._log("carol", MembershipLog.Action.terminated, _at(2026, 3, 15, 9))
+        self._log("dave", approved, _at(2026, 3, 15, 10), _at(2027, 3, 15))
+        self._log("erin", approved, _at(2025, 11, 1), _at(2025, 12, 1))
+        self._log("frank", approved, _at(2024, 5, 1), _at(2025, 5, 1))
+        self._log("frank", approved, _at(2025, 4, 20), _at(2026, 4, 20))
+
+        windows = {"30": 30, "365": 365, "all": None}
+        replayed = {
+            days_param: _build_membership_stats_active_memberships_chart_payloads(
+                now=NOW,
+                days_param=days_param,
+                days_window=days_window,
+            )
+            for days_param, days_window in windows.items()
+        }
+        replayed_cohorts = retention_cohorts_12m(now=NOW)
+
+        stdout = StringIO()
+        with patch("django.utils.timezone.now", return_value=NOW):
+            call_command("membership_stats_rollup", stdout=stdout)
+
+        self.assertTrue(rollups_are_current(now=NOW))
+        self.assertIn("1 retention cohort(s)", stdout.getvalue())
+        self.assertEqual(MembershipRetentionCohort.objects.count(), 1)
+        with patch("core.views_membership_admin.membership_activity_events") as full_replay:
+            for days_param, days_window in windows.items():
+                self.assertEqual(
+                    _build_membership_stats_active_memberships_chart_payloads(
+                        now=NOW,
+                        days_param=days_param,
+                        days_window=days_window,
+                    ),
+                    replayed[days_param],
+                )
+        full_replay.assert_not_called()
+        self.assertEqual(retention_cohorts_12m(now=NOW), replayed_cohorts)
+        self.assertFalse(rollups_are_current(now=NOW + datetime.timedelta(days=1)))
+
+    def test_dry_run_counts_rows_without_replacing_the_rollups(self) -> None:
+        self._log("alice", MembershipLog.Action.approved, _at(2025, 6, 1), _at(2027, 6, 1))
+
+        stdout = StringIO()
+        with patch("django.utils.timezone.now", return_value=NOW):
+            call_command("membership_stats_rollup", "--dry-run", stdout=stdout)
+
+        self.assertIn("Would write", stdout.getvalue())
+        self.assertFalse(rollups_are_current(now=NOW))
+        self.assertFalse(MembershipRetentionCohort.objects.exists())
+
+    def test_stale_payload_is_served_while_another_request_recomputes(self) -> None:
+        computed: list[int] = []
+
+        def compute() -> dict[str, object]:
+            computed.append(len(computed))
+            return {"version": len(computed)}
+
+        started_at = time.time()
+        with patch("core.membership_stats.time.time", return_value=started_at):
+            self.assertEqual(cached_stats_payload("membership_stats:test", compute), {"version": 1})
+            self.assertEqual(cached_stats_payload("membership_stats:test", compute), {"version": 1})
+
+        cache.add("membership_stats:test:recompute_lock", True)
+        with patch("core.membership_stats.time.time", return_value=started_at + 3600):
+            self.assertEqual(cached_stats_payload("membership_stats:test", compute), {"version": 1})
+            cache.delete("membership_stats:test:recompute_lock")
+            self.assertEqual(cached_stats_payload("membership_stats:test", compute), {"version": 2})
+        self.assertEqual(len(computed), 2)
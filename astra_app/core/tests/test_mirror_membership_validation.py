@@ -1,5 +1,6 @@
 import datetime
 import socket
+import threading
 from typing import override
 from unittest.mock import patch
 from urllib.parse import urlsplit
@@ -15,6 +16,7 @@ from core.membership_notes import CUSTOS
 from core.membership_request_workflow import record_membership_request_created, resubmit_membership_request
 from core.mirror_membership_validation import (
     InaccessibleMirrorTargetError,
+    MirrorValidationRun,
     UnsafeMirrorTargetError,
     ValidationOutcome,
     _describe_github_result,
@@ -63,6 +65,19 @@ class _FakeUrllib3Response:
     def __init__(self, *, status: int) -> None:
         self.status = status
 
+    def read(self, amt: int | None = None, decode_content: bool = False) -> bytes:
+        _ = (amt, decode_content)
+        return b""
+
+    def close(self) -> None:
+        return None
+
+
+class _FakeConnectionPool:
+    def urlopen(self, method: str, url: str, **kwargs: object) -> _FakeUrllib3Response:
+        _ = (method, url, kwargs)
+        return _FakeUrllib3Response(status=200)
+
     def close(self) -> None:
         return None
 
@@ -97,7 +112,7 @@ class MirrorMembershipValidationTests(TestCase):
         from core import mirror_membership_validation_receivers
 
         mirror_membership_validation_receivers.connect_mirror_membership_validation_receivers()
-        self.mattermost_patch = patch("core.mattermost_webhooks.dispatch_mattermost_event", autospec=True)
+        self.mattermost_patch = patch("core.mattermost_webhooks._enqueue_dispatch", autospec=True)
         self.mattermost_patch.start()
         self.addCleanup(self.mattermost_patch.stop)
 
@@ -261,6 +276,77 @@ class MirrorMembershipValidationTests(TestCase):
         self.assertEqual(outcome.overall_status, MirrorMembershipValidation.Status.failed_terminal)
         self.assertFalse(outcome.should_retry)
 
+    def test_validation_run_checks_independent_checks_concurrently(self) -> None:
+        membership_request = self._create_user_request()
+        _ = membership_request.membership_type
+        # Each check waits for the other two, so this only finishes if they overlap.
+        barrier = threading.Barrier(3)
+
+        def waiting_check(result: dict[str, object]):
+            def check(*args: object, **kwargs: object) -> dict[str, object]:
+                barrier.wait(timeout=5)
+                return result
+
+            return check
+
+        with (
+            patch(
+                "core.mirror_membership_validation._validate_domain",
+                return_value={"status": "reachable", "url": "https://mirror.example.org", "http_status": 200},
+            ),
+            patch(
+                "core.mirror_membership_validation._validate_timestamp_files",
+                side_effect=waiting_check({"status": "up_to_date", "checked_urls": []}),
+            ),
+            patch(
+                "core.mirror_membership_validation._validate_almalinux_mirror_network_registration",
+                side_effect=waiting_check({"status": "registered"}),
+            ),
+            patch(
+                "core.mirror_membership_validation._validate_github_reference",
+                side_effect=waiting_check({"status": "valid"}),
+            ) as github_mock,
+            MirrorValidationRun(workers=2) as run,
+        ):
+            outcome = run.submit(run_validation, membership_request=membership_request).result(timeout=10)
+
+        self.assertEqual(outcome.overall_status, MirrorMembershipValidation.Status.completed)
+        self.assertEqual(github_mock.call_args.kwargs["expected_file_path"], "mirrors.d/mirror.example.org.yml")
+
+    def test_validation_run_shares_lookups_between_requests_for_the_same_mirror(self) -> None:
+        first = self._create_user_request()
+        second = self._create_org_request()
+        for membership_request in (first, second):
+            _ = membership_request.membership_type
+
+        with (
+            patch(
+                "core.mirror_membership_validation.socket.getaddrinfo",
+                return_value=[(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("93.184.216.34", 443))],
+            ) as getaddrinfo_mock,
+            patch(
+                "core.mirror_membership_validation._build_bound_connection_pool",
+                side_effect=lambda **kwargs: _FakeConnectionPool(),
+            ) as pool_mock,
+            patch("core.mirror_membership_validation.requests.get", side_effect=self._requests_get) as get_mock,
+            MirrorValidationRun(workers=4) as run,
+        ):
+            futures = [
+                run.submit(run_validation, membership_request=membership_request)
+                for membership_request in (first, second)
+            ]
+            outcomes = [future.result(timeout=10) for future in futures]
+
+        self.assertEqual(outcomes[0].result, outcomes[1].result)
+        self.assertEqual(outcomes[0].result["domain"]["status"], "reachable")
+        self.assertEqual(outcomes[0].result["timestamp"]["status"], "not_found")
+        # One domain fetch plus one per timestamp candidate, each resolved on its own, for both requests.
+        fetch_count = 1 + len(outcomes[0].result["timestamp"]["checked_urls"])
+        self.assertEqual(pool_mock.call_count, fetch_count)
+        self.assertEqual(getaddrinfo_mock.call_count, fetch_count)
+        # Mirror-network lookup, pull request and its diff, fetched once for both requests.
+        self.assertEqual(get_mock.call_count, 3)
+
     def _requests_get(self, url: str, **kwargs) -> _FakeResponse:
         _ = kwargs
         if url == "https://mirror.example.org":
@@ -23,6 +23,7 @@ class OperationsDailyCommandTests(TestCase):
                 call("membership_embargoed_members", force=False, dry_run=False),
                 call("selfservice_lifecycle_cleanup", dry_run=False),
                 call("account_invitations_refresh"),
+                call("membership_stats_rollup", dry_run=False),
             ],
         )
         self.assertTrue(
@@ -47,6 +48,7 @@ class OperationsDailyCommandTests(TestCase):
                 call("membership_embargoed_members", force=True, dry_run=False),
                 call("selfservice_lifecycle_cleanup", dry_run=False),
                 call("account_invitations_refresh"),
+                call("membership_stats_rollup", dry_run=False),
             ],
         )
 
@@ -67,6 +69,7 @@ class OperationsDailyCommandTests(TestCase):
                 call("membership_embargoed_members", force=False, dry_run=True),
                 call("selfservice_lifecycle_cleanup", dry_run=True),
                 call("account_invitations_refresh"),
+                call("membership_stats_rollup", dry_run=True),
             ],
         )
 
@@ -32,13 +32,14 @@ from core.permissions import (
     ASTRA_VIEW_MEMBERSHIP,
 )
 from core.templated_email import configured_email_template_names
-from core.tests.utils_test_data import ensure_core_categories
+from core.tests.utils_test_data import GetManyViaGetMixin, ensure_core_categories
 
 
-class OrganizationUserViewsTests(TestCase):
+class OrganizationUserViewsTests(GetManyViaGetMixin, TestCase):
     _test_media_root = Path(mkdtemp(prefix="alx_test_media_"))
 
     def setUp(self) -> None:
+        super().setUp()
         self._country_code_patcher = patch(
             "core.views_membership.user.block_action_without_country_code",
             return_value=None,
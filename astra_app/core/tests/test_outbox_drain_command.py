@@ -0,0 +1,48 @@
+import os
+import signal
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import TransactionTestCase
+
+from core.outbox import DrainResult
+
+
+def _result(*, claimed: int = 0, delivered: int = 0) -> DrainResult:
+    return DrainResult(claimed=claimed, reclaimed=0, delivered=delivered, retried=0, failed=0, max_latency_ms=None)
+
+
+class TestOutboxDrainWorker(TransactionTestCase):
+    # The command closes the connection after a failed iteration, which a TestCase transaction cannot survive.
+    def test_loop_without_max_seconds_runs_until_sigterm(self) -> None:
+        results = iter([_result(claimed=1, delivered=1), _result()])
+
+        def drain(*, batch_size: int) -> DrainResult:
+            result = next(results, None)
+            if result is None:
+                os.kill(os.getpid(), signal.SIGTERM)
+                return _result()
+            return result
+
+        previous_handler = signal.getsignal(signal.SIGTERM)
+        stdout = StringIO()
+        with patch("core.management.commands.outbox_drain.drain_outbox", side_effect=drain) as drain_mock:
+            call_command("outbox_drain", "--loop", "--poll-interval", "0.01", stdout=stdout)
+
+        self.assertEqual(drain_mock.call_count, 3)
+        self.assertIn("1 delivered, 0 to retry, 0 failed, 0 purged.", stdout.getvalue())
+        self.assertIs(signal.getsignal(signal.SIGTERM), previous_handler)
+
+    def test_loop_keeps_running_after_a_failed_iteration(self) -> None:
+        stdout = StringIO()
+        with (
+            patch(
+                "core.management.commands.outbox_drain.drain_outbox",
+                side_effect=[RuntimeError("database went away"), _result(claimed=1, delivered=1), _result()],
+            ),
+            self.assertLogs("core.management.commands.outbox_drain", level="ERROR"),
+        ):
+            call_command("outbox_drain", "--loop", "--poll-interval", "0.01", "--max-seconds", "0.05", stdout=stdout)
+
+        self.assertIn("1 delivered", stdout.getvalue())
@@ -0,0 +1,109 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from core.freeipa.user import FreeIPAUser
+from core.models import FreeIPAPermissionGrant
+from core.permission_grants import (
+    _GRANTS_GENERATION_CACHE_KEY,
+    begin_permission_request_scope,
+    end_permission_request_scope,
+    permission_grant_snapshot,
+)
+
+
+def _grant_queries(context: CaptureQueriesContext) -> list[str]:
+    return [q["sql"] for q in context.captured_queries if "core_freeipapermissiongrant" in q["sql"]]
+
+
+class PermissionGrantSnapshotTests(TestCase):
+    # The membership-committee group already holds seeded membership grants, so
+    # these tests grant through a group of their own.
+    def setUp(self) -> None:
+        FreeIPAPermissionGrant.objects.create(
+            permission="astra.view_membership",
+            principal_type=FreeIPAPermissionGrant.PrincipalType.group,
+            principal_name="grant-snapshot-viewers",
+        )
+        FreeIPAPermissionGrant.objects.create(
+            permission="astra.add_membership",
+            principal_type=FreeIPAPermissionGrant.PrincipalType.user,
+            principal_name="alice",
+        )
+        self.addCleanup(end_permission_request_scope)
+
+    def _user(self) -> FreeIPAUser:
+        return FreeIPAUser("alice", {"uid": ["alice"], "memberof_group": ["grant-snapshot-viewers"]})
+
+    def test_repeated_has_perm_in_request_scope_loads_grants_once(self) -> None:
+        user = self._user()
+        begin_permission_request_scope()
+
+        with CaptureQueriesContext(connection) as ctx:
+            for _ in range(5):
+                self.assertTrue(user.has_perm("astra.view_membership"))
+                self.assertTrue(user.has_perm("astra.add_membership"))
+                self.assertFalse(user.has_perm("astra.delete_membership"))
+                self.assertTrue(user.has_module_perms("astra"))
+
+        self.assertEqual(len(_grant_queries(ctx)), 1)
+
+    def test_grant_changes_are_visible_within_the_same_request(self) -> None:
+        user = self._user()
+        begin_permission_request_scope()
+        self.assertFalse(user.has_perm("astra.delete_membership"))
+
+        grant = FreeIPAPermissionGrant.objects.create(
+            permission="astra.delete_membership",
+            principal_type=FreeIPAPermissionGrant.PrincipalType.user,
+            principal_name="alice",
+        )
+        self.assertTrue(user.has_perm("astra.delete_membership"))
+
+        grant.delete()
+        self.assertFalse(user.has_perm("astra.delete_membership"))
+
+    def test_grant_changes_bump_the_shared_generation_on_commit(self) -> None:
+        generation = cache.get(_GRANTS_GENERATION_CACHE_KEY)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            grant = FreeIPAPermissionGrant.objects.create(
+                permission="astra.delete_membership",
+                principal_type=FreeIPAPermissionGrant.PrincipalType.user,
+                principal_name="alice",
+            )
+            grant.delete()
+            self.assertEqual(cache.get(_GRANTS_GENERATION_CACHE_KEY), generation)
+
+        self.assertNotEqual(cache.get(_GRANTS_GENERATION_CACHE_KEY), generation)
+
+    @override_settings(FREEIPA_PERMISSION_GRANT_CACHE_SECONDS=0)
+    def test_scope_end_drops_the_pinned_snapshot(self) -> None:
+        begin_permission_request_scope()
+        first = permission_grant_snapshot()
+        self.assertIs(permission_grant_snapshot(), first)
+
+        end_permission_request_scope()
+        begin_permission_request_scope()
+        self.assertIsNot(permission_grant_snapshot(), first)
+
+    @override_settings(FREEIPA_PERMISSION_GRANT_CACHE_SECONDS=60)
+    def test_process_cache_reuses_snapshot_across_requests_until_invalidated(self) -> None:
+        user = self._user()
+        FreeIPAPermissionGrant.objects.filter(permission="astra.add_membership").delete()
+
+        with CaptureQueriesContext(connection) as ctx:
+            for _ in range(3):
+                begin_permission_request_scope()
+                self.assertTrue(user.has_perm("astra.view_membership"))
+                end_permission_request_scope()
+        self.assertEqual(len(_grant_queries(ctx)), 1)
+
+        FreeIPAPermissionGrant.objects.create(
+            permission="astra.add_membership",
+            principal_type=FreeIPAPermissionGrant.PrincipalType.user,
+            principal_name="alice",
+        )
+        begin_permission_request_scope()
+        self.assertTrue(user.has_perm("astra.add_membership"))
@@ -0,0 +1,102 @@
+import datetime
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+from django.core.cache import cache
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+
+from core.freeipa.agreement import FreeIPAFASAgreement
+from core.freeipa.client import _annotate_freeipa_response_span
+from core.freeipa.group import FreeIPAGroup
+from core.freeipa.local_cache import freeipa_local_cache
+from core.freeipa.user import FreeIPAUser
+from core.middleware import RequestProfilingMiddleware, StructuredAccessLogMiddleware
+from core.models import Note
+from core.request_profiling import profile_request
+
+
+def _rpc_response(method: str, *, size: int) -> Mock:
+    response = Mock()
+    response.raw.connection = None
+    response.headers = {"Content-Length": str(size)}
+    response.elapsed = datetime.timedelta(milliseconds=20)
+    response.request.body = f'{{"method": "{method}", "params": [[], {{}}], "id": 0}}'.encode()
+    return response
+
+
+class RequestProfilingTests(TestCase):
+    def test_profile_counts_freeipa_rpcs_cache_families_and_queries(self) -> None:
+        with profile_request() as profile:
+            _annotate_freeipa_response_span(_rpc_response("user_show", size=100))
+            _annotate_freeipa_response_span(_rpc_response("user_show", size=50))
+            _annotate_freeipa_response_span(_rpc_response("group_find", size=10))
+            freeipa_local_cache.get("freeipa_user_alice")
+            freeipa_local_cache.set("freeipa_user_alice", {"uid": ["alice"]})
+            freeipa_local_cache.get_many(["freeipa_user_alice", "freeipa_group_admins"])
+
+        _annotate_freeipa_response_span(_rpc_response("user_show", size=1))
+        fields = profile.log_fields()
+        self.assertEqual(fields["freeipa_rpc_count"], 3)
+        self.assertEqual(fields["freeipa_rpc_methods"], "group_find=1,user_show=2")
+        self.assertEqual(fields["freeipa_response_bytes"], 160)
+        self.assertEqual(fields["freeipa_duration_ms"], 60)
+        self.assertEqual((fields["freeipa_cache_hits"], fields["freeipa_cache_misses"]), (1, 2))
+        self.assertEqual(fields["freeipa_cache_misses_by_family"], "freeipa_group=1,freeipa_user=1")
+        self.assertEqual(fields["freeipa_cache_sets"], 1)
+
+        with profile_request() as db_profile:
+            Note.objects.count()
+        self.assertEqual(db_profile.db_queries, 1)
+
+    def test_profile_counts_user_group_and_agreement_list_reads(self) -> None:
+        cache.clear()
+        users = {"result": [{"uid": ["alice"]}]}
+        groups = {"result": [{"cn": ["admins"]}]}
+        agreements = {"result": [{"cn": ["cla"]}]}
+
+        with (
+            patch("core.freeipa.user._with_freeipa_service_client_retry", return_value=users),
+            patch("core.freeipa.group._with_freeipa_service_client_retry", return_value=groups),
+            patch("core.freeipa.agreement._with_freeipa_service_client_retry", return_value=agreements),
+            profile_request() as profile,
+        ):
+            for _ in range(2):
+                FreeIPAUser.all()
+                FreeIPAGroup.all()
+                FreeIPAFASAgreement.all()
+            FreeIPAUser.warm_user_cache(["alice"])
+
+        self.assertEqual(
+            dict(profile.cache_misses),
+            {"freeipa_users_all": 1, "freeipa_groups_all": 1, "freeipa_fasagreements_all": 1},
+        )
+        self.assertEqual(
+            dict(profile.cache_hits),
+            {"freeipa_users_all": 2, "freeipa_groups_all": 1, "freeipa_fasagreements_all": 1},
+        )
+        self.assertEqual(profile.cache_sets["freeipa_users_all"], 1)
+
+    def test_middleware_adds_totals_to_access_log_and_server_timing(self) -> None:
+        with self.assertRaises(MiddlewareNotUsed):
+            RequestProfilingMiddleware(lambda _req: HttpResponse("ok"))
+
+        def view(_request):
+            _annotate_freeipa_response_span(_rpc_response("user_find", size=5))
+            return HttpResponse("ok")
+
+        request = RequestFactory().get("/groups/")
+        request.user = SimpleNamespace(is_authenticated=True, username="alice")
+        with (
+            override_settings(REQUEST_PROFILING_ENABLED=True),
+            patch("core.middleware.access_logger.info", autospec=True) as mocked_info,
+        ):
+            middleware = RequestProfilingMiddleware(StructuredAccessLogMiddleware(view))
+            response = middleware(request)
+
+        extra = mocked_info.call_args.kwargs["extra"]
+        self.assertEqual(extra["freeipa_rpc_count"], 1)
+        self.assertEqual(extra["freeipa_rpc_methods"], "user_find=1")
+        self.assertIn("db_query_count", extra)
+        self.assertIn('freeipa;dur=20.0;desc="1 rpc"', response["Server-Timing"])
@@ -11,7 +11,13 @@ from django.urls import reverse
 
 from core.freeipa.client import clear_current_viewer_username, set_current_viewer_username
 from core.freeipa.user import FreeIPAUser
-from core.models import AccountInvitation, AccountInvitationSend, FreeIPAPermissionGrant, Organization
+from core.models import (
+    AccountInvitation,
+    AccountInvitationSend,
+    FreeIPAPermissionGrant,
+    Organization,
+    OutboxMessage,
+)
 from core.permissions import ASTRA_ADD_SEND_MAIL
 from core.views_send_mail import _CSV_SESSION_KEY, _PREVIEW_CONTEXT_SESSION_KEY, SendMailForm, _parse_csv_upload
 
@@ -500,7 +506,7 @@ class SendMailTests(TestCase):
             patch("core.freeipa.user.FreeIPAUser.get", return_value=reviewer),
             patch("core.freeipa.group.FreeIPAGroup.all", return_value=[]),
             patch("core.freeipa.user.FreeIPAUser.all", return_value=[]),
-            patch("core.views_send_mail.queue_composed_email") as queue_mock,
+            patch("core.send_mail_delivery.queue_composed_email") as queue_mock,
         ):
             queue_mock.return_value = type("_QueuedEmail", (), {"id": 1})()
             resp = self.client.post(
@@ -522,6 +528,34 @@ class SendMailTests(TestCase):
         self.assertNotContains(resp, "already been approved")
         self.assertNotContains(resp, "No email has been sent yet")
 
+    @override_settings(SEND_MAIL_BACKGROUND_THRESHOLD=2)
+    def test_background_send_with_broken_template_is_rejected_before_queueing(self) -> None:
+        self._login_as_freeipa_user("reviewer")
+        reviewer = FreeIPAUser("reviewer", {"uid": ["reviewer"], "memberof_group": [settings.FREEIPA_MEMBERSHIP_COMMITTEE_GROUP]})
+
+        with (
+            patch("core.freeipa.user.FreeIPAUser.get", return_value=reviewer),
+            patch("core.freeipa.group.FreeIPAGroup.all", return_value=[]),
+            patch("core.freeipa.user.FreeIPAUser.all", return_value=[]),
+        ):
+            resp = self.client.post(
+                reverse("send-mail"),
+                data={
+                    "recipient_mode": "manual",
+                    "manual_to": "alice@example.com, bob@example.com",
+                    "action": "send",
+                    "subject": "Hello {% if %}",
+                    "html_content": "",
+                    "text_content": "Hi {{ email }}",
+                },
+            )
+
+        self.assertEqual(resp.status_code, 200)
+        errors = self._send_mail_initial_payload(resp)["form"]["non_field_errors"]
+        self.assertEqual(len(errors), 1)
+        self.assertTrue(errors[0].startswith("Template error:"))
+        self.assertFalse(OutboxMessage.objects.exists())
+
     def test_get_extra_query_params_are_added_to_context(self) -> None:
         self._login_as_freeipa_user("reviewer")
         reviewer = FreeIPAUser("reviewer", {"uid": ["reviewer"], "memberof_group": [settings.FREEIPA_MEMBERSHIP_COMMITTEE_GROUP]})
@@ -894,7 +928,7 @@ class SendMailTests(TestCase):
             patch("core.freeipa.user.FreeIPAUser.get", return_value=reviewer),
             patch("core.freeipa.group.FreeIPAGroup.all", return_value=[]),
             patch("core.freeipa.user.FreeIPAUser.all", return_value=[]),
-            patch("core.views_send_mail.queue_composed_email") as queue_mock,
+            patch("core.send_mail_delivery.queue_composed_email") as queue_mock,
         ):
             resp = self.client.post(
                 reverse("send-mail"),
@@ -941,7 +975,7 @@ class SendMailTests(TestCase):
             patch("core.freeipa.user.FreeIPAUser.get", return_value=reviewer),
             patch("core.freeipa.group.FreeIPAGroup.all", return_value=[]),
             patch("core.freeipa.user.FreeIPAUser.all", return_value=[]),
-            patch("core.views_send_mail.queue_composed_email") as queue_mock,
+            patch("core.send_mail_delivery.queue_composed_email") as queue_mock,
         ):
             queue_mock.return_value = type("_QueuedEmail", (), {"id": 1})()
             response = self.client.post(
@@ -1001,7 +1035,7 @@ class SendMailTests(TestCase):
             patch("core.freeipa.user.FreeIPAUser.get", return_value=reviewer),
             patch("core.freeipa.group.FreeIPAGroup.all", return_value=[]),
             patch("core.freeipa.user.FreeIPAUser.all", return_value=[]),
-            patch("core.views_send_mail.queue_composed_email", side_effect=_queue_email),
+            patch("core.send_mail_delivery.queue_composed_email", side_effect=_queue_email),
         ):
             response = self.client.post(
                 reverse("send-mail"),
@@ -1264,7 +1298,7 @@ class SendMailTests(TestCase):
             patch("core.freeipa.user.FreeIPAUser.get", side_effect=_get_user),
             patch("core.freeipa.group.FreeIPAGroup.get", return_value=_FakeGroup()),
             patch("core.freeipa.group.FreeIPAGroup.all", return_value=[_FakeGroup()]),
-            patch("core.views_send_mail.queue_composed_email") as queue_mock,
+            patch("core.send_mail_delivery.queue_composed_email") as queue_mock,
         ):
             queue_mock.return_value = type("_QueuedEmail", (), {"id": 1})()
             resp = self.client.post(
@@ -1338,7 +1372,7 @@ class SendMailTests(TestCase):
             patch("core.freeipa.user.FreeIPAUser.get", side_effect=_get_user),
             patch("core.freeipa.group.FreeIPAGroup.get", return_value=_FakeGroup()),
             patch("core.freeipa.group.FreeIPAGroup.all", return_value=[_FakeGroup()]),
-            patch("core.views_send_mail.queue_composed_email") as queue_mock,
+            patch("core.send_mail_delivery.queue_composed_email") as queue_mock,
         ):
             queue_mock.return_value = type("_QueuedEmail", (), {"id": 1})()
             resp = self.client.post(
@@ -1405,7 +1439,7 @@ class SendMailTests(TestCase):
             patch("core.freeipa.user.FreeIPAUser.get", side_effect=_get_user),
             patch("core.freeipa.group.FreeIPAGroup.get", return_value=_FakeGroup()),
             patch("core.freeipa.group.FreeIPAGroup.all", return_value=[_FakeGroup()]),
-            patch("core.views_send_mail.queue_composed_email") as queue_mock,
+            patch("core.send_mail_delivery.queue_composed_email") as queue_mock,
         ):
             queue_mock.return_value = type("_QueuedEmail", (), {"id": 1})()
             resp = self.client.post(
@@ -1434,7 +1468,7 @@ class SendMailTests(TestCase):
         with (
             patch("core.freeipa.user.FreeIPAUser.get", return_value=reviewer),
             patch("core.freeipa.group.FreeIPAGroup.all", return_value=[]),
-            patch("core.views_send_mail.queue_composed_email") as queue_mock,
+            patch("core.send_mail_delivery.queue_composed_email") as queue_mock,
         ):
             queue_mock.return_value = type("_QueuedEmail", (), {"id": 1})()
             resp = self.client.post(
@@ -1464,7 +1498,7 @@ class SendMailTests(TestCase):
         with (
             patch("core.freeipa.user.FreeIPAUser.get", return_value=reviewer),
             patch("core.freeipa.group.FreeIPAGroup.all", return_value=[]),
-            patch("core.views_send_mail.queue_composed_email") as queue_mock,
+            patch("core.send_mail_delivery.queue_composed_email") as queue_mock,
         ):
             queue_mock.return_value = type("_QueuedEmail", (), {"id": 1})()
             resp = self.client.post(
@@ -1492,7 +1526,7 @@ class SendMailTests(TestCase):
         with (
             patch("core.freeipa.user.FreeIPAUser.get", return_value=reviewer),
             patch("core.freeipa.group.FreeIPAGroup.all", return_value=[]),
-            patch("core.views_send_mail.queue_composed_email") as queue_mock,
+            patch("core.send_mail_delivery.queue_composed_email") as queue_mock,
         ):
             queue_mock.return_value = type("_QueuedEmail", (), {"id": 1})()
             resp = self.client.post(
@@ -1533,7 +1567,7 @@ class SendMailTests(TestCase):
 
         with (
             patch("core.freeipa.user.FreeIPAUser.get", return_value=reviewer),
-            patch("core.views_send_mail.queue_composed_email") as queue_mock,
+            patch("core.send_mail_delivery.queue_composed_email") as queue_mock,
             patch("django.core.files.storage.default_storage.open", return_value=io.BytesIO(png_bytes)),
         ):
             queue_mock.return_value = type("_QueuedEmail", (), {"id": 1})()
@@ -1576,7 +1610,7 @@ class SendMailTests(TestCase):
             patch("core.freeipa.user.FreeIPAUser.get", return_value=reviewer),
             patch("core.freeipa.group.FreeIPAGroup.all", return_value=[]),
             patch(
-                "core.views_send_mail.queue_composed_email",
+                "core.send_mail_delivery.queue_composed_email",
                 side_effect=[first_error, queued_email],
             ) as queue_mock,
         ):
@@ -1608,7 +1642,7 @@ class SendMailTests(TestCase):
         with (
             patch("core.freeipa.user.FreeIPAUser.get", return_value=reviewer),
             patch("core.freeipa.group.FreeIPAGroup.all", return_value=[]),
-            patch("core.views_send_mail.queue_composed_email") as queue_composed_mock,
+            patch("core.send_mail_delivery.queue_composed_email") as queue_composed_mock,
             patch("core.account_invitations.queue_templated_email", return_value=SimpleNamespace(id=777)),
         ):
             response = self.client.post(
@@ -1656,7 +1690,7 @@ class SendMailTests(TestCase):
         with (
             patch("core.freeipa.user.FreeIPAUser.get", return_value=reviewer),
             patch("core.freeipa.group.FreeIPAGroup.all", return_value=[]),
-            patch("core.views_send_mail.queue_composed_email") as queue_composed_mock,
+            patch("core.send_mail_delivery.queue_composed_email") as queue_composed_mock,
             patch("core.account_invitations.queue_templated_email", return_value=SimpleNamespace(id=777)) as queue_mock,
         ):
             response = self.client.post(
@@ -1695,7 +1729,7 @@ class SendMailTests(TestCase):
             patch("core.freeipa.user.FreeIPAUser.get", return_value=reviewer),
             patch("core.freeipa.group.FreeIPAGroup.all", return_value=[]),
             patch("core.views_send_mail.allow_request", return_value=False),
-            patch("core.views_send_mail.queue_composed_email") as queue_composed_mock,
+            patch("core.send_mail_delivery.queue_composed_email") as queue_composed_mock,
             patch("core.account_invitations.queue_templated_email") as queue_templated_mock,
         ):
             response = self.client.post(
@@ -1734,7 +1768,7 @@ class SendMailTests(TestCase):
         with (
             patch("core.freeipa.user.FreeIPAUser.get", return_value=reviewer),
             patch("core.freeipa.group.FreeIPAGroup.all", return_value=[]),
-            patch("core.views_send_mail.queue_composed_email") as queue_composed_mock,
+            patch("core.send_mail_delivery.queue_composed_email") as queue_composed_mock,
             patch("core.account_invitations.queue_templated_email") as queue_templated_mock,
         ):
             response = self.client.post(
@@ -1769,7 +1803,7 @@ class SendMailTests(TestCase):
         with (
             patch("core.freeipa.user.FreeIPAUser.get", return_value=reviewer),
             patch("core.freeipa.group.FreeIPAGroup.all", return_value=[]),
-            patch("core.views_send_mail.queue_composed_email") as queue_composed_mock,
+            patch("core.send_mail_delivery.queue_composed_email") as queue_composed_mock,
             patch("core.account_invitations.queue_templated_email") as queue_templated_mock,
         ):
             response = self.client.post(
@@ -1808,7 +1842,7 @@ class SendMailTests(TestCase):
             patch("core.freeipa.user.FreeIPAUser.get", return_value=reviewer),
             patch("core.freeipa.group.FreeIPAGroup.all", return_value=[]),
             patch("core.freeipa.user.FreeIPAUser.all", return_value=[]),
-            patch("core.views_send_mail.queue_composed_email") as queue_composed_mock,
+            patch("core.send_mail_delivery.queue_composed_email") as queue_composed_mock,
             patch("core.account_invitations.queue_templated_email") as queue_templated_mock,
         ):
             response = self.client.post(
@@ -0,0 +1,125 @@
+import datetime
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from post_office.models import Email
+
+from core import templated_email
+from core.models import OutboxMessage
+from core.outbox import claim_outbox_batch, drain_outbox
+from core.send_mail_delivery import (
+    deliver_send_mail_chunks,
+    enqueue_send_mail_job,
+    queue_recipient_emails,
+    send_mail_job_progress,
+)
+
+
+def _recipients(count: int) -> list[dict[str, str]]:
+    return [{"email": f"user{index}@example.com", "first_name": f"User{index}"} for index in range(count)]
+
+
+class SendMailDeliveryTests(TestCase):
+    @override_settings(SEND_MAIL_CHUNK_SIZE=2)
+    def test_templates_compile_once_and_emails_insert_in_chunks(self) -> None:
+        chunk_sizes: list[int] = []
+
+        def bulk_save(emails: list[Email], **kwargs: object) -> None:
+            chunk_sizes.append(len(emails))
+            templated_email.bulk_save_emails(emails, **kwargs)
+
+        with (
+            patch(
+                "core.templated_email.stage_inline_images_for_sending",
+                wraps=templated_email.stage_inline_images_for_sending,
+            ) as stage_mock,
+            patch("core.send_mail_delivery.bulk_save_emails", side_effect=bulk_save),
+        ):
+            result = queue_recipient_emails(
+                recipients=[*_recipients(5), {"email": "", "first_name": "Nobody"}],
+                subject="Hello {{ first_name }}",
+                text_content="Hi {{ first_name }}",
+                html_content="<p>Hi {{ first_name }}</p>",
+                cc=[],
+                bcc=[],
+                reply_to=[],
+            )
+
+        self.assertEqual((result.queued, result.failed), (5, 0))
+        stage_mock.assert_called_once()
+        self.assertEqual(chunk_sizes, [2, 2, 1])
+        self.assertEqual(
+            sorted(Email.objects.values_list("subject", flat=True)),
+            [f"Hello User{index}" for index in range(5)],
+        )
+
+    def test_broken_template_fails_every_recipient(self) -> None:
+        result = queue_recipient_emails(
+            recipients=_recipients(3),
+            subject="Hello {% if %}",
+            text_content="Hi",
+            html_content="",
+            cc=[],
+            bcc=[],
+            reply_to=[],
+        )
+
+        self.assertEqual((result.queued, result.failed), (0, 3))
+        self.assertIsInstance(result.first_error, ValueError)
+        self.assertFalse(Email.objects.exists())
+
+    @override_settings(SEND_MAIL_CHUNK_SIZE=2)
+    def test_background_job_is_delivered_by_outbox_drain_and_reports_progress(self) -> None:
+        job_id = enqueue_send_mail_job(
+            recipients=_recipients(3),
+            subject="Hello {{ first_name }}",
+            text_content="Hi {{ first_name }}",
+            html_content="",
+            cc=[],
+            bcc=["archive@example.com"],
+            reply_to=[],
+            actor_username="reviewer",
+        )
+
+        self.assertEqual(OutboxMessage.objects.filter(kind=OutboxMessage.Kind.send_mail_chunk).count(), 2)
+        self.assertFalse(Email.objects.exists())
+        progress = send_mail_job_progress(job_id)
+        assert progress is not None
+        self.assertEqual((progress["recipients"], progress["done_chunks"], progress["finished"]), (3, 0, False))
+
+        drain_outbox(batch_size=10)
+
+        self.assertEqual(Email.objects.count(), 3)
+        self.assertEqual(Email.objects.filter(bcc="archive@example.com").count(), 3)
+        progress = send_mail_job_progress(job_id)
+        assert progress is not None
+        self.assertEqual(progress["processed_recipients"], 3)
+        self.assertTrue(progress["finished"])
+        self.assertIsNone(send_mail_job_progress("unknown"))
+
+    @override_settings(SEND_MAIL_CHUNK_SIZE=2)
+    def test_inserted_chunk_is_not_redelivered_after_its_claim_expires(self) -> None:
+        enqueue_send_mail_job(
+            recipients=_recipients(3),
+            subject="Hello {{ first_name }}",
+            text_content="Hi {{ first_name }}",
+            html_content="",
+            cc=[],
+            bcc=[],
+            reply_to=[],
+            actor_username="reviewer",
+        )
+        batch, _reclaimed = claim_outbox_batch(now=timezone.now(), batch_size=10)
+
+        # The worker dies after the handler runs, before the drain saves the batch.
+        self.assertEqual(deliver_send_mail_chunks(batch), {})
+        with patch("core.outbox.timezone.now", return_value=timezone.now() + datetime.timedelta(days=1)):
+            result = drain_outbox(batch_size=10)
+
+        self.assertEqual(result.claimed, 0)
+        self.assertEqual(Email.objects.count(), 3)
+        self.assertEqual(
+            set(OutboxMessage.objects.values_list("status", flat=True)),
+            {OutboxMessage.Status.delivered},
+        )
@@ -44,7 +44,7 @@ class SendMailMembershipContactedNoteTests(TestCase):
 
         with (
             patch("core.freeipa.user.FreeIPAUser.get", return_value=reviewer),
-            patch("core.views_send_mail.queue_composed_email") as queue_mock,
+            patch("core.send_mail_delivery.queue_composed_email") as queue_mock,
         ):
             queue_mock.return_value = type("_QueuedEmail", (), {"id": 4242})()
             resp = self.client.post(
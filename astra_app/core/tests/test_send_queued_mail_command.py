@@ -1,6 +1,9 @@
 
+from io import StringIO
 from unittest.mock import MagicMock, patch
 
+from django.core.management import call_command
+from django.core.management.base import CommandError
 from django.test import SimpleTestCase, TestCase
 from post_office.models import STATUS as POST_OFFICE_STATUS
 from post_office.models import Email as PostOfficeEmail
@@ -373,3 +376,39 @@ class TestSendQueuedMailQuotaAlerts(TestCase):
             command_module.Command().handle()
 
         warning_mock.assert_not_called()
+
+
+class TestSendQueuedMailWorker(TestCase):
+    def test_loop_sends_queued_mail_and_reports_status(self) -> None:
+        from core_commands.management.commands import send_queued_mail as command_module
+
+        email = PostOfficeEmail.objects.create(
+            from_email="from@example.com",
+            to="alice@example.com",
+            subject="Worker test",
+            message="body",
+            status=POST_OFFICE_STATUS.queued,
+            backend_alias="default",
+        )
+
+        def send_queued(processes: int, log_level: int | None) -> tuple[int, int, int]:
+            sent = PostOfficeEmail.objects.filter(status=POST_OFFICE_STATUS.queued).update(status=POST_OFFICE_STATUS.sent)
+            return sent, 0, 0
+
+        stdout = StringIO()
+        with patch.object(command_module, "send_queued", side_effect=send_queued) as send_mock:
+            call_command("send_queued_mail", "--loop", "--poll-interval", "0.01", "--max-seconds", "0.05", stdout=stdout)
+
+        send_mock.assert_called_once()
+        email.refresh_from_db()
+        self.assertEqual(email.status, POST_OFFICE_STATUS.sent)
+        self.assertIn("1 sent, 0 failed, 0 requeued.", stdout.getvalue())
+
+        status_out = StringIO()
+        call_command("send_queued_mail", "--status", stdout=status_out)
+        self.assertIn("sent: 1", status_out.getvalue())
+        self.assertIn("lock_held: True", status_out.getvalue())
+
+    def test_status_fails_without_a_recent_worker(self) -> None:
+        with self.assertRaises(CommandError):
+            call_command("send_queued_mail", "--status", stdout=StringIO())
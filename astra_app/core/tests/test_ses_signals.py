@@ -1,24 +1,31 @@
 import queue
 import threading
+from io import StringIO
 from unittest.mock import patch
 
 from django.apps import apps
 from django.contrib import admin
+from django.core.management import call_command
 from django.db import IntegrityError, close_old_connections, connection
 from django.test import SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django_ses.signals import bounce_received, click_received, complaint_received, message_sent, open_received
 from post_office.models import STATUS as POST_OFFICE_STATUS
 from post_office.models import Email as PostOfficeEmail
 from post_office.models import Log as PostOfficeLog
 from post_office.models import RecipientDeliveryStatus
 
+from core.models import OutboxMessage
+from core.outbox import drain_outbox
 from core.ses_signals import (
+    SESMilestoneEvent,
     _matched_post_office_email,
     _message_id_hash,
     handle_ses_bounce_received,
     handle_ses_complaint_received,
     handle_ses_delivery_received,
     handle_ses_send_received,
+    ingest_ses_events,
 )
 
 
@@ -1145,4 +1152,129 @@ class SESPostOfficeConcurrencyTests(TransactionTestCase):
             {RecipientDeliveryStatus.DELIVERED}
             if RecipientDeliveryStatus.ACCEPTED not in milestone_statuses
             else {RecipientDeliveryStatus.ACCEPTED, RecipientDeliveryStatus.DELIVERED},
-        )
\ No newline at end of file
+        )
+
+def _delivery_event(message_id: str) -> SESMilestoneEvent:
+    return SESMilestoneEvent(
+        ses_event_type="delivery",
+        mail_obj={"commonHeaders": {"messageId": message_id}},
+        recipient_domain="example.com",
+        event_source="django_ses.delivery_received",
+        recipient_delivery_status=RecipientDeliveryStatus.DELIVERED,
+        exception_type="SESDelivery",
+        message="SES delivered to destination mail server",
+    )
+
+
+def _send_event(message_id: str) -> SESMilestoneEvent:
+    return SESMilestoneEvent(
+        ses_event_type="send",
+        mail_obj={"commonHeaders": {"messageId": message_id}},
+        recipient_domain="example.com",
+        event_source="django_ses.send_received",
+        recipient_delivery_status=RecipientDeliveryStatus.ACCEPTED,
+        exception_type="SESSend",
+        message="SES accepted by provider",
+    )
+
+
+class SESBatchedIngestionTests(TestCase):
+    def _create_email(self, *, message_id: str) -> PostOfficeEmail:
+        return PostOfficeEmail.objects.create(
+            from_email="from@example.com",
+            to="to@example.com",
+            subject="Test",
+            message="Test message",
+            message_id=message_id,
+            status=POST_OFFICE_STATUS.sent,
+        )
+
+    def test_batch_applies_precedence_and_suppresses_duplicates(self) -> None:
+        first = self._create_email(message_id="<batch-1@example.com>")
+        second = self._create_email(message_id="<batch-2@example.com>")
+
+        outcomes = ingest_ses_events([
+            _send_event("<batch-1@example.com>"),
+            _delivery_event("<batch-1@example.com>"),
+            _delivery_event("<batch-1@example.com>"),
+            _delivery_event("<batch-2@example.com>"),
+            _send_event("<batch-2@example.com>"),
+            _delivery_event("<missing@example.com>"),
+        ])
+
+        self.assertEqual(outcomes, [
+            "recorded",
+            "recorded",
+            "stale_or_duplicate",
+            "recorded",
+            "stale_or_duplicate",
+            "missing_match",
+        ])
+        first.refresh_from_db()
+        second.refresh_from_db()
+        self.assertEqual(first.recipient_delivery_status, RecipientDeliveryStatus.DELIVERED)
+        self.assertEqual(second.recipient_delivery_status, RecipientDeliveryStatus.DELIVERED)
+        self.assertEqual(
+            list(PostOfficeLog.objects.filter(email=first).order_by("id").values_list("status", flat=True)),
+            [RecipientDeliveryStatus.ACCEPTED, RecipientDeliveryStatus.DELIVERED],
+        )
+        self.assertEqual(PostOfficeLog.objects.filter(email=second).count(), 1)
+
+    def test_batch_query_count_does_not_grow_with_batch_size(self) -> None:
+        def run(prefix: str, size: int) -> int:
+            for index in range(size):
+                self._create_email(message_id=f"<{prefix}-{index}@example.com>")
+            events = [_delivery_event(f"<{prefix}-{index}@example.com>") for index in range(size)]
+            with CaptureQueriesContext(connection) as ctx:
+                ingest_ses_events(events)
+            return len(ctx.captured_queries)
+
+        self.assertEqual(run("small", 2), run("large", 20))
+
+    @override_settings(SES_EVENT_BATCHING_ENABLED=True)
+    def test_signal_queues_event_and_outbox_drain_records_it(self) -> None:
+        email = self._create_email(message_id="<queued@example.com>")
+
+        handle_ses_delivery_received(
+            sender=self.__class__,
+            mail_obj={"messageId": "ses-queued", "commonHeaders": {"messageId": "<queued@example.com>", "to": ["x"]}},
+            delivery_obj={"recipients": ["to@example.com"]},
+            raw_message=b"{}",
+        )
+
+        email.refresh_from_db()
+        self.assertIsNone(email.recipient_delivery_status)
+        queued = OutboxMessage.objects.get(kind=OutboxMessage.Kind.ses_event)
+        self.assertEqual(
+            queued.payload["mail_obj"],
+            {"messageId": "ses-queued", "commonHeaders": {"messageId": "<queued@example.com>"}},
+        )
+
+        result = drain_outbox(batch_size=10)
+
+        self.assertEqual(result.delivered, 1)
+        email.refresh_from_db()
+        self.assertEqual(email.recipient_delivery_status, RecipientDeliveryStatus.DELIVERED)
+
+    def test_replay_command_reingests_failed_events(self) -> None:
+        email = self._create_email(message_id="<replay@example.com>")
+        failed = OutboxMessage.objects.create(
+            kind=OutboxMessage.Kind.ses_event,
+            payload=_delivery_event("<replay@example.com>").to_payload(),
+            status=OutboxMessage.Status.failed_terminal,
+            last_error="boom",
+        )
+
+        out = StringIO()
+        call_command("ses_events_replay", stdout=out)
+
+        self.assertIn("1 recorded", out.getvalue())
+        email.refresh_from_db()
+        self.assertEqual(email.recipient_delivery_status, RecipientDeliveryStatus.DELIVERED)
+        failed.refresh_from_db()
+        self.assertEqual(failed.status, OutboxMessage.Status.delivered)
+        self.assertEqual(failed.last_error, "")
+
+        call_command("ses_events_replay", str(failed.pk), stdout=out)
+        self.assertIn("1 stale_or_duplicate", out.getvalue())
+        self.assertEqual(PostOfficeLog.objects.filter(email=email).count(), 1)
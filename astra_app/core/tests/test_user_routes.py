@@ -7,6 +7,7 @@ from unittest.mock import patch
 from django.test import RequestFactory, TestCase, override_settings
 
 from core.freeipa.user import FreeIPAUser
+from core.freeipa_directory import UserDirectoryEntry, _directory_entry
 from core.views_auth import FreeIPALoginView
 
 
@@ -25,6 +26,15 @@ class UserRoutesTests(TestCase):
             get_full_name=lambda: full_name,
         )
 
+    def _directory_entries(self, users: list[SimpleNamespace]) -> list[UserDirectoryEntry]:
+        return [
+            _directory_entry(
+                user.username,
+                {"uid": [user.username], "displayname": [user.get_full_name()], "mail": [user.email]},
+            )
+            for user in users
+        ]
+
     def test_user_profile_route_renders(self) -> None:
         username = "admin"
         self._login_as_freeipa(username)
@@ -75,7 +85,7 @@ class UserRoutesTests(TestCase):
         ]
 
         with (
-            patch("core.views_users.snapshot_freeipa_users", return_value=users, create=True),
+            patch("core.views_users.get_user_directory", return_value=self._directory_entries(users)),
             patch(
                 "core.views_users.FreeIPAUser.all",
                 side_effect=AssertionError("/api/v1/users must not use FreeIPAUser.all()"),
@@ -125,7 +135,7 @@ class UserRoutesTests(TestCase):
         ]
 
         with (
-            patch("core.views_users.snapshot_freeipa_users", return_value=users, create=True),
+            patch("core.views_users.get_user_directory", return_value=self._directory_entries(users)),
             patch(
                 "core.views_users.FreeIPAUser.all",
                 side_effect=AssertionError("/api/v1/users must not use FreeIPAUser.all()"),
@@ -153,7 +163,7 @@ class UserRoutesTests(TestCase):
         ]
 
         with (
-            patch("core.views_users.snapshot_freeipa_users", return_value=users, create=True),
+            patch("core.views_users.get_user_directory", return_value=self._directory_entries(users)),
             patch(
                 "core.views_users.FreeIPAUser.all",
                 side_effect=AssertionError("/api/v1/users must not use FreeIPAUser.all()"),
@@ -174,7 +184,7 @@ class UserRoutesTests(TestCase):
         self._login_as_freeipa("admin")
 
         with (
-            patch("core.views_users.snapshot_freeipa_users", return_value=[], create=True),
+            patch("core.views_users.get_user_directory", return_value=[]),
             patch(
                 "core.views_users.FreeIPAUser.all",
                 side_effect=AssertionError("/api/v1/users must not use FreeIPAUser.all()"),
@@ -210,7 +220,7 @@ class UserRoutesTests(TestCase):
         ]
 
         with (
-            patch("core.views_users.snapshot_freeipa_users", return_value=users, create=True),
+            patch("core.views_users.get_user_directory", return_value=self._directory_entries(users)),
             patch("core.views_users.serialize_pagination", wraps=lambda page_ctx: {"count": 999}, create=True) as serialize_mock,
         ):
             response = self.client.get("/api/v1/users")
@@ -239,7 +249,7 @@ class UserRoutesTests(TestCase):
             return f"https://avatar.example/{username}.png"
 
         with (
-            patch("core.views_users.snapshot_freeipa_users", return_value=users, create=True),
+            patch("core.views_users.get_user_directory", return_value=self._directory_entries(users)),
             patch(
                 "core.views_users.FreeIPAUser.all",
                 side_effect=AssertionError("/api/v1/users must not use FreeIPAUser.all()"),
@@ -1,5 +1,9 @@
+from collections.abc import Iterable
+from unittest.mock import patch
+
 from post_office.models import EmailTemplate
 
+from core.freeipa.user import FreeIPAUser
 from core.models import MembershipTypeCategory
 from core.templated_email import configured_email_template_names
 
@@ -40,3 +44,28 @@ def ensure_email_templates() -> None:
                 "html_content": f"<p>[{name}] Body</p>",
             },
         )
+
+
+def _get_many_via_get(usernames: Iterable[str], **kwargs: object) -> dict[str, FreeIPAUser]:
+    users: dict[str, FreeIPAUser] = {}
+    for username in dict.fromkeys(str(u or "").strip() for u in usernames):
+        if not username:
+            continue
+        user = FreeIPAUser.get(username)
+        if user is not None:
+            users[username] = user
+    return users
+
+
+class GetManyViaGetMixin:
+    """Resolve `FreeIPAUser.get_many` through `FreeIPAUser.get` in every test.
+
+    Tests that fake single-user lookups by patching `FreeIPAUser.get` then also
+    cover the views' bulk lookups. List it before `TestCase` in the bases.
+    """
+
+    def setUp(self) -> None:
+        super().setUp()
+        patcher = patch("core.freeipa.user.FreeIPAUser.get_many", side_effect=_get_many_via_get)
+        patcher.start()
+        self.addCleanup(patcher.stop)
@@ -140,6 +140,11 @@ urlpatterns = [
         views_send_mail.send_mail_render_preview,
         name="send-mail-render-preview",
     ),
+    path(
+        "email-tools/send-mail/jobs/<str:job_id>/",
+        views_send_mail.send_mail_job_progress_api,
+        name="send-mail-job-progress",
+    ),
 
     path(
         "email-tools/templates/<int:template_id>/json/",
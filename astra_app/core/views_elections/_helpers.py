@@ -178,9 +178,10 @@ def _load_candidate_users(usernames: set[str]) -> dict[str, FreeIPAUser]:
     If FreeIPA doesn't return a user (e.g. account deleted), a minimal
     FreeIPAUser is constructed so rendering stays consistent.
     """
+    found = FreeIPAUser.get_many(usernames)
     result: dict[str, FreeIPAUser] = {}
     for username in sorted(usernames):
-        user = FreeIPAUser.get(username)
+        user = found.get(username)
         if user is None:
             user = FreeIPAUser(username, {"uid": [username], "memberof_group": []})
         result[username] = user
@@ -7,7 +7,8 @@ from django.shortcuts import render
 from django.urls import reverse, reverse_lazy
 from django.views.decorators.http import require_GET
 
-from core.elections_services import election_quorum_status
+from core.elections_services import quorum_status_from_counts
+from core.elections_turnout import election_turnout_counts_by_id
 from core.models import Election
 from core.permissions import ASTRA_ADD_ELECTION, json_permission_required
 
@@ -27,10 +28,11 @@ def _build_elections_turnout_report_rows() -> list[dict[str, object]]:
         .order_by("start_datetime", "id")
     )
 
+    counts_by_election_id = election_turnout_counts_by_id(elections=elections)
     report_rows: list[dict[str, object]] = []
 
     for election in elections:
-        status = election_quorum_status(election=election)
+        status = quorum_status_from_counts(election=election, counts=counts_by_election_id[election.id])
         eligible_count = int(status.get("eligible_voter_count") or 0)
         eligible_weight = int(status.get("eligible_vote_weight_total") or 0)
         participating_count = int(status.get("participating_voter_count") or 0)
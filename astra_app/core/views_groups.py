@@ -18,7 +18,7 @@ from core.freeipa.circuit_breaker import _freeipa_circuit_open
 from core.freeipa.exceptions import FreeIPAOperationFailed
 from core.freeipa.group import FreeIPAGroup
 from core.freeipa.user import DegradedFreeIPAUser, FreeIPAUser
-from core.freeipa_directory import search_freeipa_users
+from core.freeipa_directory import get_group_search_index, search_freeipa_users
 from core.permissions import ASTRA_ADD_ELECTION
 from core.templatetags._user_helpers import try_get_full_name
 from core.views_utils import (
@@ -70,27 +70,12 @@ def _can_use_group_management_search(request: HttpRequest) -> bool:
 
 
 def _group_search_results(*, q: str, fas_only: bool) -> list[dict[str, str]]:
-    q_lower = q.lower()
-
     results: list[dict[str, str]] = []
-    for g in FreeIPAGroup.all():
-        if fas_only and not g.fas_group:
-            continue
-
-        if q_lower:
-            if q_lower not in g.cn.lower() and q_lower not in (g.description or "").lower():
-                continue
-
-        text = g.cn
-        desc = str(g.description or "").strip()
-        if desc:
-            text = f"{g.cn} — {desc}"
-
-        results.append({"id": g.cn, "text": text})
-        if len(results) >= 20:
-            break
-
-    results.sort(key=lambda r: r["id"].lower())
+    for entry in get_group_search_index().search(q, fas_only=fas_only, limit=20):
+        text = entry.cn
+        if entry.description:
+            text = f"{entry.cn} — {entry.description}"
+        results.append({"id": entry.cn, "text": text})
     return results
 
 
@@ -259,21 +244,10 @@ def _group_edit_payload(group: FreeIPAGroup) -> dict[str, object]:
 
 
 def _serialize_group_user_items(usernames: list[str]) -> dict[str, dict[str, str]]:
-    FreeIPAUser.warm_user_cache(usernames)
-    users_by_username: dict[str, FreeIPAUser] = {}
-    user_objects: list[FreeIPAUser] = []
-
-    for username in usernames:
-        if username in users_by_username:
-            continue
-        user = FreeIPAUser.get(username)
-        if user is None:
-            continue
-        users_by_username[username] = user
-        user_objects.append(user)
+    users_by_username = FreeIPAUser.get_many(usernames)
 
     avatar_url_by_username, _avatar_resolution_count, _avatar_fallback_count = resolve_avatar_urls_for_users(
-        user_objects,
+        list(users_by_username.values()),
         width=50,
         height=50,
     )
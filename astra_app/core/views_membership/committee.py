@@ -32,6 +32,7 @@ from core.membership_request_workflow import (
     _resolve_approval_template_name,
     approve_membership_request,
     approve_on_hold_membership_request,
+    coalesced_group_adds,
     ignore_membership_request,
     previous_expires_at_for_extension,
     put_membership_request_on_hold,
@@ -43,7 +44,7 @@ from core.membership_requests_datatables import (
     build_note_details,
     build_note_summary,
     build_on_hold_membership_request_queue,
-    build_pending_membership_request_queue,
+    build_pending_membership_request_page,
     resolve_requested_by,
 )
 from core.models import MembershipLog, MembershipRequest, Note
@@ -369,21 +370,19 @@ def membership_requests_pending_api(request: HttpRequest) -> JsonResponse:
         return _membership_requests_datatables_error(str(exc), status=400)
 
     selected_filter = queue_filter or "all"
-    snapshot = build_pending_membership_request_queue(
+    snapshot = build_pending_membership_request_page(
         selected_filter=selected_filter,
-        visible_membership_requests=visible_committee_membership_requests,
+        start=start,
+        length=length,
         resolve_requested_by_func=resolve_requested_by,
         lookup_users=FreeIPAUser.find_lightweight_by_usernames,
-        include_rows=True,
     )
-    pending_rows = list(snapshot["pending_rows"])
-    sliced_rows = pending_rows[start : start + length]
     payload = build_datatables_payload(
-        rows=sliced_rows,
+        rows=list(snapshot["pending_rows"]),
         records_total=int(snapshot["filter_counts"]["all"]),
         draw=draw,
     )
-    payload["recordsFiltered"] = len(pending_rows)
+    payload["recordsFiltered"] = int(snapshot["records_filtered"])
     payload["pending_filter"] = {
         "selected": selected_filter,
         "options": snapshot["filter_options"],
@@ -919,62 +918,66 @@ def membership_requests_bulk(request: HttpRequest) -> HttpResponse:
     ignored = 0
     failures = 0
 
-    for req in reqs:
-        if action == "approve":
-            try:
-                approve_membership_request(
-                    membership_request=req,
-                    actor_username=actor_username,
-                    send_approved_email=True,
-                )
-            except Exception:
-                logger.exception(
-                    "Bulk approve failed for membership request pk=%s",
-                    req.pk,
-                    extra=current_exception_log_fields(),
-                )
-                failures += 1
-                continue
-
-            approved += 1
-
-        elif action == "reject":
-            try:
-                _, email_error = reject_membership_request(
-                    membership_request=req,
-                    actor_username=actor_username,
-                    rejection_reason="",
-                    send_rejected_email=True,
-                )
-                if email_error is not None:
+    if action == "approve":
+        _prefetch_bulk_approval_users(reqs)
+
+    with coalesced_group_adds():
+        for req in reqs:
+            if action == "approve":
+                try:
+                    approve_membership_request(
+                        membership_request=req,
+                        actor_username=actor_username,
+                        send_approved_email=True,
+                    )
+                except Exception:
+                    logger.exception(
+                        "Bulk approve failed for membership request pk=%s",
+                        req.pk,
+                        extra=current_exception_log_fields(),
+                    )
                     failures += 1
-            except Exception:
-                logger.exception(
-                    "Bulk reject failed for membership request pk=%s",
-                    req.pk,
-                    extra=current_exception_log_fields(),
-                )
-                failures += 1
-                continue
-
-            rejected += 1
-
-        else:
-            try:
-                ignore_membership_request(
-                    membership_request=req,
-                    actor_username=actor_username,
-                )
-            except Exception:
-                logger.exception(
-                    "Bulk ignore failed for membership request pk=%s",
-                    req.pk,
-                    extra=current_exception_log_fields(),
-                )
-                failures += 1
-                continue
+                    continue
+
+                approved += 1
+
+            elif action == "reject":
+                try:
+                    _, email_error = reject_membership_request(
+                        membership_request=req,
+                        actor_username=actor_username,
+                        rejection_reason="",
+                        send_rejected_email=True,
+                    )
+                    if email_error is not None:
+                        failures += 1
+                except Exception:
+                    logger.exception(
+                        "Bulk reject failed for membership request pk=%s",
+                        req.pk,
+                        extra=current_exception_log_fields(),
+                    )
+                    failures += 1
+                    continue
+
+                rejected += 1
+
+            else:
+                try:
+                    ignore_membership_request(
+                        membership_request=req,
+                        actor_username=actor_username,
+                    )
+                except Exception:
+                    logger.exception(
+                        "Bulk ignore failed for membership request pk=%s",
+                        req.pk,
+                        extra=current_exception_log_fields(),
+                    )
+                    failures += 1
+                    continue
 
-            ignored += 1
+                ignored += 1
 
     if approved:
         messages.success(request, f"Approved {approved} request(s).")
@@ -991,6 +994,26 @@ def membership_requests_bulk(request: HttpRequest) -> HttpResponse:
     return redirect(redirect_to)
 
 
+def _prefetch_bulk_approval_users(reqs: list[MembershipRequest]) -> None:
+    """Load every approval target with one batched FreeIPA lookup up front.
+
+    Each approval then reads its user from the cache instead of doing its own
+    ``user_show``. A failed prefetch only costs that saving.
+    """
+    usernames = [
+        req.requested_username if req.is_user_target else str(getattr(req.requested_organization, "representative", "") or "")
+        for req in reqs
+    ]
+    try:
+        FreeIPAUser.get_many(usernames, respect_privacy=False)
+    except Exception:
+        logger.exception(
+            "Bulk approve user prefetch failed request_ids=%s",
+            [req.pk for req in reqs],
+            extra=current_exception_log_fields(),
+        )
+
+
 def _execute_approve_membership_request(
     *,
     membership_request: MembershipRequest,
@@ -1508,62 +1531,66 @@ def membership_requests_bulk_api(request: HttpRequest) -> JsonResponse:
     ignored = 0
     failures = 0
 
-    for req in reqs:
-        if action == "approve":
-            try:
-                _execute_approve_membership_request(
-                    membership_request=req,
-                    actor_username=actor_username,
-                    send_approved_email=True,
-                )
-            except Exception:
-                logger.exception(
-                    "Bulk approve failed for membership request pk=%s",
-                    req.pk,
-                    extra=current_exception_log_fields(),
-                )
-                failures += 1
-                continue
-
-            approved += 1
-
-        elif action == "reject":
-            try:
-                email_error = _execute_reject_membership_request(
-                    membership_request=req,
-                    actor_username=actor_username,
-                    reason="",
-                    send_rejected_email=True,
-                )
-                if email_error is not None:
+    if action == "approve":
+        _prefetch_bulk_approval_users(reqs)
+
+    with coalesced_group_adds():
+        for req in reqs:
+            if action == "approve":
+                try:
+                    _execute_approve_membership_request(
+                        membership_request=req,
+                        actor_username=actor_username,
+                        send_approved_email=True,
+                    )
+                except Exception:
+                    logger.exception(
+                        "Bulk approve failed for membership request pk=%s",
+                        req.pk,
+                        extra=current_exception_log_fields(),
+                    )
                     failures += 1
-            except Exception:
-                logger.exception(
-                    "Bulk reject failed for membership request pk=%s",
-                    req.pk,
-                    extra=current_exception_log_fields(),
-                )
-                failures += 1
-                continue
-
-            rejected += 1
-
-        else:
-            try:
-                _execute_ignore_membership_request(
-                    membership_request=req,
-                    actor_username=actor_username,
-                )
-            except Exception:
-                logger.exception(
-                    "Bulk ignore failed for membership request pk=%s",
-                    req.pk,
-                    extra=current_exception_log_fields(),
-                )
-                failures += 1
-                continue
+                    continue
+
+                approved += 1
+
+            elif action == "reject":
+                try:
+                    email_error = _execute_reject_membership_request(
+                        membership_request=req,
+                        actor_username=actor_username,
+                        reason="",
+                        send_rejected_email=True,
+                    )
+                    if email_error is not None:
+                        failures += 1
+                except Exception:
+                    logger.exception(
+                        "Bulk reject failed for membership request pk=%s",
+                        req.pk,
+                        extra=current_exception_log_fields(),
+                    )
+                    failures += 1
+                    continue
+
+                rejected += 1
+
+            else:
+                try:
+                    _execute_ignore_membership_request(
+                        membership_request=req,
+                        actor_username=actor_username,
+                    )
+                except Exception:
+                    logger.exception(
+                        "Bulk ignore failed for membership request pk=%s",
+                        req.pk,
+                        extra=current_exception_log_fields(),
+                    )
+                    failures += 1
+                    continue
 
-            ignored += 1
+                ignored += 1
 
     return JsonResponse(
         {
@@ -2,16 +2,13 @@ import datetime
 import logging
 import math
 import statistics
-from bisect import bisect_left, bisect_right
-from collections import defaultdict
 from collections.abc import Mapping
 from enum import StrEnum
 from urllib.parse import urlencode
 
 from django.conf import settings
 from django.contrib.auth.decorators import permission_required, user_passes_test
-from django.core.cache import cache
-from django.db.models import Count, Q
+from django.db.models import Count, Min, Q
 from django.db.models.functions import TruncDay, TruncMonth, TruncWeek
 from django.http import HttpRequest, HttpResponse, JsonResponse
 from django.shortcuts import redirect, render
@@ -21,7 +18,19 @@ from django.utils import timezone
 
 from core.country_codes import country_code_status_from_user_data
 from core.freeipa.user import FreeIPAUser
+from core.freeipa_directory import get_live_usernames
 from core.membership import visible_committee_membership_requests
+from core.membership_stats import (
+    ACTIVITY_ACTIONS,
+    active_counts_at,
+    cached_stats_payload,
+    membership_activity_events,
+    membership_activity_intervals,
+    membership_type_names,
+    retention_cohorts_12m,
+    rolled_up_active_counts,
+    rollups_are_current,
+)
 from core.models import Membership, MembershipLog, MembershipRequest
 from core.permissions import (
     ASTRA_VIEW_MEMBERSHIP,
@@ -44,18 +53,6 @@ MEMBERSHIP_STATS_ALLOWED_DAYS_PRESETS: Mapping[str, int | None] = {
 }
 
 
-def _month_start_utc(value: datetime.datetime) -> datetime.datetime:
-    value_utc = value.astimezone(datetime.UTC)
-    return datetime.datetime(value_utc.year, value_utc.month, 1, tzinfo=datetime.UTC)
-
-
-def _add_months_utc(value: datetime.datetime, months: int) -> datetime.datetime:
-    month_index = value.month - 1 + months
-    year = value.year + (month_index // 12)
-    month = (month_index % 12) + 1
-    return value.replace(year=year, month=month, day=1, hour=0, minute=0, second=0, microsecond=0)
-
-
 class MembershipStatsTimeBucket(StrEnum):
     day = "day"
     week = "week"
@@ -139,77 +136,7 @@ def _compute_retention_cohort_12m(
     now: datetime.datetime,
     cohort_limit: int,
 ) -> tuple[dict[str, int], dict[str, list[object]]]:
-    events = list(
-        MembershipLog.objects.filter(
-            membership_type__category__is_individual=True,
-            action__in=[MembershipLog.Action.approved, MembershipLog.Action.terminated],
-        )
-        .exclude(target_username="")
-        .select_related("membership_type")
-        .order_by("target_username", "created_at", "id")
-    )
-
-    events_by_username: dict[str, list[MembershipLog]] = defaultdict(list)
-    for event in events:
-        username = str(event.target_username).strip()
-        if not username:
-            continue
-        events_by_username[username].append(event)
-
-    now_utc = now.astimezone(datetime.UTC)
-    cohorts: dict[str, dict[str, int]] = {}
-
-    for username, user_events in events_by_username.items():
-        approvals = [event for event in user_events if event.action == MembershipLog.Action.approved]
-        if not approvals:
-            continue
-        termination_times = [
-            event.created_at.astimezone(datetime.UTC)
-            for event in user_events
-            if event.action == MembershipLog.Action.terminated
-        ]
-
-        first_approval = approvals[0]
-        first_approval_at = first_approval.created_at.astimezone(datetime.UTC)
-        first_expires_at = first_approval.expires_at
-        if first_expires_at is not None:
-            first_expires_at = first_expires_at.astimezone(datetime.UTC)
-        cohort_start = _month_start_utc(first_approval_at)
-        horizon = _add_months_utc(cohort_start, 12)
-        if horizon > now_utc:
-            continue
-
-        next_approval = next(
-            (approval for approval in approvals[1:] if approval.created_at.astimezone(datetime.UTC) <= horizon),
-            None,
-        )
-
-        cohort_label = cohort_start.strftime("%Y-%m")
-        cohort_row = cohorts.setdefault(
-            cohort_label,
-            {
-                "cohort_size": 0,
-                "retained": 0,
-                "lapsed_then_renewed": 0,
-                "lapsed_not_renewed": 0,
-            },
-        )
-        cohort_row["cohort_size"] += 1
-
-        if next_approval is not None:
-            next_approval_at = next_approval.created_at.astimezone(datetime.UTC)
-            terminated_before_renewal = any(terminated_at <= next_approval_at for terminated_at in termination_times)
-            if not terminated_before_renewal and first_expires_at is not None and next_approval_at <= first_expires_at:
-                cohort_row["retained"] += 1
-            else:
-                cohort_row["lapsed_then_renewed"] += 1
-            continue
-
-        terminated_before_horizon = any(terminated_at <= horizon for terminated_at in termination_times)
-        if not terminated_before_horizon and (first_expires_at is None or first_expires_at >= horizon):
-            cohort_row["retained"] += 1
-        else:
-            cohort_row["lapsed_not_renewed"] += 1
+    cohorts = retention_cohorts_12m(now=now)
 
     labels = sorted(cohorts)
     if cohort_limit > 0 and len(labels) > cohort_limit:
@@ -517,9 +444,6 @@ def stats_membership_summary_api(request: HttpRequest) -> HttpResponse:
     trend_start = now - datetime.timedelta(days=days_window) if days_window is not None else None
 
     def compute() -> dict[str, object]:
-        all_freeipa_users = FreeIPAUser.all(respect_privacy=False)
-        users_by_username = {u.username: u for u in all_freeipa_users if u.username}
-
         active_memberships = Membership.objects.active()
         active_individual_usernames = list(
             active_memberships.filter(membership_type__category__is_individual=True)
@@ -537,14 +461,13 @@ def stats_membership_summary_api(request: HttpRequest) -> HttpResponse:
         )
 
         summary: dict[str, object] = {
-            "total_freeipa_users": len(all_freeipa_users),
+            "total_freeipa_users": len(get_live_usernames()),
             "active_individual_memberships": len(active_individual_usernames),
             "pending_requests": len(
                 visible_committee_membership_requests(
                     MembershipRequest.objects.select_related("requested_organization")
                     .filter(status=MembershipRequest.Status.pending)
                     .order_by("requested_at", "pk"),
-                    live_users_by_username=users_by_username,
                 )
             ),
             "on_hold_requests": len(
@@ -552,7 +475,6 @@ def stats_membership_summary_api(request: HttpRequest) -> HttpResponse:
                     MembershipRequest.objects.select_related("requested_organization")
                     .filter(status=MembershipRequest.Status.on_hold)
                     .order_by("on_hold_at", "requested_at", "pk"),
-                    live_users_by_username=users_by_username,
                 )
             ),
             "expiring_soon_90_days": active_memberships.filter(expires_at__lte=now + datetime.timedelta(days=90))
@@ -617,7 +539,7 @@ def stats_membership_summary_api(request: HttpRequest) -> HttpResponse:
         }
 
     cache_key = f"membership_stats:summary:v1:days={days_param}"
-    payload = cache.get_or_set(cache_key, compute, timeout=300)
+    payload = cached_stats_payload(cache_key, compute)
     return JsonResponse(payload)
 
 
@@ -692,7 +614,7 @@ def stats_membership_composition_charts_detail_api(request: HttpRequest) -> Http
         return _build_membership_stats_composition_payloads(now=now)
 
     cache_key = "membership_stats:composition:v2:detail"
-    payload = cache.get_or_set(cache_key, compute, timeout=300)
+    payload = cached_stats_payload(cache_key, compute)
     return JsonResponse(payload)
 
 
@@ -831,31 +753,22 @@ def _build_membership_stats_active_memberships_chart_payloads(
 ) -> dict[str, object]:
     bucket = _resolve_stats_time_bucket(days_window=days_window)
     local_tz = timezone.get_current_timezone()
-    relevant_actions = [
-        MembershipLog.Action.approved,
-        MembershipLog.Action.expiry_changed,
-        MembershipLog.Action.terminated,
-    ]
-    events = list(
-        MembershipLog.objects.filter(action__in=relevant_actions)
-        .select_related("membership_type")
-        .order_by(
-            "membership_type_id",
-            "target_username",
-            "target_organization_code",
-            "created_at",
-            "id",
-        )
-    )
+    events: list[MembershipLog] | None = None
+    if rollups_are_current(now=now):
+        earliest_event_at = MembershipLog.objects.filter(action__in=ACTIVITY_ACTIONS).aggregate(
+            earliest=Min("created_at")
+        )["earliest"]
+    else:
+        events = membership_activity_events()
+        earliest_event_at = min((event.created_at for event in events), default=None)
 
-    if not events:
+    if earliest_event_at is None:
         rows: list[dict[str, object]] = []
     else:
         now_utc = now.astimezone(datetime.UTC)
 
         checkpoints: list[tuple[str, datetime.datetime, datetime.datetime]] = []
         if days_window is None:
-            earliest_event_at = min(event.created_at for event in events)
             current_period = _stats_period_start_local(
                 value=earliest_event_at,
                 bucket=bucket,
@@ -884,55 +797,18 @@ def _build_membership_stats_active_memberships_chart_payloads(
             current_period = next_period
 
         checkpoints_at = [snapshot_at for _label, snapshot_at, _period_start in checkpoints]
-        intervals_by_type: dict[str, list[tuple[datetime.datetime, datetime.datetime | None]]] = defaultdict(list)
-        type_names: dict[str, str] = {}
-        events_by_membership: dict[tuple[str, str], list[MembershipLog]] = defaultdict(list)
-        for event in events:
-            target_key = f"user:{event.target_username}" if event.target_username else f"org:{event.organization_identifier}"
-            events_by_membership[(target_key, str(event.membership_type_id))].append(event)
-            type_names[str(event.membership_type_id)] = str(event.membership_type.name)
-
-        for (_target_key, membership_type_id), membership_events in events_by_membership.items():
-            current_start: datetime.datetime | None = None
-            current_end: datetime.datetime | None = None
-            for event in membership_events:
-                event_created_at = event.created_at.astimezone(datetime.UTC)
-                event_expires_at = event.expires_at.astimezone(datetime.UTC) if event.expires_at is not None else None
-                if event.action in {MembershipLog.Action.approved, MembershipLog.Action.expiry_changed}:
-                    if current_start is None or (current_end is not None and current_end <= event_created_at):
-                        current_start = event_created_at
-                    current_end = event_expires_at
-                    continue
-
-                if current_start is None:
-                    continue
-
-                interval_end = event_created_at if current_end is None else min(event_created_at, current_end)
-                if interval_end > current_start:
-                    intervals_by_type[membership_type_id].append((current_start, interval_end))
-                current_start = None
-                current_end = None
-
-            if current_start is not None and (current_end is None or current_end > current_start):
-                intervals_by_type[membership_type_id].append((current_start, current_end))
-
-        deltas_by_type = {
-            membership_type_id: [0] * (len(checkpoints) + 1)
-            for membership_type_id in sorted(type_names)
-        }
-        for membership_type_id, intervals in intervals_by_type.items():
-            deltas = deltas_by_type[membership_type_id]
-            for interval_start, interval_end in intervals:
-                start_index = bisect_right(checkpoints_at, interval_start)
-                if start_index >= len(checkpoints):
-                    continue
-                end_index = len(checkpoints) if interval_end is None else bisect_left(checkpoints_at, interval_end)
-                deltas[start_index] += 1
-                deltas[end_index] -= 1
+        if events is None:
+            type_names, counts_by_type = rolled_up_active_counts(checkpoints_at=checkpoints_at, now=now)
+        else:
+            type_names = membership_type_names(events)
+            counts_by_type = active_counts_at(
+                membership_activity_intervals(events),
+                checkpoints_at=checkpoints_at,
+                membership_type_ids=type_names,
+            )
 
         ordered_types = sorted(type_names.items(), key=lambda item: (item[1], item[0]))
         rows = []
-        running_counts = {membership_type_id: 0 for membership_type_id in deltas_by_type}
         for checkpoint_index, (label, _snapshot_at, period_start_local) in enumerate(checkpoints):
             period_start_ms = _stats_bucket_start_ms(
                 value=period_start_local,
@@ -940,7 +816,6 @@ def _build_membership_stats_active_memberships_chart_payloads(
                 local_tz=local_tz,
             )
             for membership_type_id, _name in ordered_types:
-                running_counts[membership_type_id] += deltas_by_type[membership_type_id][checkpoint_index]
                 rows.append(
                     {
                         "period": label,
@@ -949,7 +824,7 @@ def _build_membership_stats_active_memberships_chart_payloads(
                             "code": membership_type_id,
                             "name": type_names[membership_type_id],
                         },
-                        "count": running_counts[membership_type_id],
+                        "count": counts_by_type[membership_type_id][checkpoint_index],
                     }
                 )
 
@@ -980,7 +855,7 @@ def stats_membership_trends_charts_detail_api(request: HttpRequest) -> HttpRespo
         )
 
     cache_key = f"membership_stats:trends:v4:detail:days={days_param}"
-    payload = cache.get_or_set(cache_key, compute, timeout=300)
+    payload = cached_stats_payload(cache_key, compute)
     return JsonResponse(payload)
 
 
@@ -1001,7 +876,7 @@ def stats_membership_active_memberships_chart_detail_api(request: HttpRequest) -
         )
 
     cache_key = f"membership_stats:active_memberships:v3:detail:days={days_param}"
-    payload = cache.get_or_set(cache_key, compute, timeout=300)
+    payload = cached_stats_payload(cache_key, compute)
     return JsonResponse(payload)
 
 
@@ -1045,7 +920,7 @@ def stats_membership_retention_chart_detail_api(request: HttpRequest) -> HttpRes
         return _build_membership_stats_retention_payloads(now=now)
 
     cache_key = "membership_stats:retention:v2:detail"
-    payload = cache.get_or_set(cache_key, compute, timeout=300)
+    payload = cached_stats_payload(cache_key, compute)
     return JsonResponse(payload)
 
 
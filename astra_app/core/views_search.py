@@ -1,7 +1,6 @@
 from django.http import HttpRequest, JsonResponse
 
-from core.freeipa.group import FreeIPAGroup
-from core.freeipa_directory import search_freeipa_users
+from core.freeipa_directory import get_group_search_index, search_freeipa_users
 from core.models import Organization
 from core.permissions import can_view_user_directory
 from core.views_utils import _normalize_str
@@ -12,7 +11,6 @@ def global_search(request: HttpRequest) -> JsonResponse:
     if not q:
         return JsonResponse({"users": [], "groups": []})
 
-    q_lower = q.lower()
     has_directory_access = can_view_user_directory(request.user)
     matched_users = search_freeipa_users(query=q, limit=100) if has_directory_access else []
     matched_usernames = {
@@ -21,32 +19,15 @@ def global_search(request: HttpRequest) -> JsonResponse:
         if str(user.username).strip()
     }
 
-    groups_out: list[dict[str, str]] = []
-    for g in FreeIPAGroup.all():
-        if not g.fas_group:
-            continue
-        if not g.cn:
-            continue
-
-        members: list[str] = []
-        sponsors: list[str] = []
-        # Some tests patch FreeIPAGroup objects with lightweight stubs that may
-        # omit membership attributes.
-        if hasattr(g, "members"):
-            members = [str(member).strip() for member in g.members if str(member).strip()]
-        if hasattr(g, "sponsors"):
-            sponsors = [str(sponsor).strip() for sponsor in g.sponsors if str(sponsor).strip()]
-
-        group_member_match = bool(matched_usernames & (set(members) | set(sponsors)))
-        name_match = q_lower in g.cn.lower()
-        description_match = bool(g.description and q_lower in g.description.lower())
-
-        if not (name_match or description_match or group_member_match):
-            continue
-
-        groups_out.append({"cn": g.cn, "description": g.description})
-        if len(groups_out) >= 7:
-            break
+    groups_out = [
+        {"cn": entry.cn, "description": entry.description}
+        for entry in get_group_search_index().search(
+            q,
+            fas_only=True,
+            limit=7,
+            member_usernames=matched_usernames,
+        )
+    ]
 
     response_payload: dict[str, list[dict]] = {
         "groups": groups_out,
@@ -74,7 +55,4 @@ def global_search(request: HttpRequest) -> JsonResponse:
         )
         response_payload["orgs"] = orgs_out
 
-    # Keep output deterministic for tests/UI.
-    groups_out.sort(key=lambda x: x["cn"].lower())
-
     return JsonResponse(response_payload)
@@ -29,12 +29,18 @@ from core.membership_notes import add_note
 from core.models import MembershipRequest, Organization
 from core.permissions import ASTRA_ADD_SEND_MAIL, json_permission_required
 from core.rate_limit import allow_request
+from core.send_mail_delivery import (
+    QueuedRecipients,
+    check_recipient_templates,
+    enqueue_send_mail_job,
+    queue_recipient_emails,
+    send_mail_job_progress,
+    should_send_in_background,
+)
 from core.templated_email import (
-    bulk_save_emails,
     execute_email_template_save,
     preview_drop_inline_image_tags,
     preview_rewrite_inline_image_tags_to_urls,
-    queue_composed_email,
     render_templated_email_preview,
     render_templated_email_preview_response,
 )
@@ -1166,73 +1172,65 @@ def send_mail(request: HttpRequest) -> HttpResponse:
                     elif membership_request is not None:
                         email_kind = "custom"
 
-                    sent = 0
-                    failures = 0
-                    first_template_error: Exception | None = None
-                    pending_emails: list[Email] = []
-                    # Track emails that need a membership-request note after bulk insert.
-                    deferred_note_emails: list[object] = []
-                    for recipient in recipients:
-                        to_email = str(recipient.get("email") or "").strip()
-                        if not to_email:
-                            continue
-                        try:
-                            queued_email = queue_composed_email(
-                                recipients=[to_email],
-                                sender=settings.DEFAULT_FROM_EMAIL,
-                                subject_source=subject,
-                                text_source=text_content,
-                                html_source=html_content,
-                                context=recipient,
+                    def add_contacted_notes(saved_emails: list[Email]) -> None:
+                        # Add membership-request notes now that emails have IDs.
+                        for queued_email in saved_emails:
+                            try:
+                                add_note(
+                                    membership_request=membership_request,
+                                    username=get_username(request),
+                                    action={
+                                        "type": "contacted",
+                                        "kind": email_kind,
+                                        "email_id": queued_email.id,
+                                    },
+                                )
+                            except Exception:
+                                logger.exception(
+                                    "Send mail email-note failed membership_request_id=%s",
+                                    raw_request_id,
+                                    extra=current_exception_log_fields(),
+                                )
+
+                    background_job_id = ""
+                    if membership_request is None and should_send_in_background(recipient_count=len(recipients)):
+                        template_error = check_recipient_templates(
+                            recipients=recipients,
+                            subject=subject,
+                            text_content=text_content,
+                            html_content=html_content,
+                        )
+                        if template_error is not None:
+                            form.add_error(None, f"Template error: {template_error}")
+                            queued = QueuedRecipients()
+                        else:
+                            background_job_id = enqueue_send_mail_job(
+                                recipients=recipients,
+                                subject=subject,
+                                text_content=text_content,
+                                html_content=html_content,
                                 cc=cc,
                                 bcc=bcc,
                                 reply_to=reply_to,
-                                commit=False,
+                                actor_username=get_username(request),
                             )
-
-                            raw_election_id = recipient.get("election_id")
-                            if raw_election_id is not None:
-                                try:
-                                    queued_email.context = {"election_id": int(raw_election_id)}
-                                except (TypeError, ValueError):
-                                    pass
-
-                            if isinstance(queued_email, Email):
-                                pending_emails.append(queued_email)
-                            sent += 1
-
-                            if membership_request is not None:
-                                deferred_note_emails.append(queued_email)
-                        except Exception as exc:
-                            if first_template_error is None:
-                                first_template_error = exc
-                            failures += 1
-                            logger.exception(
-                                "Send mail failed email=%s",
-                                to_email,
-                                extra=current_exception_log_fields(),
-                            )
-
-                    bulk_save_emails(pending_emails)
-
-                    # Add membership-request notes now that emails have IDs.
-                    for queued_email in deferred_note_emails:
-                        try:
-                            add_note(
-                                membership_request=membership_request,
-                                username=get_username(request),
-                                action={
-                                    "type": "contacted",
-                                    "kind": email_kind,
-                                    "email_id": queued_email.id,
-                                },
-                            )
-                        except Exception:
-                            logger.exception(
-                                "Send mail email-note failed membership_request_id=%s",
-                                raw_request_id,
-                                extra=current_exception_log_fields(),
+                            queued = QueuedRecipients(
+                                queued=sum(1 for recipient in recipients if str(recipient.get("email") or "").strip())
                             )
+                    else:
+                        queued = queue_recipient_emails(
+                            recipients=recipients,
+                            subject=subject,
+                            text_content=text_content,
+                            html_content=html_content,
+                            cc=cc,
+                            bcc=bcc,
+                            reply_to=reply_to,
+                            on_saved=add_contacted_notes if membership_request is not None else None,
+                        )
+                    sent = queued.queued
+                    failures = queued.failed
+                    first_template_error = queued.first_error
 
                     if first_template_error is not None and sent == 0:
                         messages.error(request, f"Template error: {first_template_error}")
@@ -1240,7 +1238,14 @@ def send_mail(request: HttpRequest) -> HttpResponse:
                     if sent:
                         request.session.pop(_CSV_SESSION_KEY, None)
                         request.session.pop(_PREVIEW_CONTEXT_SESSION_KEY, None)
-                        messages.success(request, f"Queued {sent} email{'s' if sent != 1 else ''}.")
+                        if background_job_id:
+                            messages.success(
+                                request,
+                                f"Sending {sent} email{'s' if sent != 1 else ''} in the background "
+                                f"(job {background_job_id}).",
+                            )
+                        else:
+                            messages.success(request, f"Queued {sent} email{'s' if sent != 1 else ''}.")
                     if failures:
                         messages.error(request, f"Failed to queue {failures} email{'s' if failures != 1 else ''}.")
                     if sent or failures:
@@ -1409,3 +1414,12 @@ def send_mail_render_preview(request: HttpRequest) -> JsonResponse:
         request=request,
         context={str(k): str(v) for k, v in context.items()},
     )
+
+
+@require_GET
+@json_permission_required(ASTRA_ADD_SEND_MAIL)
+def send_mail_job_progress_api(request: HttpRequest, job_id: str) -> JsonResponse:
+    progress = send_mail_job_progress(job_id)
+    if progress is None:
+        return JsonResponse({"error": "Unknown send job."}, status=404)
+    return JsonResponse(progress)
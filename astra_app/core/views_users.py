@@ -24,7 +24,7 @@ from core.avatar_providers import resolve_avatar_urls_for_users
 from core.country_codes import country_code_status_from_user_data, country_name_from_code
 from core.freeipa.group import FreeIPAGroup
 from core.freeipa.user import FreeIPAUser
-from core.freeipa_directory import snapshot_freeipa_users
+from core.freeipa_directory import get_user_directory
 from core.ipa_user_attrs import _data_get, _first, _get_full_user, _split_list_field, _value_to_text
 from core.membership import (
     build_pending_request_context,
@@ -40,7 +40,7 @@ from core.permissions import can_view_user_directory, membership_review_permissi
 from core.templatetags._grid_tag_utils import parse_grid_query
 from core.templatetags._user_helpers import try_get_full_name
 from core.templatetags.core_dict import membership_tier_class
-from core.templatetags.core_user_grid import build_user_grid_page
+from core.templatetags.core_user_grid import build_user_directory_grid_page
 from core.views_utils import (
     _normalize_str,
     agreement_settings_url,
@@ -1259,10 +1259,8 @@ def users_api(request: HttpRequest) -> JsonResponse:
         return ""
 
     q, page_number, _base_query, _page_url_prefix = parse_grid_query(request)
-    users_list = snapshot_freeipa_users()
-
-    users_page, paginator, page_obj, page_numbers, show_first, show_last = build_user_grid_page(
-        users_list=users_list,
+    users_page, paginator, page_obj, page_numbers, show_first, show_last = build_user_directory_grid_page(
+        entries=get_user_directory(),
         q=q,
         page_number=page_number,
         per_page=28,
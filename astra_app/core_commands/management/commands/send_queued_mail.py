@@ -1,13 +1,22 @@
 import logging
+import os
+import signal
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import Any, override
 
-from django.core.management.base import BaseCommand
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
 from django.db import connection
-from post_office.mail import get_queued
+from django.utils import timezone
+from post_office.mail import get_queued, send_queued
 from post_office.management.commands.send_queued_mail import Command as PostOfficeCommand
 from post_office.models import STATUS as POST_OFFICE_STATUS
 from post_office.models import Log as PostOfficeLog
 
+from core.logging_extras import current_exception_log_fields
 from core.post_office_alerts import emit_immediate_ses_send_failure_alerts
 
 logger = logging.getLogger(__name__)
@@ -17,6 +26,11 @@ logger = logging.getLogger(__name__)
 _LOCK_KEY_1 = 189402183
 _LOCK_KEY_2 = 915734211
 
+# With --loop the worker records its status here for `send_queued_mail --status`.
+_WORKER_STATUS_CACHE_KEY = "send_queued_mail_worker_status"
+_WORKER_STATUS_INTERVAL_SECONDS = 30
+_WORKER_STALE_AFTER_SECONDS = 120
+
 
 def _queued_email_ids() -> list[int]:
     return list(get_queued().values_list("id", flat=True))
@@ -46,36 +60,179 @@ def _run_delegate_and_emit_alerts(*args: Any, **options: Any) -> Any:
     return result
 
 
+def _send_queued_batches(*, processes: int, log_level: int | None) -> tuple[int, int, int]:
+    """Send batches until the queue is empty; returns (sent, failed, requeued).
+
+    Unlike the delegate, this keeps the process and its database connection,
+    so an idle poll costs one query.
+    """
+    totals = (0, 0, 0)
+    if not get_queued().exists():
+        return totals
+
+    previous_log_id = PostOfficeLog.objects.order_by("-pk").values_list("pk", flat=True).first() or 0
+    try:
+        while True:
+            batch = send_queued(processes, log_level)
+            totals = (totals[0] + batch[0], totals[1] + batch[1], totals[2] + batch[2])
+            if not any(batch) or not get_queued().exists():
+                break
+    finally:
+        _emit_new_bulk_failure_alerts(previous_log_id)
+    return totals
+
+
+@contextmanager
+def _sender_lock() -> Iterator[bool]:
+    if connection.vendor != "postgresql":
+        yield True
+        return
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT pg_try_advisory_lock(%s, %s)",
+            [_LOCK_KEY_1, _LOCK_KEY_2],
+        )
+        row = cursor.fetchone()
+        lock_acquired = bool(row and row[0])
+
+    if not lock_acquired:
+        yield False
+        return
+
+    try:
+        yield True
+    finally:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT pg_advisory_unlock(%s, %s)",
+                [_LOCK_KEY_1, _LOCK_KEY_2],
+            )
+
+
 class Command(BaseCommand):
     help = PostOfficeCommand.help
 
     @override
     def add_arguments(self, parser) -> None:
         PostOfficeCommand().add_arguments(parser)
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep running and poll the queue instead of exiting once it is empty.",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=2.0,
+            help="With --loop, seconds to wait when nothing is queued.",
+        )
+        parser.add_argument(
+            "--max-seconds",
+            type=float,
+            default=0.0,
+            help="With --loop, stop after this many seconds (0 runs until stopped).",
+        )
+        parser.add_argument(
+            "--status",
+            action="store_true",
+            help="Print the status of the --loop worker; fails when it has not reported recently.",
+        )
 
     @override
     def handle(self, *args: Any, **options: Any) -> Any:
-        options.setdefault("log_level", 2)
-        if connection.vendor != "postgresql":
-            return _run_delegate_and_emit_alerts(*args, **options)
+        loop = bool(options.pop("loop", False))
+        poll_interval = float(options.pop("poll_interval", 2.0))
+        max_seconds = float(options.pop("max_seconds", 0.0))
+        if options.pop("status", False):
+            return self._print_worker_status()
 
-        with connection.cursor() as cursor:
-            cursor.execute(
-                "SELECT pg_try_advisory_lock(%s, %s)",
-                [_LOCK_KEY_1, _LOCK_KEY_2],
+        options.setdefault("log_level", 2)
+        if loop:
+            if poll_interval <= 0:
+                raise CommandError("--poll-interval must be positive")
+            return self._run_worker(
+                processes=int(options.get("processes") or 1),
+                log_level=options["log_level"],
+                poll_interval=poll_interval,
+                max_seconds=max_seconds,
             )
-            row = cursor.fetchone()
-            lock_acquired = bool(row and row[0])
 
-        if not lock_acquired:
-            logger.info("send_queued_mail: previous run still active; skipping")
-            return 0
+        with _sender_lock() as lock_acquired:
+            if not lock_acquired:
+                logger.info("send_queued_mail: previous run still active; skipping")
+                return 0
+            return _run_delegate_and_emit_alerts(*args, **options)
 
+    def _run_worker(self, *, processes: int, log_level: int | None, poll_interval: float, max_seconds: float) -> None:
+        stop = threading.Event()
+        previous_handlers = {
+            signum: signal.signal(signum, lambda *_args: stop.set()) for signum in (signal.SIGTERM, signal.SIGINT)
+        }
+        started_at = time.monotonic()
+        status: dict[str, Any] = {
+            "pid": os.getpid(),
+            "started_at": timezone.now().isoformat(),
+            "sent": 0,
+            "failed": 0,
+            "requeued": 0,
+            "last_sent_at": None,
+        }
+        reported_at = 0.0
         try:
-            return _run_delegate_and_emit_alerts(*args, **options)
+            # A signal arriving mid-batch only stops the loop once the batch's statuses are saved.
+            while not stop.is_set():
+                batch_started_at = time.monotonic()
+                try:
+                    with _sender_lock() as lock_acquired:
+                        sent, failed, requeued = (
+                            _send_queued_batches(processes=processes, log_level=log_level) if lock_acquired else (0, 0, 0)
+                        )
+                except Exception:
+                    logger.exception("send_queued_mail: worker iteration failed", extra=current_exception_log_fields())
+                    # The connection is kept between polls; reconnect in case the database went away.
+                    connection.close()
+                    stop.wait(poll_interval)
+                    continue
+
+                now = time.monotonic()
+                if sent or failed or requeued:
+                    duration = now - batch_started_at
+                    status.update(
+                        sent=status["sent"] + sent,
+                        failed=status["failed"] + failed,
+                        requeued=status["requeued"] + requeued,
+                        last_sent_at=timezone.now().isoformat(),
+                    )
+                    logger.info(
+                        "send_queued_mail.sent",
+                        extra={
+                            "sent": sent,
+                            "failed": failed,
+                            "requeued": requeued,
+                            "duration_ms": int(round(duration * 1000)),
+                            "emails_per_second": round((sent + failed + requeued) / duration, 1) if duration else None,
+                        },
+                    )
+                if sent or failed or requeued or now - reported_at >= _WORKER_STATUS_INTERVAL_SECONDS:
+                    status.update(lock_held=lock_acquired, reported_at=timezone.now().isoformat())
+                    cache.set(_WORKER_STATUS_CACHE_KEY, dict(status), timeout=_WORKER_STALE_AFTER_SECONDS)
+                    reported_at = now
+
+                if max_seconds and now - started_at + poll_interval >= max_seconds:
+                    break
+                stop.wait(poll_interval)
         finally:
-            with connection.cursor() as cursor:
-                cursor.execute(
-                    "SELECT pg_advisory_unlock(%s, %s)",
-                    [_LOCK_KEY_1, _LOCK_KEY_2],
-                )
+            for signum, handler in previous_handlers.items():
+                signal.signal(signum, handler)
+
+        self.stdout.write(
+            self.style.SUCCESS(f"{status['sent']} sent, {status['failed']} failed, {status['requeued']} requeued.")
+        )
+
+    def _print_worker_status(self) -> None:
+        status = cache.get(_WORKER_STATUS_CACHE_KEY)
+        if not isinstance(status, dict):
+            raise CommandError(f"No send_queued_mail --loop worker has reported in the last {_WORKER_STALE_AFTER_SECONDS}s.")
+        for key, value in status.items():
+            self.stdout.write(f"{key}: {value}")